@@ -47,6 +47,8 @@ import math
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from cash_mode.stakes_ladder import STAKES_ORDER, table_buy_in_window
 
 # --- Draw layer (the multiplicative "how much meat is on the table") ---
@@ -553,9 +555,15 @@ def seeker_buy_in(table: FillableTable, buy_in_multiplier: float) -> int:
     return min(round(table.min_buy_in * buy_in_multiplier), table.max_buy_in)
 
 
+# Below this many seeker × table cells the scalar loop beats the NumPy setup.
+VECTORIZE_MIN_CELLS = 256
+
+
 def assign_seats_greedy(
     seekers: List[SeatSeeker],
     tables: dict,
+    *,
+    vectorized: Optional[bool] = None,
 ) -> List[Tuple[str, str]]:
     """Sequentially seat each seeker at its most attractive affordable table.
 
@@ -566,7 +574,15 @@ def assign_seats_greedy(
     by id for deterministic tie-breaking. Returns the `(personality_id,
     table_id)` assignments in seating order; AIs with no affordable, open,
     allowed table are simply omitted.
+
+    `vectorized` picks the NumPy scorer (`_assign_seats_greedy_matrix`) or the
+    scalar loop; None chooses by problem size. Both give identical
+    assignments.
     """
+    if vectorized is None:
+        vectorized = len(seekers) * len(tables) >= VECTORIZE_MIN_CELLS
+    if vectorized:
+        return _assign_seats_greedy_matrix(seekers, tables)
     assignments: List[Tuple[str, str]] = []
     for seeker in seekers:
         best_id: Optional[str] = None
@@ -602,3 +618,122 @@ def assign_seats_greedy(
         chosen.grinder_count += 1
         assignments.append((seeker.personality_id, best_id))
     return assignments
+
+
+def _stake_max_buy_in(stake_label: str) -> int:
+    try:
+        return table_buy_in_window(stake_label)[2]
+    except KeyError:
+        return 0
+
+
+def _assign_seats_greedy_matrix(
+    seekers: List[SeatSeeker],
+    tables: dict,
+) -> List[Tuple[str, str]]:
+    """`assign_seats_greedy` over a seekers × tables score matrix.
+
+    Everything in `table_attractiveness` except the crowd penalty is fixed for
+    the whole pass, so it is built once as a matrix; the crowd penalty is a
+    per-table vector and only the chosen table's entry changes after each
+    pick. The transcendental pieces (the affordable tier index, `wealth`,
+    `hunger`, `table_affinity`) are per-seeker or sparse and come from the
+    scalar functions; the matrix step is the same float64 multiplies and adds
+    in the same order, so scores — and therefore assignments, including
+    ties — are bit-identical to the scalar loop. Columns are in sorted id
+    order and `argmax` returns the first maximum, matching its tie-break.
+    """
+    assignments: List[Tuple[str, str]] = []
+    if not seekers:
+        return assignments
+    table_ids = sorted(
+        {tid for seeker in seekers for tid in seeker.allowed_table_ids if tid in tables}
+    )
+    if not table_ids:
+        return assignments
+    col = {tid: j for j, tid in enumerate(table_ids)}
+    rows = [tables[tid] for tid in table_ids]
+    stakes = sorted({t.stake_label for t in rows})
+    stake_col = np.array([stakes.index(t.stake_label) for t in rows])
+
+    # Per-table vectors.
+    stake_max_bi = [_stake_max_buy_in(t.stake_label) for t in rows]
+    prestige = np.array([room_prestige(t.stake_label, override=t.prestige_override) for t in rows])
+    marquee = np.array([t.marquee_prestige for t in rows], dtype=float)
+    venue = np.array([t.venue_appeal for t in rows], dtype=float)
+    bait = np.array([1.0 if (t.fish_chips > 0 or t.whale_chips > 0) else 0.0 for t in rows])
+    draw = np.array(
+        [
+            W_FISH * ((t.fish_chips / m) if m > 0 else 0.0)
+            + W_WHALE * ((t.whale_chips / m) if m > 0 else 0.0)
+            + BASE_DRAW
+            for t, m in zip(rows, stake_max_bi, strict=True)
+        ]
+    )
+    min_bi = np.array([t.min_buy_in for t in rows], dtype=float)
+    max_bi = np.array([t.max_buy_in for t in rows], dtype=float)
+    open_count = np.array([t.open_count for t in rows])
+    crowd = np.array([W_CROWD * max(0, t.grinder_count) for t in rows], dtype=float)
+
+    # Per-seeker vectors and the seeker × stake fit table.
+    n = len(seekers)
+    bankroll = np.array([s.projected_bankroll for s in seekers], dtype=float)
+    mult = np.array([s.buy_in_multiplier for s in seekers], dtype=float)
+    rich = np.array([wealth(s.projected_bankroll) for s in seekers])
+    hungry = np.array([hunger(s.projected_bankroll, s.starting_bankroll) for s in seekers])
+    appetite = np.array([s.status_appetite for s in seekers], dtype=float)
+    # `stake_fit` across all stakes at once: the fit center is per seeker (one
+    # `_affordable_tier_index` each), the taper is elementwise.
+    centers = []
+    for s in seekers:
+        afford_idx = _affordable_tier_index(s.projected_bankroll, s.buy_in_multiplier)
+        anchor_idx = (
+            float(STAKES_ORDER.index(s.comfort_zone))
+            if s.comfort_zone in STAKES_ORDER
+            else afford_idx
+        )
+        centers.append(anchor_idx + ANCHOR_DRIFT * (afford_idx - anchor_idx))
+    known = np.array([label in STAKES_ORDER for label in stakes])
+    stake_idx = np.array(
+        [STAKES_ORDER.index(label) if label in STAKES_ORDER else 0 for label in stakes]
+    )
+    distance = np.abs(stake_idx[None, :] - np.array(centers)[:, None])
+    fit_by_stake = np.where(known[None, :], np.maximum(0.0, 1.0 - STAKE_FIT_TAPER * distance), 0.0)
+    fit = fit_by_stake[:, stake_col]
+
+    allowed = np.zeros((n, len(table_ids)), dtype=bool)
+    net_affinity = np.zeros((n, len(table_ids)))
+    for i, seeker in enumerate(seekers):
+        allowed[i, [col[tid] for tid in seeker.allowed_table_ids if tid in col]] = True
+        for tid, net in seeker.net_by_table.items():
+            j = col.get(tid)
+            if j is not None and net:
+                net_affinity[i, j] = table_affinity(net, stake_max_bi[j])
+
+    # Same operation order as `table_attractiveness`.
+    base = fit + (W_CLIMB * prestige)[None, :] * rich[:, None]
+    base = base + (W_MARQUEE * marquee)[None, :] * appetite[:, None]
+    hunger_mult = 1.0 + (W_HUNGER * hungry)[:, None] * bait[None, :]
+    static = venue[None, :] * base * hunger_mult * draw[None, :]
+    affinity = (W_AFFINITY * fit) * net_affinity
+    buy_in = np.minimum(np.rint(min_bi[None, :] * mult[:, None]), max_bi[None, :])
+    eligible = allowed & (bankroll[:, None] >= buy_in)
+
+    seats_left = int(np.maximum(open_count, 0).sum())
+    for i, seeker in enumerate(seekers):
+        if seats_left <= 0:
+            break
+        candidates = eligible[i] & (open_count > 0)
+        if not candidates.any():
+            continue
+        score = np.where(candidates, (static[i] - crowd) + affinity[i], -np.inf)
+        j = int(np.argmax(score))
+        tid = table_ids[j]
+        chosen = tables[tid]
+        chosen.open_count -= 1
+        chosen.grinder_count += 1
+        open_count[j] -= 1
+        seats_left -= 1
+        crowd[j] = W_CROWD * max(0, chosen.grinder_count)
+        assignments.append((seeker.personality_id, tid))
+    return assignments
@@ -22,6 +22,7 @@ and §"Locked decisions" (3 — kill_all_cash_sessions).
 
 from __future__ import annotations
 
+import functools
 import itertools
 import logging
 import random
@@ -78,6 +79,13 @@ from cash_mode.tables import (
     ai_slot,
     open_slot,
 )
+from cash_mode.world_snapshot import (
+    MISS,
+    bind_world_snapshot,
+    bound_snapshot,
+    load_world_snapshot,
+)
+from core import feature_flags
 
 logger = logging.getLogger(__name__)
 
@@ -778,7 +786,13 @@ def _process_global_greedy_fills(
         import json as _json
 
         stored = baseline = 0.5
-        if bankroll_repo is not None:
+        world = bound_snapshot(bankroll_repo)
+        axes = world.energy_axes(pid, sandbox_id) if world is not None else MISS
+        if axes is not MISS:
+            # NaN = no (or a malformed) blob: the neutral default.
+            if axes[0] == axes[0]:
+                stored, baseline = axes
+        elif bankroll_repo is not None:
             try:
                 blob = bankroll_repo.load_emotional_state_json(pid, sandbox_id=sandbox_id)
                 if blob:
@@ -986,6 +1000,67 @@ def _available_buyin_capacity(current: int, committed: int) -> int:
     return max(0, current - committed)
 
 
+def _load_tick_world_snapshot(kwargs: Dict[str, Any]):
+    """Bulk-load the tick's `WorldSnapshot`, or None to read SQLite directly.
+
+    Needs a sandbox and the real bankroll repository (test doubles have no
+    bulk reads). A failed load only costs the speed-up, never the tick.
+    """
+    from poker.repositories.bankroll_repository import BankrollRepository
+
+    bankroll_repo = kwargs.get("bankroll_repo")
+    sandbox_id = kwargs.get("sandbox_id")
+    if not sandbox_id or not isinstance(bankroll_repo, BankrollRepository):
+        return None
+    if not feature_flags.is_enabled("CASH_WORLD_SNAPSHOT_ENABLED"):
+        return None
+    try:
+        return load_world_snapshot(
+            sandbox_id=sandbox_id,
+            bankroll_repo=bankroll_repo,
+            personality_repo=kwargs.get("personality_repo"),
+            stake_repo=kwargs.get("stake_repo"),
+        )
+    except Exception as exc:  # noqa: BLE001 — fall back to per-entity reads
+        logger.warning("[CASH][LOBBY] world snapshot load failed: %s", exc)
+        return None
+
+
+def _with_world_snapshot(refresh):
+    """Run a lobby tick with its `WorldSnapshot` bound (see
+    `cash_mode/world_snapshot.py`): every bankroll / knob / psych / stake /
+    relationship read the tick makes is served from the bulk-loaded columns,
+    and every write goes through to both. With CASH_WORLD_SNAPSHOT_VERIFY on,
+    the snapshot is checked against the DB once the tick returns."""
+
+    @functools.wraps(refresh)
+    def wrapper(**kwargs):
+        world = _load_tick_world_snapshot(kwargs)
+        with bind_world_snapshot(world):
+            out = refresh(**kwargs)
+        if world is not None and feature_flags.is_enabled("CASH_WORLD_SNAPSHOT_VERIFY"):
+            try:
+                problems = world.verify(
+                    bankroll_repo=kwargs.get("bankroll_repo"),
+                    personality_repo=kwargs.get("personality_repo"),
+                    relationship_repo=kwargs.get("relationship_repo"),
+                    stake_repo=kwargs.get("stake_repo"),
+                )
+            except Exception as exc:  # noqa: BLE001 — debug check only
+                logger.warning("[CASH][LOBBY] world snapshot verify failed: %s", exc)
+                problems = []
+            for problem in problems:
+                logger.error(
+                    "[CASH][LOBBY] world snapshot diverged from DB sandbox=%s: %s",
+                    world.sandbox_id,
+                    problem,
+                )
+        return out
+
+    return wrapper
+
+
+@_with_world_snapshot
 def refresh_unseated_tables(
     *,
     cash_table_repo,
@@ -3350,7 +3425,12 @@ def _ticker_name_for(pid: str, personality_repo) -> Optional[str]:
     callers can skip emission rather than crash. Hoisted out of
     `refresh_unseated_tables`' per-table loop (it was redefined every iteration)
     so the extracted settlement / stake-creation stage helpers can share it.
+    Served from the tick's world snapshot when one is bound.
     """
+    world = bound_snapshot(personality_repo)
+    name = world.name_for(pid) if world is not None else None
+    if name:
+        return name
     try:
         personality = personality_repo.load_personality_by_id(pid)
     except Exception:
@@ -3558,6 +3638,10 @@ def _name_for_personality(personality_repo) -> Callable[[str], str]:
     """
 
     def _resolve(pid: str) -> str:
+        world = bound_snapshot(personality_repo)
+        name = world.name_for(pid) if world is not None else None
+        if name:
+            return name
         try:
             personality = personality_repo.load_personality_by_id(pid)
         except Exception:
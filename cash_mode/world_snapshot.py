@@ -0,0 +1,438 @@
+"""Per-sandbox in-memory world snapshot for one lobby tick.
+
+`refresh_unseated_tables` used to resolve its movement/fill contexts with
+per-entity repository reads: every seat and idle AI cost a bankroll row, a
+ledger-derived balance, a `config_json` knobs parse, an emotional-state blob,
+and (inside the sim hands) relationship rows per decision — the same rows
+re-read many times per tick.
+
+`load_world_snapshot` replaces that with a handful of bulk queries at the
+start of the tick: every `ai_bankroll_state` row in the sandbox (with the
+ledger-derived chips from two grouped aggregates), every knob sub-dict, the
+display names, and the active-stake borrower set. Relationships and per-table
+net chips are loaded in bulk on first touch (per observer / per sandbox), since
+most ticks never read them. Per-AI values live in columns indexed by the AI's
+row (`numpy` arrays for the numeric ones).
+
+Serving is done by the repositories themselves: while a snapshot is bound to
+the current thread (`bind_world_snapshot`), the bankroll / relationship /
+stake repositories on the same DB file answer covered reads from it and write
+every committed write through to it, so code called from the tick (movement,
+the sim hands, vice/hustle, the greedy fill) needs no changes to stay
+coherent. A write inside an open transaction can still roll back, so it marks
+the entry stale instead; a stale entry is read from the DB and, once no
+transaction is open, repaired from that read.
+
+`WorldSnapshot.verify` reloads everything from the DB and reports every
+column that disagrees — run after each tick when
+`CASH_WORLD_SNAPSHOT_VERIFY` is on (dev default).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from cash_mode.bankroll import AIBankrollState, BankrollKnobs
+from poker.memory.opponent_model import RelationshipState, project_heat
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "not covered by the snapshot — read the DB" (None is a valid
+# answer for several reads, e.g. a cleared cooldown).
+MISS = object()
+
+_bound = threading.local()
+
+
+def bound_snapshot(repo) -> Optional[WorldSnapshot]:
+    """The snapshot bound to this thread for `repo`'s DB file, if any."""
+    snapshot = getattr(_bound, "snapshot", None)
+    if snapshot is None or snapshot.db_path != getattr(repo, "db_path", None):
+        return None
+    return snapshot
+
+
+@contextmanager
+def bind_world_snapshot(snapshot: Optional[WorldSnapshot]):
+    """Serve repository reads from `snapshot` on this thread for the block.
+
+    `None` is a no-op, so callers can bind unconditionally. Restores the
+    previously bound snapshot on exit (nested ticks).
+    """
+    previous = getattr(_bound, "snapshot", None)
+    if snapshot is not None:
+        _bound.snapshot = snapshot
+    try:
+        yield snapshot
+    finally:
+        _bound.snapshot = previous
+
+
+def in_transaction(repo) -> bool:
+    """Whether `repo` has an open `transaction()` on this thread."""
+    return getattr(repo._local, "txn_depth", 0) > 0
+
+
+def _energy_axes(blob: Optional[str]) -> Tuple[float, float]:
+    """(energy, baseline_energy) from an emotional-state blob; NaN if absent."""
+    if not blob:
+        return (np.nan, np.nan)
+    try:
+        state = json.loads(blob)
+        stored = float(state.get("axes", {}).get("energy", 0.5))
+        baseline = float(state.get("anchors", {}).get("baseline_energy", stored))
+    except (TypeError, ValueError, AttributeError):
+        return (np.nan, np.nan)
+    return (stored, baseline)
+
+
+class WorldSnapshot:
+    """Columnar per-AI state of one sandbox, for the duration of a tick.
+
+    Row `i` of every column belongs to `pids[i]`; only AIs with an
+    `ai_bankroll_state` row are covered. Read accessors return `MISS` for
+    anything not covered (or stale), meaning "ask the DB".
+    """
+
+    def __init__(
+        self,
+        *,
+        db_path: str,
+        sandbox_id: str,
+        rows: List[dict],
+        knobs: Dict[str, BankrollKnobs],
+        names: Dict[str, str],
+        active_borrowers: Set[str],
+    ):
+        self.db_path = db_path
+        self.sandbox_id = sandbox_id
+        self.pids: List[str] = [row["personality_id"] for row in rows]
+        self.index: Dict[str, int] = {pid: i for i, pid in enumerate(self.pids)}
+        n = len(rows)
+
+        self.chips = np.array([row["chips"] for row in rows], dtype=np.int64)
+        self.stored_chips = np.array([row["stored_chips"] for row in rows], dtype=np.int64)
+        self.last_regen = np.array([row["last_regen_tick"] for row in rows], dtype=object)
+        self.bankruptcy_count = np.array([row["bankruptcy_count"] for row in rows], dtype=np.int64)
+        self.last_bankruptcy_at = np.array(
+            [row["last_bankruptcy_at"] for row in rows], dtype=object
+        )
+        self.aspiration_cooldown = np.array(
+            [row["aspiration_cooldown_until"] for row in rows], dtype=object
+        )
+        self.emotional_json = np.array([row["emotional_state_json"] for row in rows], dtype=object)
+        axes = [_energy_axes(row["emotional_state_json"]) for row in rows]
+        self.energy = np.array([a[0] for a in axes], dtype=np.float64)
+        self.baseline_energy = np.array([a[1] for a in axes], dtype=np.float64)
+        self.knobs = np.array([knobs[pid] for pid in self.pids], dtype=object)
+        self.has_active_stake = np.array([pid in active_borrowers for pid in self.pids], dtype=bool)
+        self.names = dict(names)
+
+        # Stale flags: set by a write inside an open transaction (it may roll
+        # back), cleared by read-repair once the transaction is gone.
+        self.chips_stale = np.zeros(n, dtype=bool)
+        self.psych_stale = np.zeros(n, dtype=bool)
+        self.status_stale = np.zeros(n, dtype=bool)
+        self.knobs_stale = np.zeros(n, dtype=bool)
+        self.stakes_stale = False
+        # A bankroll row was inserted for an uncovered AI this tick, so
+        # sandbox-wide aggregates can no longer be served from the columns.
+        self.rows_added = False
+
+        # Loaded on first touch: {observer: {opponent: RelationshipState}}
+        # (stored, unprojected) and {ai: {table_id: net_chips}}.
+        self.relationships: Dict[str, Dict[str, RelationshipState]] = {}
+        self.table_net: Optional[Dict[str, Dict[str, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def _row(self, pid: str, sandbox_id: Optional[str]) -> Optional[int]:
+        if sandbox_id != self.sandbox_id:
+            return None
+        return self.index.get(pid)
+
+    # --- bankroll ---
+
+    def ai_bankroll(self, pid: str, sandbox_id: str):
+        i = self._row(pid, sandbox_id)
+        if i is None or self.chips_stale[i]:
+            return MISS
+        return AIBankrollState(
+            personality_id=pid,
+            chips=int(self.chips[i]),
+            last_regen_tick=self.last_regen[i],
+        )
+
+    def note_bankroll(self, state: AIBankrollState, sandbox_id: str, *, committed: bool) -> None:
+        i = self._row(state.personality_id, sandbox_id)
+        if i is None:
+            if sandbox_id == self.sandbox_id:
+                self.rows_added = True
+            return
+        if not committed:
+            self.chips_stale[i] = True
+            return
+        self.chips[i] = int(state.chips)
+        self.stored_chips[i] = int(state.chips)
+        self.last_regen[i] = state.last_regen_tick
+        self.chips_stale[i] = False
+
+    def repair_bankroll(self, state: AIBankrollState, stored_chips: int, sandbox_id: str) -> None:
+        """Refill a stale row from a committed DB read."""
+        i = self._row(state.personality_id, sandbox_id)
+        if i is None or not self.chips_stale[i]:
+            return
+        self.chips[i] = int(state.chips)
+        self.stored_chips[i] = int(stored_chips)
+        self.last_regen[i] = state.last_regen_tick
+        self.chips_stale[i] = False
+
+    def stored_chip_list(self, sandbox_id: str):
+        """`list_all_ai_bankroll_chips`, when every row is current."""
+        if sandbox_id != self.sandbox_id or self.rows_added or self.chips_stale.any():
+            return MISS
+        return [int(c) for c in self.stored_chips]
+
+    def personality_knobs(self, pid: str):
+        i = self.index.get(pid)
+        if i is None or self.knobs_stale[i]:
+            return MISS
+        return self.knobs[i]
+
+    def invalidate_knobs(self, pid: str) -> None:
+        i = self.index.get(pid)
+        if i is not None:
+            self.knobs_stale[i] = True
+
+    # --- psychology / status columns ---
+
+    def emotional_state_json(self, pid: str, sandbox_id: str):
+        i = self._row(pid, sandbox_id)
+        if i is None or self.psych_stale[i]:
+            return MISS
+        return self.emotional_json[i]
+
+    def energy_axes(self, pid: str, sandbox_id: Optional[str]):
+        """(energy, baseline_energy) parsed at load, or MISS. NaNs when the
+        AI has no (or a malformed) emotional-state blob."""
+        i = self._row(pid, sandbox_id)
+        if i is None or self.psych_stale[i]:
+            return MISS
+        return (float(self.energy[i]), float(self.baseline_energy[i]))
+
+    def note_emotional_state(
+        self, pid: str, blob: Optional[str], sandbox_id: str, *, committed: bool
+    ) -> None:
+        i = self._row(pid, sandbox_id)
+        if i is None:
+            if sandbox_id == self.sandbox_id:
+                self.rows_added = True
+            return
+        if not committed:
+            self.psych_stale[i] = True
+            return
+        self.emotional_json[i] = blob
+        self.energy[i], self.baseline_energy[i] = _energy_axes(blob)
+        self.psych_stale[i] = False
+
+    def aspiration_cooldown_until(self, pid: str, sandbox_id: str):
+        i = self._row(pid, sandbox_id)
+        if i is None or self.status_stale[i]:
+            return MISS
+        return self.aspiration_cooldown[i]
+
+    def note_aspiration_cooldown(
+        self, pid: str, until: Optional[datetime], sandbox_id: str, *, committed: bool
+    ) -> None:
+        i = self._row(pid, sandbox_id)
+        if i is None:
+            return
+        if committed:
+            self.aspiration_cooldown[i] = until
+        else:
+            self.status_stale[i] = True
+
+    def bankruptcy_state(self, pid: str, sandbox_id: str):
+        i = self._row(pid, sandbox_id)
+        if i is None or self.status_stale[i]:
+            return MISS
+        return (int(self.bankruptcy_count[i]), self.last_bankruptcy_at[i])
+
+    def note_bankruptcy(
+        self, pid: str, count: int, at: datetime, sandbox_id: str, *, committed: bool
+    ) -> None:
+        i = self._row(pid, sandbox_id)
+        if i is None:
+            return
+        if committed:
+            self.bankruptcy_count[i] = count
+            self.last_bankruptcy_at[i] = at
+        else:
+            self.status_stale[i] = True
+
+    # --- names ---
+
+    def name_for(self, pid: str) -> Optional[str]:
+        return self.names.get(pid)
+
+    # --- stakes ---
+
+    def has_active_stake_for(self, pid: str, borrower_kind: str, sandbox_id: Optional[str]):
+        """Whether an AI borrower holds an active stake, or MISS.
+
+        Only the personality/sandbox-scoped form of `load_active_for_borrower`
+        is covered (the movement path's), and only the negative answer can be
+        served — a positive still needs the stake row itself."""
+        if borrower_kind != "personality" or self.stakes_stale:
+            return MISS
+        i = self._row(pid, sandbox_id)
+        if i is None:
+            return MISS
+        return bool(self.has_active_stake[i])
+
+    def note_stakes_changed(self) -> None:
+        """A stake row changed status; the next read reloads the set."""
+        self.stakes_stale = True
+
+    def reload_active_borrowers(self, active: Set[str]) -> None:
+        self.has_active_stake = np.array([pid in active for pid in self.pids], dtype=bool)
+        self.stakes_stale = False
+
+    # --- relationships ---
+
+    def relationship(self, observer_id: str, opponent_id: str, now: datetime):
+        """Projected (observer, opponent) state — None when there is no row —
+        or MISS when the observer's edges aren't loaded."""
+        edges = self.relationships.get(observer_id)
+        if edges is None:
+            return MISS
+        stored = edges.get(opponent_id)
+        if stored is None:
+            return None
+        state = replace(stored)
+        state.heat = project_heat(stored, now)
+        return state
+
+    def store_relationships(self, observer_id: str, edges: Dict[str, RelationshipState]) -> None:
+        self.relationships[observer_id] = edges
+
+    def note_relationship(
+        self, observer_id: str, opponent_id: str, state: RelationshipState, *, committed: bool
+    ) -> None:
+        edges = self.relationships.get(observer_id)
+        if edges is None:
+            return
+        if committed:
+            edges[opponent_id] = replace(state)
+        else:
+            del self.relationships[observer_id]
+
+    def ai_table_net(self, ai_id: str, sandbox_id: str):
+        if self.table_net is None or sandbox_id != self.sandbox_id:
+            return MISS
+        return dict(self.table_net.get(ai_id, {}))
+
+    def store_table_net(self, table_net: Dict[str, Dict[str, int]]) -> None:
+        self.table_net = table_net
+
+    def note_table_hand(
+        self, ai_id: str, table_id: str, net_delta: int, sandbox_id: str, *, committed: bool
+    ) -> None:
+        if self.table_net is None or sandbox_id != self.sandbox_id:
+            return
+        if not committed:
+            self.table_net = None
+            return
+        per_table = self.table_net.setdefault(ai_id, {})
+        per_table[table_id] = per_table.get(table_id, 0) + int(net_delta)
+
+    # --- debug verification ---
+
+    def verify(
+        self,
+        *,
+        bankroll_repo,
+        personality_repo=None,
+        relationship_repo=None,
+        stake_repo=None,
+    ) -> List[str]:
+        """Compare every non-stale entry against a fresh load from the DB.
+
+        Returns one human-readable line per mismatch (empty = coherent). Must
+        run with no snapshot bound, so the repos read the DB."""
+        fresh = load_world_snapshot(
+            sandbox_id=self.sandbox_id,
+            bankroll_repo=bankroll_repo,
+            personality_repo=personality_repo,
+            stake_repo=stake_repo,
+        )
+        problems: List[str] = []
+        columns = (
+            ("chips", self.chips_stale),
+            ("last_regen", self.chips_stale),
+            ("emotional_json", self.psych_stale),
+            ("aspiration_cooldown", self.status_stale),
+            ("bankruptcy_count", self.status_stale),
+            ("last_bankruptcy_at", self.status_stale),
+            ("knobs", self.knobs_stale),
+        )
+        common = [pid for pid in self.pids if pid in fresh.index]
+        mine = np.array([self.index[pid] for pid in common], dtype=np.intp)
+        theirs = np.array([fresh.index[pid] for pid in common], dtype=np.intp)
+        for column, stale in columns:
+            if not len(common):
+                break
+            ours = getattr(self, column)[mine]
+            db = getattr(fresh, column)[theirs]
+            for k in np.flatnonzero((ours != db) & ~stale[mine]):
+                problems.append(f"{column} {common[k]}: snapshot={ours[k]!r} db={db[k]!r}")
+        if stake_repo is not None and not self.stakes_stale and len(common):
+            for k in np.flatnonzero(self.has_active_stake[mine] != fresh.has_active_stake[theirs]):
+                problems.append(f"has_active_stake {common[k]}: snapshot differs from db")
+        if relationship_repo is not None:
+            for observer, edges in self.relationships.items():
+                db_edges = relationship_repo.load_raw_relationships_for(observer)
+                if db_edges != edges:
+                    problems.append(f"relationships {observer}: snapshot differs from db")
+            if self.table_net is not None:
+                db_net = relationship_repo.load_ai_table_net_for_sandbox(sandbox_id=self.sandbox_id)
+                if {k: v for k, v in self.table_net.items() if v} != db_net:
+                    problems.append("ai_table_net: snapshot differs from db")
+        return problems
+
+
+def load_world_snapshot(
+    *,
+    sandbox_id: str,
+    bankroll_repo,
+    personality_repo=None,
+    stake_repo=None,
+) -> WorldSnapshot:
+    """Build a sandbox's snapshot with bulk queries: bankroll rows (+ the
+    ledger-derived chips), knobs, names, and active-stake borrowers."""
+    rows = bankroll_repo.load_ai_bankroll_rows(sandbox_id=sandbox_id)
+    pids = [row["personality_id"] for row in rows]
+    knobs = bankroll_repo.load_personality_knobs_for_pids(pids)
+    names = personality_repo.display_names_by_ids(pids) if personality_repo is not None else {}
+    active = (
+        stake_repo.active_borrower_ids("personality", sandbox_id=sandbox_id)
+        if stake_repo is not None
+        else set()
+    )
+    return WorldSnapshot(
+        db_path=bankroll_repo.db_path,
+        sandbox_id=sandbox_id,
+        rows=rows,
+        knobs=knobs,
+        names=names,
+        active_borrowers=active,
+    )
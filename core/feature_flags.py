@@ -737,6 +737,16 @@ register(
         prod=False,
     )
 )
+register(
+    FeatureFlag(
+        "STATE_PATCH_FRAMES_ENABLED",
+        Stage.BETA,
+        "Send update_game_state as versioned JSON-patch deltas (game_state_patch) against the last emitted frame, with a full-frame resync on gaps (flask_app/state_delta.py). Off => every push is a full frame.",
+        owner=_FLASK_CFG,
+        dev=True,
+        prod=False,
+    )
+)
 register(
     FeatureFlag(
         "ENABLE_TEST_ROUTES",
@@ -831,6 +841,29 @@ register(
     )
 )
 
+# --- Cash mode: per-tick world snapshot (cash_mode/world_snapshot.py) ------
+_WORLD = "cash_mode.world_snapshot"
+register(
+    FeatureFlag(
+        "CASH_WORLD_SNAPSHOT_ENABLED",
+        Stage.BETA,
+        "Serve refresh_unseated_tables' per-AI bankroll/knob/psych/stake/relationship reads from a bulk-loaded per-sandbox snapshot kept coherent by write-through (off => every read hits SQLite).",
+        owner=_WORLD,
+        dev=True,
+        prod=False,
+    )
+)
+register(
+    FeatureFlag(
+        "CASH_WORLD_SNAPSHOT_VERIFY",
+        Stage.BETA,
+        "After each lobby tick, reload the world snapshot from the DB and log every column that disagrees (debug cost: one extra bulk load per tick).",
+        owner=_WORLD,
+        dev=True,
+        prod=False,
+    )
+)
+
 # --- Guest limits (poker/guest_limits.py) ---------------------------------
 # Migrated 2026-06-10 (formerly a `not is_development_mode()` derive + a local
 # `_bool_env` read that evaded the centralization guard).
@@ -4,6 +4,7 @@ from typing import Any, Callable, Dict, Optional
 
 from .client import LLMClient
 from .conversation import ConversationMemory
+from .hedging import HedgePolicy
 from .response import LLMResponse
 from .tokenizer import count_tokens
 from .tracking import CallType, UsageTracker
@@ -39,6 +40,7 @@ class Assistant:
         owner_id: Optional[str] = None,
         player_name: Optional[str] = None,
         default_timeout: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
     ):
         """Initialize assistant.
 
@@ -56,6 +58,8 @@ class Assistant:
             default_timeout: Optional per-call HTTP timeout (seconds) for every
                 chat/chat_full on this assistant. In-game player assistants set a
                 short value (PRH-18) so a stalled provider can't hang a hand.
+            hedge: Optional policy for hedging slow calls to a secondary
+                provider/model (see core.llm.hedging)
         """
         self._client = LLMClient(
             provider=provider,
@@ -63,6 +67,7 @@ class Assistant:
             reasoning_effort=reasoning_effort,
             tracker=tracker,
             default_timeout=default_timeout,
+            hedge=hedge,
         )
         self._provider = provider
         self._reasoning_effort = reasoning_effort
@@ -107,6 +112,7 @@ class Assistant:
         hand_number: Optional[int] = None,
         prompt_template: Optional[str] = None,
         capture_enricher: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        stable_context: Optional[str] = None,
     ) -> str:
         """Send message and get response. Handles memory automatically.
 
@@ -120,6 +126,8 @@ class Assistant:
             hand_number: Hand number for tracking
             prompt_template: Prompt template name for tracking
             capture_enricher: Optional callback to add domain-specific fields to capture
+            stable_context: Optional instructions that are identical across calls;
+                see chat_full()
 
         Returns:
             Assistant's response content (string)
@@ -134,6 +142,7 @@ class Assistant:
             hand_number=hand_number,
             prompt_template=prompt_template,
             capture_enricher=capture_enricher,
+            stable_context=stable_context,
         )
         return response.content
 
@@ -148,6 +157,7 @@ class Assistant:
         hand_number: Optional[int] = None,
         prompt_template: Optional[str] = None,
         capture_enricher: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        stable_context: Optional[str] = None,
     ) -> LLMResponse:
         """Like chat() but returns full LLMResponse for access to tokens, etc.
 
@@ -161,6 +171,11 @@ class Assistant:
             hand_number: Hand number for tracking
             prompt_template: Prompt template name for tracking
             capture_enricher: Optional callback to add domain-specific fields to capture
+            stable_context: Optional instructions that are identical across calls
+                (e.g. the response format). Sent appended to the system prompt
+                for this call only — never stored in memory — so it sits in
+                the prompt prefix providers cache, ahead of the history and
+                the per-call message.
 
         Returns:
             Full LLMResponse object
@@ -170,8 +185,16 @@ class Assistant:
 
         # Capture conversation metrics for tracking
         messages = self._memory.get_messages()
-        message_count = len(messages)
         system_prompt = self._memory.system_prompt
+        if stable_context:
+            system_prompt = (
+                f"{system_prompt}\n\n{stable_context}" if system_prompt else stable_context
+            )
+            if messages and messages[0]["role"] == "system":
+                messages[0] = {"role": "system", "content": system_prompt}
+            else:
+                messages.insert(0, {"role": "system", "content": system_prompt})
+        message_count = len(messages)
         system_prompt_tokens = (
             count_tokens(system_prompt, self._client.model) if system_prompt else 0
         )
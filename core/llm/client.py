@@ -1,5 +1,6 @@
 """Unified LLM client with built-in tracking."""
 
+import importlib
 import logging
 import re
 import time
@@ -7,21 +8,30 @@ from typing import Any, Callable, Dict, List, Optional
 
 from .budget import classify_shed, get_spend_gate
 from .config import AVAILABLE_PROVIDERS, DEFAULT_MAX_TOKENS
-from .providers.anthropic import AnthropicProvider
+from .hedging import HedgePolicy, run_hedged
+from .latency_sketch import latency_sketches
 from .providers.base import LLMProvider
-from .providers.deepseek import DeepSeekProvider
-from .providers.google import GoogleProvider
-from .providers.groq import GroqProvider
-from .providers.mistral import MistralProvider
-from .providers.openai import OpenAIProvider
-from .providers.pollinations import PollinationsProvider
-from .providers.runware import RunwareProvider
-from .providers.xai import XAIProvider
 from .response import ImageResponse, LLMResponse
 from .tracking import CallType, UsageTracker, capture_image_prompt, capture_prompt
 
 logger = logging.getLogger(__name__)
 
+# Provider registry - add new providers here. Maps provider name to
+# (module under core.llm.providers, class name). Modules are imported on first
+# use: the vendor SDKs (anthropic, google-genai, mistral, ...) take seconds to
+# import and most processes only ever talk to one or two providers.
+_PROVIDER_CLASSES = {
+    "openai": ("openai", "OpenAIProvider"),
+    "groq": ("groq", "GroqProvider"),
+    "anthropic": ("anthropic", "AnthropicProvider"),
+    "deepseek": ("deepseek", "DeepSeekProvider"),
+    "mistral": ("mistral", "MistralProvider"),
+    "google": ("google", "GoogleProvider"),
+    "xai": ("xai", "XAIProvider"),
+    "pollinations": ("pollinations", "PollinationsProvider"),
+    "runware": ("runware", "RunwareProvider"),
+}
+
 
 class LLMClient:
     """Low-level, stateless LLM client with usage tracking.
@@ -37,6 +47,8 @@ class LLMClient:
         reasoning_effort: str = "low",
         tracker: Optional[UsageTracker] = None,
         default_timeout: Optional[float] = None,
+        adaptive_timeout: bool = False,
+        hedge: Optional[HedgePolicy] = None,
     ):
         """Initialize LLM client.
 
@@ -49,10 +61,21 @@ class LLMClient:
                 every complete() on this client unless overridden per call. Set a
                 short value for in-game/ticker clients (PRH-18); leave None for
                 batch/experiment clients to keep the long shared-client default.
+            adaptive_timeout: When no explicit timeout is passed, derive one from
+                the recent p99 latency of this provider/model/call_type (see
+                core.llm.latency_sketch.suggested_timeout), capped at
+                default_timeout. Falls back to default_timeout until enough
+                calls have been observed.
+            hedge: Optional policy for hedging slow calls (and failing over
+                failed ones) to a secondary provider/model. Calls with a
+                tool_executor are never hedged.
         """
         self._provider = self._create_provider(provider, model, reasoning_effort)
         self._tracker = tracker or UsageTracker.get_default()
         self._default_timeout = default_timeout
+        self._adaptive_timeout = adaptive_timeout
+        self._hedge = hedge
+        self._hedge_secondary: Optional[LLMClient] = None
 
     def _create_provider(
         self,
@@ -61,26 +84,14 @@ class LLMClient:
         reasoning_effort: str,
     ) -> LLMProvider:
         """Create the appropriate provider instance."""
-        # Provider registry - add new providers here
-        provider_registry = {
-            "openai": lambda: OpenAIProvider(model=model, reasoning_effort=reasoning_effort),
-            "groq": lambda: GroqProvider(model=model, reasoning_effort=reasoning_effort),
-            "anthropic": lambda: AnthropicProvider(model=model, reasoning_effort=reasoning_effort),
-            "deepseek": lambda: DeepSeekProvider(model=model, reasoning_effort=reasoning_effort),
-            "mistral": lambda: MistralProvider(model=model, reasoning_effort=reasoning_effort),
-            "google": lambda: GoogleProvider(model=model, reasoning_effort=reasoning_effort),
-            "xai": lambda: XAIProvider(model=model, reasoning_effort=reasoning_effort),
-            "pollinations": lambda: PollinationsProvider(
-                model=model, reasoning_effort=reasoning_effort
-            ),
-            "runware": lambda: RunwareProvider(model=model, reasoning_effort=reasoning_effort),
-        }
-
-        if provider not in provider_registry:
+        if provider not in _PROVIDER_CLASSES:
             supported = ", ".join(AVAILABLE_PROVIDERS)
             raise ValueError(f"Unknown provider: {provider}. Supported: {supported}")
 
-        return provider_registry[provider]()
+        module_name, class_name = _PROVIDER_CLASSES[provider]
+        module = importlib.import_module(f"{__package__}.providers.{module_name}")
+        provider_class = getattr(module, class_name)
+        return provider_class(model=model, reasoning_effort=reasoning_effort)
 
     @property
     def model(self) -> str:
@@ -133,9 +144,110 @@ class LLMClient:
             message_count: Number of messages in conversation (for Assistant)
             system_prompt_tokens: Token count of system prompt (via tiktoken)
             capture_enricher: Optional callback to add domain-specific fields to capture
+            timeout: Per-call HTTP timeout in seconds (overrides the client's
+                default and any adaptive timeout)
 
         Returns:
-            LLMResponse with content and usage data
+            LLMResponse with content and usage data. With a hedge policy
+            this is the first successful response of primary and secondary
+            (see core.llm.hedging); both requests are tracked.
+        """
+        kwargs = dict(
+            messages=messages,
+            json_format=json_format,
+            max_tokens=max_tokens,
+            tools=tools,
+            tool_choice=tool_choice,
+            tool_executor=tool_executor,
+            max_tool_iterations=max_tool_iterations,
+            call_type=call_type,
+            game_id=game_id,
+            owner_id=owner_id,
+            player_name=player_name,
+            hand_number=hand_number,
+            prompt_template=prompt_template,
+            message_count=message_count,
+            system_prompt_tokens=system_prompt_tokens,
+            capture_enricher=capture_enricher,
+            timeout=timeout,
+        )
+        # Tool loops run executors with side effects; never run them twice.
+        secondary = self._hedge_client() if tool_executor is None else None
+        if secondary is None:
+            return self._complete_once(**kwargs)
+
+        delay = self._hedge.delay_for(
+            self._provider.provider_name,
+            self._provider.model,
+            call_type.value if call_type else None,
+        )
+        # Both legs record usage, but only the winning response is captured
+        # (and enriched): the abandoned leg finishes in the background and
+        # must not add a second capture for the same decision.
+        response = run_hedged(
+            lambda: self._complete_once(**kwargs, capture=False),
+            lambda: secondary._complete_once(**kwargs, capture=False),
+            delay,
+        )
+        self._capture(
+            response,
+            messages=messages,
+            call_type=call_type,
+            game_id=game_id,
+            owner_id=owner_id,
+            player_name=player_name,
+            hand_number=hand_number,
+            capture_enricher=capture_enricher,
+            prompt_template=prompt_template,
+        )
+        return response
+
+    def _hedge_client(self) -> Optional["LLMClient"]:
+        """The secondary client for hedged calls, created on first use."""
+        if self._hedge is None:
+            return None
+        if self._hedge_secondary is None:
+            try:
+                self._hedge_secondary = LLMClient(
+                    provider=self._hedge.provider,
+                    model=self._hedge.model,
+                    reasoning_effort=self._provider.reasoning_effort or "low",
+                    tracker=self._tracker,
+                    default_timeout=self._default_timeout,
+                )
+            except Exception as e:
+                logger.error(f"Hedge provider {self._hedge.provider} unavailable, disabling: {e}")
+                self._hedge = None
+                return None
+        return self._hedge_secondary
+
+    def _complete_once(
+        self,
+        messages: List[Dict[str, str]],
+        json_format: bool = False,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        # Tool calling support
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[str] = None,
+        tool_executor: Optional[Callable[[str, Dict[str, Any]], str]] = None,
+        max_tool_iterations: int = 5,
+        # Tracking context
+        call_type: Optional[CallType] = None,
+        game_id: Optional[str] = None,
+        owner_id: Optional[str] = None,
+        player_name: Optional[str] = None,
+        hand_number: Optional[int] = None,
+        prompt_template: Optional[str] = None,
+        message_count: Optional[int] = None,
+        system_prompt_tokens: Optional[int] = None,
+        capture_enricher: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        timeout: Optional[float] = None,
+        capture: bool = True,
+    ) -> LLMResponse:
+        """Make a single (unhedged) completion request; see complete().
+
+        ``capture=False`` records usage but skips the prompt capture, which
+        the hedged path does once for the winning response.
         """
         import json as json_module
 
@@ -176,6 +288,16 @@ class LLMClient:
         # client's default). Passed through to the provider only when set, so
         # batch/experiment callers keep the shared client's long default.
         resolved_timeout = timeout if timeout is not None else self._default_timeout
+        if timeout is None and self._adaptive_timeout:
+            suggested = latency_sketches.suggested_timeout(
+                self._provider.provider_name,
+                self._provider.model,
+                call_type.value if call_type else "unknown",
+            )
+            if suggested is not None:
+                resolved_timeout = (
+                    min(suggested, resolved_timeout) if resolved_timeout is not None else suggested
+                )
         timeout_kwargs = {"timeout": resolved_timeout} if resolved_timeout is not None else {}
 
         # Make a mutable copy of messages for tool loop
@@ -340,23 +462,49 @@ class LLMClient:
             system_prompt_tokens=system_prompt_tokens,
         )
 
-        # Capture prompt for playground (if enabled via LLM_PROMPT_CAPTURE env var)
-        if response.status == "ok" and call_type:
-            capture_prompt(
+        if capture:
+            self._capture(
+                response,
                 messages=messages,
-                response=response,
                 call_type=call_type,
                 game_id=game_id,
                 owner_id=owner_id,
                 player_name=player_name,
                 hand_number=hand_number,
-                debug_mode=False,  # Game-level debug mode handled separately
-                enricher=capture_enricher,
+                capture_enricher=capture_enricher,
                 prompt_template=prompt_template,
             )
 
         return response
 
+    @staticmethod
+    def _capture(
+        response: Optional[LLMResponse],
+        messages: List[Dict[str, str]],
+        call_type: Optional[CallType],
+        game_id: Optional[str],
+        owner_id: Optional[str],
+        player_name: Optional[str],
+        hand_number: Optional[int],
+        capture_enricher: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]],
+        prompt_template: Optional[str],
+    ) -> None:
+        """Capture prompt for playground (if enabled via LLM_PROMPT_CAPTURE env var)."""
+        if response is None or response.status != "ok" or not call_type:
+            return
+        capture_prompt(
+            messages=messages,
+            response=response,
+            call_type=call_type,
+            game_id=game_id,
+            owner_id=owner_id,
+            player_name=player_name,
+            hand_number=hand_number,
+            debug_mode=False,  # Game-level debug mode handled separately
+            enricher=capture_enricher,
+            prompt_template=prompt_template,
+        )
+
     def generate_image(
         self,
         prompt: str,
@@ -35,6 +35,16 @@ FAST_LLM_TIMEOUT_SECONDS = float(os.environ.get("LLM_FAST_TIMEOUT", "15.0"))
 # late line into the next hand. Override with LLM_COMMENTARY_TIMEOUT.
 COMMENTARY_LLM_TIMEOUT_SECONDS = float(os.environ.get("LLM_COMMENTARY_TIMEOUT", "8.0"))
 
+# Hedged in-game decisions (core.llm.hedging). When LLM_HEDGE_PROVIDER is set,
+# a player decision still running after LLM_HEDGE_DELAY seconds fires a
+# duplicate request at the secondary provider/model and the first success wins;
+# a primary that fails outright fails over to the secondary. Costs the
+# occasional duplicate call in exchange for a much shorter p99. Empty provider
+# (the default) disables hedging. LLM_HEDGE_MODEL empty = provider default.
+HEDGE_PROVIDER = os.environ.get("LLM_HEDGE_PROVIDER", "")
+HEDGE_MODEL = os.environ.get("LLM_HEDGE_MODEL", "")
+HEDGE_DELAY_SECONDS = float(os.environ.get("LLM_HEDGE_DELAY", "6.0"))
+
 # =============================================================================
 # OpenAI Configuration
 # =============================================================================
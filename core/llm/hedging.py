@@ -0,0 +1,205 @@
+"""Hedged and failover completions across two providers.
+
+A slow-but-not-failing provider used to stall an AI decision until the
+per-call timeout, after which ``ai_resilience`` fell back to rules. With a
+``HedgePolicy`` on the ``LLMClient``:
+
+1. the primary request starts as usual;
+2. if it has not finished after the call type's hedge delay, the same request
+   goes to the secondary provider/model, and the first *successful* response
+   wins;
+3. if the primary fails before the delay (error, not slowness), the secondary
+   runs immediately as a failover.
+
+Python threads cannot be interrupted, so the losing request is abandoned
+rather than aborted: it runs to completion (bounded by the client's timeout)
+in the background and its usage is still recorded — both requests show up in
+``api_usage`` with their own provider, model and cost. Only the winning
+response is written to ``prompt_captures`` (``LLMClient.complete`` captures it
+after the race). A secondary that was queued but not yet started is cancelled.
+
+The hedge delay per call type is the policy's explicit value when set,
+otherwise the primary's recent p95 from the latency sketches (so hedging
+tracks the provider's real tail), clamped to ``[min_delay_seconds,
+delay_seconds]``.
+"""
+
+import contextvars
+import logging
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeout,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from .config import HEDGE_DELAY_SECONDS, HEDGE_MODEL, HEDGE_PROVIDER
+from .latency_sketch import TIMEOUT_MIN_SAMPLES, latency_sketches
+from .response import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# Concurrent hedged requests (primary + secondary each take a slot). Abandoned
+# losers hold a slot until their own timeout, so this is sized well above the
+# number of tables deciding at once.
+_MAX_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_MAX_WORKERS, thread_name_prefix="llm-hedge"
+                )
+    return _executor
+
+
+@dataclass
+class HedgePolicy:
+    """Where and when to hedge a completion.
+
+    Attributes:
+        provider: Secondary provider name (one of ``AVAILABLE_PROVIDERS``).
+        model: Secondary model; None uses the provider's default.
+        delay_seconds: Default hedge delay, and the ceiling for observed delays.
+        call_type_delays: Fixed delays per call type value, overriding both the
+            default and the observed p95.
+        min_delay_seconds: Floor for observed delays, so a fast provider's
+            tight p95 doesn't turn every call into two.
+        use_observed_latency: Derive the delay from the primary's recent p95.
+    """
+
+    provider: str
+    model: Optional[str] = None
+    delay_seconds: float = HEDGE_DELAY_SECONDS
+    call_type_delays: Dict[str, float] = field(default_factory=dict)
+    min_delay_seconds: float = 1.0
+    use_observed_latency: bool = True
+
+    def delay_for(self, provider: str, model: str, call_type: Optional[str]) -> float:
+        """Seconds to wait on the primary before firing the secondary."""
+        if call_type in self.call_type_delays:
+            return self.call_type_delays[call_type]
+        if self.use_observed_latency:
+            recent = latency_sketches.recent(provider, model, call_type or "unknown")
+            if recent.count >= TIMEOUT_MIN_SAMPLES:
+                p95_seconds = recent.quantile(0.95) / 1000.0
+                return min(self.delay_seconds, max(self.min_delay_seconds, p95_seconds))
+        return self.delay_seconds
+
+
+def hedge_policy_from_config() -> Optional[HedgePolicy]:
+    """The deployment's hedge policy (``LLM_HEDGE_*`` env), or None when unset."""
+    if not HEDGE_PROVIDER:
+        return None
+    return HedgePolicy(provider=HEDGE_PROVIDER, model=HEDGE_MODEL or None)
+
+
+class HedgeStats:
+    """Process-wide counters for the admin latency view."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = {
+                'primary_fast': 0,  # primary succeeded before the delay
+                'hedged': 0,  # secondary fired after the delay
+                'primary_won': 0,
+                'secondary_won': 0,
+                'failover': 0,  # primary failed before the delay
+                'failover_ok': 0,
+                'all_failed': 0,
+            }
+
+    def bump(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+hedge_stats = HedgeStats()
+
+
+def _submit(fn: Callable[[], LLMResponse]) -> Future:
+    # Carry contextvars (request/owner context) into the worker thread.
+    ctx = contextvars.copy_context()
+    return _get_executor().submit(ctx.run, fn)
+
+
+def _outcome(future: Future) -> Optional[LLMResponse]:
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error(f"Hedged LLM request raised: {e}")
+        return None
+
+
+def run_hedged(
+    primary: Callable[[], LLMResponse],
+    secondary: Callable[[], LLMResponse],
+    delay_seconds: float,
+) -> LLMResponse:
+    """Run ``primary``, hedging with ``secondary`` after ``delay_seconds``.
+
+    Both callables perform (and record) a complete request and return an
+    ``LLMResponse``; a response with ``status == 'ok'`` is a success.
+
+    Returns:
+        The first successful response, else the primary's failure (or the
+        secondary's, if the primary produced none).
+    """
+    first = _submit(primary)
+    try:
+        first.result(timeout=delay_seconds)
+        primary_done = True
+    except FutureTimeout:
+        primary_done = False
+    except Exception:
+        primary_done = True
+
+    if primary_done:
+        response = _outcome(first)
+        if response is not None and response.status == "ok":
+            hedge_stats.bump('primary_fast')
+            return response
+        hedge_stats.bump('failover')
+        logger.warning("[LLM HEDGE] primary failed fast, failing over to secondary")
+        fallback = _outcome(_submit(secondary))
+        if fallback is not None and fallback.status == "ok":
+            hedge_stats.bump('failover_ok')
+            return fallback
+        hedge_stats.bump('all_failed')
+        return response or fallback
+
+    hedge_stats.bump('hedged')
+    logger.info(f"[LLM HEDGE] primary still running after {delay_seconds:.1f}s, hedging")
+    second = _submit(secondary)
+    pending = {first, second}
+    failures: Dict[Future, Optional[LLMResponse]] = {}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            response = _outcome(future)
+            if response is not None and response.status == "ok":
+                hedge_stats.bump('primary_won' if future is first else 'secondary_won')
+                for other in pending:
+                    other.cancel()  # only effective if it never started
+                return response
+            failures[future] = response
+    hedge_stats.bump('all_failed')
+    return failures.get(first) or failures.get(second)
@@ -0,0 +1,183 @@
+"""Live LLM latency histograms per provider × model × call_type.
+
+``UsageTracker.record`` feeds every completed LLM / image call into the
+process-wide ``latency_sketches`` registry. Each key keeps:
+
+- a *recent* view — one histogram per ``WINDOW_SECONDS`` window for the last
+  ``RECENT_WINDOWS`` windows, plus error counts — so a degrading provider
+  shows up in minutes rather than in the next hour's rollup;
+- a *lifetime* histogram since process start (or the last ``reset``).
+
+The histograms use the same log buckets as the persisted
+``api_usage_latency_rollups`` (``core.llm.usage_rollups.LATENCY_BOUNDS_MS``,
+ratio 1.25) and the same quantile estimate, so the live and historical views
+report comparable numbers. History lives only in those rollups, which the
+``api_usage`` triggers maintain; this module persists nothing.
+
+``suggested_timeout`` turns the recent p99 into a per-call timeout; clients
+created with ``LLMClient(adaptive_timeout=True)`` use it when no explicit
+timeout is passed.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .usage_rollups import latency_bucket, latency_quantile
+
+WINDOW_SECONDS = 60
+RECENT_WINDOWS = 15
+
+# suggested_timeout: p99 of the recent window times this headroom, never
+# below the floor, and only once the window holds enough calls to trust.
+TIMEOUT_QUANTILE = 0.99
+TIMEOUT_HEADROOM = 1.5
+TIMEOUT_FLOOR_SECONDS = 5.0
+TIMEOUT_MIN_SAMPLES = 20
+
+SketchKey = Tuple[str, str, str]
+
+
+class LatencySketch:
+    """Mergeable latency histogram (milliseconds) over the rollup buckets."""
+
+    __slots__ = ('bins', 'count', 'sum_ms', 'max_ms')
+
+    def __init__(self):
+        self.bins: Dict[int, int] = {}
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        idx = latency_bucket(ms)
+        self.bins[idx] = self.bins.get(idx, 0) + 1
+        self.count += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def merge(self, other: 'LatencySketch') -> 'LatencySketch':
+        for idx, n in other.bins.items():
+            self.bins[idx] = self.bins.get(idx, 0) + n
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Bucket upper bound at quantile ``q`` (0..1), capped at the max; None if empty."""
+        value = latency_quantile(self.bins, q)
+        return None if value is None else min(value, self.max_ms)
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean_ms': round(self.sum_ms / self.count, 1),
+            'max_ms': round(self.max_ms, 1),
+            'p50_ms': round(self.quantile(0.50), 1),
+            'p90_ms': round(self.quantile(0.90), 1),
+            'p95_ms': round(self.quantile(0.95), 1),
+            'p99_ms': round(self.quantile(0.99), 1),
+        }
+
+
+class _KeyState:
+    __slots__ = ('windows', 'lifetime', 'lifetime_errors')
+
+    def __init__(self):
+        # (window_start_epoch, sketch, error_count), oldest first.
+        self.windows: Deque[List[Any]] = deque(maxlen=RECENT_WINDOWS)
+        self.lifetime = LatencySketch()
+        self.lifetime_errors = 0
+
+
+class LatencySketchRegistry:
+    """Per-key recent + lifetime histograms for this process."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._keys: Dict[SketchKey, _KeyState] = {}
+
+    def record(
+        self, provider: str, model: str, call_type: str, latency_ms: float, ok: bool = True
+    ) -> None:
+        key = (provider, model, call_type)
+        now = self._clock()
+        window_start = now - now % WINDOW_SECONDS
+        with self._lock:
+            state = self._keys.get(key)
+            if state is None:
+                state = self._keys[key] = _KeyState()
+            if not state.windows or state.windows[-1][0] != window_start:
+                state.windows.append([window_start, LatencySketch(), 0])
+            window = state.windows[-1]
+            window[1].add(latency_ms)
+            state.lifetime.add(latency_ms)
+            if not ok:
+                window[2] += 1
+                state.lifetime_errors += 1
+
+    def _recent(self, state: _KeyState, now: float) -> Tuple[LatencySketch, int]:
+        horizon = now - WINDOW_SECONDS * RECENT_WINDOWS
+        sketch, errors = LatencySketch(), 0
+        for window_start, window, window_errors in state.windows:
+            if window_start > horizon:
+                sketch.merge(window)
+                errors += window_errors
+        return sketch, errors
+
+    def recent(self, provider: str, model: str, call_type: Optional[str] = None) -> LatencySketch:
+        """Merged recent histogram for a key (all call types when ``call_type`` is None)."""
+        now = self._clock()
+        merged = LatencySketch()
+        with self._lock:
+            for (p, m, c), state in self._keys.items():
+                if p == provider and m == model and call_type in (None, c):
+                    merged.merge(self._recent(state, now)[0])
+        return merged
+
+    def suggested_timeout(
+        self, provider: str, model: str, call_type: Optional[str] = None
+    ) -> Optional[float]:
+        """Per-call timeout in seconds from the recent p99, or None without enough data."""
+        sketch = self.recent(provider, model, call_type)
+        if sketch.count < TIMEOUT_MIN_SAMPLES:
+            return None
+        p99_ms = sketch.quantile(TIMEOUT_QUANTILE)
+        return max(TIMEOUT_FLOOR_SECONDS, p99_ms * TIMEOUT_HEADROOM / 1000.0)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Recent and lifetime summaries per key, busiest recent keys first."""
+        now = self._clock()
+        rows = []
+        with self._lock:
+            for (provider, model, call_type), state in self._keys.items():
+                recent, recent_errors = self._recent(state, now)
+                rows.append(
+                    {
+                        'provider': provider,
+                        'model': model,
+                        'call_type': call_type,
+                        'recent': {
+                            **recent.summary(),
+                            'errors': recent_errors,
+                            'window_seconds': WINDOW_SECONDS * RECENT_WINDOWS,
+                        },
+                        'lifetime': {**state.lifetime.summary(), 'errors': state.lifetime_errors},
+                    }
+                )
+        rows.sort(key=lambda r: (-r['recent']['count'], -r['lifetime']['count']))
+        return rows
+
+    def reset(self) -> None:
+        """Drop in-memory histograms."""
+        with self._lock:
+            self._keys.clear()
+
+
+latency_sketches = LatencySketchRegistry()
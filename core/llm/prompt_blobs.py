@@ -0,0 +1,191 @@
+"""Content-addressed, compressed storage for the bulky prompt-capture text.
+
+Every prompt capture used to store its full system prompt and conversation
+history inline. Both repeat heavily: one persona's system prompt is identical
+across every decision it makes in a game, and each capture's history is the
+previous capture's history plus one exchange. This module moves that text into
+``prompt_blobs`` (sha256 hash → zlib-compressed text) so each distinct
+section is stored once:
+
+- ``system_prompt`` of at least ``BLOB_MIN_CHARS`` is replaced by an empty
+  string in the row and referenced via ``system_prompt_hash``;
+- ``conversation_history`` is stored one blob per message and referenced via
+  ``conversation_history_hashes`` (a JSON list of hashes, in order).
+
+``refcount`` is the number of capture rows referencing a blob. It is maintained
+by triggers on ``prompt_captures`` (see the ``prompt_blobs`` migration), so
+every delete path — retention, per-game deletes, FK cascades — keeps it
+correct. ``collect_orphan_blobs`` removes blobs nothing references any more.
+
+Rows written before the blob store (no hashes) keep their inline text and are
+returned unchanged by ``hydrate_capture``.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Shorter system prompts (placeholders, one-line playground prompts) stay inline.
+BLOB_MIN_CHARS = 256
+
+# Decompressed-text cache size. Blobs are immutable per hash, so the cache
+# never needs invalidation; it only bounds memory.
+_CACHE_SIZE = 512
+
+_ZLIB_LEVEL = 6
+
+
+class _LRU:
+    def __init__(self, size: int):
+        self._size = size
+        self._items: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_text_cache = _LRU(_CACHE_SIZE)
+_encoded_cache = _LRU(_CACHE_SIZE)
+
+
+def blob_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _encode(text: str) -> Tuple[str, bytes]:
+    raw = text.encode('utf-8')
+    packed = zlib.compress(raw, _ZLIB_LEVEL)
+    if len(packed) < len(raw):
+        return 'zlib', packed
+    return 'raw', raw
+
+
+def _decode(codec: str, data: bytes) -> str:
+    if codec == 'zlib':
+        data = zlib.decompress(data)
+    return data.decode('utf-8')
+
+
+def put_blobs(conn: sqlite3.Connection, texts: Iterable[str]) -> List[str]:
+    """Store each text (if not already present) and return their hashes in order.
+
+    Call on the same connection and transaction as the capture INSERT that
+    references the hashes: the INSERT trigger then bumps ``refcount``, and the
+    write lock taken here keeps a concurrent ``collect_orphan_blobs`` from
+    deleting a blob between the two statements.
+    """
+    hashes: List[str] = []
+    rows = []
+    for text in texts:
+        digest = blob_hash(text)
+        hashes.append(digest)
+        encoded = _encoded_cache.get(digest)
+        if encoded is None:
+            encoded = _encode(text)
+            _encoded_cache.put(digest, encoded)
+        rows.append((digest, encoded[0], encoded[1], len(text)))
+    if rows:
+        conn.executemany(
+            "INSERT OR IGNORE INTO prompt_blobs (hash, codec, data, size) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+    return hashes
+
+
+def get_blobs(conn: sqlite3.Connection, hashes: Iterable[str]) -> Dict[str, str]:
+    """Return ``{hash: text}`` for the given hashes (missing hashes are omitted)."""
+    found: Dict[str, str] = {}
+    missing = []
+    for digest in dict.fromkeys(hashes):
+        text = _text_cache.get(digest)
+        if text is None:
+            missing.append(digest)
+        else:
+            found[digest] = text
+    if missing:
+        placeholders = ','.join('?' * len(missing))
+        cursor = conn.execute(
+            f"SELECT hash, codec, data FROM prompt_blobs WHERE hash IN ({placeholders})",
+            missing,
+        )
+        for digest, codec, data in cursor.fetchall():
+            text = _decode(codec, data)
+            _text_cache.put(digest, text)
+            found[digest] = text
+    return found
+
+
+def externalize_capture(conn: sqlite3.Connection, system_prompt, conversation_history) -> tuple:
+    """Move a capture's system prompt and history into the blob store.
+
+    Args:
+        system_prompt: The capture's system prompt text (may be None).
+        conversation_history: List of ``{role, content}`` messages (may be None).
+
+    Returns:
+        ``(system_prompt_column, system_prompt_hash, conversation_history_column,
+        conversation_history_hashes)`` — the values to write into the
+        ``prompt_captures`` row.
+    """
+    system_prompt_hash = None
+    if system_prompt and len(system_prompt) >= BLOB_MIN_CHARS:
+        system_prompt_hash = put_blobs(conn, [system_prompt])[0]
+        system_prompt = ''
+
+    history_hashes = None
+    if conversation_history:
+        history_hashes = json.dumps(
+            put_blobs(conn, [json.dumps(msg) for msg in conversation_history])
+        )
+
+    return system_prompt, system_prompt_hash, None, history_hashes
+
+
+def hydrate_capture(conn: sqlite3.Connection, capture: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore blob-stored text into a capture row dict, in place.
+
+    ``system_prompt`` and ``conversation_history`` come back exactly as the
+    inline columns would hold them (text and a JSON string respectively), so
+    callers parse them the same way for old and new rows. The hash columns
+    are dropped from the dict.
+    """
+    prompt_hash = capture.pop('system_prompt_hash', None)
+    history_json = capture.pop('conversation_history_hashes', None)
+    history_hashes = json.loads(history_json) if history_json else []
+    wanted = history_hashes + ([prompt_hash] if prompt_hash else [])
+    if not wanted:
+        return capture
+
+    texts = get_blobs(conn, wanted)
+    if prompt_hash and prompt_hash in texts:
+        capture['system_prompt'] = texts[prompt_hash]
+    if history_hashes:
+        capture['conversation_history'] = json.dumps(
+            [json.loads(texts[h]) for h in history_hashes if h in texts]
+        )
+    return capture
+
+
+def collect_orphan_blobs(conn: sqlite3.Connection) -> int:
+    """Delete blobs no capture row references. Returns the number deleted."""
+    return conn.execute("DELETE FROM prompt_blobs WHERE refcount <= 0").rowcount
@@ -1,15 +1,32 @@
-"""LLM provider implementations."""
+"""LLM provider implementations.
+
+Provider classes are resolved lazily (PEP 562) so importing this package does
+not pull in every vendor SDK; ``from core.llm.providers import X`` still works.
+"""
+
+import importlib
 
-from .anthropic import AnthropicProvider
 from .base import LLMProvider
-from .deepseek import DeepSeekProvider
-from .google import GoogleProvider
-from .groq import GroqProvider
-from .mistral import MistralProvider
-from .openai import OpenAIProvider
-from .pollinations import PollinationsProvider
-from .runware import RunwareProvider
-from .xai import XAIProvider
+
+_LAZY_PROVIDERS = {
+    "OpenAIProvider": "openai",
+    "GroqProvider": "groq",
+    "AnthropicProvider": "anthropic",
+    "DeepSeekProvider": "deepseek",
+    "MistralProvider": "mistral",
+    "GoogleProvider": "google",
+    "XAIProvider": "xai",
+    "PollinationsProvider": "pollinations",
+    "RunwareProvider": "runware",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+
 
 __all__ = [
     "LLMProvider",
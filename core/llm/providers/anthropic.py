@@ -143,7 +143,17 @@ class AnthropicProvider(LLMProvider):
         }
 
         if system_prompt:
-            kwargs["system"] = system_prompt
+            # Prompt caching: the system prompt (persona + fixed instructions)
+            # is the stable prefix of every call, so mark it as a cache
+            # breakpoint. Prefixes under the model's minimum cacheable length
+            # are simply not cached.
+            kwargs["system"] = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
 
         # Add extended thinking if configured
         if self._thinking_budget:
@@ -208,10 +218,16 @@ class AnthropicProvider(LLMProvider):
         # output_tokens AND reasoning_tokens separately, so report output NET of
         # thinking to avoid double-counting the thinking portion (mirrors the
         # OpenAI provider, which subtracts reasoning from completion_tokens).
+        # Anthropic's `input_tokens` EXCLUDES prompt-cache reads and writes.
+        # Tracking treats input_tokens as the full prompt and cached_tokens as
+        # the cached part of it (as OpenAI reports), so add them back. Cache
+        # writes are billed as plain input here (Anthropic charges 1.25x).
+        cache_read = getattr(usage, 'cache_read_input_tokens', 0) or 0
+        cache_write = getattr(usage, 'cache_creation_input_tokens', 0) or 0
         return {
-            "input_tokens": usage.input_tokens,
+            "input_tokens": usage.input_tokens + cache_read + cache_write,
             "output_tokens": max(0, usage.output_tokens - thinking_tokens),
-            "cached_tokens": getattr(usage, 'cache_read_input_tokens', 0) or 0,
+            "cached_tokens": cache_read,
             "reasoning_tokens": thinking_tokens,
         }
 
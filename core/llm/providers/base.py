@@ -1,5 +1,6 @@
 """Abstract base class for LLM providers."""
 
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -60,6 +61,22 @@ class LLMProvider(ABC):
         """
         ...
 
+    @staticmethod
+    def prompt_cache_key(messages: List[Dict[str, Any]]) -> Optional[str]:
+        """A short stable key for the request's cacheable prefix.
+
+        Derived from the leading system message (persona + fixed
+        instructions). Providers that route prompt caches by a client-supplied
+        key use it so calls sharing a prefix land on the same cache; None when
+        there is no system message.
+        """
+        if not messages or messages[0].get("role") != "system":
+            return None
+        content = messages[0].get("content") or ""
+        if not isinstance(content, str) or not content:
+            return None
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
     @abstractmethod
     def generate_image(
         self,
@@ -123,6 +123,11 @@ class DeepSeekProvider(LLMProvider):
         Tool calling is supported for deepseek-chat. If tools are provided when
         using deepseek-reasoner, we automatically switch to deepseek-chat with
         thinking mode enabled to get both reasoning and tool support.
+
+        DeepSeek caches prompt prefixes automatically (reported as
+        ``prompt_cache_hit_tokens``); there is no request-side hint, so cache
+        hits depend on callers keeping stable content first (see
+        ``Assistant.chat_full(stable_context=...)``).
         """
         # Determine actual model to use
         # If tools requested but using reasoner (which doesn't support tools),
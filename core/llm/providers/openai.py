@@ -112,6 +112,13 @@ class OpenAIProvider(LLMProvider):
             # Legacy models (shouldn't be used, but handle gracefully)
             kwargs["temperature"] = 1.0
 
+        # Prompt caching is automatic for prefixes of 1024+ tokens; the cache
+        # key keeps calls sharing a system prompt on the same cache shard.
+        # Sent via extra_body so older SDKs without the parameter still work.
+        cache_key = self.prompt_cache_key(messages)
+        if cache_key:
+            kwargs["extra_body"] = {"prompt_cache_key": cache_key}
+
         # PRH-18: per-call timeout override (the OpenAI SDK accepts it on
         # create()); short for in-game/ticker calls so a stall fails fast.
         if timeout is not None:
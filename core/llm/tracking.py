@@ -11,7 +11,10 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .capture_config import should_capture_prompt
+from .latency_sketch import latency_sketches
+from .prompt_blobs import externalize_capture
 from .response import ImageResponse, LLMResponse
+from .usage_rollups import rollups_available, window_spend
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +125,7 @@ class UsageTracker:
         # is part of the key so two different windows can't alias each other.
         self._spend_cache: Dict[Tuple[Optional[str], int], Tuple[float, float]] = {}
         self._spend_cache_lock = threading.Lock()
+        self._rollups_ready = False
 
     @classmethod
     def get_default(cls) -> "UsageTracker":
@@ -181,6 +185,19 @@ class UsageTracker:
         # Always log (backwards compat with existing log analysis)
         self._log_stats(response, call_type)
 
+        # Live latency histograms. Spend-gate refusals never reached a provider.
+        if response.error_code != "budget_exceeded":
+            try:
+                latency_sketches.record(
+                    response.provider,
+                    response.model,
+                    call_type.value if call_type else "unknown",
+                    float(response.latency_ms),
+                    ok=response.status == "ok",
+                )
+            except Exception as e:
+                logger.debug(f"Failed to record latency sketch: {e}")
+
         # Persist to database
         try:
             estimated_cost = self._insert_usage(
@@ -300,21 +317,29 @@ class UsageTracker:
         return total
 
     def _query_recent_spend(self, owner_id: Optional[str], window_hours: int) -> float:
-        """Run the rolling-window SUM(estimated_cost) query. Fails open (0.0)."""
-        cutoff = (datetime.now(timezone.utc) - timedelta(hours=window_hours)).isoformat()
+        """Sum cost over the rolling window. Fails open (0.0).
+
+        Reads the hourly/daily rollups (``core.llm.usage_rollups``) so the cost
+        is O(buckets), not O(calls); a database without the rollup migration
+        falls back to summing raw rows.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=window_hours)
         try:
             with sqlite3.connect(self.db_path) as conn:
+                if self._rollups_ready or rollups_available(conn):
+                    self._rollups_ready = True
+                    return window_spend(conn, cutoff.strftime('%Y-%m-%d %H:%M:%S'), owner_id)
                 if owner_id is None:
                     row = conn.execute(
                         "SELECT COALESCE(SUM(estimated_cost), 0) FROM api_usage "
                         "WHERE created_at >= ?",
-                        (cutoff,),
+                        (cutoff.isoformat(),),
                     ).fetchone()
                 else:
                     row = conn.execute(
                         "SELECT COALESCE(SUM(estimated_cost), 0) FROM api_usage "
                         "WHERE created_at >= ? AND owner_id = ?",
-                        (cutoff, owner_id),
+                        (cutoff.isoformat(), owner_id),
                     ).fetchone()
             return float(row[0]) if row and row[0] is not None else 0.0
         except Exception as e:
@@ -358,6 +383,9 @@ class UsageTracker:
     def prune_old_usage(self, retention_days: int) -> int:
         """Delete api_usage rows older than ``retention_days`` (PRH-32).
 
+        The hourly/daily rollups are kept, so cost analytics still covers the
+        pruned period at bucket granularity.
+
         0 or negative = keep everything (no-op). Compares against an ISO cutoff
         string, matching how ``created_at`` is written (UTC isoformat) and how
         ``find_recent_null_cost_combos`` reads it. Fails open (logs, returns 0)
@@ -512,7 +540,11 @@ class UsageTracker:
         message_count: Optional[int],
         system_prompt_tokens: Optional[int],
     ) -> Optional[float]:
-        """Insert usage record into database. Returns the estimated cost (USD)."""
+        """Insert usage record into database. Returns the estimated cost (USD).
+
+        The api_usage triggers fold the row into the hourly/daily rollups in
+        the same transaction.
+        """
         is_image = isinstance(response, ImageResponse)
 
         with sqlite3.connect(self.db_path) as conn:
@@ -703,12 +735,19 @@ def capture_prompt(
         metadata_json = json.dumps(extra, default=str) if extra else None
 
         with sqlite3.connect(db_path) as conn:
+            # System prompt + history go to the deduplicated blob store.
+            system_prompt, system_prompt_hash, history, history_hashes = externalize_capture(
+                conn,
+                capture_data.get('system_prompt'),
+                capture_data.get('conversation_history'),
+            )
             conn.execute(
                 """
                 INSERT INTO prompt_captures (
                     game_id, owner_id, player_name, hand_number, phase, call_type,
                     system_prompt, user_message, ai_response,
                     conversation_history, raw_api_response,
+                    system_prompt_hash, conversation_history_hashes,
                     provider, model, reasoning_effort,
                     latency_ms, input_tokens, output_tokens,
                     original_request_id,
@@ -718,7 +757,7 @@ def capture_prompt(
                     parent_id, error_type, error_description, correction_attempt,
                     prompt_template,
                     metadata_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
                 (
                     capture_data.get('game_id'),
@@ -727,15 +766,15 @@ def capture_prompt(
                     capture_data.get('hand_number'),
                     capture_data.get('phase'),
                     capture_data.get('call_type'),
-                    capture_data.get('system_prompt'),
+                    system_prompt,
                     capture_data.get('user_message'),
                     capture_data.get('ai_response'),
-                    json.dumps(capture_data.get('conversation_history'))
-                    if capture_data.get('conversation_history')
-                    else None,
+                    history,
                     json.dumps(capture_data.get('raw_api_response'), default=str)
                     if capture_data.get('raw_api_response')
                     else None,
+                    system_prompt_hash,
+                    history_hashes,
                     capture_data.get('provider'),
                     capture_data.get('model'),
                     capture_data.get('reasoning_effort'),
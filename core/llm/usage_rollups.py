@@ -0,0 +1,287 @@
+"""Hourly and daily rollups of ``api_usage`` for cost analytics and the spend gate.
+
+Every dashboard query and every spend-gate refresh used to aggregate raw
+``api_usage`` rows, so their cost grew with call volume. Two tables, created
+and back-filled by the ``api_usage_rollups`` migration, hold the same numbers
+pre-aggregated:
+
+- ``api_usage_rollups`` — one row per (bucket, bucket_start, owner_id,
+  provider, model, call_type) with calls, error / uncosted counts, cost,
+  token totals and latency sum / max. ``bucket`` is ``'hour'`` or ``'day'``;
+  ``bucket_start`` is a UTC ``'YYYY-MM-DD HH:00:00'`` string; a NULL owner is
+  stored as ``''``.
+- ``api_usage_latency_rollups`` — a log-bucketed latency histogram per
+  (bucket, bucket_start, provider, model, call_type), bucket ``i`` counting
+  calls with ``LATENCY_BOUNDS_MS[i-1] < latency_ms <= LATENCY_BOUNDS_MS[i]``.
+
+Both are maintained by triggers on ``api_usage`` (insert, plus cost/token
+corrections such as ``scripts/reconcile_api_usage_costs.py``), so
+``UsageTracker._insert_usage`` and every other writer update them in the same
+statement. They are deliberately *not* decremented on delete: retention
+pruning of raw rows keeps the aggregated history. ``rebuild_rollups``
+re-derives a range from the raw rows.
+
+Rolling windows are read exactly: whole days from the daily rows, whole hours
+from the hourly rows, and only the leading partial hour from ``api_usage``
+itself (see ``window_source``), so a query touches O(days + 24) rollup rows
+plus at most an hour of raw rows.
+"""
+
+import bisect
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+ROLLUP_TABLE = 'api_usage_rollups'
+LATENCY_TABLE = 'api_usage_latency_rollups'
+
+BUCKET_FORMATS = {
+    'hour': '%Y-%m-%d %H:00:00',
+    'day': '%Y-%m-%d 00:00:00',
+}
+
+# Latency histogram upper bounds in milliseconds: 1 ms .. ~21 min, ratio 1.25
+# (quantiles accurate to one bucket, ~25% relative). Mirrored by the
+# api_usage_latency_bounds table the triggers bucket against.
+LATENCY_BOUNDS_MS: List[float] = [1.25**i for i in range(64)]
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_ROLLUP_KEY = "owner_id, provider, model, call_type"
+_ROLLUP_VALUES = (
+    "calls, error_calls, uncosted_calls, cost, input_tokens, output_tokens, "
+    "cached_tokens, reasoning_tokens, image_count, latency_calls, latency_sum_ms"
+)
+_RAW_KEY = "COALESCE(owner_id, ''), provider, model, call_type"
+_RAW_VALUES = (
+    "1, status = 'error', status != 'error' AND estimated_cost IS NULL, "
+    "COALESCE(estimated_cost, 0), COALESCE(input_tokens, 0), COALESCE(output_tokens, 0), "
+    "COALESCE(cached_tokens, 0), COALESCE(reasoning_tokens, 0), COALESCE(image_count, 0), "
+    "latency_ms IS NOT NULL, COALESCE(latency_ms, 0)"
+)
+
+
+def latency_bucket(latency_ms: float) -> int:
+    """Histogram bucket index for a latency (the trigger's COUNT of smaller bounds)."""
+    return bisect.bisect_left(LATENCY_BOUNDS_MS, latency_ms)
+
+
+def latency_quantile(counts: Dict[int, int], q: float) -> Optional[float]:
+    """Estimate the ``q`` quantile from ``{bucket index: count}`` (bucket upper bound)."""
+    total = sum(counts.values())
+    if not total:
+        return None
+    target = q * total
+    seen = 0
+    for idx in sorted(counts):
+        seen += counts[idx]
+        if seen >= target:
+            return LATENCY_BOUNDS_MS[min(idx, len(LATENCY_BOUNDS_MS) - 1)]
+    return LATENCY_BOUNDS_MS[-1]
+
+
+def rollups_available(conn: sqlite3.Connection) -> bool:
+    """True once the rollup migration has run on this database."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (ROLLUP_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def window_edges(cutoff: str) -> Tuple[str, str]:
+    """First whole hour and first whole day at or after ``cutoff``.
+
+    ``cutoff`` is a UTC ``'YYYY-MM-DD HH:MM:SS'`` string (what SQLite's
+    ``datetime()`` returns). The edges are exclusive of the partial bucket the
+    cutoff falls in, so ``[cutoff, hour_edge)`` is the only span that has to
+    come from raw rows.
+    """
+    start = datetime.strptime(cutoff[:19], _TIMESTAMP_FORMAT)
+    hour_edge = start.replace(minute=0, second=0) + timedelta(hours=1)
+    day_edge = start.replace(hour=0, minute=0, second=0) + timedelta(days=1)
+    return hour_edge.strftime(_TIMESTAMP_FORMAT), day_edge.strftime(_TIMESTAMP_FORMAT)
+
+
+def _raw_range(start: str, end: str) -> Tuple[str, List[str]]:
+    """``created_at`` in ``[start, end)`` for both stored timestamp formats.
+
+    ``UsageTracker`` writes ``isoformat()`` (``'T'`` separator, UTC offset);
+    rows defaulted by SQLite use a space. Comparing each format against its own
+    bounds keeps the range exact and lets both halves use the created_at index.
+    Each half also checks the separator: across a date boundary a row of the
+    other format can sort inside its bounds.
+    """
+    t_start, t_end = start.replace(' ', 'T'), end.replace(' ', 'T')
+    clause = (
+        "((created_at >= ? AND created_at < ? AND substr(created_at, 11, 1) != 'T')"
+        " OR (created_at >= ? AND created_at < ? AND substr(created_at, 11, 1) = 'T'))"
+    )
+    return clause, [start, end, t_start, t_end]
+
+
+def window_source(cutoff: str, granularity: str = 'day') -> Tuple[str, List[str]]:
+    """A UNION ALL over rollup and raw rows covering ``[cutoff, now]`` exactly.
+
+    Every row exposes ``owner_id`` ('' for system calls), ``provider``,
+    ``model``, ``call_type``, ``period`` (bucket start, or the row's own
+    timestamp for raw rows) and the additive columns ``calls, error_calls,
+    uncosted_calls, cost, input_tokens, output_tokens, cached_tokens,
+    reasoning_tokens, image_count, latency_calls, latency_sum_ms``.
+
+    Args:
+        cutoff: Window start, UTC ``'YYYY-MM-DD HH:MM:SS'``.
+        granularity: ``'day'`` reads whole days from the daily rollups;
+            ``'hour'`` reads only hourly rows, for per-hour grouping.
+
+    Returns:
+        ``(sql, params)`` — wrap the SQL as a derived table.
+    """
+    hour_edge, day_edge = window_edges(cutoff)
+    raw_clause, raw_params = _raw_range(cutoff, hour_edge)
+    rollup_select = (
+        f"SELECT {_ROLLUP_KEY}, bucket_start AS period, {_ROLLUP_VALUES} FROM {ROLLUP_TABLE}"
+    )
+    parts = []
+    params: List[str] = []
+    if granularity == 'hour':
+        parts.append(f"{rollup_select} WHERE bucket = 'hour' AND bucket_start >= ?")
+        params.append(hour_edge)
+    else:
+        parts.append(f"{rollup_select} WHERE bucket = 'day' AND bucket_start >= ?")
+        parts.append(
+            f"{rollup_select} WHERE bucket = 'hour' AND bucket_start >= ? AND bucket_start < ?"
+        )
+        params.extend([day_edge, hour_edge, day_edge])
+    parts.append(
+        f"SELECT {_RAW_KEY}, datetime(created_at) AS period, {_RAW_VALUES} "
+        f"FROM api_usage WHERE {raw_clause}"
+    )
+    params.extend(raw_params)
+    return " UNION ALL ".join(parts), params
+
+
+def latency_window_source(cutoff: str) -> Tuple[str, List[str]]:
+    """Like ``window_source`` for the latency histogram.
+
+    Rows expose ``provider, model, call_type, latency_bucket, count``.
+    """
+    hour_edge, day_edge = window_edges(cutoff)
+    raw_clause, raw_params = _raw_range(cutoff, hour_edge)
+    select = f"SELECT provider, model, call_type, latency_bucket, count FROM {LATENCY_TABLE}"
+    sql = (
+        f"{select} WHERE bucket = 'day' AND bucket_start >= ? "
+        f"UNION ALL {select} WHERE bucket = 'hour' AND bucket_start >= ? AND bucket_start < ? "
+        "UNION ALL SELECT provider, model, call_type, "
+        "(SELECT COUNT(*) FROM api_usage_latency_bounds b WHERE b.upper_ms < latency_ms), 1 "
+        f"FROM api_usage WHERE latency_ms IS NOT NULL AND {raw_clause}"
+    )
+    return sql, [day_edge, hour_edge, day_edge, *raw_params]
+
+
+def window_spend(conn: sqlite3.Connection, cutoff: str, owner_id: Optional[str] = None) -> float:
+    """Summed cost since ``cutoff``, optionally for one owner (the spend-gate read)."""
+    source, params = window_source(cutoff)
+    owner_clause = ""
+    if owner_id is not None:
+        owner_clause = " WHERE owner_id = ?"
+        params.append(owner_id)
+    row = conn.execute(
+        f"SELECT COALESCE(SUM(cost), 0) FROM ({source}){owner_clause}", params
+    ).fetchone()
+    return float(row[0]) if row and row[0] is not None else 0.0
+
+
+def reassign_owner(conn: sqlite3.Connection, from_id: str, to_id: str) -> None:
+    """Merge ``from_id``'s rollup rows into ``to_id`` (guest → account transfer).
+
+    Call alongside ``UPDATE api_usage SET owner_id`` — the triggers do not track
+    owner changes, and the rollups may hold history already pruned from the
+    raw table.
+    """
+    if from_id == to_id:
+        return
+    conn.execute(
+        f"""
+        INSERT INTO {ROLLUP_TABLE} (
+            bucket, bucket_start, {_ROLLUP_KEY}, {_ROLLUP_VALUES}, latency_max_ms
+        )
+        SELECT bucket, bucket_start, ?, provider, model, call_type,
+               {_ROLLUP_VALUES}, latency_max_ms
+        FROM {ROLLUP_TABLE}
+        WHERE owner_id = ?
+        ON CONFLICT (bucket, bucket_start, owner_id, provider, model, call_type) DO UPDATE SET
+            calls = calls + excluded.calls,
+            error_calls = error_calls + excluded.error_calls,
+            uncosted_calls = uncosted_calls + excluded.uncosted_calls,
+            cost = cost + excluded.cost,
+            input_tokens = input_tokens + excluded.input_tokens,
+            output_tokens = output_tokens + excluded.output_tokens,
+            cached_tokens = cached_tokens + excluded.cached_tokens,
+            reasoning_tokens = reasoning_tokens + excluded.reasoning_tokens,
+            image_count = image_count + excluded.image_count,
+            latency_calls = latency_calls + excluded.latency_calls,
+            latency_sum_ms = latency_sum_ms + excluded.latency_sum_ms,
+            latency_max_ms = MAX(
+                COALESCE(latency_max_ms, excluded.latency_max_ms),
+                COALESCE(excluded.latency_max_ms, latency_max_ms)
+            )
+        """,
+        (to_id, from_id),
+    )
+    conn.execute(f"DELETE FROM {ROLLUP_TABLE} WHERE owner_id = ?", (from_id,))
+
+
+def rebuild_rollups(conn: sqlite3.Connection, since_day: Optional[str] = None) -> int:
+    """Re-derive both rollup tables from raw ``api_usage`` rows.
+
+    Args:
+        since_day: ``'YYYY-MM-DD'``; only buckets from that day on are
+            replaced. ``None`` rebuilds everything — which drops any history
+            whose raw rows retention has already pruned, so prefer a date.
+
+    Returns:
+        Number of raw rows aggregated.
+    """
+    bucket_clause, raw_clause, params = "", "", []
+    if since_day is not None:
+        bucket_clause = " WHERE bucket_start >= ?"
+        raw_clause = " WHERE created_at >= ?"
+        params = [since_day]
+    conn.execute(f"DELETE FROM {ROLLUP_TABLE}{bucket_clause}", params)
+    conn.execute(f"DELETE FROM {LATENCY_TABLE}{bucket_clause}", params)
+    for bucket, fmt in BUCKET_FORMATS.items():
+        period = f"COALESCE(strftime('{fmt}', created_at), strftime('{fmt}', 'now'))"
+        conn.execute(
+            f"""
+            INSERT INTO {ROLLUP_TABLE} (
+                bucket, bucket_start, {_ROLLUP_KEY}, {_ROLLUP_VALUES}, latency_max_ms
+            )
+            SELECT '{bucket}', {period} AS period, {_RAW_KEY},
+                   COUNT(*), SUM(status = 'error'),
+                   SUM(status != 'error' AND estimated_cost IS NULL),
+                   COALESCE(SUM(estimated_cost), 0), COALESCE(SUM(input_tokens), 0),
+                   COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cached_tokens), 0),
+                   COALESCE(SUM(reasoning_tokens), 0), COALESCE(SUM(image_count), 0),
+                   COUNT(latency_ms), COALESCE(SUM(latency_ms), 0), MAX(latency_ms)
+            FROM api_usage{raw_clause}
+            GROUP BY period, {_RAW_KEY}
+            """,
+            params,
+        )
+        latency_clause = " AND created_at >= ?" if since_day is not None else ""
+        conn.execute(
+            f"""
+            INSERT INTO {LATENCY_TABLE} (
+                bucket, bucket_start, provider, model, call_type, latency_bucket, count
+            )
+            SELECT '{bucket}', {period} AS period, provider, model, call_type,
+                   (SELECT COUNT(*) FROM api_usage_latency_bounds b
+                    WHERE b.upper_ms < a.latency_ms) AS lb,
+                   COUNT(*)
+            FROM api_usage a
+            WHERE latency_ms IS NOT NULL{latency_clause}
+            GROUP BY period, provider, model, call_type, lb
+            """,
+            params,
+        )
+    return conn.execute(f"SELECT COUNT(*) FROM api_usage{raw_clause}", params).fetchone()[0]
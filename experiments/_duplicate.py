@@ -0,0 +1,46 @@
+"""Duplicate-deal (seat-mirrored) variance reduction for the sim harnesses.
+
+Card luck dominates the variance of a bb/100 comparison: most of the spread in
+per-hand results is who was dealt the better hand, not who played it better.
+Duplicate poker removes it by replaying every seeded deck once per seating,
+rotating the players through the seats while the deck and the button stay put.
+Every player then holds every seat's cards in that seat's position exactly once
+per deal, and the deal's luck cancels out of the group's total.
+
+The harnesses already make a deal reproducible — ``create_deck(random_seed=
+hand_seed)`` plus ``sm.current_hand_seed = hand_seed`` and a per-hand
+``random.seed(hand_seed)`` — so a mirrored replay is just the same hand setup
+with the player list rotated. Heads-up, the single rotation is the seat swap.
+
+Each deal group yields ONE paired observation: the hero's mean delta across the
+group's seatings (heads-up, that is half the paired difference "hero's result
+with these cards minus the opponent's result with the same cards"). Feed those
+into ``compute_stats`` / ``SequentialTest`` in place of raw per-hand deltas —
+the mean is unchanged (the group mean of an unbiased per-hand estimate) and the
+variance drops because the deal term cancels. The observations are
+independent across deals, so the usual CI machinery stays valid.
+"""
+
+from typing import List, Sequence
+
+
+def duplicate_seatings(names: Sequence[str], duplicate: bool) -> List[List[str]]:
+    """Seat orders to replay one deal under.
+
+    ``duplicate=False`` → just the original order (one hand per deal).
+    ``duplicate=True`` → every rotation of the ring, starting with the original
+    (heads-up: ``[A, B]`` then ``[B, A]``). Rotating keeps each player's
+    neighbours, so relative position-vs-opponent effects stay as in the
+    original deal; only the cards/seat each player receives move.
+    """
+    order = list(names)
+    if not duplicate:
+        return [order]
+    return [order[-k:] + order[:-k] if k else order for k in range(len(order))]
+
+
+def paired_observation(group_deltas: Sequence[float]) -> float:
+    """One deal group's paired observation: the hero's mean delta across seatings."""
+    if not group_deltas:
+        raise ValueError("a deal group needs at least one seating")
+    return sum(group_deltas) / len(group_deltas)
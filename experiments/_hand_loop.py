@@ -94,6 +94,7 @@ def drive_hand(
     post_action: Optional[Callable] = None,
     max_actions: int = MAX_ACTIONS_PER_HAND,
     on_max_actions: Optional[Callable[[], None]] = None,
+    on_run_it_out: Optional[Callable] = None,
 ) -> Dict[str, int]:
     """Drive one complete hand to completion, returning {name: final_stack}.
 
@@ -121,6 +122,12 @@ def drive_hand(
           bookkeeping is applied by the skeleton itself (it was identical in
           both copies); post_action runs after that bookkeeping.
 
+      on_run_it_out(gs)
+          Called once, with the game state at the moment the hand first goes
+          to an all-in runout (before any remaining board card is dealt). The
+          sequential A/B mode snapshots it for the all-in EV adjustment (see
+          experiments/_sequential.allin_ev_deltas).
+
     ``hero_controller`` drives the ``_sim_*`` bookkeeping (reset at hand start +
     accepted-action updates). When None, the hero fields aren't touched (matches
     a None hero in the originals). Pass the controller resolved from hero_name.
@@ -130,6 +137,7 @@ def drive_hand(
 
     reset_hero_sim_state(hero_controller)
     sim_current_street: Optional[str] = None
+    run_it_out_seen = False
 
     while sm.phase not in TERMINAL_PHASES:
         sm.run_until(list(TERMINAL_PHASES))
@@ -140,6 +148,9 @@ def drive_hand(
         gs = sm.game_state
 
         if gs.run_it_out:
+            if on_run_it_out is not None and not run_it_out_seen:
+                on_run_it_out(gs)
+            run_it_out_seen = True
             _run_it_out_advance(sm)
             continue
 
@@ -0,0 +1,277 @@
+"""Early-stopping sequential analysis + variance-reduced estimators for bb/100 A/Bs.
+
+`simulate_bb100` and `champion_challenger` used to run a fixed ``--hands``
+count even when one arm was already CI-clear better after a fraction of it, or
+when the comparison was so noisy that the remaining hands could never resolve
+it. This module lets a hand loop stream its per-hand results in blocks and stop
+as soon as the question is answered.
+
+Two pieces:
+
+  - ``SequentialTest`` — a group-sequential test on the running mean bb/100.
+    The loop calls ``add(delta)`` per observation; at every block boundary
+    ("look") the test checks the running confidence interval and returns a
+    ``SequentialResult`` once it can stop. The per-look z critical value is
+    Bonferroni-split across the planned number of looks
+    (``ceil(max_hands / block_size)``), so repeatedly peeking does NOT inflate
+    the false-positive rate past ``alpha`` — the classic optional-stopping bug
+    a naive "stop when the 95% CI clears 0" loop has. Conservative, but valid
+    and dependency-free.
+
+  - ``allin_ev_deltas`` — the all-in EV adjustment. When a hand is all-in
+    before the river with exactly two live players, the realized result is
+    replaced by its expectation over the remaining runout (equity x main pot
+    minus the matched contribution). The runout luck is pure noise with respect
+    to the decisions under test, so removing it shrinks per-hand variance
+    without biasing the mean. Multi-way / side-pot-with-dead-excess all-ins
+    keep their realized result (rare, and the exact split is not worth the
+    complexity here).
+
+Seat/deck-mirrored duplicate hands are the other big variance lever; they feed
+this test as paired observations (one observation per mirrored deal group).
+"""
+
+import itertools
+import math
+import random
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, List, Mapping, Optional
+
+try:
+    import eval7
+
+    EVAL7_AVAILABLE = True
+except ImportError:
+    EVAL7_AVAILABLE = False
+    eval7 = None
+
+# Stop reasons. `max_hands` is the only non-early stop.
+STOP_POSITIVE = 'positive'
+STOP_NEGATIVE = 'negative'
+STOP_FUTILE = 'futile'
+STOP_MAX_HANDS = 'max_hands'
+
+# Above this many unseen-board combinations (i.e. preflop all-ins) the runout
+# equity is Monte Carlo'd instead of enumerated exactly.
+_EXACT_RUNOUT_LIMIT = 50_000
+_MC_RUNOUTS = 3000
+
+
+@dataclass
+class SequentialResult:
+    """Outcome of a sequential test (at stop, or a progress snapshot)."""
+
+    reason: Optional[str]  # one of the STOP_* constants, None while running
+    n: int
+    bb100: float
+    ci_lo: float
+    ci_hi: float
+    looks: int
+    z: float  # per-look critical value the CI was built with
+
+
+class SequentialTest:
+    """Group-sequential stopping rule on the running mean bb/100.
+
+    ``add(x)`` takes one observation in chips (a per-hand delta, or a paired
+    sum over a mirrored deal group). Every ``block_size`` observations is a
+    look; at a look the test stops when:
+
+      - the CI clears 0 (``positive`` / ``negative``) — a decisive winner; or
+      - ``futility_bb100`` is set and the whole CI sits inside
+        ±futility_bb100 — any remaining effect is too small to matter; or
+      - ``max_hands`` observations have been seen.
+
+    ``min_hands`` suppresses stopping on the very first looks, where the
+    variance estimate itself is still unreliable.
+    """
+
+    def __init__(
+        self,
+        big_blind: int,
+        max_hands: int,
+        block_size: int = 200,
+        alpha: float = 0.05,
+        futility_bb100: Optional[float] = None,
+        min_hands: int = 0,
+    ):
+        if block_size <= 0:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha must be in (0, 1), got {alpha}")
+        self.big_blind = big_blind
+        self.max_hands = max_hands
+        self.block_size = block_size
+        self.alpha = alpha
+        self.futility_bb100 = futility_bb100
+        self.min_hands = min_hands
+        self.planned_looks = max(1, math.ceil(max_hands / block_size))
+        # Bonferroni spend: alpha/K per look, two-sided.
+        self.z = NormalDist().inv_cdf(1 - alpha / (2 * self.planned_looks))
+        self.looks = 0
+        self.result: Optional[SequentialResult] = None
+        # Welford running mean / M2 — O(1) memory regardless of run length.
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def stopped(self) -> bool:
+        return self.result is not None
+
+    def snapshot(self, reason: Optional[str] = None) -> SequentialResult:
+        """Current running estimate with the sequential (look-adjusted) CI."""
+        n = self._n
+        if n == 0:
+            return SequentialResult(reason, 0, 0.0, 0.0, 0.0, self.looks, self.z)
+        variance = self._m2 / max(n - 1, 1)
+        stderr = math.sqrt(variance / n)
+        bb100 = (self._mean / self.big_blind) * 100
+        margin = self.z * (stderr / self.big_blind) * 100
+        return SequentialResult(
+            reason, n, bb100, bb100 - margin, bb100 + margin, self.looks, self.z
+        )
+
+    def add(self, x: float) -> Optional[SequentialResult]:
+        """Record one observation; returns the final result once stopped."""
+        if self.result is not None:
+            return self.result
+        self._n += 1
+        d = x - self._mean
+        self._mean += d / self._n
+        self._m2 += d * (x - self._mean)
+
+        final_look = self._n >= self.max_hands
+        if self._n % self.block_size and not final_look:
+            return None
+
+        self.looks += 1
+        if self._n < self.min_hands and not final_look:
+            return None
+        snap = self.snapshot()
+        reason = None
+        if snap.ci_lo > 0:
+            reason = STOP_POSITIVE
+        elif snap.ci_hi < 0:
+            reason = STOP_NEGATIVE
+        elif (
+            self.futility_bb100 is not None
+            and snap.ci_lo > -self.futility_bb100
+            and snap.ci_hi < self.futility_bb100
+        ):
+            reason = STOP_FUTILE
+        elif final_look:
+            reason = STOP_MAX_HANDS
+        if reason is not None:
+            self.result = self.snapshot(reason)
+        return self.result
+
+    def finish(self) -> SequentialResult:
+        """Final result; a loop that ran out of hands reports `max_hands`."""
+        if self.result is None:
+            self.result = self.snapshot(STOP_MAX_HANDS)
+        return self.result
+
+
+def format_sequential_result(result: SequentialResult, max_hands: int) -> str:
+    """One-line human summary for the CLI reports."""
+    verdict = {
+        STOP_POSITIVE: 'CI-clear POSITIVE',
+        STOP_NEGATIVE: 'CI-clear NEGATIVE',
+        STOP_FUTILE: 'FUTILE (|effect| below the futility margin)',
+        STOP_MAX_HANDS: 'hit max hands (inconclusive unless CI clears 0)',
+    }.get(result.reason, 'running')
+    saved = 100.0 * (1 - result.n / max_hands) if max_hands else 0.0
+    return (
+        f"sequential stop after {result.n}/{max_hands} obs ({result.looks} looks, "
+        f"{saved:.0f}% saved): {result.bb100:+.1f} bb/100 "
+        f"[{result.ci_lo:+.1f}, {result.ci_hi:+.1f}] z={result.z:.2f} — {verdict}"
+    )
+
+
+# ── All-in EV adjustment ─────────────────────────────────────────────────────
+
+
+def _runout_equity(
+    hands: List[List['eval7.Card']], board: List['eval7.Card'], seed: int
+) -> Optional[List[float]]:
+    """Equity share per hand over every (or a sampled set of) board runouts."""
+    known = {c for hand in hands for c in hand} | set(board)
+    deck = [c for c in eval7.Deck().cards if c not in known]
+    to_come = 5 - len(board)
+    if to_come <= 0:
+        return None
+    n_runouts = math.comb(len(deck), to_come)
+    if n_runouts <= _EXACT_RUNOUT_LIMIT:
+        runouts = itertools.combinations(deck, to_come)
+        total = n_runouts
+    else:
+        rng = random.Random(seed)
+        runouts = (rng.sample(deck, to_come) for _ in range(_MC_RUNOUTS))
+        total = _MC_RUNOUTS
+
+    shares = [0.0] * len(hands)
+    for runout in runouts:
+        full = board + list(runout)
+        scores = [eval7.evaluate(hand + full) for hand in hands]
+        best = max(scores)
+        winners = [i for i, s in enumerate(scores) if s == best]
+        for i in winners:
+            shares[i] += 1.0 / len(winners)
+    return [s / total for s in shares]
+
+
+def allin_ev_deltas(
+    allin_state,
+    start_stacks: Mapping[str, int],
+    final_stacks: Mapping[str, int],
+    seed: int = 0,
+) -> Dict[str, float]:
+    """Per-player chip deltas with the all-in runout luck integrated out.
+
+    ``allin_state`` is the game state at the moment the hand went to a
+    run-it-out (board not yet complete); ``None`` means the hand never did, and
+    the realized deltas are returned unchanged. Only the two-live-player case
+    is adjusted: folded players keep their realized (certain) loss, and the two
+    live players split the main pot by exact (or, preflop, seeded Monte Carlo)
+    runout equity. Falls back to realized deltas whenever the state is not
+    cleanly adjustable (multi-way, dead money above the matched level,
+    unparseable cards, eval7 missing).
+    """
+    realized = {n: float(final_stacks[n] - start_stacks[n]) for n in final_stacks}
+    if allin_state is None or not EVAL7_AVAILABLE:
+        return realized
+
+    from poker.card_utils import card_to_string
+
+    live = [p for p in allin_state.players if not p.is_folded]
+    if len(live) != 2 or len(allin_state.community_cards) >= 5:
+        return realized
+
+    contributed = {p.name: start_stacks[p.name] - p.stack for p in allin_state.players}
+    matched = min(contributed[p.name] for p in live)
+    dead = [contributed[p.name] for p in allin_state.players if p.is_folded]
+    if any(c > matched for c in dead):
+        return realized
+    main_pot = 2 * matched + sum(dead)
+
+    try:
+        hands = [[eval7.Card(card_to_string(c)) for c in p.hand] for p in live]
+        board = [eval7.Card(card_to_string(c)) for c in allin_state.community_cards]
+    except Exception:
+        return realized
+    if any(len(h) != 2 for h in hands):
+        return realized
+    equities = _runout_equity(hands, board, seed)
+    if equities is None:
+        return realized
+
+    adjusted = dict(realized)
+    for p, eq in zip(live, equities, strict=True):
+        adjusted[p.name] = eq * main_pot - matched
+    return adjusted
@@ -58,6 +58,9 @@ Usage:
 
 Output format defaults to text; pass --output json for machine-readable
 JSON suitable for downstream piping into jq or a notebook.
+
+For shadow-eval across many games and many rules at once, export the
+snapshots with `experiments.bulk_shadow_replay` and replay them there.
 """
 
 from __future__ import annotations
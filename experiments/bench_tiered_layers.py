@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Per-layer latency / allocation benchmark for the TieredBotController pipeline.
+
+Two phases:
+
+  1. Record — play ``--hands`` seeded 6-max hands (simulate_bb100's hand loop)
+     and capture every tiered-bot decision spot: the game state the actor saw,
+     the phase, and which seat/archetype was acting. ``--save-corpus`` pickles
+     the spots so later runs (e.g. before/after an optimization) replay the
+     identical corpus; ``--corpus`` loads one instead of recording.
+  2. Replay — feed every spot to a fresh controller per seat with a
+     ``LayerTimer`` attached (``--repeat`` passes after one untimed warm-up,
+     GC disabled while timing) and report per-layer p50/p99 latency and each
+     layer's share of pipeline time. ``--allocations`` adds a tracemalloc pass
+     for per-layer peak allocation (slower; its latencies are not reported).
+
+Layer names match the controller's ``_lap`` marks, which follow the
+InterventionTrace layer names; ``finalize`` is the expression layer plus
+decision assembly, and fallback/veto early returns.
+
+Usage:
+    docker compose exec backend python -m experiments.bench_tiered_layers --hands 300
+    docker compose exec backend python -m experiments.bench_tiered_layers --hands 300 \
+        --save-corpus /tmp/spots.pkl
+    docker compose exec backend python -m experiments.bench_tiered_layers \
+        --corpus /tmp/spots.pkl --repeat 5 --allocations --json /tmp/layers.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import pickle
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from experiments.simulate_bb100 import (
+    ARCHETYPES,
+    _make_seat_names,
+    make_controller,
+    make_game_state,
+    run_hand,
+)
+from poker.poker_state_machine import PokerPhase, PokerStateMachine
+from poker.strategy.layer_timing import LayerTimer, format_layer_summary
+from poker.strategy.strategy_table import load_strategy_table
+from poker.tiered_bot_controller import TieredBotController
+
+DEFAULT_FIELD = ['TAG', 'LAG', 'Rock', 'Calling Station', 'Maniac', 'Baseline']
+CORPUS_VERSION = 1
+
+
+@dataclass
+class DecisionSpot:
+    """One recorded tiered-bot decision: who acted, and what they saw."""
+
+    seat: str
+    archetype: str
+    phase: str  # PokerPhase name
+    game_state: object  # PokerGameState (frozen)
+
+
+class _SpotMachine:
+    """Minimal state-machine stand-in: the controller reads only these two."""
+
+    def __init__(self):
+        self.game_state = None
+        self.current_phase = None
+
+
+def record_corpus(field: List[str], n_hands: int, base_seed: int) -> List[DecisionSpot]:
+    """Play seeded 6-max hands and capture every tiered-bot decision spot."""
+    if len(field) != 6:
+        raise ValueError(f"field must have 6 archetypes, got {len(field)}")
+    table = load_strategy_table()
+    seats = _make_seat_names(field)
+    archetype_of = dict(zip(seats, field, strict=True))
+    spots: List[DecisionSpot] = []
+
+    def observe(current_player, controller, action, raise_to, phase_name, gs, *_):
+        if isinstance(controller, TieredBotController):
+            phase = controller.state_machine.current_phase
+            spots.append(
+                DecisionSpot(current_player.name, archetype_of[current_player.name], phase.name, gs)
+            )
+
+    for hand_num in range(n_hands):
+        hand_seed = base_seed + hand_num
+        random.seed(hand_seed)
+        gs = make_game_state(seats, dealer_idx=hand_num % 6, seed=hand_seed)
+        sm = PokerStateMachine(gs)
+        sm.current_hand_seed = hand_seed
+        controllers = [
+            make_controller(seat, ARCHETYPES[arch], table, sm, rng_seed=hand_seed + 1000 * i)
+            for i, (seat, arch) in enumerate(zip(seats, field, strict=True))
+        ]
+        run_hand(sm, controllers, big_blind=100, decision_observer=observe)
+    return spots
+
+
+def replay_corpus(
+    spots: List[DecisionSpot],
+    repeat: int,
+    track_allocations: bool = False,
+    seed: int = 0,
+) -> LayerTimer:
+    """Replay every spot ``repeat`` times under a LayerTimer (after a warm-up)."""
+    table = load_strategy_table()
+    machine = _SpotMachine()
+    timer = LayerTimer(track_allocations=track_allocations)
+    controllers: Dict[str, TieredBotController] = {}
+    for spot in spots:
+        if spot.seat not in controllers:
+            controllers[spot.seat] = make_controller(
+                spot.seat, ARCHETYPES[spot.archetype], table, machine, rng_seed=seed
+            )
+
+    def one_pass(timed: bool):
+        for controller in controllers.values():
+            controller.layer_timer = timer if timed else None
+        for spot in spots:
+            machine.game_state = spot.game_state
+            machine.current_phase = PokerPhase[spot.phase]
+            controllers[spot.seat].decide_action()
+
+    one_pass(timed=False)  # warm the chart/lookup caches and import paths
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            one_pass(timed=True)
+    finally:
+        gc.enable()
+    return timer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-layer TieredBotController benchmark')
+    parser.add_argument('--hands', type=int, default=200, help='hands to record (default 200)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument(
+        '--field',
+        nargs=6,
+        default=DEFAULT_FIELD,
+        metavar='ARCH',
+        help='6 tiered archetypes to seat (default: %(default)s)',
+    )
+    parser.add_argument('--corpus', help='replay a pickled corpus instead of recording')
+    parser.add_argument('--save-corpus', help='pickle the recorded corpus here')
+    parser.add_argument('--repeat', type=int, default=3, help='timed replay passes (default 3)')
+    parser.add_argument(
+        '--allocations', action='store_true', help='extra tracemalloc pass for per-layer KB'
+    )
+    parser.add_argument('--json', help='write the per-layer summary as JSON here')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    if args.corpus:
+        with open(args.corpus, 'rb') as f:
+            payload = pickle.load(f)
+        if payload.get('version') != CORPUS_VERSION:
+            parser.error(f"{args.corpus}: corpus version {payload.get('version')} unsupported")
+        spots = payload['spots']
+        print(f"Loaded {len(spots)} decision spots from {args.corpus}")
+    else:
+        t0 = time.perf_counter()
+        spots = record_corpus(args.field, args.hands, args.seed)
+        print(
+            f"Recorded {len(spots)} decision spots from {args.hands} hands "
+            f"in {time.perf_counter() - t0:.1f}s"
+        )
+        if args.save_corpus:
+            with open(args.save_corpus, 'wb') as f:
+                pickle.dump({'version': CORPUS_VERSION, 'spots': spots}, f)
+            print(f"Saved corpus to {args.save_corpus}")
+
+    n_pre = sum(1 for s in spots if s.phase == 'PRE_FLOP')
+    print(f"  preflop {n_pre}, postflop {len(spots) - n_pre}\n")
+
+    timer = replay_corpus(spots, args.repeat, seed=args.seed)
+    summary = timer.summary()
+    total_us = sum(s['mean_us'] * s['n'] for s in summary.values()) / max(timer.decisions, 1)
+    print(f"Latency — {timer.decisions} timed decisions, mean {total_us:.0f} us/decision")
+    print(format_layer_summary(summary))
+
+    if args.allocations:
+        alloc_timer = replay_corpus(spots, 1, track_allocations=True, seed=args.seed)
+        alloc_summary = alloc_timer.summary()
+        for layer, stats in alloc_summary.items():
+            if layer in summary:
+                summary[layer]['p50_alloc_kb'] = stats.get('p50_alloc_kb', 0.0)
+                summary[layer]['p99_alloc_kb'] = stats.get('p99_alloc_kb', 0.0)
+        print('\nAllocations (tracemalloc peak per layer; latency columns include its overhead)')
+        print(format_layer_summary(alloc_summary))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'decisions': timer.decisions, 'layers': summary}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,486 @@
+"""Bulk Mode 1 (shadow-eval) over stored strategy-pipeline snapshots.
+
+`analyze_intervention_traces --mode shadow` replays one game for one rule:
+it fetches each `strategy_pipeline_snapshot_json` row, parses it and runs
+`replay_strategy_pipeline` live + shadow. That is fine for a game, far too slow
+for a week of production decisions times every rule. This tool splits the work
+in two:
+
+1. **export** streams the snapshot rows out of SQLite once into a compact
+   columnar `.npz` file. Every top-level snapshot key becomes a column of int32
+   codes into a per-key dictionary of distinct JSON values (anchors, legal
+   actions, base strategies and deviation profiles repeat heavily), so the file
+   is small and each distinct value is parsed once per worker, not once per row.
+
+2. **replay** loads the file, collapses rows whose snapshots are identical
+   (same code in every column; replay is deterministic, so they are evaluated
+   once and weighted by their count), and spreads the distinct snapshots over
+   worker processes. Each worker replays live once and shadow once per arm (a
+   rule or a '+'-joined rule subset) and returns L1 / action-flip aggregates;
+   the parent merges them as chunks complete.
+
+Per arm the report carries the same fields as `shadow_eval` (evaluated
+decisions, mean / max L1, flips) plus the share of decisions the arm changed at
+all and L1 percentiles (from a 0.05-wide histogram over [0, 2]).
+
+Run:
+    python3 -m experiments.bulk_shadow_replay export \\
+        --db /app/data/poker_games.db --out /tmp/snapshots.npz --since 2026-10-12
+    python3 -m experiments.bulk_shadow_replay replay --snapshots /tmp/snapshots.npz \\
+        --rule math_floor.default --rule exploitation.hyper_aggressive+exploitation.tight_nit
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from poker.repositories.decision_analysis_repository import DecisionAnalysisRepository
+from poker.strategy.intervention_trace import _RULE_IDS_BY_LAYER, l1_distance, primary_action
+
+FORMAT_VERSION = 1
+L1_BIN_WIDTH = 0.05
+L1_BINS = int(round(2.0 / L1_BIN_WIDTH))
+# Below this an arm counts as not having changed the decision at all.
+AFFECTED_EPS = 1e-9
+
+Arm = FrozenSet[Tuple[str, str]]
+
+
+# ── Columnar snapshot file ──────────────────────────────────────────────
+
+
+@dataclass
+class SnapshotColumns:
+    """Dictionary-encoded snapshot rows.
+
+    `codes[row, k]` indexes `values[k]` (the JSON text of a distinct value of
+    snapshot key `keys[k]`); -1 means the key was absent from that snapshot.
+    """
+
+    analysis_ids: np.ndarray
+    game_codes: np.ndarray
+    games: List[str]
+    keys: List[str]
+    codes: np.ndarray
+    values: List[List[str]]
+    _decoded: List[Dict[int, Any]] = field(default_factory=list, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.analysis_ids)
+
+    def snapshot(self, row: int) -> Dict[str, Any]:
+        """Rebuild the snapshot dict for `row`.
+
+        Decoded values are cached per (key, code) and shared between the
+        dicts this returns; replay only reads them.
+        """
+        if not self._decoded:
+            self._decoded = [{} for _ in self.keys]
+        out: Dict[str, Any] = {}
+        for k, code in enumerate(self.codes[row].tolist()):
+            if code < 0:
+                continue
+            cache = self._decoded[k]
+            if code not in cache:
+                cache[code] = json.loads(self.values[k][code])
+            out[self.keys[k]] = cache[code]
+        return out
+
+    def save(self, path: str) -> None:
+        arrays = {
+            'format_version': np.array([FORMAT_VERSION]),
+            'analysis_ids': self.analysis_ids,
+            'game_codes': self.game_codes,
+            'codes': self.codes,
+        }
+        arrays['games_blob'], arrays['games_offsets'] = _pack_strings(self.games)
+        arrays['keys_blob'], arrays['keys_offsets'] = _pack_strings(self.keys)
+        for k, values in enumerate(self.values):
+            arrays[f'values_{k}_blob'], arrays[f'values_{k}_offsets'] = _pack_strings(values)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> SnapshotColumns:
+        with np.load(path) as data:
+            version = int(data['format_version'][0])
+            if version != FORMAT_VERSION:
+                raise ValueError(
+                    f'{path}: snapshot file format {version}, expected {FORMAT_VERSION}'
+                )
+            keys = _unpack_strings(data['keys_blob'], data['keys_offsets'])
+            return cls(
+                analysis_ids=data['analysis_ids'],
+                game_codes=data['game_codes'],
+                games=_unpack_strings(data['games_blob'], data['games_offsets']),
+                keys=keys,
+                codes=data['codes'],
+                values=[
+                    _unpack_strings(data[f'values_{k}_blob'], data[f'values_{k}_offsets'])
+                    for k in range(len(keys))
+                ],
+            )
+
+
+def _pack_strings(strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 concatenation + end offsets (avoids pickled object arrays)."""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.cumsum([len(b) for b in encoded], dtype=np.int64)
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_strings(blob: np.ndarray, offsets: np.ndarray) -> List[str]:
+    raw = blob.tobytes()
+    starts = [0] + offsets[:-1].tolist()
+    return [raw[s:e].decode('utf-8') for s, e in zip(starts, offsets.tolist(), strict=True)]
+
+
+def export_snapshots(
+    repo: DecisionAnalysisRepository,
+    path: str,
+    *,
+    game_ids: Optional[List[str]] = None,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Stream every snapshot row matching the filters into `path`.
+
+    Rows whose JSON is malformed or not an object are skipped and counted,
+    as `shadow_eval` counts them under `no_snapshot_coverage`.
+    """
+    ids: array = array('q')
+    game_codes: array = array('i')
+    games: Dict[str, int] = {}
+    columns: Dict[str, array] = {}
+    tables: Dict[str, Dict[str, int]] = {}
+    skipped = 0
+
+    for analysis_id, game_id, raw in repo.iter_strategy_pipeline_snapshots(
+        game_ids=game_ids, since=since
+    ):
+        try:
+            payload = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            skipped += 1
+            continue
+        if not isinstance(payload, dict):
+            skipped += 1
+            continue
+
+        n = len(ids)
+        ids.append(analysis_id)
+        game_codes.append(games.setdefault(game_id, len(games)))
+        for key, value in payload.items():
+            if key not in columns:
+                columns[key] = array('i', [-1]) * n
+                tables[key] = {}
+            # Key order inside values is kept: it is the action order replay
+            # (and argmax tie-breaking) sees.
+            text = json.dumps(value, separators=(',', ':'))
+            table = tables[key]
+            columns[key].append(table.setdefault(text, len(table)))
+        for key, column in columns.items():
+            if len(column) == n:
+                column.append(-1)
+
+    keys = list(columns)
+    codes = np.empty((len(ids), len(keys)), dtype=np.int32)
+    for k, key in enumerate(keys):
+        codes[:, k] = np.frombuffer(columns[key], dtype=np.int32)
+    snapshots = SnapshotColumns(
+        analysis_ids=np.frombuffer(ids, dtype=np.int64),
+        game_codes=np.frombuffer(game_codes, dtype=np.int32),
+        games=list(games),
+        keys=keys,
+        codes=codes,
+        values=[list(tables[key]) for key in keys],
+    )
+    snapshots.save(path)
+    return {
+        'rows': len(snapshots),
+        'skipped_malformed': skipped,
+        'games': len(games),
+        'keys': len(keys),
+        'distinct_values': sum(len(v) for v in snapshots.values),
+        'bytes': os.path.getsize(path),
+    }
+
+
+# ── Replay ──────────────────────────────────────────────────────────────
+
+
+def parse_arm(spec: str) -> Arm:
+    """'layer.rule_id' or 'layer.rule_id+layer.rule_id' → disable set."""
+    rules = []
+    for part in spec.split('+'):
+        layer, sep, rule_id = part.strip().partition('.')
+        if not sep or not layer or not rule_id:
+            raise ValueError(f"rule {part!r} must be in 'layer.rule_id' format")
+        rules.append((layer, rule_id))
+    return frozenset(rules)
+
+
+def arm_label(arm: Arm) -> str:
+    return '+'.join(f'{layer}.{rule_id}' for layer, rule_id in sorted(arm))
+
+
+def all_rule_arms() -> List[Arm]:
+    """One single-rule arm per (layer, rule_id) the trace schema knows."""
+    return [
+        frozenset({(layer, rule_id)})
+        for layer in sorted(_RULE_IDS_BY_LAYER)
+        for rule_id in sorted(_RULE_IDS_BY_LAYER[layer])
+    ]
+
+
+class ShadowAggregates:
+    """Decision-weighted live-vs-shadow aggregates, one slot per arm."""
+
+    def __init__(self, n_arms: int):
+        self.evaluated = 0
+        self.failed = 0
+        self.l1_sum = np.zeros(n_arms)
+        self.l1_sq_sum = np.zeros(n_arms)
+        self.l1_max = np.zeros(n_arms)
+        self.affected = np.zeros(n_arms, dtype=np.int64)
+        self.flips = np.zeros(n_arms, dtype=np.int64)
+        self.l1_hist = np.zeros((n_arms, L1_BINS), dtype=np.int64)
+
+    def add(self, arm: int, l1: float, flipped: bool, weight: int) -> None:
+        self.l1_sum[arm] += l1 * weight
+        self.l1_sq_sum[arm] += l1 * l1 * weight
+        self.l1_max[arm] = max(self.l1_max[arm], l1)
+        if l1 > AFFECTED_EPS:
+            self.affected[arm] += weight
+        if flipped:
+            self.flips[arm] += weight
+        self.l1_hist[arm, min(int(l1 / L1_BIN_WIDTH), L1_BINS - 1)] += weight
+
+    def merge(self, other: ShadowAggregates) -> None:
+        self.evaluated += other.evaluated
+        self.failed += other.failed
+        self.l1_sum += other.l1_sum
+        self.l1_sq_sum += other.l1_sq_sum
+        np.maximum(self.l1_max, other.l1_max, out=self.l1_max)
+        self.affected += other.affected
+        self.flips += other.flips
+        self.l1_hist += other.l1_hist
+
+    def l1_percentile(self, arm: int, q: float) -> float:
+        """Upper edge of the histogram bin holding the q-quantile."""
+        counts = self.l1_hist[arm]
+        if not counts.sum():
+            return 0.0
+        idx = int(np.searchsorted(np.cumsum(counts), q * counts.sum()))
+        return min((idx + 1) * L1_BIN_WIDTH, 2.0)
+
+
+def replay_rows(
+    snapshots: SnapshotColumns,
+    rows: Sequence[int],
+    weights: Sequence[int],
+    arms: Sequence[Arm],
+) -> ShadowAggregates:
+    """Replay each row live + once per arm and aggregate the distances."""
+    # Local import, as in shadow_eval: replay.py pulls in the strategy modules.
+    from poker.strategy.replay import replay_strategy_pipeline
+
+    agg = ShadowAggregates(len(arms))
+    for row, weight in zip(rows, weights, strict=True):
+        snapshot = snapshots.snapshot(row)
+        try:
+            live = replay_strategy_pipeline(snapshot, disable_rules=frozenset())
+            shadows = [replay_strategy_pipeline(snapshot, disable_rules=arm) for arm in arms]
+        except Exception:
+            agg.failed += weight
+            continue
+        live_probs = live.action_probabilities
+        live_action = primary_action(live_probs)
+        for a, shadow in enumerate(shadows):
+            probs = shadow.action_probabilities
+            agg.add(a, l1_distance(live_probs, probs), primary_action(probs) != live_action, weight)
+        agg.evaluated += weight
+    return agg
+
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(path: str, arms: List[Arm]) -> None:
+    _worker_state['snapshots'] = SnapshotColumns.load(path)
+    _worker_state['arms'] = arms
+
+
+def _replay_chunk(rows: np.ndarray, weights: np.ndarray) -> ShadowAggregates:
+    return replay_rows(
+        _worker_state['snapshots'], rows.tolist(), weights.tolist(), _worker_state['arms']
+    )
+
+
+def bulk_shadow_eval(
+    path: str,
+    arms: Sequence[Arm],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 2000,
+    game_ids: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Shadow-evaluate every snapshot in `path` against each arm.
+
+    `workers` defaults to the CPU count; 1 replays in-process. `game_ids`
+    restricts the replay to those games of the exported set.
+    """
+    started = time.perf_counter()
+    arms = list(arms)
+    snapshots = SnapshotColumns.load(path)
+    if game_ids is not None:
+        wanted = [i for i, g in enumerate(snapshots.games) if g in set(game_ids)]
+        selected = np.flatnonzero(np.isin(snapshots.game_codes, wanted))
+    else:
+        selected = np.arange(len(snapshots))
+    rows = len(selected)
+
+    # Identical code rows are identical snapshots: replay once, weight by count.
+    codes = snapshots.codes[selected]
+    if not codes.shape[1]:
+        codes = np.zeros((rows, 1), dtype=np.int32)
+    _, first, counts = np.unique(codes, axis=0, return_index=True, return_counts=True)
+    first = selected[first]
+    unique_rows = len(first)
+
+    workers = workers or os.cpu_count() or 1
+    total = ShadowAggregates(len(arms))
+    if workers <= 1 or unique_rows <= chunk_size:
+        total.merge(replay_rows(snapshots, first.tolist(), counts.tolist(), arms))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(path, arms)
+        ) as ex:
+            futures = [
+                ex.submit(_replay_chunk, first[i : i + chunk_size], counts[i : i + chunk_size])
+                for i in range(0, unique_rows, chunk_size)
+            ]
+            for future in as_completed(futures):
+                total.merge(future.result())
+
+    evaluated = total.evaluated
+    per_arm = []
+    for a, arm in enumerate(arms):
+        mean = total.l1_sum[a] / evaluated if evaluated else 0.0
+        var = total.l1_sq_sum[a] / evaluated - mean * mean if evaluated else 0.0
+        per_arm.append(
+            {
+                'disable_rule': arm_label(arm),
+                'mean_l1_distance': round(float(mean), 4),
+                'std_l1_distance': round(float(np.sqrt(max(var, 0.0))), 4),
+                'max_l1_distance': round(float(total.l1_max[a]), 4),
+                'p50_l1_distance': round(total.l1_percentile(a, 0.5), 2),
+                'p90_l1_distance': round(total.l1_percentile(a, 0.9), 2),
+                'p99_l1_distance': round(total.l1_percentile(a, 0.99), 2),
+                'affected_decisions': int(total.affected[a]),
+                'affected_rate': round(int(total.affected[a]) / evaluated, 4) if evaluated else 0.0,
+                'action_flips': int(total.flips[a]),
+                'action_flip_rate': round(int(total.flips[a]) / evaluated, 4) if evaluated else 0.0,
+            }
+        )
+    per_arm.sort(key=lambda r: (-r['mean_l1_distance'], r['disable_rule']))
+    return {
+        'mode': 'bulk-shadow',
+        'total_decisions': rows,
+        'unique_snapshots': unique_rows,
+        'evaluated_decisions': evaluated,
+        'replay_failures': total.failed,
+        'arms': per_arm,
+        'seconds': round(time.perf_counter() - started, 2),
+    }
+
+
+def _format_report_text(report: Dict[str, Any]) -> str:
+    lines = [
+        "Mode: bulk shadow-eval (same-state per-rule attribution)",
+        f"Decisions: {report['total_decisions']} "
+        f"({report['unique_snapshots']} distinct snapshots), "
+        f"evaluated {report['evaluated_decisions']}, "
+        f"replay failures {report['replay_failures']}, {report['seconds']:.1f}s",
+        "",
+        f"{'rule':<48s} {'mean L1':>8s} {'p90':>5s} {'max':>6s} {'affected':>9s} {'flips':>7s}",
+    ]
+    for r in report['arms']:
+        lines.append(
+            f"{r['disable_rule'][:48]:<48s} {r['mean_l1_distance']:8.4f} "
+            f"{r['p90_l1_distance']:5.2f} {r['max_l1_distance']:6.3f} "
+            f"{r['affected_rate'] * 100:8.2f}% {r['action_flip_rate'] * 100:6.2f}%"
+        )
+    return '\n'.join(lines)
+
+
+# ── CLI entry point ─────────────────────────────────────────────────────
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Export strategy-pipeline snapshots and shadow-evaluate them in bulk.',
+    )
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    export = sub.add_parser('export', help='Write snapshot rows to a columnar .npz file.')
+    export.add_argument('--db', required=True, help='SQLite database path.')
+    export.add_argument('--out', required=True, help='Output .npz path.')
+    export.add_argument('--game-id', action='append', help='Restrict to a game (repeatable).')
+    export.add_argument('--since', help="Only rows with created_at >= SINCE ('YYYY-MM-DD').")
+
+    replay = sub.add_parser('replay', help='Shadow-evaluate an exported file.')
+    replay.add_argument('--snapshots', required=True, help='File written by export.')
+    replay.add_argument(
+        '--rule',
+        action='append',
+        metavar='layer.rule_id[+layer.rule_id]',
+        help='Arm to disable (repeatable). Defaults to every known rule, one at a time.',
+    )
+    replay.add_argument('--game-id', action='append', help='Restrict to a game (repeatable).')
+    replay.add_argument('--workers', type=int, default=None)
+    replay.add_argument('--chunk-size', type=int, default=2000)
+    replay.add_argument('--output', choices=('text', 'json'), default='text')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+
+    if args.command == 'export':
+        summary = export_snapshots(
+            DecisionAnalysisRepository(args.db), args.out, game_ids=args.game_id, since=args.since
+        )
+        print(json.dumps(summary, sort_keys=True))
+        return 0
+
+    try:
+        arms = [parse_arm(spec) for spec in args.rule] if args.rule else all_rule_arms()
+    except ValueError as e:
+        sys.stderr.write(f"{e}\n")
+        return 2
+    report = bulk_shadow_eval(
+        args.snapshots,
+        arms,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        game_ids=args.game_id,
+    )
+    if args.output == 'json':
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(_format_report_text(report))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -57,6 +57,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 logging.getLogger('poker.bounded_options').setLevel(logging.ERROR)
 
+from experiments._sequential import (
+    SequentialResult,
+    SequentialTest,
+    allin_ev_deltas,
+    format_sequential_result,
+)
 from experiments.simulate_bb100 import (
     ARCHETYPES,
     MAX_ACTIONS_PER_HAND,
@@ -473,6 +479,7 @@ def run_cc_hand(
     big_blind: int,
     feed: Optional[OpponentFeed] = None,
     hand_number: int = 0,
+    on_run_it_out: Optional[Callable] = None,
 ) -> Dict[str, int]:
     """Drive one hand to completion; return {player_name: final_stack}.
 
@@ -487,6 +494,9 @@ def run_cc_hand(
     CbetDetector recipe as run_hand), so the opponent-modeling exploitation
     layer actually fires. `feed=None` (the default) leaves the existing
     field/cc gates byte-identical and adds zero overhead.
+
+    `on_run_it_out(gs)` fires once, when the hand first goes to an all-in
+    runout (same contract as `_hand_loop.drive_hand`'s hook).
     """
     controller_map = {c.player_name: c for c in controllers}
 
@@ -498,6 +508,7 @@ def run_cc_hand(
     sim_current_street: Optional[str] = None
     action_count = 0
     start_stacks: Dict[str, int] = {}
+    run_it_out_seen = False
 
     if feed is not None:
         # Per-hand denominator + c-bet state reset (mirrors
@@ -522,6 +533,9 @@ def run_cc_hand(
         gs = sm.game_state
 
         if gs.run_it_out:
+            if on_run_it_out is not None and not run_it_out_seen:
+                on_run_it_out(gs)
+            run_it_out_seen = True
             sm.game_state = gs.update(run_it_out=False, awaiting_action=False)
             sm.phase = {
                 PokerPhase.PRE_FLOP: PokerPhase.DEALING_CARDS,
@@ -658,8 +672,16 @@ def run_cc_matchup(
     big_blind: int = 100,
     starting_stack: int = 10000,
     base_seed: int = 42,
+    allin_ev: bool = False,
+    sequential: Optional[SequentialTest] = None,
 ) -> CCMatchupResult:
-    """Run n_hands at one table; return per-seat deltas tagged champion/challenger."""
+    """Run n_hands at one table; return per-seat deltas tagged champion/challenger.
+
+    `allin_ev` scores all-in-before-the-river hands by runout equity
+    (`_sequential.allin_ev_deltas`) instead of the realized result.
+    `sequential`, when given, receives the per-hand mean challenger-seat delta
+    and the run stops early once it decides (n_hands is then the cap).
+    """
     spec = CHANGES[change_name]
     arch_config = ARCHETYPES[archetype]
 
@@ -699,9 +721,31 @@ def run_cc_matchup(
                 )
             )
 
-        final_stacks = run_cc_hand(sm, controllers, big_blind)
+        allin_snapshot: List = []
+        final_stacks = run_cc_hand(
+            sm,
+            controllers,
+            big_blind,
+            on_run_it_out=allin_snapshot.append if allin_ev else None,
+        )
+        if allin_ev:
+            hand_deltas = allin_ev_deltas(
+                allin_snapshot[0] if allin_snapshot else None,
+                {name: starting_stack for name in names},
+                final_stacks,
+                seed=hand_seed,
+            )
+        else:
+            hand_deltas = {
+                name: final_stacks.get(name, starting_stack) - starting_stack for name in names
+            }
         for name in names:
-            seat_deltas[name].append(final_stacks.get(name, starting_stack) - starting_stack)
+            seat_deltas[name].append(hand_deltas[name])
+
+        if sequential is not None:
+            chal_mean = sum(hand_deltas[n] for n in challenger_names) / len(challenger_names)
+            if sequential.add(chal_mean) is not None:
+                break
 
     return CCMatchupResult(seat_deltas, challenger_names, champion_names)
 
@@ -709,7 +753,7 @@ def run_cc_matchup(
 def _run_seed_worker(args: Tuple) -> Tuple[int, CCMatchupResult]:
     """ProcessPool worker: run one seed. Builds its own tables from the change
     spec (avoids shipping unpicklable StrategyTable / lambdas across processes)."""
-    change_name, archetype, n_seats, n_challenger, n_hands, seed, stack_bb = args
+    change_name, archetype, n_seats, n_challenger, n_hands, seed, stack_bb, allin_ev = args
     logging.getLogger('poker.bounded_options').setLevel(logging.ERROR)
     spec = CHANGES[change_name]
     champion_table = spec.champion_table()
@@ -724,6 +768,7 @@ def _run_seed_worker(args: Tuple) -> Tuple[int, CCMatchupResult]:
         challenger_table,
         base_seed=seed,
         starting_stack=stack_bb * 100,
+        allin_ev=allin_ev,
     )
     return seed, result
 
@@ -748,6 +793,7 @@ def print_report(
     results: List[Tuple[int, CCMatchupResult]],
     big_blind: int,
     stack_bb: int,
+    sequential_result: Optional[SequentialResult] = None,
 ):
     spec = CHANGES[change_name]
     n_champion = n_seats - n_challenger
@@ -793,6 +839,10 @@ def print_report(
     else:
         verdict = "➖ INCONCLUSIVE — CI spans 0 (need more hands/seeds, or no real effect)"
     print(f"  VERDICT: {verdict}")
+    if sequential_result is not None:
+        # The pooled CI above is the fixed-n 95% CI; after early stopping the
+        # look-adjusted one below is the one that holds its coverage.
+        print(f"  {format_sequential_result(sequential_result, n_hands * len(seeds))}")
 
     # Per-seat bb/100 (catch per-seat sign disagreement = noise, not signal).
     print("\n── per-seat bb/100 (pooled across seeds) ──")
@@ -831,6 +881,28 @@ def main():
     p.add_argument(
         '--stack-bb', type=int, default=100, help='effective starting stack in BB (default 100)'
     )
+    p.add_argument(
+        '--allin-ev',
+        action='store_true',
+        help='score all-in-before-the-river hands by runout equity (lower variance)',
+    )
+    p.add_argument(
+        '--sequential',
+        action='store_true',
+        help='early-stopping mode: seeds run in order in one process, --hands x '
+        'seeds is the cap, and the run stops at the first block whose '
+        'look-adjusted CI clears 0 (or falls inside --futility-bb100)',
+    )
+    p.add_argument('--block-size', type=int, default=200, help='hands per sequential look')
+    p.add_argument(
+        '--alpha', type=float, default=0.05, help='overall false-positive rate across looks'
+    )
+    p.add_argument(
+        '--futility-bb100',
+        type=float,
+        default=None,
+        help='stop as "no meaningful effect" once the CI sits inside ±this bb/100',
+    )
     args = p.parse_args()
 
     if args.archetype not in ARCHETYPES:
@@ -855,10 +927,43 @@ def main():
             args.hands,
             s,
             args.stack_bb,
+            args.allin_ev,
         )
         for s in seeds
     ]
-    if len(seeds) > 1:
+    sequential = None
+    if args.sequential:
+        # One shared test across seeds, so the run can stop mid-seed. The
+        # ProcessPool fan-out can't share a stopping rule, so seeds run in turn.
+        sequential = SequentialTest(
+            big_blind=100,
+            max_hands=args.hands * len(seeds),
+            block_size=args.block_size,
+            alpha=args.alpha,
+            futility_bb100=args.futility_bb100,
+        )
+        spec = CHANGES[args.change]
+        champion_table = spec.champion_table()
+        challenger_table = spec.challenger_table()
+        results = []
+        for s in seeds:
+            result = run_cc_matchup(
+                args.change,
+                args.archetype,
+                args.seats,
+                args.challenger_seats,
+                args.hands,
+                champion_table,
+                challenger_table,
+                base_seed=s,
+                starting_stack=args.stack_bb * 100,
+                allin_ev=args.allin_ev,
+                sequential=sequential,
+            )
+            results.append((s, result))
+            if sequential.stopped:
+                break
+    elif len(seeds) > 1:
         with ProcessPoolExecutor(max_workers=min(len(seeds), os.cpu_count() or 1)) as ex:
             results = list(ex.map(_run_seed_worker, work))
     else:
@@ -874,6 +979,7 @@ def main():
         results,
         big_blind=100,
         stack_bb=args.stack_bb,
+        sequential_result=sequential.finish() if sequential is not None else None,
     )
 
 
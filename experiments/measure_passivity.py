@@ -55,6 +55,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # dominate runtime and bury the report.
 logging.getLogger('poker.bounded_options').setLevel(logging.ERROR)
 
+from experiments._duplicate import duplicate_seatings, paired_observation
 from experiments._hand_loop import drive_hand
 from experiments.simulate_bb100 import (
     ARCHETYPES,
@@ -625,6 +626,7 @@ def run_passivity_matchup(
     entry: str = 'default',
     h1_classes: Optional[frozenset] = None,
     hero_table: Optional[object] = None,
+    duplicate: bool = False,
 ) -> Tuple[List[float], PassivityStats]:
     """Run n_hands of 6-max (hero + 5 opponents); return (deltas, Tier-A stats).
 
@@ -642,6 +644,11 @@ def run_passivity_matchup(
     the opponents — the ONLY variable becomes the hero's open frequencies. When
     None, the hero uses `strategy_table` (current behavior), optionally
     transformed by `entry='isolate'`.
+
+    `duplicate=True` replays each deal under every seat rotation (same deck,
+    same button — see `_duplicate`). `n_hands` then counts deals, the Tier-A
+    stats cover every replayed hand, and each returned delta is the hero's
+    mean over the deal's rotations (a paired observation).
     """
     if len(opponents) < 1:
         raise ValueError(f"need >=1 opponent, got {len(opponents)}")
@@ -721,143 +728,155 @@ def run_passivity_matchup(
     for hand_num in range(n_hands):
         hand_seed = base_seed + hand_num
         dealer_idx = hand_num % len(all_names)
-        random.seed(hand_seed)  # per-hand global-random reset (rule bots)
-
-        gs = make_game_state(
-            player_names=all_names,
-            big_blind=big_blind,
-            starting_stack=starting_stack,
-            dealer_idx=dealer_idx,
-            seed=hand_seed,
-        )
-        sm = PokerStateMachine(gs)
-        sm.current_hand_seed = hand_seed
-
-        controllers = [make_controller(hero_name, config_arch, hero_table, sm, rng_seed=hand_seed)]
-        if hero_chart_forced:
-            # The forced --preflop-chart / isolate table is the hero's
-            # strategy_table; drop archetype auto-selection so it isn't
-            # overridden by a width-tier chart.
-            controllers[0].archetype_preflop_tables = {}
-        # No opponent_manager: Baseline (anchors=None) skips exploitation and
-        # equity recording only writes to models, so omitting it is identical
-        # for decisions/stacks and disables equity-MC (plan requirement).
-        controllers[0].opponent_model_manager = None
-        _apply_mode(controllers[0], mode)
-        controllers[0].multistreet_h1_classes = h1_classes
-        # River-bluff (OVERBET_BALANCING T2) validation knob. Env-var so it
-        # crosses the ProcessPool boundary (children inherit env), mirroring the
-        # REGPLUS_* convention. OFF (unset) = byte-identical. Drives the tell-map
-        # check: does the river leak (blf%→target) close, and at what fish cost?
-        _rbf = os.environ.get('RIVER_BLUFF_FRACTION')
-        if _rbf:
-            # make_controller bypasses __init__, so enable_overbet_context is
-            # unset (the layer is dormant in this harness). Turn it on and
-            # ISOLATE the river-bluff effect: overbet_fraction=0.0 keeps the
-            # value side a no-op so the only change vs baseline is the new river
-            # bluffs (give-up-air checks → bet at river_bluff_size).
-            controllers[0].enable_overbet_context = True
-            # overbet_fraction default 0.0 ISOLATES the bluff effect; set
-            # OVERBET_FRACTION=1.0 to calibrate under the production config (value
-            # relabel ON, so value + bluff both sit at the overbet size → the
-            # tell-map xl bucket shows the BALANCED ratio to tune toward ~37.5%).
-            controllers[0].overbet_fraction = float(os.environ.get('OVERBET_FRACTION', '0.0'))
-            controllers[0].river_bluff_fraction = float(_rbf)
-            _rbs = os.environ.get('RIVER_BLUFF_SIZE')
-            if _rbs:
-                controllers[0].river_bluff_size = int(_rbs)
-            # Regime-gate read override (no model manager in this harness): set a
-            # synthetic fold_to_big_bet so the gate sees a "reader" (high) or
-            # "caller" (low). Unset → gate has no read → river bluff never fires.
-            _ftbb = os.environ.get('RIVER_BLUFF_FTBB')
-            if _ftbb:
-                controllers[0].river_bluff_ftbb_override = float(_ftbb)
-            # River-air SUPPLY build: barrel turn air so more reaches the river.
-            # Fires inside multistreet_context → needs --mode on/h1 to be active.
-            _abt = os.environ.get('AIR_BARREL_TARGET')
-            if _abt:
-                controllers[0].air_barrel_target = float(_abt)
-        # Gated stab-defense (§5j) validation knob (independent of river bluff):
-        # STAB_DEFENSE=intensity, STAB_DEFENSE_READ=synthetic stab-freq (default 1.0
-        # = simulate a detected stabber, trips the 0.5 gate). Measured vs the
-        # adaptive stabber (does it recover the −1.2?) + vs static (false-pos cost).
-        _sd = os.environ.get('STAB_DEFENSE')
-        if _sd:
-            controllers[0].stab_defense_intensity = float(_sd)
-            controllers[0].stab_defense_override = float(os.environ.get('STAB_DEFENSE_READ', '1.0'))
-        # Skill-tier knob (PLAYER_SKILL_SPECTRUM.md Phase 3 monotonicity check):
-        # SKILL_TIER=shark|reg|weak_reg|rec applies the whole tier bundle at once
-        # (exploitation_strength + river_bluff_fraction + stab_defense_intensity +
-        # overbet_fraction). Applied LAST so it's the single high-level lever — it
-        # overrides any manual knob above. make_controller bypasses __init__, so we
-        # also turn the overbet layer ON and inject synthetic opponent reads (so the
-        # gated river-bluff / stab-defense layers actually fire at the tier's
-        # intensity vs a simulated reader/stabber); override the reads via
-        # RIVER_BLUFF_FTBB / STAB_DEFENSE_READ to probe other regimes (e.g. a caller).
-        _skill = os.environ.get('SKILL_TIER')
-        if _skill:
-            from poker.strategy.skill_tiers import SKILL_TIERS
-
-            # Two reasons we read the spec directly rather than calling
-            # apply_skill_tier here:
-            #  1. make_controller bypasses __init__, so every field must be
-            #     materialized explicitly — apply_skill_tier no-ops the default
-            #     `shark` tier by design, which would leave the ceiling
-            #     un-materialized and the ladder incomparable.
-            #  2. This block also wires enable_overbet_context + synthetic
-            #     opponent reads below — harness-only scaffolding the tier spec
-            #     doesn't (and shouldn't) own.
-            _spec = SKILL_TIERS[_skill]
-            controllers[0].exploitation_strength = _spec.exploitation_strength
-            controllers[0].river_bluff_fraction = _spec.river_bluff_fraction
-            controllers[0].stab_defense_intensity = _spec.stab_defense_intensity
-            controllers[0].overbet_fraction = _spec.overbet_fraction
-            controllers[0].enable_overbet_context = True
-            controllers[0].river_bluff_ftbb_override = float(
-                os.environ.get('RIVER_BLUFF_FTBB', '1.0')
+        seatings = duplicate_seatings(all_names, duplicate)
+        group_deltas: List[float] = []
+
+        for seating in seatings:
+            random.seed(hand_seed)  # per-hand global-random reset (rule bots)
+
+            gs = make_game_state(
+                player_names=seating,
+                big_blind=big_blind,
+                starting_stack=starting_stack,
+                dealer_idx=dealer_idx,
+                seed=hand_seed,
             )
-            controllers[0].stab_defense_override = float(os.environ.get('STAB_DEFENSE_READ', '1.0'))
-        # Range-aware prototype: turn on equity-vs-range for the hero and feed it
-        # perfect-read field stats (uniform-field assumption: all opponents share
-        # the first opponent archetype's stats). Concept-test ceiling.
-        if config_arch.get('use_range_equity'):
-            from experiments.simulate_bb100 import ARCHETYPE_STATS
-
-            controllers[0].use_range_equity = True
-            controllers[0]._assumed_opp_stats = ARCHETYPE_STATS.get(opponents[0])
-
-        for i, (seat, cfg) in enumerate(zip(opponent_seats, opp_configs, strict=False)):
-            controllers.append(
-                make_controller(
-                    seat, cfg, strategy_table, sm, rng_seed=hand_seed + 1_000_000 * (i + 1)
+            sm = PokerStateMachine(gs)
+            sm.current_hand_seed = hand_seed
+
+            controllers = [
+                make_controller(hero_name, config_arch, hero_table, sm, rng_seed=hand_seed)
+            ]
+            if hero_chart_forced:
+                # The forced --preflop-chart / isolate table is the hero's
+                # strategy_table; drop archetype auto-selection so it isn't
+                # overridden by a width-tier chart.
+                controllers[0].archetype_preflop_tables = {}
+            # No opponent_manager: Baseline (anchors=None) skips exploitation and
+            # equity recording only writes to models, so omitting it is identical
+            # for decisions/stacks and disables equity-MC (plan requirement).
+            controllers[0].opponent_model_manager = None
+            _apply_mode(controllers[0], mode)
+            controllers[0].multistreet_h1_classes = h1_classes
+            # River-bluff (OVERBET_BALANCING T2) validation knob. Env-var so it
+            # crosses the ProcessPool boundary (children inherit env), mirroring the
+            # REGPLUS_* convention. OFF (unset) = byte-identical. Drives the tell-map
+            # check: does the river leak (blf%→target) close, and at what fish cost?
+            _rbf = os.environ.get('RIVER_BLUFF_FRACTION')
+            if _rbf:
+                # make_controller bypasses __init__, so enable_overbet_context is
+                # unset (the layer is dormant in this harness). Turn it on and
+                # ISOLATE the river-bluff effect: overbet_fraction=0.0 keeps the
+                # value side a no-op so the only change vs baseline is the new river
+                # bluffs (give-up-air checks → bet at river_bluff_size).
+                controllers[0].enable_overbet_context = True
+                # overbet_fraction default 0.0 ISOLATES the bluff effect; set
+                # OVERBET_FRACTION=1.0 to calibrate under the production config (value
+                # relabel ON, so value + bluff both sit at the overbet size → the
+                # tell-map xl bucket shows the BALANCED ratio to tune toward ~37.5%).
+                controllers[0].overbet_fraction = float(os.environ.get('OVERBET_FRACTION', '0.0'))
+                controllers[0].river_bluff_fraction = float(_rbf)
+                _rbs = os.environ.get('RIVER_BLUFF_SIZE')
+                if _rbs:
+                    controllers[0].river_bluff_size = int(_rbs)
+                # Regime-gate read override (no model manager in this harness): set a
+                # synthetic fold_to_big_bet so the gate sees a "reader" (high) or
+                # "caller" (low). Unset → gate has no read → river bluff never fires.
+                _ftbb = os.environ.get('RIVER_BLUFF_FTBB')
+                if _ftbb:
+                    controllers[0].river_bluff_ftbb_override = float(_ftbb)
+                # River-air SUPPLY build: barrel turn air so more reaches the river.
+                # Fires inside multistreet_context → needs --mode on/h1 to be active.
+                _abt = os.environ.get('AIR_BARREL_TARGET')
+                if _abt:
+                    controllers[0].air_barrel_target = float(_abt)
+            # Gated stab-defense (§5j) validation knob (independent of river bluff):
+            # STAB_DEFENSE=intensity, STAB_DEFENSE_READ=synthetic stab-freq (default 1.0
+            # = simulate a detected stabber, trips the 0.5 gate). Measured vs the
+            # adaptive stabber (does it recover the −1.2?) + vs static (false-pos cost).
+            _sd = os.environ.get('STAB_DEFENSE')
+            if _sd:
+                controllers[0].stab_defense_intensity = float(_sd)
+                controllers[0].stab_defense_override = float(
+                    os.environ.get('STAB_DEFENSE_READ', '1.0')
+                )
+            # Skill-tier knob (PLAYER_SKILL_SPECTRUM.md Phase 3 monotonicity check):
+            # SKILL_TIER=shark|reg|weak_reg|rec applies the whole tier bundle at once
+            # (exploitation_strength + river_bluff_fraction + stab_defense_intensity +
+            # overbet_fraction). Applied LAST so it's the single high-level lever — it
+            # overrides any manual knob above. make_controller bypasses __init__, so we
+            # also turn the overbet layer ON and inject synthetic opponent reads (so the
+            # gated river-bluff / stab-defense layers actually fire at the tier's
+            # intensity vs a simulated reader/stabber); override the reads via
+            # RIVER_BLUFF_FTBB / STAB_DEFENSE_READ to probe other regimes (e.g. a caller).
+            _skill = os.environ.get('SKILL_TIER')
+            if _skill:
+                from poker.strategy.skill_tiers import SKILL_TIERS
+
+                # Two reasons we read the spec directly rather than calling
+                # apply_skill_tier here:
+                #  1. make_controller bypasses __init__, so every field must be
+                #     materialized explicitly — apply_skill_tier no-ops the default
+                #     `shark` tier by design, which would leave the ceiling
+                #     un-materialized and the ladder incomparable.
+                #  2. This block also wires enable_overbet_context + synthetic
+                #     opponent reads below — harness-only scaffolding the tier spec
+                #     doesn't (and shouldn't) own.
+                _spec = SKILL_TIERS[_skill]
+                controllers[0].exploitation_strength = _spec.exploitation_strength
+                controllers[0].river_bluff_fraction = _spec.river_bluff_fraction
+                controllers[0].stab_defense_intensity = _spec.stab_defense_intensity
+                controllers[0].overbet_fraction = _spec.overbet_fraction
+                controllers[0].enable_overbet_context = True
+                controllers[0].river_bluff_ftbb_override = float(
+                    os.environ.get('RIVER_BLUFF_FTBB', '1.0')
+                )
+                controllers[0].stab_defense_override = float(
+                    os.environ.get('STAB_DEFENSE_READ', '1.0')
+                )
+            # Range-aware prototype: turn on equity-vs-range for the hero and feed it
+            # perfect-read field stats (uniform-field assumption: all opponents share
+            # the first opponent archetype's stats). Concept-test ceiling.
+            if config_arch.get('use_range_equity'):
+                from experiments.simulate_bb100 import ARCHETYPE_STATS
+
+                controllers[0].use_range_equity = True
+                controllers[0]._assumed_opp_stats = ARCHETYPE_STATS.get(opponents[0])
+
+            for i, (seat, cfg) in enumerate(zip(opponent_seats, opp_configs, strict=False)):
+                controllers.append(
+                    make_controller(
+                        seat, cfg, strategy_table, sm, rng_seed=hand_seed + 1_000_000 * (i + 1)
+                    )
                 )
-            )
 
-        hero_overbet_obs = [] if adaptive_reader_state is not None else None
-        hero_faced_raise_obs = [] if adaptive_aggressor_state is not None else None
-        hero_faced_bet_obs = [] if adaptive_stabber_state is not None else None
-        final_stacks, callcall_river = run_passivity_hand(
-            sm,
-            controllers,
-            hero_name,
-            stats,
-            hero_overbet_obs=hero_overbet_obs,
-            hero_faced_raise_obs=hero_faced_raise_obs,
-            hero_faced_bet_obs=hero_faced_bet_obs,
-        )
-        if adaptive_reader_state is not None and hero_overbet_obs:
-            for hs in hero_overbet_obs:
-                adaptive_reader_state.observe(hs in _BLUFF_CLASSES)
-        if adaptive_aggressor_state is not None and hero_faced_raise_obs:
-            for folded in hero_faced_raise_obs:
-                adaptive_aggressor_state.observe(folded)
-        if adaptive_stabber_state is not None and hero_faced_bet_obs:
-            for folded in hero_faced_bet_obs:
-                adaptive_stabber_state.observe(folded)
-        delta = final_stacks.get(hero_name, starting_stack) - starting_stack
-        deltas.append(delta)
-        if callcall_river and delta < 0:
-            stats.payoff_loss += 1
+            hero_overbet_obs = [] if adaptive_reader_state is not None else None
+            hero_faced_raise_obs = [] if adaptive_aggressor_state is not None else None
+            hero_faced_bet_obs = [] if adaptive_stabber_state is not None else None
+            final_stacks, callcall_river = run_passivity_hand(
+                sm,
+                controllers,
+                hero_name,
+                stats,
+                hero_overbet_obs=hero_overbet_obs,
+                hero_faced_raise_obs=hero_faced_raise_obs,
+                hero_faced_bet_obs=hero_faced_bet_obs,
+            )
+            if adaptive_reader_state is not None and hero_overbet_obs:
+                for hs in hero_overbet_obs:
+                    adaptive_reader_state.observe(hs in _BLUFF_CLASSES)
+            if adaptive_aggressor_state is not None and hero_faced_raise_obs:
+                for folded in hero_faced_raise_obs:
+                    adaptive_aggressor_state.observe(folded)
+            if adaptive_stabber_state is not None and hero_faced_bet_obs:
+                for folded in hero_faced_bet_obs:
+                    adaptive_stabber_state.observe(folded)
+            delta = final_stacks.get(hero_name, starting_stack) - starting_stack
+            group_deltas.append(delta)
+            if callcall_river and delta < 0:
+                stats.payoff_loss += 1
+
+        deltas.append(paired_observation(group_deltas))
 
     if adaptive_reader_state is not None:
         s = adaptive_reader_state
@@ -1261,6 +1280,9 @@ def _run_seed_worker(
     `preflop_chart` (when set) is loaded into a SEPARATE hero-only strategy
     table; opponents keep the default chart. Built inside the worker (not the
     parent) so the unpicklable StrategyTable never crosses the process boundary.
+
+    An optional 11th element turns on duplicate-deal mode; the 10-tuple form
+    (variety_eval, casebot_gauntlet) keeps its meaning.
     """
     (
         hero,
@@ -1273,7 +1295,8 @@ def _run_seed_worker(
         h1_classes,
         stack_bb,
         preflop_chart,
-    ) = args
+    ) = args[:10]
+    duplicate = bool(args[10]) if len(args) > 10 else False
     logging.getLogger('poker.bounded_options').setLevel(logging.ERROR)
     if clone_profile:
         _ensure_clone_registered(clone_profile)
@@ -1290,6 +1313,7 @@ def _run_seed_worker(
         h1_classes=h1_classes,
         starting_stack=stack_bb * 100,  # big_blind=100 → stack_bb effective
         hero_table=hero_table,
+        duplicate=duplicate,
     )
     return seed, deltas, stats
 
@@ -1368,6 +1392,13 @@ def main():
         "value-overbet exploitability (SIZING_AWARE_OPPONENT_MODELING.md §D). "
         "Run with/without and diff: the drop = how much a sizing-reader extracts.",
     )
+    p.add_argument(
+        '--duplicate',
+        action='store_true',
+        help="duplicate-deal mode: replay every seeded deal under each seat rotation "
+        "(HU: the seat swap); --hands counts deals and bb/100 comes from per-deal "
+        "paired observations, so card luck cancels",
+    )
     args = p.parse_args()
     if args.oracle_opp:
         os.environ['ORACLE_PUNISH_OVERBETS'] = '1'  # inherited by ProcessPool workers
@@ -1437,6 +1468,7 @@ def main():
             h1_classes,
             args.stack_bb,
             args.preflop_chart,
+            args.duplicate,
         )
         for s in seeds
     ]
@@ -1449,10 +1481,12 @@ def main():
 
     agg_stats = PassivityStats()
     per_seed_bb100: List[Tuple[int, float]] = []
+    pooled_deltas: List[float] = []
     for seed, deltas, stats in sorted(results, key=lambda r: r[0]):
         _aggregate(agg_stats, stats)
         ms = compute_stats(deltas, big_blind=100)
         per_seed_bb100.append((seed, ms.bb100))
+        pooled_deltas.extend(deltas)
 
     print_report(
         args.hero,
@@ -1467,6 +1501,15 @@ def main():
         tell_map=args.tell_map,
         stack_bb=args.stack_bb,
     )
+    if args.duplicate:
+        # Each delta is already a per-deal paired observation, so this CI is
+        # the duplicate-mode one (card luck cancelled within each deal).
+        ps = compute_stats(pooled_deltas, big_blind=100)
+        rotations = len(opponents) + 1
+        print(
+            f"\n── duplicate deals: {ps.n} deals x {rotations} seatings ──\n"
+            f"  paired bb/100: {ps.bb100:+8.1f}   95% CI [{ps.ci_lo:+.1f}, {ps.ci_hi:+.1f}]"
+        )
 
 
 if __name__ == '__main__':
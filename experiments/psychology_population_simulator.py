@@ -0,0 +1,401 @@
+"""Population-scale, NumPy-vectorized psychology simulator for tuning sweeps.
+
+`measure_zone_distribution` drives one real PlayerPsychology per persona, one
+hand at a time, so a sweep over the zone/tilt parameters costs minutes per grid
+point. This module advances a whole population of synthetic players under every
+point of a parameter grid at once: state is a (grid points x players) array and
+each hand is a handful of array ops.
+
+The dynamics are the SHIPPING ones, not a re-derivation:
+  - events go through the same impact table, severity floors and ego / (1-poise)
+    sensitivity as `PlayerPsychology.apply_pressure_event` (clamped per event);
+  - between hands, axes recover exactly as `PlayerPsychology.recover` does
+    (asymmetric zone-config modifiers, energy edge springs, and the
+    TILT_PERSISTENCE / EMOTIONAL_REBALANCE variants, read from the live flags);
+  - baselines come from the real `compute_baseline_*` via PlayerPsychology.
+`tests/test_psychology_population_simulator.py` pins parity with the scalar path.
+
+The event model is `measure_zone_distribution`'s: a played hand is a coin-flip
+win/loss drawn from WIN_MIX / LOSS_MIX (a third straight loss adds
+`losing_streak`), an unplayed hand is `not_in_hand`. All grid points see the
+same event draws (common random numbers), so differences between them are the
+parameters, not sampling noise.
+
+Output per grid point: composure-band occupancy (focused / alert / rattled /
+tilted, as `PlayerPsychology.composure_category`) and the distribution of tilt
+swing durations (contiguous hands with composure < TILT_LINE).
+
+Run:
+    python3 -m experiments.psychology_population_simulator --players 4000 --hands 3000 \\
+        --grid RECOVERY_BELOW_BASELINE_FLOOR=0.5,0.6,0.7 TILT_DRAG_FLOOR=0.2,0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import poker.player_psychology as pp
+from experiments.measure_zone_distribution import LOSS_MIX, WIN_MIX, _load_real_personas
+from poker.player_psychology import PlayerPsychology
+from poker.zone_config import _calculate_sensitivity, _get_severity_floor, get_zone_param
+
+# Zone-config parameters `recover()` reads via get_zone_param.
+ZONE_PARAMS = (
+    'RECOVERY_BELOW_BASELINE_FLOOR',
+    'RECOVERY_BELOW_BASELINE_RANGE',
+    'RECOVERY_ABOVE_BASELINE',
+)
+# Tilt-excursion constants `recover()` reads from poker.player_psychology.
+TILT_PARAMS = (
+    'TILT_LINE',
+    'TILT_DRAG_FLOOR',
+    'TILT_DRAG_EXP',
+    'TILT_SECOND_WIND_K',
+    'TILT_SECOND_WIND_ACCEL',
+    'TILT_EPISODE_MAX_HANDS',
+    'TILT_EPISODE_HOLD_DRAG',
+)
+GRID_PARAMS = ZONE_PARAMS + TILT_PARAMS
+
+# composure_category thresholds, high to low.
+COMPOSURE_BANDS = (('focused', 0.8), ('alert', 0.6), ('rattled', 0.4), ('tilted', 0.0))
+
+STREAK_EVENT = 'losing_streak'
+IDLE_EVENT = 'not_in_hand'
+
+
+def default_params() -> Dict[str, float]:
+    """The live value of every grid parameter."""
+    params = {name: float(get_zone_param(name)) for name in ZONE_PARAMS}
+    params.update({name: float(getattr(pp, name)) for name in TILT_PARAMS})
+    return params
+
+
+def expand_grid(axes: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """Cartesian product of `axes` over the live defaults."""
+    unknown = set(axes) - set(GRID_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown grid parameters: {sorted(unknown)}")
+    base = default_params()
+    names = list(axes)
+    return [
+        {**base, **dict(zip(names, values, strict=True))}
+        for values in itertools.product(*(axes[n] for n in names))
+    ]
+
+
+@dataclass
+class Population:
+    """Per-player anchors and derived baselines, as (N,) arrays."""
+
+    names: List[str]
+    ego: np.ndarray
+    poise: np.ndarray
+    recovery_rate: np.ndarray
+    baseline_energy: np.ndarray
+    baseline_confidence: np.ndarray
+    baseline_composure: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def build_population(personas: Dict[str, dict], size: Optional[int] = None) -> Population:
+    """Tile `personas` (name -> personality config) out to `size` players.
+
+    Baselines come from a real PlayerPsychology per distinct persona, so they
+    follow the live formulas (and the rebalance flag) exactly.
+    """
+    per_persona = []
+    for name, cfg in personas.items():
+        psy = PlayerPsychology.from_personality_config(name, cfg)
+        a = psy.anchors
+        per_persona.append(
+            (
+                name,
+                a.ego,
+                a.poise,
+                a.recovery_rate,
+                a.baseline_energy,
+                psy._baseline_confidence,
+                psy._baseline_composure,
+            )
+        )
+    size = len(per_persona) if size is None else size
+    rows = [per_persona[i % len(per_persona)] for i in range(size)]
+    cols = list(zip(*rows, strict=True))
+    return Population(list(cols[0]), *(np.array(c, dtype=np.float64) for c in cols[1:]))
+
+
+@dataclass
+class SweepResult:
+    """Distributions per grid point (row i = grid[i])."""
+
+    grid: List[Dict[str, float]]
+    hands: int
+    players: int
+    band_occupancy: np.ndarray  # (P, len(COMPOSURE_BANDS)) fraction of player-hands
+    swing_hist: np.ndarray  # (P, max_swing + 1) tilt swings by length; last bin = longer
+    seconds: float
+
+    def swing_percentiles(self, qs: Sequence[float] = (0.5, 0.9, 0.99)) -> np.ndarray:
+        """(P, len(qs)) swing-length percentiles from the histogram."""
+        cdf = np.cumsum(self.swing_hist, axis=1)
+        total = np.maximum(cdf[:, -1:], 1)
+        return np.stack([np.argmax(cdf >= q * total, axis=1) for q in qs], axis=1)
+
+    def swings_per_1k(self) -> np.ndarray:
+        """Tilt swings started per 1000 player-hands, per grid point."""
+        return 1000.0 * self.swing_hist.sum(axis=1) / (self.hands * self.players)
+
+
+class PopulationSimulator:
+    """Advance every (grid point, player) pair one hand per `step`.
+
+    Flags are read once, at construction, through the same helpers
+    PlayerPsychology uses, so a run reflects the system as currently flagged.
+    """
+
+    def __init__(
+        self,
+        population: Population,
+        grid: List[Dict[str, float]],
+        *,
+        play_rate: float = 0.30,
+        seed: int = 42,
+        max_swing: int = 200,
+    ):
+        self.population = population
+        self.grid = grid
+        self.play_rate = play_rate
+        self.max_swing = max_swing
+        self.rng = np.random.default_rng(seed)
+        self.tilt_persist = pp._tilt_persistence_enabled()
+        self.rebalance = pp._emotional_rebalance_enabled()
+
+        impacts = pp._PRESSURE_IMPACTS_REBALANCED if self.rebalance else pp._PRESSURE_IMPACTS
+        self.events = list(dict.fromkeys([*WIN_MIX, *LOSS_MIX, STREAK_EVENT, IDLE_EVENT]))
+        self.event_index = {name: i for i, name in enumerate(self.events)}
+        self.win_ids = np.array([self.event_index[e] for e in WIN_MIX])
+        self.win_p = np.array(list(WIN_MIX.values())) / sum(WIN_MIX.values())
+        self.loss_ids = np.array([self.event_index[e] for e in LOSS_MIX])
+        self.loss_p = np.array(list(LOSS_MIX.values())) / sum(LOSS_MIX.values())
+
+        # Event tables: raw axis deltas, and which axes the event touches.
+        self.d_conf, self.d_comp, self.d_energy = (
+            np.array([impacts.get(e, {}).get(axis, 0.0) for e in self.events])
+            for axis in ('confidence', 'composure', 'energy')
+        )
+        self.has_conf, self.has_comp, self.has_energy = (
+            np.array([axis in impacts.get(e, {}) for e in self.events])
+            for axis in ('confidence', 'composure', 'energy')
+        )
+        # Sensitivity per (event, player): floor + (1 - floor) * anchor.
+        floors = np.array([_get_severity_floor(e) for e in self.events])[:, None]
+        self.conf_sens = _calculate_sensitivity(population.ego[None, :], floors)
+        self.comp_sens = _calculate_sensitivity(1.0 - population.poise[None, :], floors)
+
+        def col(name):
+            return np.array([g[name] for g in grid], dtype=np.float64)[:, None]
+
+        self.p = {name: col(name) for name in GRID_PARAMS}
+
+        shape = (len(grid), len(population))
+        self.conf = np.broadcast_to(population.baseline_confidence, shape).copy()
+        self.comp = np.broadcast_to(population.baseline_composure, shape).copy()
+        self.energy = np.broadcast_to(population.baseline_energy, shape).copy()
+        self.tilt_streak = np.zeros(shape, dtype=np.int64)
+        self.episode_len = np.zeros(shape, dtype=np.int64)
+        self.consec_losses = np.zeros(len(population), dtype=np.int64)
+
+        self.hands = 0
+        self.band_counts = np.zeros((len(grid), len(COMPOSURE_BANDS)), dtype=np.int64)
+        self.swing_hist = np.zeros((len(grid), max_swing + 1), dtype=np.int64)
+        self._swing = np.zeros(shape, dtype=np.int64)
+
+    # --- event model ---
+
+    def draw_hand(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """One hand of events for every player (shared by all grid points).
+
+        Returns (event ids, losing-streak mask, episode-roll uniforms), each (N,).
+        """
+        n = len(self.population)
+        played = self.rng.random(n) < self.play_rate
+        won = self.rng.random(n) < 0.5
+        win_ev = self.rng.choice(self.win_ids, size=n, p=self.win_p)
+        loss_ev = self.rng.choice(self.loss_ids, size=n, p=self.loss_p)
+        lost = played & ~won
+        self.consec_losses = np.where(lost, self.consec_losses + 1, 0)
+        events = np.where(played, np.where(won, win_ev, loss_ev), self.event_index[IDLE_EVENT])
+        return events, self.consec_losses >= 3, self.rng.random(n)
+
+    # --- dynamics ---
+
+    def apply_events(self, event_ids: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        """`apply_pressure_event` for one event per player (where `mask`)."""
+        cols = np.arange(len(self.population))
+        touch_conf, touch_comp, touch_energy = (
+            self.has_conf[event_ids],
+            self.has_comp[event_ids],
+            self.has_energy[event_ids],
+        )
+        if mask is not None:
+            touch_conf, touch_comp, touch_energy = (
+                touch_conf & mask,
+                touch_comp & mask,
+                touch_energy & mask,
+            )
+        new_conf = self.conf + self.d_conf[event_ids] * self.conf_sens[event_ids, cols]
+        new_comp = self.comp + self.d_comp[event_ids] * self.comp_sens[event_ids, cols]
+        new_energy = self.energy + self.d_energy[event_ids]
+        self.conf = np.where(touch_conf, np.clip(new_conf, 0.0, 1.0), self.conf)
+        self.comp = np.where(touch_comp, np.clip(new_comp, 0.0, 1.0), self.comp)
+        self.energy = np.where(touch_energy, np.clip(new_energy, 0.0, 1.0), self.energy)
+
+    def recover(self, episode_u: np.ndarray) -> None:
+        """`PlayerPsychology.recover` with the anchor recovery rate."""
+        pop, p = self.population, self.p
+        rate = pop.recovery_rate
+        floor = p['RECOVERY_BELOW_BASELINE_FLOOR']
+        range_ = p['RECOVERY_BELOW_BASELINE_RANGE']
+        above = p['RECOVERY_ABOVE_BASELINE']
+        pre_conf, pre_comp, pre_energy = self.conf, self.comp, self.energy
+
+        conf_base = pop.baseline_confidence
+        conf_mod = np.where(pre_conf < conf_base, floor + range_ * pre_conf, above)
+        new_conf = pre_conf + (conf_base - pre_conf) * rate * conf_mod
+
+        comp_base = pop.baseline_composure
+        comp_mod = np.where(pre_comp < comp_base, floor + range_ * pre_comp, above)
+        comp_rate = np.broadcast_to(rate, pre_comp.shape)
+        tilted = pre_comp < p['TILT_LINE']
+        if self.rebalance:
+            proneness = (1.0 - pop.poise) ** 2
+            rolled = np.round(
+                proneness * p['TILT_EPISODE_MAX_HANDS'] * (0.4 + 0.6 * episode_u)
+            ).astype(np.int64)
+            self.episode_len = np.where(tilted & (self.tilt_streak == 0), rolled, self.episode_len)
+            held = np.where(
+                self.tilt_streak < self.episode_len,
+                rate * p['TILT_EPISODE_HOLD_DRAG'],
+                p['TILT_SECOND_WIND_ACCEL'],
+            )
+            comp_rate = np.where(tilted, held, comp_rate)
+        elif self.tilt_persist:
+            drag = p['TILT_DRAG_FLOOR'] + (1.0 - p['TILT_DRAG_FLOOR']) * (
+                pop.poise ** p['TILT_DRAG_EXP']
+            )
+            climb = np.where(
+                self.tilt_streak >= p['TILT_SECOND_WIND_K'],
+                p['TILT_SECOND_WIND_ACCEL'],
+                rate * drag,
+            )
+            comp_rate = np.where(tilted, climb, comp_rate)
+        new_comp = pre_comp + (comp_base - pre_comp) * comp_rate * comp_mod
+
+        spring = np.where(
+            pre_energy < 0.15,
+            (0.15 - pre_energy) * 0.33,
+            np.where(pre_energy > 0.85, (pre_energy - 0.85) * 0.33, 0.0),
+        )
+        new_energy = pre_energy + (pop.baseline_energy - pre_energy) * (rate + spring)
+
+        self.conf = np.clip(new_conf, 0.0, 1.0)
+        self.comp = np.clip(new_comp, 0.0, 1.0)
+        self.energy = np.clip(new_energy, 0.0, 1.0)
+        if self.tilt_persist or self.rebalance:
+            self.tilt_streak = np.where(new_comp < p['TILT_LINE'], self.tilt_streak + 1, 0)
+
+    def step(self, event_ids: np.ndarray, streak: np.ndarray, episode_u: np.ndarray) -> None:
+        """One hand: the drawn event, `losing_streak` where due, then recovery."""
+        self.apply_events(event_ids)
+        if streak.any():
+            self.apply_events(np.full_like(event_ids, self.event_index[STREAK_EVENT]), mask=streak)
+        self.recover(episode_u)
+        self._record()
+
+    # --- statistics ---
+
+    def _record(self) -> None:
+        self.hands += 1
+        upper = np.inf
+        for b, (_, lower) in enumerate(COMPOSURE_BANDS):
+            self.band_counts[:, b] += ((self.comp >= lower) & (self.comp < upper)).sum(axis=1)
+            upper = lower
+        below = self.comp < self.p['TILT_LINE']
+        self._close_swings(~below & (self._swing > 0))
+        self._swing = np.where(below, self._swing + 1, 0)
+
+    def _close_swings(self, ended: np.ndarray) -> None:
+        rows, cols = np.nonzero(ended)
+        np.add.at(self.swing_hist, (rows, np.minimum(self._swing[rows, cols], self.max_swing)), 1)
+
+    def run(self, hands: int) -> SweepResult:
+        start = time.perf_counter()
+        for _ in range(hands):
+            self.step(*self.draw_hand())
+        # Swings still open at the end count at their length so far.
+        self._close_swings(self._swing > 0)
+        self._swing[:] = 0
+        return SweepResult(
+            grid=self.grid,
+            hands=self.hands,
+            players=len(self.population),
+            band_occupancy=self.band_counts / (self.hands * len(self.population)),
+            swing_hist=self.swing_hist.copy(),
+            seconds=time.perf_counter() - start,
+        )
+
+
+def _parse_axis(spec: str) -> Tuple[str, List[float]]:
+    name, _, values = spec.partition('=')
+    return name, [float(v) for v in values.split(',')]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--players', type=int, default=4000)
+    ap.add_argument('--hands', type=int, default=3000)
+    ap.add_argument('--play-rate', type=float, default=0.30)
+    ap.add_argument('--seed', type=int, default=42)
+    ap.add_argument(
+        '--grid',
+        nargs='*',
+        default=[],
+        metavar='PARAM=v1,v2',
+        help=f'parameter axes; any of {", ".join(GRID_PARAMS)}',
+    )
+    args = ap.parse_args()
+
+    grid = expand_grid(dict(_parse_axis(s) for s in args.grid))
+    population = build_population(_load_real_personas(), args.players)
+    sim = PopulationSimulator(population, grid, play_rate=args.play_rate, seed=args.seed)
+    result = sim.run(args.hands)
+
+    swept = [_parse_axis(s)[0] for s in args.grid]
+    bands = [b for b, _ in COMPOSURE_BANDS]
+    print(
+        f'{len(grid)} grid points x {len(population)} players x {args.hands} hands '
+        f'in {result.seconds:.1f}s (tilt_persist={sim.tilt_persist}, rebalance={sim.rebalance})'
+    )
+    head = '  '.join(f'{n[:14]:>14s}' for n in swept)
+    cells = '  '.join(f'{b:>8s}' for b in bands)
+    print(f'{head}  {cells}  {"swings/1k":>9s} {"p50":>4s} {"p90":>4s} {"p99":>4s}')
+    pcts = result.swing_percentiles()
+    rates = result.swings_per_1k()
+    for i, point in enumerate(grid):
+        params = '  '.join(f'{point[n]:14.3f}' for n in swept)
+        occ = '  '.join(f'{100 * v:7.2f}%' for v in result.band_occupancy[i])
+        p50, p90, p99 = pcts[i]
+        print(f'{params}  {occ}  {rates[i]:9.2f} {p50:4d} {p90:4d} {p99:4d}')
+
+
+if __name__ == '__main__':
+    main()
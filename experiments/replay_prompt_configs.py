@@ -18,6 +18,7 @@ from typing import Dict, List
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.llm import CallType, LLMClient
+from core.llm.prompt_blobs import hydrate_capture
 from poker.prompt_config import PromptConfig
 
 # Define prompt config variants to test
@@ -69,7 +70,7 @@ def get_hybrid_captures(db_path: str, limit: int = 50, preflop_only: bool = Fals
             SELECT
                 id, game_id, player_name, hand_number, phase,
                 player_hand, community_cards, pot_total, cost_to_call,
-                action_taken, system_prompt, user_message, ai_response,
+                action_taken, system_prompt, system_prompt_hash, user_message, ai_response,
                 model, provider
             FROM prompt_captures
             WHERE game_id LIKE '%hybrid%'
@@ -83,7 +84,7 @@ def get_hybrid_captures(db_path: str, limit: int = 50, preflop_only: bool = Fals
             (limit,),
         )
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [hydrate_capture(conn, dict(row)) for row in cursor.fetchall()]
 
 
 def build_minimal_prompt(capture: Dict, config: PromptConfig) -> tuple:
@@ -17,6 +17,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.llm import CallType, LLMClient
+from core.llm.prompt_blobs import hydrate_capture
 
 # Predefined guidance variants to test
 GUIDANCE_VARIANTS = {
@@ -103,7 +104,7 @@ def get_capture(db_path: str, capture_id: int) -> dict:
         if not row:
             raise ValueError(f"Capture {capture_id} not found")
 
-        return dict(row)
+        return hydrate_capture(conn, dict(row))
 
 
 def inject_guidance(user_message: str, guidance_text: str) -> str:
@@ -29,6 +29,7 @@ from typing import Any, Callable, Dict, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.llm import CallType, LLMClient
+from core.llm.prompt_blobs import hydrate_capture
 from experiments.pause_coordinator import pause_coordinator
 from experiments.variant_config import build_effective_variant_config
 from poker.repositories import create_repos
@@ -263,7 +264,7 @@ class ReplayExperimentRunner:
             row = cursor.fetchone()
             if not row:
                 return None
-            return dict(row)
+            return hydrate_capture(conn, dict(row))
 
     def _replay_capture(
         self, capture: Dict[str, Any], variant_dict: Dict[str, Any]
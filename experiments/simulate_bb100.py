@@ -9,6 +9,9 @@ Usage:
     docker compose exec backend python -m experiments.simulate_bb100 --hands 10000
     docker compose exec backend python -m experiments.simulate_bb100 --hands 10000 --round-robin
     docker compose exec backend python -m experiments.simulate_bb100 --hands 1000 --verbose
+    docker compose exec backend python -m experiments.simulate_bb100 --hands 20000 \
+        --sequential --allin-ev --futility-bb100 5
+    docker compose exec backend python -m experiments.simulate_bb100 --hands 2000 --duplicate
 """
 
 import argparse
@@ -34,7 +37,13 @@ except ImportError:
         return it
 
 
+from experiments._duplicate import duplicate_seatings, paired_observation
 from experiments._hand_loop import drive_hand
+from experiments._sequential import (
+    SequentialTest,
+    allin_ev_deltas,
+    format_sequential_result,
+)
 from poker.memory.cbet_detector import CbetDetector
 from poker.memory.opponent_model import OpponentModelManager
 from poker.poker_game import (
@@ -793,6 +802,7 @@ def run_hand(
     hand_number: Optional[int] = None,
     equity_seed: Optional[int] = None,
     decision_observer: Optional[Callable] = None,
+    on_run_it_out: Optional[Callable] = None,
 ) -> Dict[str, int]:
     """Drive one complete hand to completion.
 
@@ -811,6 +821,10 @@ def run_hand(
     ``decision_observer`` is an optional diagnostics hook called after the
     controller chooses an action but before ``play_turn`` mutates state. It
     must not alter gameplay state.
+
+    ``on_run_it_out`` is forwarded to ``drive_hand``: called once with the
+    game state when the hand goes to an all-in runout (the all-in EV
+    adjustment snapshot).
     """
     controller_map = {c.player_name: c for c in controllers}
 
@@ -970,6 +984,7 @@ def run_hand(
         on_decision=_on_decision,
         post_action=_post_action,
         on_max_actions=lambda: logger.warning("Max actions reached — terminating hand"),
+        on_run_it_out=on_run_it_out,
     )
 
     # Polarization Phase A: end-of-hand equity-at-action recording.
@@ -1035,6 +1050,9 @@ def run_matchup(
     disable_rules: Optional[frozenset] = None,
     game_id: Optional[str] = None,
     enable_session_drift: bool = False,
+    allin_ev: bool = False,
+    sequential: Optional[SequentialTest] = None,
+    duplicate: bool = False,
 ) -> List[float]:
     """Run n_hands between two archetypes.
 
@@ -1052,6 +1070,20 @@ def run_matchup(
     anchors then drive every hand in this matchup — drift is per-
     session, not per-hand. Default off so the post-patch baselines
     measured for the Phase B gate stay reproducible.
+
+    `allin_ev` (default False): report each hand's delta with the all-in
+    runout luck integrated out (`_sequential.allin_ev_deltas`) instead of the
+    realized result — same expectation, much lower variance.
+
+    `sequential`: when provided, every per-hand delta is streamed into it and
+    the matchup stops early once the test reaches a decision; `n_hands` is then
+    the cap. The returned list covers only the hands actually played.
+
+    `duplicate` (default False): play every seeded deal twice, the second
+    time with the seats swapped (`_duplicate.duplicate_seatings`). `n_hands`
+    then counts deals (2x the hands are played) and each returned entry is
+    the deal's paired observation — A's mean delta over both seatings — so
+    the card luck of the deal cancels.
     """
     config_a = apply_adaptation_bias_override(ARCHETYPES[archetype_a], hero_adaptation_bias)
     config_b = ARCHETYPES[archetype_b]
@@ -1102,76 +1134,99 @@ def run_matchup(
     ):
         hand_seed = base_seed + hand_num
         dealer_idx = hand_num % 2  # alternate button for fairness
+        seatings = duplicate_seatings([name_a, name_b], duplicate)
+        group_deltas: List[float] = []
+
+        # Duplicate mode replays this deal with the seats swapped: same deck,
+        # same button, so A holds B's cards in B's position the second time
+        # and the deal's card luck cancels out of the pair.
+        for k, seating in enumerate(seatings):
+            hand_number = hand_num * len(seatings) + k
+            # Re-seed the global `random` module per hand. Several downstream
+            # consumers (eval7.Deck().shuffle() inside calculate_quick_equity,
+            # rule strategies' fallback paths, etc.) read from the global
+            # random state. Without per-hand re-seeding, cross-matchup
+            # state varies based on prior matchups' consumption — including
+            # any drift-induced changes to tiered controllers' decision
+            # schedule, which advances global random differently and breaks
+            # reproducibility for downstream rule_bot matchups. Per-hand
+            # seeding isolates each hand to its own deterministic prefix.
+            random.seed(hand_seed)
+
+            gs = make_game_state(
+                player_names=seating,
+                big_blind=big_blind,
+                starting_stack=starting_stack,
+                dealer_idx=dealer_idx,
+                seed=hand_seed,
+            )
+            sm = PokerStateMachine(gs)
+            # Tell the state machine the deck seed was provided. Otherwise
+            # `_resolve_hand_seed` falls back to `random.getrandbits(32)`
+            # (global random state) and reshuffles the deck on the first
+            # initialize_hand_transition — making the sim non-deterministic
+            # despite `make_game_state(seed=hand_seed)` setting up a
+            # deterministic initial deck.
+            sm.current_hand_seed = hand_seed
+
+            ctrl_a = make_controller(
+                name_a,
+                config_a,
+                strategy_table,
+                sm,
+                rng_seed=hand_seed,
+                decision_analysis_repo=decision_analysis_repo,
+                disable_rules=disable_rules,
+                game_id=game_id,
+            )
+            ctrl_b = make_controller(
+                name_b,
+                config_b,
+                strategy_table,
+                sm,
+                rng_seed=hand_seed + 1_000_000,
+            )
 
-        # Re-seed the global `random` module per hand. Several downstream
-        # consumers (eval7.Deck().shuffle() inside calculate_quick_equity,
-        # rule strategies' fallback paths, etc.) read from the global
-        # random state. Without per-hand re-seeding, cross-matchup
-        # state varies based on prior matchups' consumption — including
-        # any drift-induced changes to tiered controllers' decision
-        # schedule, which advances global random differently and breaks
-        # reproducibility for downstream rule_bot matchups. Per-hand
-        # seeding isolates each hand to its own deterministic prefix.
-        random.seed(hand_seed)
-
-        gs = make_game_state(
-            player_names=[name_a, name_b],
-            big_blind=big_blind,
-            starting_stack=starting_stack,
-            dealer_idx=dealer_idx,
-            seed=hand_seed,
-        )
-        sm = PokerStateMachine(gs)
-        # Tell the state machine the deck seed was provided. Otherwise
-        # `_resolve_hand_seed` falls back to `random.getrandbits(32)`
-        # (global random state) and reshuffles the deck on the first
-        # initialize_hand_transition — making the sim non-deterministic
-        # despite `make_game_state(seed=hand_seed)` setting up a
-        # deterministic initial deck.
-        sm.current_hand_seed = hand_seed
-
-        ctrl_a = make_controller(
-            name_a,
-            config_a,
-            strategy_table,
-            sm,
-            rng_seed=hand_seed,
-            decision_analysis_repo=decision_analysis_repo,
-            disable_rules=disable_rules,
-            game_id=game_id,
-        )
-        ctrl_b = make_controller(
-            name_b,
-            config_b,
-            strategy_table,
-            sm,
-            rng_seed=hand_seed + 1_000_000,
-        )
-
-        # Attach the shared manager to the hero controller for this hand.
-        ctrl_a.opponent_model_manager = opponent_manager
-        opponent_manager.record_hand_dealt(
-            observer=name_a,
-            opponents=[name_b],
-            hand_number=hand_num,
-        )
+            # Attach the shared manager to the hero controller for this hand.
+            ctrl_a.opponent_model_manager = opponent_manager
+            opponent_manager.record_hand_dealt(
+                observer=name_a,
+                opponents=[name_b],
+                hand_number=hand_number,
+            )
 
-        final_stacks = run_hand(
-            sm,
-            [ctrl_a, ctrl_b],
-            big_blind,
-            verbose=verbose,
-            opponent_manager=opponent_manager,
-            hero_name=name_a,
-            hand_number=hand_num,
-            # Stable per-hand seed for the Phase A equity Monte Carlo.
-            # Without this, calculate_equity_vs_random uses an unseeded
-            # Random and recorded equity values vary across runs — which
-            # feeds the opponent model and breaks sim reproducibility.
-            equity_seed=hand_seed * 31 + 7,
-        )
-        delta_a = final_stacks.get(name_a, starting_stack) - starting_stack
-        deltas_a.append(delta_a)
+            allin_snapshot: List = []
+            final_stacks = run_hand(
+                sm,
+                [ctrl_a, ctrl_b],
+                big_blind,
+                verbose=verbose,
+                opponent_manager=opponent_manager,
+                hero_name=name_a,
+                hand_number=hand_number,
+                # Stable per-hand seed for the Phase A equity Monte Carlo.
+                # Without this, calculate_equity_vs_random uses an unseeded
+                # Random and recorded equity values vary across runs — which
+                # feeds the opponent model and breaks sim reproducibility.
+                equity_seed=hand_seed * 31 + 7,
+                on_run_it_out=allin_snapshot.append if allin_ev else None,
+            )
+            if allin_ev:
+                delta_a = allin_ev_deltas(
+                    allin_snapshot[0] if allin_snapshot else None,
+                    {name_a: starting_stack, name_b: starting_stack},
+                    final_stacks,
+                    seed=hand_seed,
+                )[name_a]
+            else:
+                delta_a = final_stacks.get(name_a, starting_stack) - starting_stack
+            group_deltas.append(delta_a)
+
+        obs_a = paired_observation(group_deltas)
+        deltas_a.append(obs_a)
+
+        if sequential is not None and sequential.add(obs_a) is not None:
+            break
 
     return deltas_a
 
@@ -1213,6 +1268,7 @@ def run_6max_matchup(
     disable_rules: Optional[frozenset] = None,
     decision_analysis_repo=None,
     game_id: Optional[str] = None,
+    duplicate: bool = False,
 ) -> List[float]:
     """Run n_hands of 6-max poker: 1 archetype + 5 opponents.
 
@@ -1230,6 +1286,11 @@ def run_6max_matchup(
     per-decision pipeline snapshot (incl. the `push_fold_routed` flag) is
     persisted — the validation hook for short-stack push/fold routing.
     Mirrors the HU `run_matchup` persistence path.
+
+    `duplicate=True` replays each deal under all 6 seat rotations (same deck,
+    same button), so the hero holds every seat's cards once per deal. `n_hands`
+    then counts deals and each returned entry is the hero's mean delta over
+    the deal's rotations (see `_duplicate`).
     """
     if opponents is None:
         opponents = ['Baseline'] * 5
@@ -1266,62 +1327,67 @@ def run_6max_matchup(
     ):
         hand_seed = base_seed + hand_num
         dealer_idx = hand_num % 6  # rotate button through all 6 seats
-
-        random.seed(hand_seed)  # see HU branch — per-hand global-random reset
-
-        gs = make_game_state(
-            player_names=all_names,
-            big_blind=big_blind,
-            starting_stack=starting_stack,
-            dealer_idx=dealer_idx,
-            seed=hand_seed,
-        )
-        sm = PokerStateMachine(gs)
-        sm.current_hand_seed = hand_seed  # see HU branch above
-
-        controllers = [
-            make_controller(
-                archetype_seat,
-                config_arch,
-                strategy_table,
-                sm,
-                rng_seed=hand_seed,
-                disable_rules=disable_rules,  # hero only — ablation target
-                decision_analysis_repo=decision_analysis_repo,
-                game_id=game_id,
+        seatings = duplicate_seatings(all_names, duplicate)
+        group_deltas: List[float] = []
+
+        for k, seating in enumerate(seatings):
+            hand_number = hand_num * len(seatings) + k
+            random.seed(hand_seed)  # see HU branch — per-hand global-random reset
+
+            gs = make_game_state(
+                player_names=seating,
+                big_blind=big_blind,
+                starting_stack=starting_stack,
+                dealer_idx=dealer_idx,
+                seed=hand_seed,
             )
-        ]
-        for i, (seat, cfg) in enumerate(zip(opponent_seats, opp_configs, strict=False)):
-            controllers.append(
+            sm = PokerStateMachine(gs)
+            sm.current_hand_seed = hand_seed  # see HU branch above
+
+            controllers = [
                 make_controller(
-                    seat,
-                    cfg,
+                    archetype_seat,
+                    config_arch,
                     strategy_table,
                     sm,
-                    rng_seed=hand_seed + 1_000_000 * (i + 1),
+                    rng_seed=hand_seed,
+                    disable_rules=disable_rules,  # hero only — ablation target
+                    decision_analysis_repo=decision_analysis_repo,
+                    game_id=game_id,
                 )
+            ]
+            for i, (seat, cfg) in enumerate(zip(opponent_seats, opp_configs, strict=False)):
+                controllers.append(
+                    make_controller(
+                        seat,
+                        cfg,
+                        strategy_table,
+                        sm,
+                        rng_seed=hand_seed + 1_000_000 * (i + 1),
+                    )
+                )
+
+            # Attach the shared manager to the hero controller for this hand.
+            controllers[0].opponent_model_manager = opponent_manager
+            opponent_manager.record_hand_dealt(
+                observer=archetype_seat,
+                opponents=opponent_seats,
+                hand_number=hand_number,
             )
 
-        # Attach the shared manager to the hero controller for this hand.
-        controllers[0].opponent_model_manager = opponent_manager
-        opponent_manager.record_hand_dealt(
-            observer=archetype_seat,
-            opponents=opponent_seats,
-            hand_number=hand_num,
-        )
+            final_stacks = run_hand(
+                sm,
+                controllers,
+                big_blind,
+                verbose=verbose,
+                opponent_manager=opponent_manager,
+                hero_name=archetype_seat,
+                hand_number=hand_number,
+                equity_seed=hand_seed * 31 + 7,
+            )
+            group_deltas.append(final_stacks.get(archetype_seat, starting_stack) - starting_stack)
 
-        final_stacks = run_hand(
-            sm,
-            controllers,
-            big_blind,
-            verbose=verbose,
-            opponent_manager=opponent_manager,
-            hero_name=archetype_seat,
-            hand_number=hand_num,
-            equity_seed=hand_seed * 31 + 7,
-        )
-        delta = final_stacks.get(archetype_seat, starting_stack) - starting_stack
-        deltas.append(delta)
+        deltas.append(paired_observation(group_deltas))
 
     return deltas
 
@@ -1334,11 +1400,17 @@ def run_all_6max_vs_baseline(
     seed: int,
     verbose: bool = False,
     hero_adaptation_bias: Optional[float] = None,
+    duplicate: bool = False,
 ):
     """Run each archetype vs 5 baselines at 6-max."""
     print(f"\nBB/100 Simulation: 6-MAX, {n_hands} hands per archetype, seed={seed}")
     print("Format: 1 archetype + 5 Baselines, dealer rotates")
     print(f"Stack: {starting_stack}, BB: {big_blind}")
+    if duplicate:
+        print(
+            "Duplicate deals: ON — each deal replayed under every seat rotation; "
+            "bb/100 + CI from per-deal paired observations ('Hands' = deals)"
+        )
     print("=" * 67)
 
     results: Dict[str, MatchupStats] = {}
@@ -1359,6 +1431,7 @@ def run_all_6max_vs_baseline(
             base_seed=seed,
             verbose=verbose,
             hero_adaptation_bias=hero_adaptation_bias,
+            duplicate=duplicate,
         )
         results[name] = compute_stats(deltas, big_blind)
 
@@ -1387,6 +1460,7 @@ def run_all_6max_vs_rules(
     disable_rules: Optional[frozenset] = None,
     decision_analysis_repo=None,
     game_id_prefix: Optional[str] = None,
+    duplicate: bool = False,
 ):
     """Run each tiered archetype vs a fixed mix of 5 rule_bots at 6-max.
 
@@ -1402,6 +1476,11 @@ def run_all_6max_vs_rules(
     if disable_rules:
         rules_str = ', '.join(f'{l}.{r}' for (l, r) in sorted(disable_rules))
         print(f"Disabled (hero only): {rules_str}")
+    if duplicate:
+        print(
+            "Duplicate deals: ON — each deal replayed under every seat rotation; "
+            "bb/100 + CI from per-deal paired observations ('Hands' = deals)"
+        )
     print("=" * 67)
 
     # Test all tiered archetypes (not the rule_bots themselves)
@@ -1429,6 +1508,7 @@ def run_all_6max_vs_rules(
             disable_rules=disable_rules,
             decision_analysis_repo=decision_analysis_repo,
             game_id=matchup_game_id,
+            duplicate=duplicate,
         )
         results[name] = compute_stats(deltas, big_blind)
 
@@ -1600,8 +1680,16 @@ def run_all_vs_tag(
     disable_rules: Optional[frozenset] = None,
     game_id_prefix: Optional[str] = None,
     enable_session_drift: bool = False,
+    allin_ev: bool = False,
+    sequential_cfg: Optional[dict] = None,
+    duplicate: bool = False,
 ):
-    """Run each archetype heads-up vs TAG (or specified opponent)."""
+    """Run each archetype heads-up vs TAG (or specified opponent).
+
+    `sequential_cfg` (SequentialTest kwargs minus big_blind/max_hands) turns on
+    early stopping: each matchup runs at most `n_hands` and stops at the first
+    block where its sequential test decides.
+    """
     print(f"\nBB/100 Simulation: {n_hands} hands per matchup, seed={seed}")
     print(f"Opponent: {opponent}, Stack: {starting_stack}, BB: {big_blind}")
     if hero_adaptation_bias is not None:
@@ -1611,15 +1699,30 @@ def run_all_vs_tag(
         print(f"Disabled rules: {rules_str}")
     if enable_session_drift:
         print("Session drift: ENABLED (anchors perturbed once per matchup)")
+    if allin_ev:
+        print("All-in EV adjustment: ON (runout luck integrated out)")
+    if sequential_cfg is not None:
+        print(f"Sequential early stopping: {sequential_cfg}")
+    if duplicate:
+        print(
+            "Duplicate deals: ON — each deal replayed under every seat rotation; "
+            "bb/100 + CI from per-deal paired observations ('Hands' = deals)"
+        )
     print("=" * 67)
 
     results: Dict[str, MatchupStats] = {}
+    sequential_results = {}
 
     for name in ARCHETYPES:
         # Phase 7.6 Step 7: per-matchup game_id for trace persistence.
         matchup_game_id = (
             f'{game_id_prefix}_{name}_vs_{opponent}' if game_id_prefix is not None else None
         )
+        sequential = (
+            SequentialTest(big_blind, n_hands, **sequential_cfg)
+            if sequential_cfg is not None
+            else None
+        )
         deltas = run_matchup(
             name,
             opponent,
@@ -1634,10 +1737,19 @@ def run_all_vs_tag(
             disable_rules=disable_rules,
             game_id=matchup_game_id,
             enable_session_drift=enable_session_drift,
+            allin_ev=allin_ev,
+            sequential=sequential,
+            duplicate=duplicate,
         )
         results[name] = compute_stats(deltas, big_blind)
+        if sequential is not None:
+            sequential_results[name] = sequential.finish()
 
     print_results(results, opponent_label=opponent)
+    if sequential_results:
+        print("\nSequential stopping (look-adjusted CIs):")
+        for name, seq in sequential_results.items():
+            print(f"  {name:<23} {format_sequential_result(seq, n_hands)}")
     if opponent == 'Baseline':
         print_baseline_hypothesis_check(results)
     else:
@@ -1872,6 +1984,53 @@ def main():
         help='Call-retention multiplier for the sizing-defense layer (default '
         '0.55 — retain ~55%% of baseline calls vs a face-up big bet).',
     )
+    parser.add_argument(
+        '--duplicate',
+        action='store_true',
+        help='Duplicate-deal mode: replay every seeded deal under each seat '
+        'rotation (heads-up: the seat swap) and report bb/100 from the '
+        'per-deal paired observations. --hands then counts deals; the hands '
+        'played are deals x seats. Card luck cancels within a deal.',
+    )
+    parser.add_argument(
+        '--allin-ev',
+        action='store_true',
+        help='Score all-in-before-the-river hands by runout equity instead of '
+        'the realized result (heads-up vs-opponent mode). Same expectation, '
+        'much lower variance.',
+    )
+    parser.add_argument(
+        '--sequential',
+        action='store_true',
+        help='Early-stopping sequential mode (heads-up vs-opponent mode): '
+        '--hands becomes the cap, and each matchup stops at the first block '
+        'whose look-adjusted CI clears 0 (or falls inside --futility-bb100).',
+    )
+    parser.add_argument(
+        '--block-size',
+        type=int,
+        default=200,
+        help='Hands per sequential look (default: 200)',
+    )
+    parser.add_argument(
+        '--alpha',
+        type=float,
+        default=0.05,
+        help='Overall two-sided false-positive rate across all looks (default: 0.05)',
+    )
+    parser.add_argument(
+        '--futility-bb100',
+        type=float,
+        default=None,
+        help='Stop as "no meaningful effect" once the whole CI sits inside '
+        '±this many bb/100. Default: off (only stop on a decisive winner).',
+    )
+    parser.add_argument(
+        '--min-hands',
+        type=int,
+        default=0,
+        help='Never stop a sequential matchup before this many hands (default: 0)',
+    )
     args = parser.parse_args()
 
     # Short-stack knob: --start-bb overrides --stack so matchups play at a
@@ -2028,6 +2187,7 @@ def main():
             disable_rules=disable_rules,
             decision_analysis_repo=decision_analysis_repo,
             game_id_prefix=game_id_prefix,
+            duplicate=args.duplicate,
         )
     elif args.six_max:
         run_all_6max_vs_baseline(
@@ -2038,6 +2198,7 @@ def main():
             args.seed,
             verbose=args.verbose,
             hero_adaptation_bias=args.adaptation_bias,
+            duplicate=args.duplicate,
         )
     elif args.round_robin:
         run_round_robin(
@@ -2062,6 +2223,18 @@ def main():
             disable_rules=disable_rules,
             game_id_prefix=game_id_prefix,
             enable_session_drift=args.enable_session_drift,
+            allin_ev=args.allin_ev,
+            duplicate=args.duplicate,
+            sequential_cfg=(
+                {
+                    'block_size': args.block_size,
+                    'alpha': args.alpha,
+                    'futility_bb100': args.futility_bb100,
+                    'min_hands': args.min_hands,
+                }
+                if args.sequential
+                else None
+            ),
         )
 
 
@@ -6,6 +6,9 @@ They get initialized in the app factory via init_app().
 
 import logging
 import re
+import time
+from contextlib import contextmanager
+from typing import Dict
 
 from authlib.integrations.flask_client import OAuth
 from flask import Flask, request
@@ -129,6 +132,10 @@ oauth = OAuth()
 # Personality generator
 personality_generator = None
 
+# Wall time (ms) of each init_extensions() step from the last run, in run order.
+# Logged at the end of startup and printed by scripts/startup_report.py.
+startup_timings: Dict[str, float] = {}
+
 
 def get_rate_limit_key():
     """Rate-limit key: a real (OAuth) account's stable id, else the client IP (PRH-41).
@@ -405,40 +412,84 @@ def init_auth(app: Flask) -> None:
     init_authorization(user_repo, auth_manager)
 
 
+@contextmanager
+def _startup_step(name: str):
+    """Record the wall time of one init_extensions() step in startup_timings."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def get_startup_report() -> dict:
+    """Per-step init timings (ms) of the last init_extensions() run."""
+    return {
+        'steps_ms': dict(startup_timings),
+        'total_ms': round(sum(startup_timings.values()), 1),
+    }
+
+
 def init_extensions(app: Flask) -> None:
-    """Initialize all Flask extensions with the app."""
+    """Initialize all Flask extensions with the app.
+
+    Each step is timed into ``startup_timings``; the breakdown is logged once
+    startup finishes. Heavy services are not built here: LLM provider SDKs are
+    imported on first use, and the schema check returns immediately on a DB
+    with no pending migrations.
+    """
+    startup_timings.clear()
+
     # Initialize CORS
-    init_cors(app)
+    with _startup_step('cors'):
+        init_cors(app)
 
     # Initialize rate limiter
-    init_limiter(app)
+    with _startup_step('limiter'):
+        init_limiter(app)
 
     # Initialize SocketIO
-    socketio.init_app(app)
+    with _startup_step('socketio'):
+        socketio.init_app(app)
 
     # Initialize persistence
-    init_persistence()
+    with _startup_step('persistence'):
+        init_persistence()
 
     # Seed base pricing from YAML (idempotent - only adds missing SKUs)
-    sync_pricing_from_yaml()
+    with _startup_step('sync_pricing'):
+        sync_pricing_from_yaml()
 
     # Sync enabled_models with PROVIDER_MODELS (idempotent - only adds missing models)
-    sync_enabled_models()
+    with _startup_step('sync_enabled_models'):
+        sync_enabled_models()
 
     # Sync game mode presets from YAML (overwrites system presets each startup)
-    sync_game_modes_from_yaml()
+    with _startup_step('sync_game_modes'):
+        sync_game_modes_from_yaml()
 
     # Initialize OAuth (must be before auth)
-    init_oauth(app)
+    with _startup_step('oauth'):
+        init_oauth(app)
 
     # Initialize auth
-    init_auth(app)
+    with _startup_step('auth'):
+        init_auth(app)
 
     # Initialize admin from environment variable
-    if user_repo:
-        admin_user_id = user_repo.initialize_admin_from_env()
-        if admin_user_id:
-            logger.info(f"Initial admin configured: {admin_user_id}")
-
-    # Initialize personality generator
-    init_personality_generator()
+    with _startup_step('admin_from_env'):
+        if user_repo:
+            admin_user_id = user_repo.initialize_admin_from_env()
+            if admin_user_id:
+                logger.info(f"Initial admin configured: {admin_user_id}")
+
+    # Initialize personality generator (its LLM client is built on first use)
+    with _startup_step('personality_generator'):
+        init_personality_generator()
+
+    report = get_startup_report()
+    logger.info(
+        "Extensions initialized in %.0f ms (%s)",
+        report['total_ms'],
+        ", ".join(f"{name}={ms:.0f}ms" for name, ms in report['steps_ms'].items()),
+    )
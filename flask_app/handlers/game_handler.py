@@ -8,9 +8,11 @@ import json
 import logging
 import sqlite3
 import threading
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from core import feature_flags
 from core.card import Card
 from poker.ai_resilience import (
     AIFallbackStrategy,
@@ -33,7 +35,7 @@ from poker.poker_game import (
     play_turn,
 )
 from poker.poker_state_machine import PokerPhase
-from poker.psychology_pipeline import PsychologyContext, PsychologyPipeline
+from poker.psychology_pipeline import PostHandWrites, PsychologyContext, PsychologyPipeline
 from poker.rule_based_controller import RuleBasedController, RuleConfig
 from poker.rule_bot_controller import RuleBotController
 from poker.runout_reactions import compute_runout_reactions, runout_schedule_payload
@@ -51,9 +53,10 @@ from ..extensions import (
     socketio,
     tournament_repo,
 )
-from ..services import game_state_service
+from ..services import emit_decorations, game_state_service
 from ..services.ai_debug_service import get_all_players_llm_stats
 from ..services.elasticity_service import format_elasticity_data
+from ..state_delta import frame_log
 from ..state_version import next_state_version
 from .avatar_handler import get_avatar_url_with_fallback, start_single_emotion_generation
 from .message_handler import (
@@ -509,18 +512,80 @@ def _all_ai_no_llm(ai_controllers: dict) -> bool:
     return True
 
 
+def _build_static_decorations(game_id: str, current_game_data: dict, game_state) -> dict:
+    """Per-hand seat decorations for the state push (see services.emit_decorations).
+
+    Everything here is stable within a hand: the human owner's profile avatar
+    and each AI's nickname and rule-bot badge.
+    """
+    # Lazy import to avoid circulars; used for is_rule_bot detection.
+    from poker.rule_bot_controller import RuleBotController
+    from poker.tiered_bot_controller import BaselineSolverBot
+
+    # Resolve the human owner's custom profile avatar once per hand (indexed
+    # lookup). A mid-game change in /profile shows up from the next hand.
+    # Applied to the human seat so the player isn't a bare initial like the
+    # AIs aren't.
+    human_avatar_url = None
+    owner_id = current_game_data.get('owner_id')
+    if owner_id:
+        try:
+            from ..extensions import user_avatar_service
+
+            if user_avatar_service:
+                human_avatar_url = user_avatar_service.get_avatar_url(owner_id)
+        except Exception as e:
+            logger.debug(f"Could not resolve human avatar for {owner_id}: {e}")
+
+    ai_controllers = current_game_data.get('ai_controllers', {})
+    seats = {}
+    for player in game_state.players:
+        controller = ai_controllers.get(player.name)
+        if player.is_human or controller is None:
+            continue
+        seat = {}
+        # Rule-bot flag drives the UI's "bot" badge overlay.
+        if isinstance(controller, RuleBotController | BaselineSolverBot):
+            seat['is_rule_bot'] = True
+        # Nickname from personality config (for compact UI display).
+        # RuleBasedController has no ai_player, so check first.
+        if hasattr(controller, 'ai_player') and controller.ai_player:
+            nickname = controller.ai_player.personality_config.get('nickname')
+            if nickname:
+                seat['nickname'] = nickname
+        seats[player.name] = seat
+
+    return {'human_avatar_url': human_avatar_url, 'seats': seats}
+
+
 def update_and_emit_game_state(game_id: str) -> None:
     """Emit the current game state to all clients in the game room.
 
     Args:
         game_id: The game identifier
     """
+    start = time.perf_counter()
+    cache_hit = _emit_game_state(game_id)
+    if cache_hit is not None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        emit_decorations.emit_latency['warm' if cache_hit else 'cold'].record(elapsed_ms)
+
+
+def _emit_game_state(game_id: str) -> Optional[bool]:
+    """Build and emit the frame; returns whether the static decorations were
+    cached (None when the game isn't loaded)."""
     current_game_data = game_state_service.get_game(game_id)
     if not current_game_data:
-        return
+        return None
 
     game_state = current_game_data['state_machine'].game_state
     game_state_dict = game_state.to_dict()
+    static, cache_hit = emit_decorations.get_static_decorations(
+        current_game_data,
+        game_state,
+        lambda: _build_static_decorations(game_id, current_game_data, game_state),
+    )
+    human_avatar_url = static['human_avatar_url']
 
     # Resolve the human player name once so we can attach their observations of
     # each AI opponent to the corresponding player_dict below.
@@ -536,25 +601,6 @@ def update_and_emit_game_state(game_id: str) -> None:
     )
     pressure_stats = current_game_data.get('pressure_stats')
 
-    # Lazy import to avoid circulars; used for is_rule_bot detection.
-    from poker.rule_bot_controller import RuleBotController
-    from poker.tiered_bot_controller import BaselineSolverBot
-
-    # Resolve the human owner's custom profile avatar once per emit (cheap
-    # indexed lookup; kept fresh rather than cached so a mid-game change in
-    # /profile shows up on the next state push). Applied to the human seat
-    # below so the player isn't a bare initial like the AIs aren't.
-    human_avatar_url = None
-    owner_id = current_game_data.get('owner_id')
-    if owner_id:
-        try:
-            from ..extensions import user_avatar_service
-
-            if user_avatar_service:
-                human_avatar_url = user_avatar_service.get_avatar_url(owner_id)
-        except Exception as e:
-            logger.debug(f"Could not resolve human avatar for {owner_id}: {e}")
-
     # Add avatar data and psychology to AI players
     ai_controllers = current_game_data.get('ai_controllers', {})
     for player_dict in game_state_dict.get('players', []):
@@ -583,16 +629,8 @@ def update_and_emit_game_state(game_id: str) -> None:
             player_dict['avatar_emotion'] = display_emotion
             player_dict['avatar_url'] = avatar_url
 
-            # Rule-bot flag drives the UI's "bot" badge overlay.
-            if isinstance(controller, RuleBotController | BaselineSolverBot):
-                player_dict['is_rule_bot'] = True
-
-            # Add nickname from personality config (for compact UI display)
-            # RuleBasedController has no ai_player, so check first
-            if hasattr(controller, 'ai_player') and controller.ai_player:
-                nickname = controller.ai_player.personality_config.get('nickname')
-                if nickname:
-                    player_dict['nickname'] = nickname
+            # Rule-bot badge + nickname (per-hand cached)
+            player_dict.update(static['seats'].get(player_name, {}))
 
             # Add psychology data for heads-up mode display (skip for RuleBots)
             psych = controller.psychology
@@ -637,17 +675,18 @@ def update_and_emit_game_state(game_id: str) -> None:
             if player_pressure is not None:
                 player_dict['pressure_summary'] = player_pressure.get_summary()
 
-    # Add LLM debug info for AI players (when enabled)
+    # LLM debug info for AI players (when enabled). Not part of the per-hand
+    # decorations: every AI decision adds a call, so it is read on each emit.
+    llm_stats = {}
     if config.enable_ai_debug:
-        ai_player_names = [
-            p.get('name') for p in game_state_dict.get('players', []) if not p.get('is_human', True)
-        ]
+        ai_player_names = [p.name for p in game_state.players if not p.is_human]
         if ai_player_names:
             llm_stats = get_all_players_llm_stats(game_id, ai_player_names)
-            for player_dict in game_state_dict.get('players', []):
-                player_name = player_dict.get('name', '')
-                if player_name in llm_stats:
-                    player_dict['llm_debug'] = llm_stats[player_name]
+    if llm_stats:
+        for player_dict in game_state_dict.get('players', []):
+            player_name = player_dict.get('name', '')
+            if player_name in llm_stats:
+                player_dict['llm_debug'] = llm_stats[player_name]
 
     # Include messages (transform to frontend format)
     messages = format_messages_for_api(current_game_data.get('messages', []))
@@ -712,7 +751,42 @@ def update_and_emit_game_state(game_id: str) -> None:
     # (the two-hand-flicker class of bug). See flask_app.state_version.
     game_state_dict['state_version'] = next_state_version()
 
+    # Delta frames: when the room already holds the previous frame, send only
+    # the changed paths keyed by its version; clients that hold a different
+    # version ask for a full resync (request_full_state). See flask_app.state_delta.
+    if feature_flags.is_enabled('STATE_PATCH_FRAMES_ENABLED'):
+        patch = frame_log.record(game_id, game_state_dict)
+        if patch is not None:
+            base_version, ops = patch
+            socketio.emit(
+                'game_state_patch',
+                {
+                    'game_id': game_id,
+                    'base_version': base_version,
+                    'state_version': game_state_dict['state_version'],
+                    'ops': ops,
+                },
+                to=game_id,
+            )
+            return cache_hit
+    else:
+        frame_log.forget(game_id)
+
     socketio.emit('update_game_state', {'game_state': game_state_dict}, to=game_id)
+    return cache_hit
+
+
+def emit_full_game_state(game_id: str, to: str) -> None:
+    """Resend the last full frame to one socket (a patch client that hit a gap).
+
+    Falls back to a fresh room-wide emit when no frame has been recorded yet
+    (e.g. after a server restart).
+    """
+    frame = frame_log.latest(game_id)
+    if frame is None:
+        update_and_emit_game_state(game_id)
+        return
+    socketio.emit('update_game_state', {'game_state': frame}, to=to)
 
 
 def build_cash_mode_payload(current_game_data: dict, game_state) -> Optional[dict]:
@@ -3336,6 +3410,7 @@ def _run_async_narration(game_id: str, game_data: dict, pending: list) -> None:
     since the synchronous emotional-state save was removed with the deferral.
     """
     ai_controllers = game_data.get('ai_controllers', {})
+    writes = PostHandWrites(game_id)
     for req in pending:
         controller = ai_controllers.get(req.player_name)
         if controller is None or getattr(controller, 'psychology', None) is None:
@@ -3347,8 +3422,7 @@ def _run_async_narration(game_id: str, game_data: dict, pending: list) -> None:
                 # controller_state row (psychology_json carries narrative/
                 # inner_voice). The emotional_state table was retired in v136.
                 prompt_config = getattr(controller, 'prompt_config', None)
-                game_repo.save_controller_state(
-                    game_id,
+                writes.add_controller_state(
                     req.player_name,
                     psychology=controller.psychology.to_dict(),
                     prompt_config=prompt_config.to_dict() if prompt_config else None,
@@ -3358,6 +3432,8 @@ def _run_async_narration(game_id: str, game_data: dict, pending: list) -> None:
                 f"[Game {game_id}] Async narration failed for {req.player_name}: {e}",
                 exc_info=True,
             )
+    # One commit for the table's narrated states instead of one per player.
+    writes.commit(game_repo=game_repo)
 
 
 def _run_async_commentary(
@@ -3908,7 +3984,8 @@ def handle_evaluating_hand_phase(game_id: str, game_data: dict, state_machine, g
     socketio.emit('winner_announcement', winner_data, to=game_id)
 
     # === UNIFIED PSYCHOLOGY PIPELINE ===
-    # Runs synchronously: detect -> resolve -> persist -> update -> recover -> save
+    # Runs synchronously: detect -> resolve -> update -> recover, then one commit
+    # for the hand's psychology writes (PostHandWrites)
     hand_number = _get_hand_number(game_data)
 
     if 'pressure_detector' not in game_data:
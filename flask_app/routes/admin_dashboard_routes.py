@@ -8,7 +8,10 @@ from datetime import datetime, timezone
 from flask import Blueprint, jsonify, request
 
 from core.llm import UsageTracker
+from core.llm.hedging import hedge_stats
+from core.llm.latency_sketch import latency_sketches
 from poker.authorization import require_permission
+from poker.repositories.prompt_capture_repository import decode_capture_cursor
 
 from .. import extensions
 from ..extensions import (
@@ -21,7 +24,7 @@ from ..extensions import (
     settings_repo,
 )
 from ..route_utils import register_admin_guard
-from ..services import game_state_service
+from ..services import emit_decorations, game_state_service
 
 logger = logging.getLogger(__name__)
 
@@ -193,9 +196,18 @@ def api_playground_captures():
         provider: Filter by LLM provider
         limit: Max results (default 50)
         offset: Pagination offset (default 0)
+        cursor: Keyset cursor from the previous page's next_cursor (replaces offset)
+        q: Full-text search over prompt, response and tags
         date_from: Filter by start date (ISO format)
         date_to: Filter by end date (ISO format)
     """
+    cursor = request.args.get('cursor') or None
+    if cursor:
+        try:
+            decode_capture_cursor(cursor)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'Invalid cursor'}), 400
+
     try:
         result = extensions.prompt_capture_repo.list_playground_captures(
             call_type=request.args.get('call_type'),
@@ -204,6 +216,8 @@ def api_playground_captures():
             offset=int(request.args.get('offset', 0)),
             date_from=request.args.get('date_from'),
             date_to=request.args.get('date_to'),
+            search=request.args.get('q') or None,
+            cursor=cursor,
         )
 
         # Stats are a full-table aggregation that blocks the list. Callers can
@@ -219,6 +233,7 @@ def api_playground_captures():
                 'success': True,
                 'captures': result['captures'],
                 'total': result['total'],
+                'next_cursor': result['next_cursor'],
                 'stats': stats,
             }
         )
@@ -1535,6 +1550,49 @@ def api_reset_settings():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@admin_dashboard_bp.route('/api/emit-latency')
+@_dev_only
+def api_emit_latency():
+    """Game-state push latency histograms since process start (or last reset).
+
+    ``cold`` emits rebuilt the per-hand seat decorations, ``warm`` emits reused
+    them (see services.emit_decorations). ``?reset=1`` clears the counters.
+    """
+    snapshot = emit_decorations.emit_latency_snapshot()
+    if request.args.get('reset') == '1':
+        for hist in emit_decorations.emit_latency.values():
+            hist.reset()
+    return jsonify({'success': True, 'emit_latency': snapshot})
+
+
+@admin_dashboard_bp.route('/api/llm-latency')
+@_dev_only
+def api_llm_latency():
+    """LLM latency percentiles per provider / model / call_type.
+
+    ``live`` comes from this process's histograms: the last 15 minutes (with
+    error counts, for spotting a degrading provider) and since start.
+    ``persisted`` reads the api_usage latency rollups (every process) over
+    ``?range=`` (24h / 7d / 30d / all, default 24h); both use the same buckets.
+    ``hedging`` counts this process's hedged-request outcomes (see
+    core.llm.hedging).
+    """
+    range_param = request.args.get('range', '24h')
+    try:
+        persisted = extensions.llm_repo.get_latency_by_call_type(_get_date_modifier(range_param))
+        return jsonify(
+            {
+                'success': True,
+                'range': range_param,
+                'live': latency_sketches.snapshot(),
+                'persisted': persisted,
+                'hedging': hedge_stats.snapshot(),
+            }
+        )
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @admin_dashboard_bp.route('/api/active-games')
 @_dev_only
 def api_active_games():
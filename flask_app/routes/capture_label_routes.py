@@ -18,6 +18,8 @@ import logging
 
 from flask import Blueprint, jsonify, request
 
+from poker.repositories.prompt_capture_repository import decode_capture_cursor
+
 from .. import extensions
 from ..route_utils import register_admin_guard
 
@@ -156,10 +158,13 @@ def search_captures():
         game_id, player_name, action, phase: Optional filters
         min_pot_odds, max_pot_odds: Optional pot odds range
         error_type, has_error, is_correction: Resilience filters
+        q: Full-text search over prompt, response and tags (unlabelled search only)
         limit, offset: Pagination
+        cursor: Keyset cursor from the previous page's next_cursor (replaces offset;
+            unlabelled search only)
 
     Returns:
-        {"success": true, "captures": [...], "total": 123}
+        {"success": true, "captures": [...], "total": 123, "next_cursor": "..."}
     """
     try:
         # Parse labels from comma-separated string
@@ -175,6 +180,18 @@ def search_captures():
         max_pot_odds = request.args.get('max_pot_odds', type=float)
         limit = request.args.get('limit', 50, type=int)
         offset = request.args.get('offset', 0, type=int)
+        search = request.args.get('q') or None
+        cursor = request.args.get('cursor') or None
+
+        if cursor:
+            try:
+                decode_capture_cursor(cursor)
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid cursor'}), 400
+        if labels and (search or cursor):
+            return jsonify(
+                {'success': False, 'error': 'q and cursor are not supported with labels'}
+            ), 400
 
         # Parse error/correction filters
         error_type = request.args.get('error_type')
@@ -220,11 +237,20 @@ def search_captures():
                 error_type=error_type,
                 has_error=has_error,
                 is_correction=is_correction,
+                search=search,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
             )
 
-        return jsonify({'success': True, 'captures': result['captures'], 'total': result['total']})
+        return jsonify(
+            {
+                'success': True,
+                'captures': result['captures'],
+                'total': result['total'],
+                'next_cursor': result.get('next_cursor'),
+            }
+        )
     except Exception as e:
         logger.error(f"Error searching captures: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
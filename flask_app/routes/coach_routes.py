@@ -267,7 +267,7 @@ def coach_preflop_leaks():
     from ..services.coach_leaks import (
         compute_preflop_leaks,
         count_owner_preflop_decisions,
-        load_owner_preflop_decisions,
+        load_owner_preflop_counts,
     )
 
     owner_id = _get_current_user_id()
@@ -291,7 +291,7 @@ def coach_preflop_leaks():
     def _build() -> dict:
         # VPIP-by-position bars: orientation only (always all-time; depth scopes
         # the chart leaks, not these context bars).
-        vpip_report = compute_preflop_leaks(load_owner_preflop_decisions(db_path, owner_id))
+        vpip_report = compute_preflop_leaks(load_owner_preflop_counts(db_path, owner_id))
         # Load chart decisions ONCE; depth-slice, then reuse for every pass.
         all_decisions = load_owner_chart_decisions(db_path, owner_id)
         deep_n = sum(
@@ -1,12 +1,14 @@
 """Admin cost-analytics routes — LLM + image-gen spend breakdowns.
 
-Read-only aggregation over the `api_usage` table, gated behind the same
+Read-only aggregation over `api_usage` (via its hourly/daily rollups for
+everything but per-game and per-call views), gated behind the same
 `can_access_admin_tools` permission as the rest of the admin surface.
 Cost comes from the pre-computed `estimated_cost` column (USD), written at
 insert time by UsageTracker — these endpoints never re-derive pricing.
 
 Three drill levels, mirroring the dashboard:
   1. overview  — KPIs + by-owner + by-call-type + by-model + time-series
+                 + per-model latency percentiles
   2. owner/<id> — one owner's call-type / model / time-series breakdown
   3. calls      — raw individual rows, filtered by owner / call_type
 
@@ -60,6 +62,8 @@ def cost_overview():
         by_game = repo.get_cost_by_game(date_modifier, limit=50)
         uncosted = repo.get_uncosted_calls(date_modifier)
         timeseries = repo.get_cost_timeseries(date_modifier, bucket=_bucket_for_range(range_param))
+        latency = repo.get_latency_by_model(date_modifier)
+        prompt_cache = repo.get_prompt_cache_by_call_type(date_modifier)
         return jsonify(
             {
                 'range': range_param,
@@ -70,6 +74,8 @@ def cost_overview():
                 'by_game': by_game,
                 'uncosted': uncosted,
                 'timeseries': timeseries,
+                'latency_by_model': latency,
+                'prompt_cache_by_call_type': prompt_cache,
             }
         )
     except Exception as e:
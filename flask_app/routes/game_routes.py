@@ -46,6 +46,7 @@ from ..game_adapter import StateMachineAdapter
 from ..handlers.avatar_handler import start_background_avatar_generation
 from ..handlers.chat_relationship import dispatch_chat_relationship_event
 from ..handlers.game_handler import (
+    emit_full_game_state,
     maybe_engage_fast_forward_on_fold,
     progress_game,
     recover_stuck_runout,
@@ -2687,6 +2688,31 @@ def register_socket_events(sio):
             logger.debug(f"[SOCKET] Starting game progression for: {game_id_str}")
             progress_game(game_id_str)
 
+    @sio.on('request_full_state')
+    @socket_rate_limit(max_calls=20, window_seconds=10)
+    def on_request_full_state(data):
+        """Resync a patch client that holds a different base version.
+
+        A ``game_state_patch`` only applies on top of the exact frame it was
+        diffed against; a client that joined mid-stream or missed a frame asks
+        here and gets the last full ``update_game_state`` frame on its own
+        socket. See flask_app.state_delta.
+        """
+        game_id = str((data or {}).get('game_id', ''))
+        game_data = game_state_service.get_game(game_id)
+        if not game_data:
+            _emit_reload_if_persisted(game_id)
+            return
+
+        user = extensions.auth_manager.get_current_user() if extensions.auth_manager else None
+        owner_id = game_data.get('owner_id')
+        user_id = user.get('id') if user else None
+        if not user_id or (user_id != owner_id and not _is_admin(user_id)):
+            emit('auth_error', {'error': 'Not authorized for this game', 'code': 'NOT_OWNER'})
+            return
+
+        emit_full_game_state(game_id, to=request.sid)
+
     @sio.on('player_action')
     @socket_rate_limit(max_calls=10, window_seconds=10)
     def handle_player_action(data):
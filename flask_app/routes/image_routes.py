@@ -1,13 +1,16 @@
 """Character image routes.
 
-Serves avatar images from the database (primary) with filesystem fallback.
+Serves avatar images from the content-addressed avatar store (see
+poker/avatar_store.py) with filesystem fallback. Avatar responses carry the
+content hash as ETag and answer If-None-Match with 304.
 """
 
 import logging
 import time
+from functools import lru_cache
 from pathlib import Path
 
-from flask import Blueprint, Response, jsonify, request, send_from_directory
+from flask import Blueprint, Response, jsonify, request, send_file, send_from_directory
 
 from core.llm.config import POLLINATIONS_RATE_LIMIT_DELAY
 from poker.authorization import require_permission
@@ -15,10 +18,10 @@ from poker.character_images import (
     EMOTIONS,
     generate_character_images,
     get_available_emotions,
+    get_avatar_file,
     get_character_image_service,
     has_character_images,
     load_avatar_image,
-    load_full_avatar_image,
     regenerate_avatar_emotion,
 )
 from poker.image_processing import detect_image_mimetype
@@ -46,6 +49,18 @@ def _detect_image_mimetype(image_data: bytes) -> str:
     return detect_image_mimetype(image_data) or 'image/png'
 
 
+@lru_cache(maxsize=4096)
+def _store_file_mimetype(path: str) -> str:
+    """Sniff an avatar-store file's mimetype from its leading bytes.
+
+    The row's `content_type` is not trusted (writers record 'image/png' for
+    every upload). Store files are named by content hash and never rewritten,
+    so the answer is cached per path.
+    """
+    with open(path, 'rb') as f:
+        return _detect_image_mimetype(f.read(16))
+
+
 GENERATED_IMAGES_DIR = Path(__file__).parent.parent.parent / 'generated_images'
 
 
@@ -54,7 +69,7 @@ def _load_with_priority_fallback(
     emotion: str,
     loader,
 ):
-    """Load avatar image bytes for `emotion`, falling back to a priority
+    """Load the avatar for `emotion` via `loader`, falling back to a priority
     emotion if the requested one is missing.
 
     Some personalities were seeded before `thinking` was added to
@@ -64,7 +79,7 @@ def _load_with_priority_fallback(
     and break the avatar element.
 
     Returns:
-        (image_bytes_or_None, served_emotion_or_None, is_fallback)
+        (loaded_avatar_or_None, served_emotion_or_None, is_fallback)
     """
     image_data = loader(personality_name, emotion)
     if image_data:
@@ -80,6 +95,29 @@ def _load_with_priority_fallback(
     return None, None, False
 
 
+def _avatar_response(avatar: dict, cache_header: str, served_emotion: str) -> Response:
+    """Serve an avatar located by ``get_avatar_file``.
+
+    Store files go out via sendfile; inline bytes (in-memory DB) as a normal
+    body. Either way the content hash is the ETag, so a revalidating client
+    gets a 304 without the image being read.
+    """
+    if avatar['path']:
+        response = send_file(
+            avatar['path'],
+            mimetype=_store_file_mimetype(avatar['path']),
+            etag=avatar['hash'] or True,
+            conditional=True,
+        )
+    else:
+        response = Response(avatar['data'], mimetype=_detect_image_mimetype(avatar['data']))
+        response.set_etag(avatar['hash'])
+        response.make_conditional(request)
+    response.headers['Cache-Control'] = cache_header
+    response.headers['X-Avatar-Served-Emotion'] = served_emotion
+    return response
+
+
 @image_bp.route('/api/character-images', methods=['GET'])
 def list_character_images():
     """List all generated character images."""
@@ -224,9 +262,10 @@ def serve_grid_icon(filename):
 @image_bp.route('/api/avatar/<personality_name>/<emotion>')
 @limiter.exempt
 def serve_avatar(personality_name: str, emotion: str):
-    """Serve avatar image from database.
+    """Serve avatar image from the avatar store.
 
-    This is the primary endpoint for database-stored avatars.
+    This is the primary endpoint for stored avatars. ``?size=64|128`` serves a
+    pre-generated smaller icon.
 
     Args:
         personality_name: Name of the personality (URL encoded)
@@ -243,13 +282,14 @@ def serve_avatar(personality_name: str, emotion: str):
         if emotion not in EMOTIONS:
             emotion = 'confident'
 
-        image_data, served_emotion, is_fallback = _load_with_priority_fallback(
+        size = request.args.get('size', type=int)
+        avatar, served_emotion, is_fallback = _load_with_priority_fallback(
             personality_name,
             emotion,
-            load_avatar_image,
+            lambda name, emo: get_avatar_file(name, emo, 'icon', size),
         )
 
-        if image_data:
+        if avatar:
             if is_fallback:
                 # Kick off generation of the requested emotion so it's ready
                 # next time. Optional game_id query param routes the socket
@@ -263,15 +303,7 @@ def serve_avatar(personality_name: str, emotion: str):
             else:
                 cache_header = 'public, max-age=86400'
 
-            mimetype = _detect_image_mimetype(image_data)
-            return Response(
-                image_data,
-                mimetype=mimetype,
-                headers={
-                    'Cache-Control': cache_header,
-                    'X-Avatar-Served-Emotion': served_emotion or emotion,
-                },
-            )
+            return _avatar_response(avatar, cache_header, served_emotion or emotion)
 
         return jsonify({'error': f'Avatar not found for {personality_name} - {emotion}'}), 404
 
@@ -283,9 +315,10 @@ def serve_avatar(personality_name: str, emotion: str):
 @image_bp.route('/api/avatar/<personality_name>/<emotion>/full')
 @limiter.exempt
 def serve_full_avatar(personality_name: str, emotion: str):
-    """Serve full uncropped avatar image from database.
+    """Serve full uncropped avatar image from the avatar store.
 
-    This endpoint serves the full-size image for CSS-based cropping on the frontend.
+    This endpoint serves the full-size image for CSS-based cropping on the
+    frontend. ``?size=256`` serves a pre-generated smaller rendition.
 
     Args:
         personality_name: Name of the personality (URL encoded)
@@ -304,19 +337,20 @@ def serve_full_avatar(personality_name: str, emotion: str):
 
         # Prefer full images across priority emotions, then fall back to
         # cropped icons. Both pass through the same priority-emotion ladder.
-        image_data, served_emotion, is_fallback = _load_with_priority_fallback(
+        size = request.args.get('size', type=int)
+        avatar, served_emotion, is_fallback = _load_with_priority_fallback(
             personality_name,
             emotion,
-            load_full_avatar_image,
+            lambda name, emo: get_avatar_file(name, emo, 'full', size),
         )
-        if image_data is None:
-            image_data, served_emotion, is_fallback = _load_with_priority_fallback(
+        if avatar is None:
+            avatar, served_emotion, is_fallback = _load_with_priority_fallback(
                 personality_name,
                 emotion,
-                load_avatar_image,
+                lambda name, emo: get_avatar_file(name, emo, 'icon'),
             )
 
-        if image_data:
+        if avatar:
             if is_fallback:
                 game_id = request.args.get('game_id')
                 start_single_emotion_generation(game_id, personality_name, emotion)
@@ -324,15 +358,7 @@ def serve_full_avatar(personality_name: str, emotion: str):
             else:
                 cache_header = 'public, max-age=86400'
 
-            mimetype = _detect_image_mimetype(image_data)
-            return Response(
-                image_data,
-                mimetype=mimetype,
-                headers={
-                    'Cache-Control': cache_header,
-                    'X-Avatar-Served-Emotion': served_emotion or emotion,
-                },
-            )
+            return _avatar_response(avatar, cache_header, served_emotion or emotion)
 
         return jsonify({'error': f'Full avatar not found for {personality_name} - {emotion}'}), 404
 
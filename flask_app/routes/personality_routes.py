@@ -16,6 +16,7 @@ from poker.utils import get_celebrities
 
 from .. import config, extensions
 from ..extensions import limiter
+from ..services import emit_decorations
 
 logger = logging.getLogger(__name__)
 
@@ -290,6 +291,8 @@ def update_personality(name):
                 owner_id=user_id,
                 visibility='private',
             )
+        # Live games cache nicknames per hand; rebuild them on the next push.
+        emit_decorations.bump_personality_epoch()
 
         return jsonify({'success': True, 'message': f'Personality {name} updated successfully'})
     except Exception as e:
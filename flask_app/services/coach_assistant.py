@@ -420,7 +420,12 @@ def _format_stats_for_prompt(data: Dict) -> str:
 
     outs = data.get('outs')
     if outs is not None:
-        lines.append(f"Outs: {outs}")
+        by_class = data.get('outs_by_class')
+        if by_class:
+            detail = ', '.join(f"{n} to {hand_class}" for hand_class, n in by_class.items())
+            lines.append(f"Outs: {outs} ({detail})")
+        else:
+            lines.append(f"Outs: {outs}")
 
     rec = data.get('recommendation')
     if rec:
@@ -10,6 +10,8 @@ enriches coaching data with skill-aware progression context.
 
 import logging
 import os
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from poker.card_utils import card_to_string
@@ -20,9 +22,10 @@ from poker.controllers import (
     _process_preflop_lines,
     classify_preflop_hand,
 )
-from poker.decision_analyzer import DecisionAnalyzer
+from poker.decision_analyzer import DecisionAnalyzer, equity_memo_key
 from poker.hand_evaluator import HandEvaluator
-from poker.hand_ranges import OpponentInfo
+from poker.hand_ranges import OpponentInfo, get_opponent_range
+from poker.outs_calculator import compute_outs
 
 from ..extensions import game_repo
 from ..services import game_state_service
@@ -40,6 +43,40 @@ logger = logging.getLogger(__name__)
 _COACH_EQUITY_ITERATIONS = int(os.environ.get("DECISION_ANALYSIS_ITERATIONS", "2000"))
 _decision_analyzer = DecisionAnalyzer(iterations=_COACH_EQUITY_ITERATIONS)
 
+# The coach is asked for stats, then questions, about the same decision point;
+# each request re-ran both equity Monte Carlos. Keep the most recent spots'
+# results (keyed like the analysis worker's batch memo) so only the first pays.
+_EQUITY_MEMO_SIZE = 256
+_equity_memo: 'OrderedDict[tuple, float]' = OrderedDict()
+_equity_memo_lock = threading.Lock()
+
+
+def _memoized_equity(key: tuple, compute) -> Optional[float]:
+    """Return the memoized equity for ``key``, computing it on a miss.
+    ``None`` (failed calculation) is not stored."""
+    with _equity_memo_lock:
+        if key in _equity_memo:
+            _equity_memo.move_to_end(key)
+            return _equity_memo[key]
+    value = compute()
+    if value is not None:
+        with _equity_memo_lock:
+            _equity_memo[key] = value
+            while len(_equity_memo) > _EQUITY_MEMO_SIZE:
+                _equity_memo.popitem(last=False)
+    return value
+
+
+def _equity_vs_random(
+    player_hand: List[str], community: List[str], num_opponents: int
+) -> Optional[float]:
+    return _memoized_equity(
+        equity_memo_key(player_hand, community, num_opponents),
+        lambda: _decision_analyzer.calculate_equity_vs_random(
+            player_hand, community, num_opponents
+        ),
+    )
+
 
 def _get_position_label(game_state, player_idx: int) -> str:
     """Get position label for a player.
@@ -69,8 +106,11 @@ def _compute_equity(
 
     try:
         if opponent_infos:
-            equity = _decision_analyzer.calculate_equity_vs_ranges(
-                player_hand, community, opponent_infos
+            equity = _memoized_equity(
+                equity_memo_key(player_hand, community, len(opponent_infos), opponent_infos),
+                lambda: _decision_analyzer.calculate_equity_vs_ranges(
+                    player_hand, community, opponent_infos
+                ),
             )
             if equity is not None:
                 return equity
@@ -78,9 +118,7 @@ def _compute_equity(
 
         # Fallback: vs random hands
         num_opponents = len(opponent_infos) if opponent_infos else 1
-        equity = _decision_analyzer.calculate_equity_vs_random(
-            player_hand, community, num_opponents
-        )
+        equity = _equity_vs_random(player_hand, community, num_opponents)
         if equity is not None:
             return equity
 
@@ -91,48 +129,27 @@ def _compute_equity(
         return None
 
 
-def _compute_outs(player_hand: List[str], community: List[str]) -> Optional[Dict]:
-    """Count cards that improve the player's hand rank."""
+def _compute_outs(
+    player_hand: List[str], community: List[str], opponent_infos: Optional[List] = None
+) -> Optional[Dict]:
+    """Exact outs: unseen cards that improve the hand class and leave the player
+    ahead of the opponents' combined range (any two cards without opponent info).
+
+    Cached per (hole, board, range) in `poker.outs_calculator`, so repeat coach
+    requests at the same decision point are free.
+    """
     if not community:
         return None
 
     try:
-        import eval7
-
-        hero_cards = [eval7.Card(c) for c in player_hand]
-        board_cards = [eval7.Card(c) for c in community]
-        known = set(hero_cards + board_cards)
-        deck = [c for c in eval7.Deck().cards if c not in known]
-
-        if len(board_cards) >= 3:
-            # Evaluate current hand with available cards
-            if len(board_cards) == 5:
-                current_score = eval7.evaluate(hero_cards + board_cards)
-            else:
-                # For incomplete boards, evaluate current made hand
-                # by considering the best among random completions
-                current_score = eval7.evaluate(
-                    hero_cards + board_cards + deck[: 5 - len(board_cards)]
-                )
-
-            outs = []
-            for card in deck:
-                test_board = board_cards + [card]
-                if len(test_board) < 5:
-                    remaining = [c for c in deck if c != card]
-                    test_score = eval7.evaluate(
-                        hero_cards + test_board + remaining[: 5 - len(test_board)]
-                    )
-                else:
-                    test_score = eval7.evaluate(hero_cards + test_board[:5])
-
-                if test_score > current_score:
-                    outs.append(str(card))
-
-            return {
-                'count': len(outs),
-                'cards': outs[:15],  # Cap display at 15
-            }
+        opponent_range = None
+        if opponent_infos:
+            opponent_range = set()
+            for info in opponent_infos:
+                opponent_range |= get_opponent_range(info)
+        outs = compute_outs(player_hand, community, opponent_range)
+        if outs is not None:
+            return outs.to_dict(max_cards=15)  # Cap display at 15
     except Exception as e:
         logger.warning(f"Outs calculation failed: {e}", exc_info=True)
 
@@ -773,6 +790,7 @@ def compute_coaching_data(
         'hand_rank': None,
         'outs': None,
         'outs_cards': None,
+        'outs_by_class': None,
         'recommendation': None,
         'opponent_stats': [],
     }
@@ -796,9 +814,7 @@ def compute_coaching_data(
     # Only calculate separately when primary equity used opponent ranges;
     # if no ranges were available, _compute_equity already fell back to vs-random.
     if opponent_infos and equity is not None:
-        equity_random = _decision_analyzer.calculate_equity_vs_random(
-            hand_strs, community_strs, num_opponents
-        )
+        equity_random = _equity_vs_random(hand_strs, community_strs, num_opponents)
         result['equity_vs_random'] = round(equity_random, 3) if equity_random is not None else None
     elif equity is not None:
         # Primary equity was already vs-random — reuse it
@@ -831,10 +847,11 @@ def compute_coaching_data(
 
     # Outs (only post-flop, pre-river)
     if community_strs and len(community_strs) < 5:
-        outs_info = _compute_outs(hand_strs, community_strs)
+        outs_info = _compute_outs(hand_strs, community_strs, opponent_infos)
         if outs_info:
             result['outs'] = outs_info['count']
             result['outs_cards'] = outs_info['cards']
+            result['outs_by_class'] = outs_info['by_class']
 
     # Optimal action recommendation
     if equity is not None:
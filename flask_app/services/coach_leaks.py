@@ -13,7 +13,11 @@ node construction (`build_preflop_node` wants a game_state), so it's deferred.
 
 The core (`compute_preflop_leaks`) is pure: it takes decision records + a
 reference predicate and returns ranked leaks, so it's unit-testable without a DB.
-`load_owner_preflop_decisions` is the thin DB adapter.
+`load_owner_preflop_counts` is the thin DB adapter: it reads the per-owner
+(hand, position, action) counts kept current by triggers on every analyzed
+decision (`owner_preflop_action_counts`), so the report's cost no longer grows
+with the player's history. `load_owner_preflop_decisions` is the row-level scan
+it replaces, kept as the fallback for a DB without the table.
 
 Honest scope: this measures VPIP (voluntary play vs fold), position-grouped — it
 catches the big, costly "too loose / too tight by position" leak (the #1 leak),
@@ -199,7 +203,9 @@ def compute_preflop_leaks(
     """Diff a player's preflop decisions against a reference range.
 
     `decisions`: iterable of dicts with `canon`, `position` (any form), and
-    `action` (the preflop action taken). Pure — no DB/IO.
+    `action` (the preflop action taken), plus an optional `n` — how many
+    identical decisions the record stands for (aggregate rows; default 1).
+    Pure — no DB/IO.
     """
     _ensure_position_groups()
     _ensure_group_names()
@@ -213,10 +219,11 @@ def compute_preflop_leaks(
         action = (d.get('action') or '').lower()
         if not canon or not group:
             continue
-        total += 1
-        agg[(group, canon)][1] += 1
+        weight = d.get('n', 1)
+        total += weight
+        agg[(group, canon)][1] += weight
         if action in _VOLUNTARY:
-            agg[(group, canon)][0] += 1
+            agg[(group, canon)][0] += weight
 
     # Per-position rollup (ungated — VPIP context + total loose-play count).
     pos: dict[str, dict] = defaultdict(lambda: {'decisions': 0, 'voluntary': 0, 'loose_plays': 0})
@@ -313,27 +320,50 @@ def load_owner_preflop_decisions(db_path: str, owner_id: str) -> list[dict]:
     return rows
 
 
+def load_owner_preflop_counts(db_path: str, owner_id: str) -> list[dict]:
+    """Load an owner's HUMAN preflop decisions as (canon, position, action, n) counts.
+
+    Same scope as `load_owner_preflop_decisions`, read from the trigger-kept
+    `owner_preflop_action_counts` aggregate (bounded by hands x positions x
+    actions, not by history length). Falls back to the row scan when the table
+    doesn't exist yet. Best-effort, read-only.
+    """
+    import sqlite3
+
+    try:
+        conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+        try:
+            rows = conn.execute(
+                "SELECT canon, position, action, n FROM owner_preflop_action_counts "
+                "WHERE owner_id = ?",
+                (owner_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.OperationalError:
+        return load_owner_preflop_decisions(db_path, owner_id)
+    except Exception as e:
+        logger.warning("load_owner_preflop_counts failed for %s: %s", owner_id, e)
+        return []
+    return [
+        {'canon': canon, 'position': position or None, 'action': action, 'n': n}
+        for canon, position, action, n in rows
+    ]
+
+
 def count_owner_preflop_decisions(db_path: str, owner_id: str) -> int:
-    """Cheap owner-scoped PRE_FLOP row count — the cache key for the leak report.
+    """Owner-scoped human PRE_FLOP decision count — the cache key for the leak report.
 
-    Slightly over-counts vs the human-seat filter (we don't apply
-    player_name==owner_name here, to keep it a single indexed COUNT), which is
-    fine for a cache key: any new hand bumps it, the cache misses, and the report
-    recomputes. Read-only.
+    A sum over the owner's rows of `owner_preflop_action_counts`: any newly
+    analyzed hand bumps it, the cache misses, and the report recomputes.
+    Read-only.
     """
     import sqlite3
 
     try:
         conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
         n = conn.execute(
-            """
-            SELECT COUNT(*)
-            FROM player_decision_analysis pda
-            JOIN games g ON g.game_id = pda.game_id
-            WHERE g.owner_id = ?
-              AND pda.phase = 'PRE_FLOP'
-              AND pda.player_hand_canonical IS NOT NULL
-            """,
+            "SELECT COALESCE(SUM(n), 0) FROM owner_preflop_action_counts WHERE owner_id = ?",
             (owner_id,),
         ).fetchone()[0]
         conn.close()
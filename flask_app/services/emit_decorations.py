@@ -0,0 +1,65 @@
+"""Per-hand cache of the static decorations on the game-state push.
+
+``update_and_emit_game_state`` decorates every seat before each push. Some of
+that is genuinely dynamic (stacks, bets, display emotion, psychology) but a
+good part only changes between hands: the human owner's profile avatar and
+each AI's nickname and rule-bot badge. This module keeps those per game, keyed
+by
+
+    (hand number, seats + controller identities, personality epoch)
+
+so the first emit of a hand builds them and every later action's emit reuses
+them. The key changes — and the cache rebuilds — on hand start, any seat or
+controller change, or a personality edit (``bump_personality_epoch``, called
+by the personality routes).
+
+Emit latency is recorded per path (``cold`` = decorations rebuilt, ``warm`` =
+reused) in ``emit_latency`` and surfaced at ``/admin/api/emit-latency``.
+"""
+
+import itertools
+from typing import Any, Callable, Dict, Tuple
+
+from .latency_histogram import LatencyHistogram
+
+_GAME_DATA_KEY = 'emit_decorations'
+
+_epoch_counter = itertools.count(1)
+_personality_epoch = 0
+
+emit_latency: Dict[str, LatencyHistogram] = {
+    'cold': LatencyHistogram(),
+    'warm': LatencyHistogram(),
+}
+
+
+def bump_personality_epoch() -> None:
+    """Invalidate every game's cached decorations (a personality was edited)."""
+    global _personality_epoch
+    _personality_epoch = next(_epoch_counter)
+
+
+def decoration_key(game_data: dict, game_state) -> Tuple:
+    """Cache key for the game's current hand, seats and controllers."""
+    memory_manager = game_data.get('memory_manager')
+    hand_number = memory_manager.hand_count if memory_manager else 0
+    controllers = game_data.get('ai_controllers') or {}
+    seats = tuple((p.name, p.is_human, id(controllers.get(p.name))) for p in game_state.players)
+    return hand_number, seats, game_data.get('owner_id'), _personality_epoch
+
+
+def get_static_decorations(
+    game_data: dict, game_state, build: Callable[[], Dict[str, Any]]
+) -> Tuple[Dict[str, Any], bool]:
+    """Return ``(decorations, cache_hit)``, rebuilding via ``build()`` on a miss."""
+    key = decoration_key(game_data, game_state)
+    cached = game_data.get(_GAME_DATA_KEY)
+    if cached is not None and cached[0] == key:
+        return cached[1], True
+    decorations = build()
+    game_data[_GAME_DATA_KEY] = (key, decorations)
+    return decorations, False
+
+
+def emit_latency_snapshot() -> Dict[str, Dict[str, float]]:
+    return {path: hist.snapshot() for path, hist in emit_latency.items()}
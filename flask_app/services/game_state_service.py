@@ -9,6 +9,8 @@ import threading
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
+from ..state_delta import frame_log
+
 logger = logging.getLogger(__name__)
 
 # Global state - single source of truth
@@ -145,6 +147,7 @@ def delete_game(game_id: str) -> Optional[dict]:
     """
     game_last_access.pop(game_id, None)
     game_locks.pop(game_id, None)
+    frame_log.forget(game_id)
     return games.pop(game_id, None)
 
 
@@ -0,0 +1,65 @@
+"""In-process latency histogram with fixed log-spaced buckets.
+
+Cheap enough to record on every socket emit: ``record()`` is a bisect plus a
+few integer adds under a lock, memory is constant, and ``snapshot()`` reports
+count / mean / max plus p50 / p95 / p99 estimated from the bucket bounds
+(accurate to within one bucket, ~25% relative). Counters are per-process and
+reset on restart; they exist to compare code paths on a live server, not to
+replace real monitoring.
+"""
+
+import bisect
+import threading
+from typing import Dict, List
+
+# Bucket upper bounds in milliseconds: 0.05 ms .. ~10 s, ratio 1.25.
+_BOUNDS_MS: List[float] = [0.05 * 1.25**i for i in range(56)]
+
+
+class LatencyHistogram:
+    """Bucketed millisecond latencies for one measured code path."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(_BOUNDS_MS) + 1)  # last bucket = overflow
+            self._count = 0
+            self._total_ms = 0.0
+            self._max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        idx = bisect.bisect_left(_BOUNDS_MS, ms)
+        with self._lock:
+            self._counts[idx] += 1
+            self._count += 1
+            self._total_ms += ms
+            if ms > self._max_ms:
+                self._max_ms = ms
+
+    def _quantile(self, counts: List[int], total: int, q: float) -> float:
+        target = q * total
+        seen = 0
+        for idx, n in enumerate(counts):
+            seen += n
+            if n and seen >= target:
+                return _BOUNDS_MS[idx] if idx < len(_BOUNDS_MS) else self._max_ms
+        return 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary stats; quantiles are bucket upper bounds."""
+        with self._lock:
+            counts = list(self._counts)
+            count, total_ms, max_ms = self._count, self._total_ms, self._max_ms
+        if not count:
+            return {'count': 0}
+        return {
+            'count': count,
+            'mean_ms': round(total_ms / count, 3),
+            'max_ms': round(max_ms, 3),
+            'p50_ms': round(self._quantile(counts, count, 0.50), 3),
+            'p95_ms': round(self._quantile(counts, count, 0.95), 3),
+            'p99_ms': round(self._quantile(counts, count, 0.99), 3),
+        }
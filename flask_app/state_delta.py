@@ -0,0 +1,167 @@
+"""Versioned JSON-patch deltas for the ``update_game_state`` socket push.
+
+Every action used to push the whole decorated game-state document to the
+room — nine seats of psychology / avatar / observation blocks plus the
+cumulative chat log — even when one player's bet and the pot were all that
+moved. With patch frames on, the server remembers the last full frame it
+emitted for each game and sends ``game_state_patch`` instead::
+
+    {'game_id': ..., 'base_version': 41, 'state_version': 42, 'ops': [...]}
+
+``ops`` is an RFC 6902 subset (``add`` / ``remove`` / ``replace``) that turns
+the frame stamped ``base_version`` into the frame stamped ``state_version``
+(see ``flask_app.state_version``). A client applies a patch only when it holds
+exactly ``base_version``; on any gap (it joined mid-stream, dropped a frame,
+or two emit threads raced) it emits ``request_full_state`` and the server
+replies to that socket alone with the last full frame. The full
+``update_game_state`` frame is also sent whenever there is no base yet or the
+delta would not be meaningfully smaller than the document.
+
+A list that kept a suffix of its old items and appended new ones — the
+capped, sliding ``messages`` log — becomes ``remove .../0`` plus ``add .../-``
+ops; other equal-length lists (the seat list) diff element-wise; any other
+list change replaces the list whole.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Beyond this many ops the patch is no longer a clear win over a full frame
+# (a new hand rewrites most of the document) — send the frame instead.
+MAX_PATCH_OPS = 150
+
+_MISSING = object()
+
+
+def _escape(token: str) -> str:
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def diff_state(old: Any, new: Any, path: str = '') -> List[Dict[str, Any]]:
+    """JSON-patch ops turning ``old`` into ``new`` (both JSON-shaped values)."""
+    ops: List[Dict[str, Any]] = []
+    _diff(old, new, path, ops)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: str, ops: List[Dict[str, Any]]) -> None:
+    if old is new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, old_value in old.items():
+            new_value = new.get(key, _MISSING)
+            child = f"{path}/{_escape(key)}"
+            if new_value is _MISSING:
+                ops.append({'op': 'remove', 'path': child})
+            else:
+                _diff(old_value, new_value, child, ops)
+        for key, new_value in new.items():
+            if key not in old:
+                ops.append({'op': 'add', 'path': f"{path}/{_escape(key)}", 'value': new_value})
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, ops)
+        return
+    # bool is an int subclass: compare types too so True never matches 1.
+    if type(old) is not type(new) or old != new:
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+
+
+def _window_shift(old: list, new: list) -> Optional[int]:
+    """How many leading items ``new`` dropped from ``old``, if ``new`` is
+    ``old`` minus a prefix plus appended items (a capped, sliding log)."""
+    for k in range(len(old)):
+        kept = len(old) - k
+        if len(new) >= kept and old[k] == new[0] and old[k:] == new[:kept]:
+            return k
+    return None
+
+
+def _diff_list(old: list, new: list, path: str, ops: List[Dict[str, Any]]) -> None:
+    if old == new:
+        return
+    shift = _window_shift(old, new) if old else 0
+    if shift is not None:
+        ops.extend({'op': 'remove', 'path': f"{path}/0"} for _ in range(shift))
+        for item in new[len(old) - shift :]:
+            ops.append({'op': 'add', 'path': f"{path}/-", 'value': item})
+    elif len(old) == len(new):
+        for i, (old_item, new_item) in enumerate(zip(old, new, strict=True)):
+            _diff(old_item, new_item, f"{path}/{i}", ops)
+    else:
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+
+
+class FrameLog:
+    """Last full frame emitted per game — the base the next patch diffs against.
+
+    Frames are held by reference: callers must not mutate a frame after
+    recording it (the emit path builds a fresh document every time).
+    """
+
+    def __init__(self):
+        self._frames: Dict[str, Tuple[int, dict]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, game_id: str, frame: dict) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """Store ``frame`` as the game's latest and return ``(base_version, ops)``.
+
+        Returns None when a full frame should be sent instead: no previous
+        frame, or a delta too large to be worth it.
+        """
+        with self._lock:
+            previous = self._frames.get(game_id)
+            self._frames[game_id] = (frame['state_version'], frame)
+        if previous is None:
+            return None
+        base_version, base_frame = previous
+        ops = diff_state(
+            {k: v for k, v in base_frame.items() if k != 'state_version'},
+            {k: v for k, v in frame.items() if k != 'state_version'},
+        )
+        if len(ops) > MAX_PATCH_OPS:
+            return None
+        return base_version, ops
+
+    def latest(self, game_id: str) -> Optional[dict]:
+        """The last recorded full frame for ``game_id`` (None if none yet)."""
+        with self._lock:
+            entry = self._frames.get(game_id)
+        return entry[1] if entry else None
+
+    def forget(self, game_id: str) -> None:
+        with self._lock:
+            self._frames.pop(game_id, None)
+
+
+def apply_patch(doc: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply ``ops`` to a deep copy of ``doc`` (reference implementation —
+    the React client has its own; this one backs the server-side tests)."""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        tokens = [t.replace('~1', '/').replace('~0', '~') for t in op['path'].split('/')[1:]]
+        if not tokens:
+            doc = copy.deepcopy(op['value'])
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op['op'] == 'add' and last == '-':
+                parent.append(copy.deepcopy(op['value']))
+            elif op['op'] == 'remove':
+                del parent[int(last)]
+            else:
+                parent[int(last)] = copy.deepcopy(op['value'])
+        elif op['op'] == 'remove':
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op['value'])
+    return doc
+
+
+frame_log = FrameLog()
@@ -0,0 +1,93 @@
+"""Content-addressed on-disk store for avatar images.
+
+Avatar bytes live in files named by their SHA-256 digest; ``avatar_images``
+rows keep only the digest plus metadata. Serving an avatar is then a single
+metadata lookup plus a ``sendfile`` of an immutable file, instead of pulling a
+100-500 KB BLOB through the SQLite connection gameplay also uses. The digest
+doubles as the HTTP ETag.
+
+Layout: ``<root>/<d[0:2]>/<d[2:4]>/<digest>`` (no extension; the content type
+is stored on the row). The root defaults to ``avatar_store/`` next to the
+database file, so every DB (including per-test temp DBs) gets its own store;
+``AVATAR_STORE_DIR`` overrides it. Back the directory up together with the DB.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR_ENV = 'AVATAR_STORE_DIR'
+DEFAULT_STORE_DIRNAME = 'avatar_store'
+
+
+def store_dir_for_db(db_path: str) -> Optional[str]:
+    """Store root for ``db_path``: ``$AVATAR_STORE_DIR`` or a sibling directory.
+
+    Returns None for an in-memory / temporary database (no file to sit next
+    to); callers then keep the bytes inline in the row.
+    """
+    override = os.environ.get(STORE_DIR_ENV)
+    if override:
+        return override
+    if not db_path or db_path == ':memory:' or str(db_path).startswith('file::memory:'):
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), DEFAULT_STORE_DIRNAME)
+
+
+class AvatarStore:
+    """Write-once, content-addressed image files under ``root``."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    @classmethod
+    def for_db(cls, db_path: str) -> Optional['AvatarStore']:
+        root = store_dir_for_db(db_path)
+        return cls(root) if root else None
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).is_file()
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its digest. Idempotent.
+
+        Writes go to a temp file in the target directory and are renamed into
+        place, so a reader never sees a partial file and concurrent writers of
+        the same content are harmless.
+        """
+        digest = self.digest(data)
+        target = self.path(digest)
+        if target.is_file():
+            return digest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    def read(self, digest: str) -> Optional[bytes]:
+        try:
+            return self.path(digest).read_bytes()
+        except FileNotFoundError:
+            logger.warning("Avatar store file missing for digest %s", digest)
+            return None
@@ -238,6 +238,52 @@ class CharacterImageService:
         """
         return self._persistence.load_full_avatar_image(personality_name, emotion)
 
+    def get_avatar_file(
+        self,
+        personality_name: str,
+        emotion: str,
+        variant: str = 'icon',
+        size: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Locate an avatar for serving (see PersonalityRepository.get_avatar_file).
+
+        A `size` that isn't one of the pre-generated variant sizes is ignored.
+        A valid size missing from the store (avatars saved before variants
+        existed) is rendered from the original once, stored, and served. Icons
+        missing from the database fall back to the legacy icons directory.
+        """
+        from .image_processing import (
+            FULL_VARIANT_SIZES,
+            ICON_VARIANT_SIZES,
+            process_avatar_variants,
+        )
+
+        allowed = FULL_VARIANT_SIZES if variant == 'full' else ICON_VARIANT_SIZES
+        if size is not None and size not in allowed:
+            size = None
+
+        avatar = self._persistence.get_avatar_file(personality_name, emotion, variant, size)
+        if avatar is None and size is not None:
+            source = self._persistence.load_full_avatar_image(
+                personality_name, emotion
+            ) or self._persistence.load_avatar_image(personality_name, emotion)
+            if not source:
+                return None
+            self._persistence.save_avatar_variants(
+                personality_name, emotion, process_avatar_variants(source)
+            )
+            avatar = self._persistence.get_avatar_file(personality_name, emotion, variant, size)
+            if avatar is None:
+                # No on-disk store to keep variants in: serve the original.
+                avatar = self._persistence.get_avatar_file(personality_name, emotion, variant)
+        if avatar is not None or variant != 'icon':
+            return avatar
+
+        icon_path = ICONS_DIR / self._get_icon_filename(personality_name, emotion)
+        if icon_path.exists():
+            return {'hash': None, 'content_type': 'image/png', 'path': str(icon_path), 'data': None}
+        return None
+
     def get_full_avatar_url(
         self, personality_name: str, emotion: str = "confident"
     ) -> Optional[str]:
@@ -620,7 +666,7 @@ class CharacterImageService:
         # Shared pipeline: center-crop + resize to a square full image and a
         # circular icon. Identical to the human-avatar path (see
         # poker/image_processing.py) so both stay pixel-consistent.
-        from .image_processing import process_avatar_image
+        from .image_processing import process_avatar_image, process_avatar_variants
 
         icon_bytes, raw_image_bytes, full_width, full_height = process_avatar_image(
             raw_image_bytes, icon_size=ICON_SIZE, full_size=FULL_IMAGE_DIMENSIONS[0]
@@ -636,6 +682,7 @@ class CharacterImageService:
             full_image_data=raw_image_bytes,
             full_width=full_width,
             full_height=full_height,
+            variants=process_avatar_variants(raw_image_bytes),
         )
 
         logger.debug(
@@ -781,6 +828,13 @@ def load_full_avatar_image(personality_name: str, emotion: str) -> Optional[byte
     return get_character_image_service().load_full_avatar_image(personality_name, emotion)
 
 
+def get_avatar_file(
+    personality_name: str, emotion: str, variant: str = 'icon', size: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Locate an avatar image (store file or inline bytes) for serving."""
+    return get_character_image_service().get_avatar_file(personality_name, emotion, variant, size)
+
+
 def get_full_avatar_url(personality_name: str, emotion: str = "confident") -> Optional[str]:
     """Get URL for full uncropped avatar image."""
     return get_character_image_service().get_full_avatar_url(personality_name, emotion)
@@ -82,8 +82,9 @@ def _dispatch_decision_analysis(job, analysis_repo, capture_label_repo) -> Optio
 
     Queue-enabled → enqueue for the analytics worker (moves the heavy equity-MC
     off the gameplay worker; returns None, nothing consumes the id live). Else →
-    run inline (default). Enqueue failures fall back to inline so data is never
-    silently dropped.
+    run inline (default). A Redis enqueue failure spills to the local durable
+    queue (see ``decision_analysis_queue``); only if that fails too does the job
+    run inline, so data is never silently dropped.
     """
     if _decision_analysis_queue_enabled():
         try:
@@ -1273,6 +1274,7 @@ class AIPlayerController:
         game_state = self.state_machine.game_state
 
         # Build the decision prompt with situational guidance
+        self._decision_stable_context = None
         decision_prompt, drama_context = self._build_decision_prompt(message, context)
 
         # Track captures for linking
@@ -1377,6 +1379,7 @@ class AIPlayerController:
                     json_format=True,
                     hand_number=self.current_hand_number,
                     prompt_template='decision',
+                    stable_context=self._decision_stable_context,
                     capture_enricher=make_enricher(drama_context=drama_context),
                 )
                 original_response_json = llm_response.content
@@ -1481,6 +1484,7 @@ class AIPlayerController:
                             json_format=True,
                             hand_number=self.current_hand_number,
                             prompt_template='decision_correction',
+                            stable_context=self._decision_stable_context,
                             capture_enricher=make_enricher(
                                 parent_id=parent_capture_id[0],
                                 error_type=error_type.value,
@@ -1946,8 +1950,7 @@ class AIPlayerController:
         )
 
         # Use the prompt manager for the decision prompt (respecting prompt_config toggles)
-        prompt = self.prompt_manager.render_decision_prompt(
-            message=message,
+        render_options = dict(
             include_mind_games=self.prompt_config.mind_games,
             include_dramatic_sequence=self.prompt_config.dramatic_sequence,
             include_betting_discipline=self.prompt_config.betting_discipline,
@@ -1962,6 +1965,15 @@ class AIPlayerController:
             expression_guidance=expression_guidance,
             zone_guidance=zone_guidance,
         )
+        # Stable instructions go to the cacheable prompt prefix (after the
+        # system prompt) rather than into the per-action message.
+        if self.prompt_config.cacheable_prompt_prefix:
+            segments = self.prompt_manager.render_decision_segments(message, **render_options)
+            self._decision_stable_context = segments.stable or None
+            prompt = segments.volatile
+        else:
+            self._decision_stable_context = None
+            prompt = self.prompt_manager.render_decision_prompt(message, **render_options)
 
         prompt = self._append_relationship_context_if_enabled(prompt, game_state, player)
         return (prompt, drama_context)
@@ -1,18 +1,30 @@
-"""Redis-backed queue for off-hot-path decision-analysis jobs.
+"""Queue for off-hot-path decision-analysis jobs.
 
 The gameplay worker enqueues a JSON job (see ``controllers._analyze_decision``)
 instead of running the equity Monte Carlo inline; the out-of-band
 ``decision_analysis_worker`` drains the queue on a separate core/box. Keeps the
 heavy analytics CPU off the single gevent gameplay core.
 
-The queue is best-effort/lossy by design: analytics are "mostly OK if delayed"
-and a dropped job (Redis flush/restart) just means one fewer logged decision —
-gameplay never depends on it.
+Two backends, picked by ``DECISION_ANALYSIS_QUEUE_BACKEND``:
+
+  * ``redis`` (default) — a Redis list. Best-effort/lossy: a dropped job (Redis
+    flush/restart) just means one fewer logged decision. When an LPUSH fails the
+    job spills to the local SQLite queue below instead of running inline, and the
+    worker drains the spill first, so a Redis outage doesn't put the Monte Carlo
+    back on the gameplay core.
+  * ``sqlite`` — ``SQLiteJobQueue``, a durable queue in its own SQLite file
+    (``DECISION_ANALYSIS_QUEUE_PATH``, default ``decision_analysis_queue.db``
+    next to the app DB). For single-box deployments without Redis.
+
+Gameplay never depends on either: if both fail, the caller runs the job inline.
 """
 
 import json
 import logging
 import os
+import sqlite3
+import threading
+import time
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
@@ -26,8 +38,171 @@ QUEUE_KEY = "decision_analysis:jobs"
 #    own idle wait; a socket_timeout <= the BRPOP timeout would abort it every cycle.
 _producer = None
 _consumer = None
+_local_queue = None
 ENQUEUE_TIMEOUT_S = float(os.environ.get("DECISION_ANALYSIS_ENQUEUE_TIMEOUT", "0.25"))
 
+# Key the SQLite queue adds to dequeued jobs; ``ack_jobs`` deletes by it.
+RECEIPT_KEY = "_queue_receipt"
+
+
+class SQLiteJobQueue:
+    """Durable job queue in a dedicated SQLite file.
+
+    Crash-safe: every enqueue is a committed WAL transaction, and a dequeued job
+    is only leased — it stays in the table, invisible for ``visibility_timeout``
+    seconds, until ``ack`` deletes it. A worker that dies mid-batch leaves its
+    leases to expire, and the jobs are handed out again. A job leased
+    ``max_attempts`` times without an ack is dropped as poison.
+
+    Bounded: once more than ``max_size`` jobs have been enqueued since the
+    oldest live one, the oldest are shed on insert (analytics favour recent
+    decisions). Ids only grow, so the check is a single indexed delete.
+
+    The file is separate from the app DB so queue writes never contend with
+    gameplay writes for the SQLite write lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 10000,
+        visibility_timeout: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 0.5,
+    ):
+        self.path = path
+        self.max_size = max_size
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payload TEXT NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    visible_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_visible ON jobs(visible_at, id)")
+            self._local.connection = conn
+        return conn
+
+    def enqueue(self, job: dict) -> None:
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cur = conn.execute(
+                "INSERT INTO jobs (payload, enqueued_at, visible_at) VALUES (?, ?, ?)",
+                (json.dumps(job), now, now),
+            )
+            shed = conn.execute(
+                "DELETE FROM jobs WHERE id <= ?", (cur.lastrowid - self.max_size,)
+            ).rowcount
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if shed:
+            logger.warning("decision-analysis queue full; shed %d oldest job(s)", shed)
+
+    def _claim(self, max_items: int) -> List[dict]:
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            dropped = conn.execute(
+                "DELETE FROM jobs WHERE visible_at <= ? AND attempts >= ?",
+                (now, self.max_attempts),
+            ).rowcount
+            rows = conn.execute(
+                "SELECT id, payload FROM jobs WHERE visible_at <= ? ORDER BY id LIMIT ?",
+                (now, max_items),
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    "UPDATE jobs SET visible_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    [(now + self.visibility_timeout, row_id) for row_id, _ in rows],
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if dropped:
+            logger.warning(
+                "dropped %d decision-analysis job(s) after %d attempts", dropped, self.max_attempts
+            )
+        jobs = []
+        for row_id, payload in rows:
+            job = json.loads(payload)
+            job[RECEIPT_KEY] = row_id
+            jobs.append(job)
+        return jobs
+
+    def dequeue_batch(self, max_items: int = 50, timeout: float = 5) -> List[dict]:
+        """Lease up to ``max_items`` jobs, polling up to ``timeout`` s for the
+        first. Returns [] on idle timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            jobs = self._claim(max_items)
+            if jobs or time.monotonic() >= deadline:
+                return jobs
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+    def ack(self, jobs: List[dict]) -> None:
+        """Delete finished jobs (successful or given up on)."""
+        receipts = [(j[RECEIPT_KEY],) for j in jobs if RECEIPT_KEY in j]
+        if receipts:
+            self._conn().executemany("DELETE FROM jobs WHERE id = ?", receipts)
+
+    def depth(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+
+def _backend() -> str:
+    return os.environ.get("DECISION_ANALYSIS_QUEUE_BACKEND", "redis").strip().lower()
+
+
+def _get_local_queue() -> SQLiteJobQueue:
+    global _local_queue
+    if _local_queue is None:
+        path = os.environ.get("DECISION_ANALYSIS_QUEUE_PATH")
+        if not path:
+            from poker.db_utils import get_default_db_path
+
+            path = os.path.join(
+                os.path.dirname(get_default_db_path()), "decision_analysis_queue.db"
+            )
+        _local_queue = SQLiteJobQueue(
+            path,
+            max_size=int(os.environ.get("DECISION_ANALYSIS_QUEUE_MAX", "10000")),
+            visibility_timeout=float(
+                os.environ.get("DECISION_ANALYSIS_QUEUE_VISIBILITY_TIMEOUT", "300")
+            ),
+        )
+    return _local_queue
+
 
 def _get_producer():
     global _producer
@@ -52,14 +227,40 @@ def _get_consumer():
 
 
 def enqueue_decision_analysis_job(job: dict) -> None:
-    """Push one analysis job onto the queue (LPUSH) via the short-timeout producer,
-    so a Redis stall fails fast on the gameplay hot path (caller falls back inline)."""
-    _get_producer().lpush(QUEUE_KEY, json.dumps(job))
+    """Queue one analysis job, stamped with ``enqueued_at`` (epoch seconds) so
+    the worker can report queue lag.
+
+    Redis: LPUSH via the short-timeout producer, so a Redis stall fails fast on
+    the gameplay hot path; on failure the job spills to the local SQLite queue.
+    Raises only if the job could not be queued anywhere (caller runs it inline).
+    """
+    job = {**job, "enqueued_at": time.time()}
+    if _backend() == "sqlite":
+        _get_local_queue().enqueue(job)
+        return
+    try:
+        _get_producer().lpush(QUEUE_KEY, json.dumps(job))
+    except Exception as e:
+        logger.warning(f"[DECISION_ANALYSIS] Redis enqueue failed, spilling to local queue: {e}")
+        _get_local_queue().enqueue(job)
 
 
 def dequeue_batch(max_items: int = 50, timeout: int = 5) -> List[dict]:
     """Block up to ``timeout`` s for the first job, then drain up to ``max_items``
-    more without blocking. Returns [] on idle timeout."""
+    more without blocking. Returns [] on idle timeout.
+
+    Jobs from the SQLite queue are leases: pass them to ``ack_jobs`` once
+    handled. On the Redis backend, spilled jobs are drained before Redis is
+    polled (and even while Redis is down)."""
+    if _backend() == "sqlite":
+        return _get_local_queue().dequeue_batch(max_items, timeout)
+    try:
+        spilled = _get_local_queue().dequeue_batch(max_items, timeout=0)
+    except Exception as e:
+        logger.warning(f"[DECISION_ANALYSIS] local spill queue unreadable: {e}")
+        spilled = []
+    if spilled:
+        return spilled
     r = _get_consumer()
     first = r.brpop(QUEUE_KEY, timeout=timeout)
     if not first:
@@ -73,9 +274,18 @@ def dequeue_batch(max_items: int = 50, timeout: int = 5) -> List[dict]:
     return items
 
 
+def ack_jobs(jobs: List[dict]) -> None:
+    """Mark dequeued jobs done. No-op for Redis jobs (popped = gone)."""
+    if any(RECEIPT_KEY in j for j in jobs):
+        _get_local_queue().ack(jobs)
+
+
 def queue_depth() -> Optional[int]:
-    """Current backlog (LLEN), or None if Redis is unreachable."""
+    """Current backlog (Redis LLEN plus spilled jobs), or None if unreachable."""
     try:
-        return _get_producer().llen(QUEUE_KEY)
+        local = _get_local_queue().depth()
+        if _backend() == "sqlite":
+            return local
+        return _get_producer().llen(QUEUE_KEY) + local
     except Exception:
         return None
@@ -1,21 +1,42 @@
 """Out-of-band decision-analysis worker.
 
-Drains the Redis decision-analysis queue and runs the per-decision equity Monte
+Drains the decision-analysis queue (Redis, or the durable SQLite queue; see
+``decision_analysis_queue``) and runs the per-decision equity Monte
 Carlo + persistence off the gameplay hot path. Intended to run as its own
 container (on the box's otherwise-idle second core, or a separate box later), so
 the single gevent gameplay worker is freed of the ~70% analytics CPU the
 2026-06-09 load test measured. Processing is delayed-OK and batched.
 
+Pipeline: this process dequeues a batch, groups jobs with identical equity
+inputs (hand, board, opponent profiles), and fans the groups out to
+``DECISION_ANALYSIS_WORKER_PROCESSES`` compute processes. Each group shares one
+equity memo, so duplicates run the Monte Carlo once. Results come back to this
+process, the single writer, which commits each batch in one transaction (the
+compute processes never open the DB, so there is no SQLite write contention).
+While the pool computes batch N+1, batch N is written. With one process (the
+default) compute runs inline, still with per-batch dedup and batched commits.
+
+Each batch logs throughput (jobs/s), queue lag (now - ``enqueued_at``), dedup
+hits and queue depth.
+
+Jobs are acked after their batch is written. On the durable SQLite queue an
+unacked job (worker crash, dead compute process) is redelivered once its
+visibility timeout expires, so delivery there is at-least-once.
+
 Run:  python -m poker.decision_analysis_worker
-Env:  REDIS_URL, DECISION_ANALYSIS_ITERATIONS, DECISION_ANALYSIS_WORKER_BATCH,
+Env:  REDIS_URL, DECISION_ANALYSIS_QUEUE_BACKEND, DECISION_ANALYSIS_ITERATIONS, DECISION_ANALYSIS_WORKER_BATCH,
+      DECISION_ANALYSIS_WORKER_PROCESSES (compute processes, default 1),
       DECISION_ANALYSIS_DB_PATH (defaults to the app's DB).
 """
 
+import json
 import logging
 import os
 import signal
 import sys
 import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 logging.basicConfig(
     level=os.environ.get("LOG_LEVEL", "INFO"),
@@ -32,10 +53,151 @@ def _handle_signal(signum, _frame):
     _stop = True
 
 
+@dataclass
+class WorkerMetrics:
+    """Running counters for the worker's batch log line."""
+
+    started: float = field(default_factory=time.monotonic)
+    processed: int = 0
+    failed: int = 0
+    deduped: int = 0
+    last_lag_s: Optional[float] = None
+    max_lag_s: float = 0.0
+
+    def record_lag(self, jobs: List[dict], now: Optional[float] = None) -> None:
+        """Queue lag of a batch: age of its oldest job at dequeue time."""
+        now = time.time() if now is None else now
+        stamps = [j["enqueued_at"] for j in jobs if j.get("enqueued_at")]
+        if not stamps:
+            return
+        self.last_lag_s = max(0.0, now - min(stamps))
+        self.max_lag_s = max(self.max_lag_s, self.last_lag_s)
+
+    @property
+    def throughput(self) -> float:
+        """Jobs written per second since start."""
+        elapsed = time.monotonic() - self.started
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+
+def equity_group_key(job: dict) -> str:
+    """Jobs with the same key have identical equity inputs."""
+    from poker.decision_analyzer import equity_memo_key
+
+    kw = job.get("analyze_kwargs") or {}
+    range_data = kw.get("opponent_infos") or kw.get("opponent_positions")
+    if range_data and isinstance(range_data[0], dict):
+        range_data = [sorted(d.items()) for d in range_data]
+    key = equity_memo_key(
+        kw.get("player_hand") or [],
+        kw.get("community_cards"),
+        kw.get("num_opponents") or 0,
+        range_data,
+    )
+    return json.dumps(key, default=str)
+
+
+def group_jobs(jobs: List[dict]) -> List[List[dict]]:
+    """Group jobs by ``equity_group_key``, keeping first-seen order."""
+    groups: Dict[str, List[dict]] = {}
+    for job in jobs:
+        groups.setdefault(equity_group_key(job), []).append(job)
+    return list(groups.values())
+
+
+def partition_groups(groups: List[List[dict]], parts: int) -> List[List[dict]]:
+    """Spread groups over ``parts`` chunks of similar job count (largest first),
+    never splitting a group — its members must share one memo."""
+    chunks: List[List[dict]] = [[] for _ in range(max(1, parts))]
+    for group in sorted(groups, key=len, reverse=True):
+        min(chunks, key=len).extend(group)
+    return [c for c in chunks if c]
+
+
+def compute_jobs(jobs: List[dict]) -> List[Tuple[dict, Optional[object]]]:
+    """Compute a chunk of jobs with one shared equity memo.
+
+    Runs in a compute process (or inline). Returns ``(job, analysis)`` pairs;
+    ``analysis`` is None when the job failed (logged, dropped).
+    """
+    from poker.decision_analyzer import compute_decision_analysis
+
+    memo: dict = {}
+    results = []
+    for job in jobs:
+        try:
+            results.append((job, compute_decision_analysis(job, equity_memo=memo)))
+        except Exception:
+            logger.exception("decision-analysis job failed (dropped)")
+            results.append((job, None))
+    return results
+
+
+def write_results(results, analysis_repo, capture_label_repo=None) -> int:
+    """Persist computed analyses: one transaction for the rows, one for labels.
+
+    The two repos hold separate connections, so the writes are sequential
+    rather than nested (nesting would have the label writer wait on the row
+    writer's lock). If the batched insert fails, the batch is retried row by
+    row so one bad job doesn't drop the others. Returns rows written.
+    """
+    from poker.decision_analyzer import auto_label_data
+
+    done = [(job, a) for job, a in results if a is not None]
+    if not done:
+        return 0
+    try:
+        with analysis_repo.transaction():
+            saved = [(job, a, analysis_repo.save_decision_analysis(a)) for job, a in done]
+    except Exception:
+        logger.exception("batched write failed; retrying %d rows one at a time", len(done))
+        saved = []
+        for job, a in done:
+            try:
+                saved.append((job, a, analysis_repo.save_decision_analysis(a)))
+            except Exception:
+                logger.exception("decision-analysis write failed (dropped)")
+
+    if capture_label_repo is not None:
+        try:
+            with capture_label_repo.transaction():
+                for job, a, decision_id in saved:
+                    if decision_id:
+                        capture_label_repo.compute_and_store_auto_labels(
+                            decision_id, auto_label_data(job, a)
+                        )
+        except Exception:
+            logger.exception("auto-labeling failed for batch (rows kept)")
+    return len(saved)
+
+
+def submit_batch(jobs: List[dict], pool, processes: int):
+    """Start computing a batch on ``pool``. Returns (futures, dedup hits)."""
+    groups = group_jobs(jobs)
+    futures = [pool.submit(compute_jobs, chunk) for chunk in partition_groups(groups, processes)]
+    return futures, len(jobs) - len(groups)
+
+
+def process_batch(jobs: List[dict], analysis_repo, capture_label_repo=None) -> Tuple[int, int]:
+    """Compute (inline, deduped) and write one batch.
+
+    Returns (rows written, dedup hits)."""
+    groups = group_jobs(jobs)
+    results = [r for group in groups for r in compute_jobs(group)]
+    return write_results(results, analysis_repo, capture_label_repo), len(jobs) - len(groups)
+
+
+def _init_compute_process():
+    # Let the parent handle SIGINT/SIGTERM; the pool is shut down from there.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from poker.decision_analyzer import get_analyzer
+
+    get_analyzer()
+
+
 def main() -> int:
     from poker.db_utils import get_default_db_path
-    from poker.decision_analysis_queue import dequeue_batch, queue_depth
-    from poker.decision_analyzer import run_decision_analysis_job
+    from poker.decision_analysis_queue import ack_jobs, dequeue_batch, queue_depth
     from poker.repositories import create_repos
 
     signal.signal(signal.SIGTERM, _handle_signal)
@@ -43,49 +205,102 @@ def main() -> int:
 
     db_path = os.environ.get("DECISION_ANALYSIS_DB_PATH") or get_default_db_path()
     batch = int(os.environ.get("DECISION_ANALYSIS_WORKER_BATCH", "50"))
+    processes = max(1, int(os.environ.get("DECISION_ANALYSIS_WORKER_PROCESSES", "1")))
     repos = create_repos(db_path)
     analysis_repo = repos["decision_analysis_repo"]
     capture_label_repo = repos["capture_label_repo"]
 
+    pool = None
+    if processes > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_compute_process)
+
     logger.info(
-        "decision-analysis worker started (db=%s, batch=%d, iterations=%s)",
+        "decision-analysis worker started (db=%s, batch=%d, processes=%d, iterations=%s)",
         db_path,
         batch,
+        processes,
         os.environ.get("DECISION_ANALYSIS_ITERATIONS", "2000"),
     )
 
-    processed = 0
-    backoff = 1.0  # seconds; grows on repeated dequeue failure (Redis down), resets on success
-    while not _stop:
-        try:
-            jobs = dequeue_batch(batch, timeout=5)
-            backoff = 1.0
-        except Exception:
-            # Redis down/misconfigured: dequeue_batch raises immediately, so without
-            # a sleep this loop would spin (peg CPU + flood logs). Back off, capped.
-            logger.warning("dequeue failed; backing off %.0fs", backoff)
-            time.sleep(backoff)
-            backoff = min(backoff * 2, 30.0)
-            continue
-        if not jobs:
-            continue
-        ok = 0
-        for job in jobs:
+    metrics = WorkerMetrics()
+    pending = None  # (futures, jobs) of the batch the pool is computing
+
+    def _flush_pending():
+        nonlocal pending
+        if pending is None:
+            return
+        futures, jobs = pending
+        pending = None
+        results = []
+        for future in futures:
             try:
-                run_decision_analysis_job(job, analysis_repo, capture_label_repo)
-                ok += 1
+                results.extend(future.result())
             except Exception:
-                logger.exception("decision-analysis job failed (dropped)")
-        processed += ok
+                # Not acked: a durable queue hands the chunk out again later.
+                logger.exception("compute process failed; chunk not written")
+        _log_batch(len(jobs), write_results(results, analysis_repo, capture_label_repo))
+        ack_jobs([job for job, _ in results])
+
+    def _log_batch(count, ok):
+        metrics.processed += ok
+        metrics.failed += count - ok
         logger.info(
-            "processed batch=%d ok=%d total=%d depth=%s",
-            len(jobs),
+            "processed batch=%d ok=%d total=%d failed=%d deduped=%d rate=%.1f/s "
+            "lag=%s max_lag=%.1fs depth=%s",
+            count,
             ok,
-            processed,
+            metrics.processed,
+            metrics.failed,
+            metrics.deduped,
+            metrics.throughput,
+            "n/a" if metrics.last_lag_s is None else f"{metrics.last_lag_s:.1f}s",
+            metrics.max_lag_s,
             queue_depth(),
         )
 
-    logger.info("decision-analysis worker stopped (total processed=%d)", processed)
+    backoff = 1.0  # seconds; grows on repeated dequeue failure (Redis down), resets on success
+    try:
+        while not _stop:
+            try:
+                # Don't sit on computed-but-unwritten results through a long idle wait.
+                jobs = dequeue_batch(batch, timeout=1 if pending else 5)
+                backoff = 1.0
+            except Exception:
+                # Redis down/misconfigured: dequeue_batch raises immediately, so without
+                # a sleep this loop would spin (peg CPU + flood logs). Back off, capped.
+                logger.warning("dequeue failed; backing off %.0fs", backoff)
+                _flush_pending()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+                continue
+            if not jobs:
+                _flush_pending()
+                continue
+            metrics.record_lag(jobs)
+            if pool is None:
+                ok, deduped = process_batch(jobs, analysis_repo, capture_label_repo)
+                metrics.deduped += deduped
+                _log_batch(len(jobs), ok)
+                ack_jobs(jobs)
+                continue
+            futures, deduped = submit_batch(jobs, pool, processes)
+            metrics.deduped += deduped
+            # Write the previous batch while the pool computes this one.
+            _flush_pending()
+            pending = (futures, jobs)
+        _flush_pending()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    logger.info(
+        "decision-analysis worker stopped (total processed=%d, failed=%d, deduped=%d)",
+        metrics.processed,
+        metrics.failed,
+        metrics.deduped,
+    )
     return 0
 
 
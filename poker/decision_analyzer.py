@@ -9,10 +9,11 @@ import json
 import logging
 import os
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, astuple, dataclass, is_dataclass
 from typing import Any, List, Optional, Tuple
 
 from poker.card_utils import normalize_card_string
+from poker.outs_calculator import eval7_card, eval7_deck
 
 # Import equity calculator - gracefully degrade if not available
 try:
@@ -270,6 +271,7 @@ class DecisionAnalyzer:
         all_players_bets: Optional[List[Tuple[int, bool]]] = None,
         psychology_snapshot: Optional[dict] = None,
         skip_equity: bool = False,
+        equity_memo: Optional[dict] = None,
     ) -> DecisionAnalysis:
         """
         Analyze a decision and return analysis result.
@@ -298,6 +300,9 @@ class DecisionAnalyzer:
             player_bet: Player's current round bet (for max_winnable calculation)
             all_players_bets: List of (bet, is_folded) tuples for ALL players
                              to calculate stack-aware EV (for short stack scenarios)
+            equity_memo: Optional dict shared across a batch of analyses; equity
+                        results are reused for identical (hand, board, opponent
+                        profile) inputs instead of re-running the Monte Carlo
 
         Returns:
             DecisionAnalysis with equity and quality assessment
@@ -391,8 +396,12 @@ class DecisionAnalyzer:
         if not skip_equity and player_hand and self.calculator and num_opponents > 0:
             try:
                 # Calculate equity vs random opponent hands using Monte Carlo
-                analysis.equity = self.calculate_equity_vs_random(
-                    player_hand, community_cards or [], num_opponents
+                analysis.equity = _memoized(
+                    equity_memo,
+                    equity_memo_key(player_hand, community_cards, num_opponents),
+                    lambda: self.calculate_equity_vs_random(
+                        player_hand, community_cards or [], num_opponents
+                    ),
                 )
             except Exception as e:
                 logger.debug(f"Equity calculation failed: {e}")
@@ -401,8 +410,12 @@ class DecisionAnalyzer:
             range_data = opponent_infos if opponent_infos else opponent_positions
             if range_data:
                 try:
-                    analysis.equity_vs_ranges = self.calculate_equity_vs_ranges(
-                        player_hand, community_cards or [], range_data
+                    analysis.equity_vs_ranges = _memoized(
+                        equity_memo,
+                        equity_memo_key(player_hand, community_cards, num_opponents, range_data),
+                        lambda: self.calculate_equity_vs_ranges(
+                            player_hand, community_cards or [], range_data
+                        ),
                     )
                     # Store opponent positions for reference
                     if opponent_positions:
@@ -518,16 +531,12 @@ class DecisionAnalyzer:
             import eval7
 
             # Parse hero's hand
-            hero_hand = [eval7.Card(normalize_card_string(c)) for c in player_hand]
-            board = (
-                [eval7.Card(normalize_card_string(c)) for c in community_cards]
-                if community_cards
-                else []
-            )
+            hero_hand = [eval7_card(c) for c in player_hand]
+            board = [eval7_card(c) for c in community_cards] if community_cards else []
 
             # Build deck excluding known cards
             all_known = set(hero_hand + board)
-            deck = [c for c in eval7.Deck().cards if c not in all_known]
+            deck = [c for c in eval7_deck() if c not in all_known]
 
             wins = 0
             iterations = self.iterations
@@ -606,19 +615,15 @@ class DecisionAnalyzer:
             )
 
             # Parse hero's hand
-            hero_hand = [eval7.Card(normalize_card_string(c)) for c in player_hand]
-            board = (
-                [eval7.Card(normalize_card_string(c)) for c in community_cards]
-                if community_cards
-                else []
-            )
+            hero_hand = [eval7_card(c) for c in player_hand]
+            board = [eval7_card(c) for c in community_cards] if community_cards else []
 
             # Build set of excluded cards (hero's hand + board)
             excluded_cards = set(player_hand + (community_cards or []))
 
             # Build deck excluding known cards
             all_known = set(hero_hand + board)
-            deck = [c for c in eval7.Deck().cards if c not in all_known]
+            deck = [c for c in eval7_deck() if c not in all_known]
 
             wins = 0
             iterations = self.iterations
@@ -651,8 +656,8 @@ class DecisionAnalyzer:
                 opp_cards_set = set()
                 for hand in opponent_hands_raw:
                     opp_hand = [
-                        eval7.Card(normalize_card_string(hand[0])),
-                        eval7.Card(normalize_card_string(hand[1])),
+                        eval7_card(hand[0]),
+                        eval7_card(hand[1]),
                     ]
                     opponent_hands.append(opp_hand)
                     opp_cards_set.add(opp_hand[0])
@@ -959,6 +964,40 @@ class DecisionAnalyzer:
             return "fold"
 
 
+def equity_memo_key(
+    player_hand: List[str],
+    community_cards: Optional[List[str]],
+    num_opponents: int,
+    range_data: Optional[List[Any]] = None,
+) -> tuple:
+    """Key under which an equity result can be reused within a batch.
+
+    Card order doesn't change equity, so hand and board are sorted. Without
+    ``range_data`` the key is for equity vs random hands (which only depends on
+    the opponent count); with it, the opponent profiles (``OpponentInfo`` or
+    position strings, order-insensitive) are part of the key.
+    """
+    hand = tuple(sorted(player_hand))
+    board = tuple(sorted(community_cards or []))
+    if range_data is None:
+        return ('random', hand, board, num_opponents)
+    profiles = tuple(sorted((astuple(o) if is_dataclass(o) else o for o in range_data), key=repr))
+    return ('ranges', hand, board, profiles)
+
+
+def _memoized(memo: Optional[dict], key: tuple, compute):
+    """Return ``memo[key]``, computing and storing it on a miss. ``None`` results
+    (failed calculation) are not stored so the next job retries."""
+    if memo is None:
+        return compute()
+    if key in memo:
+        return memo[key]
+    value = compute()
+    if value is not None:
+        memo[key] = value
+    return value
+
+
 # Singleton instance for reuse
 _analyzer_instance: Optional[DecisionAnalyzer] = None
 
@@ -983,18 +1022,13 @@ def get_analyzer(iterations: Optional[int] = None) -> DecisionAnalyzer:
     return _analyzer_instance
 
 
-def run_decision_analysis_job(job: dict, analysis_repo, capture_label_repo=None) -> Optional[int]:
-    """Run one decision-analysis job: the heavy equity Monte Carlo + persistence.
+def compute_decision_analysis(job: dict, equity_memo: Optional[dict] = None) -> DecisionAnalysis:
+    """The CPU half of a decision-analysis job: rehydrate, analyze, annotate.
 
-    This is the single compute chokepoint shared by the inline path
-    (``controllers._analyze_decision``) and the out-of-band analytics worker.
-    ``job`` is a fully JSON-serializable dict built by ``_analyze_decision``;
-    ``opponent_infos`` arrive as plain dicts and are rehydrated here. Returns the
-    saved decision row id, or None.
-
-    All the CPU cost (the equity sim) lives here, so moving this off the gameplay
-    worker — by enqueuing the job instead of calling this inline — is what frees
-    the single gevent core (see docs/SCALING.md, 2026-06-09 load test).
+    Touches no database, so the worker can run it in compute processes and
+    hand the result to a single writer. ``equity_memo`` (see
+    ``DecisionAnalyzer.analyze``) lets a batch share equity results between
+    jobs with identical inputs.
     """
     from poker.hand_ranges import OpponentInfo
 
@@ -1002,7 +1036,7 @@ def run_decision_analysis_job(job: dict, analysis_repo, capture_label_repo=None)
     kwargs["opponent_infos"] = [OpponentInfo(**d) for d in (kwargs.get("opponent_infos") or [])]
 
     analyzer = get_analyzer()
-    analysis = analyzer.analyze(**kwargs)
+    analysis = analyzer.analyze(**kwargs, equity_memo=equity_memo)
 
     bounded_options = job.get("bounded_options")
     if bounded_options:
@@ -1012,23 +1046,46 @@ def run_decision_analysis_job(job: dict, analysis_repo, capture_label_repo=None)
     # carried verbatim through the queue.
     analysis.intervention_trace_json = job.get("intervention_trace_json")
     analysis.strategy_pipeline_snapshot_json = job.get("strategy_pipeline_snapshot_json")
+    return analysis
+
 
+def auto_label_data(job: dict, analysis: DecisionAnalysis) -> dict:
+    """Decision data for ``compute_and_store_auto_labels``."""
+    big_blind = job.get("big_blind") or 100
+    player_bet = job.get("player_bet") or 0
+    label_data = {
+        "action_taken": analysis.action_taken,
+        "pot_odds": (analysis.pot_total / analysis.cost_to_call) if analysis.cost_to_call else None,
+        "stack_bb": (analysis.player_stack / big_blind) if big_blind > 0 else None,
+        "already_bet_bb": (player_bet / big_blind) if big_blind > 0 else None,
+    }
+    extra = job.get("auto_label_extra")
+    if extra:
+        label_data.update(extra)
+    return label_data
+
+
+def run_decision_analysis_job(job: dict, analysis_repo, capture_label_repo=None) -> Optional[int]:
+    """Run one decision-analysis job: the heavy equity Monte Carlo + persistence.
+
+    This is the single compute chokepoint shared by the inline path
+    (``controllers._analyze_decision``) and the out-of-band analytics worker.
+    ``job`` is a fully JSON-serializable dict built by ``_analyze_decision``;
+    ``opponent_infos`` arrive as plain dicts and are rehydrated here. Returns the
+    saved decision row id, or None.
+
+    All the CPU cost (the equity sim) lives here, so moving this off the gameplay
+    worker — by enqueuing the job instead of calling this inline — is what frees
+    the single gevent core (see docs/SCALING.md, 2026-06-09 load test). The
+    worker runs the two halves separately (``compute_decision_analysis`` in
+    compute processes, batched writes in one writer).
+    """
+    analysis = compute_decision_analysis(job)
     decision_id = analysis_repo.save_decision_analysis(analysis)
 
     if capture_label_repo and decision_id:
-        big_blind = job.get("big_blind") or 100
-        player_bet = job.get("player_bet") or 0
-        label_data = {
-            "action_taken": analysis.action_taken,
-            "pot_odds": (analysis.pot_total / analysis.cost_to_call)
-            if analysis.cost_to_call
-            else None,
-            "stack_bb": (analysis.player_stack / big_blind) if big_blind > 0 else None,
-            "already_bet_bb": (player_bet / big_blind) if big_blind > 0 else None,
-        }
-        extra = job.get("auto_label_extra")
-        if extra:
-            label_data.update(extra)
-        capture_label_repo.compute_and_store_auto_labels(decision_id, label_data)
+        capture_label_repo.compute_and_store_auto_labels(
+            decision_id, auto_label_data(job, analysis)
+        )
 
     return decision_id
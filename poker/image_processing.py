@@ -9,7 +9,7 @@ pixel-identical.
 """
 
 import io
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from PIL import Image, ImageDraw
 
@@ -17,6 +17,11 @@ from PIL import Image, ImageDraw
 ICON_SIZE = 256
 FULL_SIZE = 512
 
+# Smaller renditions pre-generated for every avatar and served via ``?size=N``,
+# so seat icons and lists don't download the 256/512 px originals.
+ICON_VARIANT_SIZES = (64, 128)
+FULL_VARIANT_SIZES = (256,)
+
 # Magic-byte signatures for the formats we accept on upload. WebP is checked
 # separately because it lives inside a RIFF container.
 _IMAGE_SIGNATURES = {
@@ -89,3 +94,26 @@ def process_avatar_image(
     icon_bytes = buffer.getvalue()
 
     return icon_bytes, full_bytes, full_width, full_height
+
+
+def process_avatar_variants(
+    source_bytes: bytes,
+    icon_sizes: Tuple[int, ...] = ICON_VARIANT_SIZES,
+    full_sizes: Tuple[int, ...] = FULL_VARIANT_SIZES,
+) -> Dict[Tuple[str, int], bytes]:
+    """Render the size variants of an avatar: ``{('icon'|'full', size): png}``.
+
+    Each size runs ``source_bytes`` (normally the stored full image) through
+    ``process_avatar_image``, so a variant is exactly the original pipeline's
+    output at that size.
+    """
+    variants: Dict[Tuple[str, int], bytes] = {}
+    for size in sorted(set(icon_sizes) | set(full_sizes)):
+        icon_bytes, full_bytes, _, _ = process_avatar_image(
+            source_bytes, icon_size=size, full_size=size
+        )
+        if size in icon_sizes:
+            variants[('icon', size)] = icon_bytes
+        if size in full_sizes:
+            variants[('full', size)] = full_bytes
+    return variants
@@ -0,0 +1,202 @@
+"""
+Exact outs and draw enumeration.
+
+For a post-flop, pre-river spot every unseen card is dealt in turn and
+classified by the hand class it gives the hero. Cards that raise the class
+(above what the board itself now shows, so pairing the board doesn't count) are
+then scored against the opponent range: the share of range combos (not blocked
+by a known card) whose made hand the hero's beats on the new board, ties
+counting half. An out is an improving card that leaves the hero ahead of the
+range; one that doesn't (a flush card that also pairs the board against a
+range full of sets) is a tainted out.
+
+Results are exhaustive rather than sampled, and cached per (hole, board,
+range). The eval7 card table here is shared with the equity Monte Carlo in
+``poker.decision_analyzer``.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from poker.card_utils import normalize_card_string
+from poker.hand_ranges import _generate_all_starting_hands, _get_all_combos_for_hand
+
+try:
+    import eval7
+
+    EVAL7_AVAILABLE = True
+except ImportError:
+    EVAL7_AVAILABLE = False
+    eval7 = None
+
+logger = logging.getLogger(__name__)
+
+# eval7.handtype() names, weakest first.
+HAND_CLASSES = (
+    'High Card',
+    'Pair',
+    'Two Pair',
+    'Trips',
+    'Straight',
+    'Flush',
+    'Full House',
+    'Quads',
+    'Straight Flush',
+)
+_CLASS_RANK = {name: i for i, name in enumerate(HAND_CLASSES)}
+
+# Share of the range an improving card must leave the hero beating to be a clean out.
+OUT_STRENGTH_THRESHOLD = 0.5
+
+
+@lru_cache(maxsize=256)
+def eval7_card(card_str: str) -> 'eval7.Card':
+    """Parse a card string ('Ah', '10♥', 'Th') into a shared eval7.Card."""
+    return eval7.Card(normalize_card_string(card_str))
+
+
+@lru_cache(maxsize=1)
+def eval7_deck() -> Tuple['eval7.Card', ...]:
+    """The 52 eval7 cards, built once."""
+    return tuple(eval7.Deck().cards)
+
+
+@lru_cache(maxsize=64)
+def range_combos(
+    canonical_hands: Optional[FrozenSet[str]] = None,
+) -> Tuple[Tuple['eval7.Card', 'eval7.Card'], ...]:
+    """Every two-card combo of the given canonical hands as eval7 cards.
+
+    ``None`` means any two cards. Cached per range; the combos come from
+    ``hand_ranges``' combo table.
+    """
+    if canonical_hands is None:
+        canonical_hands = frozenset(_generate_all_starting_hands())
+    return tuple(
+        (eval7_card(c1), eval7_card(c2))
+        for canonical in sorted(canonical_hands)
+        for c1, c2 in _get_all_combos_for_hand(canonical)
+    )
+
+
+def _showdown_share(hero_score: int, combos, board: list) -> Optional[float]:
+    """Share of ``combos`` the hero's made hand beats on ``board`` (ties half),
+    skipping combos that hold the board's last card. None when none are live."""
+    dealt = board[-1]
+    wins = 0.0
+    live = 0
+    for c1, c2 in combos:
+        if c1 == dealt or c2 == dealt:
+            continue
+        live += 1
+        score = eval7.evaluate([c1, c2] + board)
+        if hero_score > score:
+            wins += 1.0
+        elif hero_score == score:
+            wins += 0.5
+    return wins / live if live else None
+
+
+@dataclass(frozen=True)
+class CardOutcome:
+    """What one unseen card does for the hero."""
+
+    card: str
+    hand_class: str
+    improves: bool  # hand class is higher than before the card and than the board's own
+    # Share of the range beaten after the card; only scored for improving
+    # cards, and None when every range combo is blocked.
+    strength: Optional[float]
+
+    @property
+    def is_out(self) -> bool:
+        return self.improves and (self.strength is None or self.strength >= OUT_STRENGTH_THRESHOLD)
+
+
+@dataclass(frozen=True)
+class OutsResult:
+    """Every unseen card for a (hole, board, range); outs strongest first."""
+
+    current_class: str
+    outcomes: Tuple[CardOutcome, ...]
+
+    @property
+    def outs(self) -> List[CardOutcome]:
+        return [o for o in self.outcomes if o.is_out]
+
+    @property
+    def tainted_outs(self) -> List[CardOutcome]:
+        return [o for o in self.outcomes if o.improves and not o.is_out]
+
+    def outs_by_class(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for outcome in self.outs:
+            counts[outcome.hand_class] = counts.get(outcome.hand_class, 0) + 1
+        return counts
+
+    def to_dict(self, max_cards: int = 15) -> dict:
+        outs = self.outs
+        return {
+            'count': len(outs),
+            'cards': [o.card for o in outs[:max_cards]],
+            'by_class': self.outs_by_class(),
+            'tainted': len(self.tainted_outs),
+            'current_class': self.current_class,
+        }
+
+
+def compute_outs(
+    player_hand: List[str],
+    community_cards: List[str],
+    opponent_range: Optional[Iterable[str]] = None,
+) -> Optional[OutsResult]:
+    """Exact outs for the hero on a flop or turn board.
+
+    Args:
+        player_hand: Hero's hole cards as strings ['Ah', 'Kd']
+        community_cards: Board cards as strings (3 or 4 of them)
+        opponent_range: Canonical hands ('AKs', 'QQ', ...) the opponents can
+            hold; None for any two cards
+
+    Returns:
+        OutsResult, or None when there is no card to come or eval7 is missing
+    """
+    if not EVAL7_AVAILABLE or len(player_hand) != 2 or len(community_cards) not in (3, 4):
+        return None
+    hole = tuple(sorted(normalize_card_string(c) for c in player_hand))
+    board = tuple(sorted(normalize_card_string(c) for c in community_cards))
+    range_key = frozenset(opponent_range) if opponent_range is not None else None
+    return _compute_outs_cached(hole, board, range_key)
+
+
+@lru_cache(maxsize=512)
+def _compute_outs_cached(
+    hole: Tuple[str, ...], board: Tuple[str, ...], range_key: Optional[FrozenSet[str]]
+) -> OutsResult:
+    hero = [eval7_card(c) for c in hole]
+    board_cards = [eval7_card(c) for c in board]
+    current_class = eval7.handtype(eval7.evaluate(hero + board_cards))
+    current_rank = _CLASS_RANK[current_class]
+
+    known = set(hero + board_cards)
+    combos = [(c1, c2) for c1, c2 in range_combos(range_key) if c1 not in known and c2 not in known]
+    outcomes = []
+    for card in eval7_deck():
+        if card in known:
+            continue
+        new_board = board_cards + [card]
+        score = eval7.evaluate(hero + new_board)
+        hand_class = eval7.handtype(score)
+        # A class the board makes on its own (a paired board) is no improvement.
+        board_rank = _CLASS_RANK[eval7.handtype(eval7.evaluate(new_board))]
+        improves = _CLASS_RANK[hand_class] > max(current_rank, board_rank)
+        strength = None
+        if improves:
+            strength = _showdown_share(score, combos, new_board)
+        outcomes.append(
+            CardOutcome(card=str(card), hand_class=hand_class, improves=improves, strength=strength)
+        )
+    outcomes.sort(key=lambda o: (not o.improves, -(o.strength or 0.0)))
+    return OutsResult(current_class=current_class, outcomes=tuple(outcomes))
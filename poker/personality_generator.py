@@ -446,14 +446,21 @@ Respond with ONLY a JSON object in this exact format:
             SchemaManager(db_path).ensure_schema()
             self.personality_repo = PersonalityRepository(db_path)
 
-        # Use stateless LLMClient for generation. Personality generation uses the
-        # Assistant tier (a stronger model) — the Default tier is the cheap groq
-        # llama used for in-game narration, too weak for authoring personalities.
-        self._client = LLMClient(model=get_assistant_model(), provider=get_assistant_provider())
+        # Stateless LLMClient for generation, built on first use (see _get_client)
+        # so app startup doesn't pay for the provider SDK import.
+        self._client: Optional[LLMClient] = None
 
         # Cache for this session
         self._cache = {}
 
+    def _get_client(self) -> LLMClient:
+        # Personality generation uses the Assistant tier (a stronger model) — the
+        # Default tier is the cheap groq llama used for in-game narration, too
+        # weak for authoring personalities.
+        if self._client is None:
+            self._client = LLMClient(model=get_assistant_model(), provider=get_assistant_provider())
+        return self._client
+
     def _get_default_db_path(self) -> str:
         """Get the default database path based on environment."""
         if Path('/app/data').exists():
@@ -666,7 +673,7 @@ Respond with ONLY a JSON object in this exact format:
         prompt = self.GENERATION_PROMPT.format(name=name, description=desc_text)
 
         try:
-            response = self._client.complete(
+            response = self._get_client().complete(
                 messages=[
                     {
                         "role": "system",
@@ -117,6 +117,7 @@ class AIPokerPlayer(PokerPlayer):
         # Store and extract LLM configuration
         self.llm_config = llm_config or {}
         from core.llm.config import DEFAULT_REASONING_EFFORT, INGAME_LLM_TIMEOUT_SECONDS
+        from core.llm.hedging import hedge_policy_from_config
 
         provider = self.llm_config.get("provider", "openai")
         model = self.llm_config.get("model")  # Let provider use its default if None
@@ -139,6 +140,9 @@ class AIPokerPlayer(PokerPlayer):
             # hang the hand under the per-game lock (falls back to the
             # deterministic engine instead).
             default_timeout=INGAME_LLM_TIMEOUT_SECONDS,
+            # Off unless LLM_HEDGE_PROVIDER is set: a slow decision is raced
+            # against the secondary provider before the timeout is reached.
+            hedge=hedge_policy_from_config(),
         )
 
         # Hand strategy persistence
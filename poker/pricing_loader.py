@@ -21,6 +21,10 @@ from poker.db_utils import get_default_db_path
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed safe loader when PyYAML was built with it (~10x faster to
+# parse on every startup); same safe-load semantics either way.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def get_default_config_path() -> str:
     """Get the default pricing config path."""
@@ -41,7 +45,7 @@ def load_pricing_yaml(config_path: str) -> dict:
     """
     try:
         with open(config_path) as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_YAML_LOADER) or {}
     except FileNotFoundError:
         logger.warning(f"Pricing config not found: {config_path}")
         return {}
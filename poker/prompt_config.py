@@ -39,6 +39,7 @@ class PromptConfig:
         gto_verdict: Show explicit +EV/-EV verdict (CALL is +EV, FOLD is correct)
         include_personality: Include personality system prompt (when False, uses generic prompt)
         use_simple_response_format: Use simple JSON response format instead of rich format
+        cacheable_prompt_prefix: Move fixed decision instructions into the cached prompt prefix
         guidance_injection: Extra text to append to decision prompts (for experiments)
     """
 
@@ -111,6 +112,14 @@ class PromptConfig:
     # only as part of an A/B experiment with a known hypothesis.
     hu_equity_offset: bool = False
 
+    # Send the decision template's fixed instructions (betting discipline,
+    # mind games, response format) after the system prompt instead of inside
+    # each decision message, so providers can serve them from prompt cache.
+    # Default off — it reorders the live decision prompt, which can change
+    # JSON compliance and play on small models. Enable per experiment or
+    # preset once cache-hit and decision-quality numbers justify it.
+    cacheable_prompt_prefix: bool = False
+
     # Experiment support
     guidance_injection: str = ""  # Extra text appended to decision prompts
 
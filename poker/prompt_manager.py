@@ -13,7 +13,7 @@ import time
 import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -172,6 +172,14 @@ def compute_prompt_hash(text: str) -> str:
     return hashlib.sha256(text.encode()).hexdigest()[:12]
 
 
+@dataclass(frozen=True)
+class DecisionPromptSegments:
+    """A decision prompt split into a cacheable prefix and per-action text."""
+
+    stable: str
+    volatile: str
+
+
 @dataclass
 class PromptTemplate:
     """Structured prompt template with configurable sections."""
@@ -646,6 +654,7 @@ class PromptManager:
     def render_decision_prompt(
         self,
         message: str,
+        *,
         include_mind_games: bool = True,
         include_dramatic_sequence: bool = True,
         include_betting_discipline: bool = True,
@@ -681,40 +690,135 @@ class PromptManager:
             zone_guidance: Phase 7 zone-based strategy guidance string
 
         Returns:
-            Rendered decision prompt
+            Rendered decision prompt, sections in presentation order
+        """
+        sections = self._decision_sections(
+            message,
+            include_mind_games=include_mind_games,
+            include_dramatic_sequence=include_dramatic_sequence,
+            include_betting_discipline=include_betting_discipline,
+            pot_committed_info=pot_committed_info,
+            short_stack_info=short_stack_info,
+            made_hand_info=made_hand_info,
+            equity_verdict_info=equity_verdict_info,
+            drama_context=drama_context,
+            include_pot_odds=include_pot_odds,
+            pot_odds_info=pot_odds_info,
+            use_simple_response_format=use_simple_response_format,
+            expression_guidance=expression_guidance,
+            zone_guidance=zone_guidance,
+        )
+        return "\n\n".join(text for text, _ in sections)
+
+    def render_decision_segments(
+        self,
+        message: str,
+        *,
+        include_mind_games: bool = True,
+        include_dramatic_sequence: bool = True,
+        include_betting_discipline: bool = True,
+        pot_committed_info: dict | None = None,
+        short_stack_info: dict | None = None,
+        made_hand_info: dict | None = None,
+        equity_verdict_info: dict | None = None,
+        drama_context: dict | None = None,
+        include_pot_odds: bool = True,
+        pot_odds_info: dict | None = None,
+        use_simple_response_format: bool = False,
+        expression_guidance: str | None = None,
+        zone_guidance: str | None = None,
+    ) -> DecisionPromptSegments:
+        """Render the decision prompt split for provider prompt caching.
+
+        Takes the same arguments as ``render_decision_prompt``. The stable
+        sections are meant to ride in the cached prefix (after the system
+        prompt, see ``Assistant.chat_full(stable_context=...)``) and the
+        volatile sections form the per-action message.
+        """
+        sections = self._decision_sections(
+            message,
+            include_mind_games=include_mind_games,
+            include_dramatic_sequence=include_dramatic_sequence,
+            include_betting_discipline=include_betting_discipline,
+            pot_committed_info=pot_committed_info,
+            short_stack_info=short_stack_info,
+            made_hand_info=made_hand_info,
+            equity_verdict_info=equity_verdict_info,
+            drama_context=drama_context,
+            include_pot_odds=include_pot_odds,
+            pot_odds_info=pot_odds_info,
+            use_simple_response_format=use_simple_response_format,
+            expression_guidance=expression_guidance,
+            zone_guidance=zone_guidance,
+        )
+        return DecisionPromptSegments(
+            stable="\n\n".join(text for text, stable in sections if stable),
+            volatile="\n\n".join(text for text, stable in sections if not stable),
+        )
+
+    def _decision_sections(
+        self,
+        message: str,
+        *,
+        include_mind_games: bool = True,
+        include_dramatic_sequence: bool = True,
+        include_betting_discipline: bool = True,
+        pot_committed_info: dict | None = None,
+        short_stack_info: dict | None = None,
+        made_hand_info: dict | None = None,
+        equity_verdict_info: dict | None = None,
+        drama_context: dict | None = None,
+        include_pot_odds: bool = True,
+        pot_odds_info: dict | None = None,
+        use_simple_response_format: bool = False,
+        expression_guidance: str | None = None,
+        zone_guidance: str | None = None,
+    ) -> List[Tuple[str, bool]]:
+        """Build the decision prompt sections as ``(text, is_stable)`` pairs.
+
+        Stable sections depend only on the template and the prompt-config
+        toggles (betting discipline, mind games, response format), so they
+        are byte-identical across a player's decisions; everything derived
+        from the current game state is volatile.
         """
         template = self.get_template('decision')
-        sections_to_render = []
+        sections = []
 
         # Always include base section with message substitution
         if 'base' in template.sections:
-            sections_to_render.append(template.sections['base'].format(message=message))
+            sections.append((template.sections['base'].format(message=message), False))
 
         # Include betting discipline block (toggleable — may cause over-cautious play in small models)
         if include_betting_discipline and 'betting_discipline' in template.sections:
-            sections_to_render.append(template.sections['betting_discipline'])
+            sections.append((template.sections['betting_discipline'], True))
 
         # Phase 7: Include zone-based strategy guidance (early to frame the decision)
         if zone_guidance:
-            sections_to_render.append(zone_guidance)
+            sections.append((zone_guidance, False))
 
         # Include pot-committed warning if applicable (high priority - insert before other guidance)
         if pot_committed_info and 'pot_committed' in template.sections:
-            sections_to_render.append(
-                template.sections['pot_committed'].format(
-                    pot_odds=_safe_pot_odds(pot_committed_info.get('pot_odds')),
-                    required_equity=pot_committed_info.get('required_equity', 0),
-                    already_bet_bb=pot_committed_info.get('already_bet_bb', 0),
-                    stack_bb=pot_committed_info.get('stack_bb', 0),
-                    cost_to_call_bb=pot_committed_info.get('cost_to_call_bb', 0),
+            sections.append(
+                (
+                    template.sections['pot_committed'].format(
+                        pot_odds=_safe_pot_odds(pot_committed_info.get('pot_odds')),
+                        required_equity=pot_committed_info.get('required_equity', 0),
+                        already_bet_bb=pot_committed_info.get('already_bet_bb', 0),
+                        stack_bb=pot_committed_info.get('stack_bb', 0),
+                        cost_to_call_bb=pot_committed_info.get('cost_to_call_bb', 0),
+                    ),
+                    False,
                 )
             )
 
         # Include short-stack warning if applicable
         if short_stack_info and 'short_stack' in template.sections:
-            sections_to_render.append(
-                template.sections['short_stack'].format(
-                    stack_bb=short_stack_info.get('stack_bb', 0)
+            sections.append(
+                (
+                    template.sections['short_stack'].format(
+                        stack_bb=short_stack_info.get('stack_bb', 0)
+                    ),
+                    False,
                 )
             )
 
@@ -728,10 +832,13 @@ class PromptManager:
             section_name = f'made_hand_{tier}_{tone}'
 
             if section_name in template.sections:
-                sections_to_render.append(
-                    template.sections[section_name].format(
-                        hand_name=made_hand_info.get('hand_name', 'a strong hand'),
-                        equity=made_hand_info.get('equity', 0),
+                sections.append(
+                    (
+                        template.sections[section_name].format(
+                            hand_name=made_hand_info.get('hand_name', 'a strong hand'),
+                            equity=made_hand_info.get('equity', 0),
+                        ),
+                        False,
                     )
                 )
 
@@ -749,52 +856,61 @@ class PromptManager:
                 equity_verdict_info.get('verdict')
                 and 'equity_verdict_with_call' in template.sections
             ):
-                sections_to_render.append(
-                    template.sections['equity_verdict_with_call'].format(
-                        equity_random=equity_random,
-                        equity_ranges=equity_ranges,
-                        required_equity=equity_verdict_info.get('required_equity', 0),
-                        pot_odds=_safe_pot_odds(equity_verdict_info.get('pot_odds')),
-                        verdict=equity_verdict_info.get('verdict', ''),
-                        opponent_stats=opponent_stats,
+                sections.append(
+                    (
+                        template.sections['equity_verdict_with_call'].format(
+                            equity_random=equity_random,
+                            equity_ranges=equity_ranges,
+                            required_equity=equity_verdict_info.get('required_equity', 0),
+                            pot_odds=_safe_pot_odds(equity_verdict_info.get('pot_odds')),
+                            verdict=equity_verdict_info.get('verdict', ''),
+                            opponent_stats=opponent_stats,
+                        ),
+                        False,
                     )
                 )
             elif 'equity_verdict' in template.sections:
-                sections_to_render.append(
-                    template.sections['equity_verdict'].format(
-                        equity_random=equity_random,
-                        equity_ranges=equity_ranges,
-                        required_equity=equity_verdict_info.get('required_equity', 0),
-                        pot_odds=_safe_pot_odds(equity_verdict_info.get('pot_odds')),
-                        opponent_stats=opponent_stats,
+                sections.append(
+                    (
+                        template.sections['equity_verdict'].format(
+                            equity_random=equity_random,
+                            equity_ranges=equity_ranges,
+                            required_equity=equity_verdict_info.get('required_equity', 0),
+                            pot_odds=_safe_pot_odds(equity_verdict_info.get('pot_odds')),
+                            opponent_stats=opponent_stats,
+                        ),
+                        False,
                     )
                 )
 
         # Include pot odds guidance from YAML template (if enabled and info provided)
         if include_pot_odds and pot_odds_info:
             if pot_odds_info.get('free') and 'pot_odds_free' in template.sections:
-                sections_to_render.append(template.sections['pot_odds_free'])
+                sections.append((template.sections['pot_odds_free'], False))
             elif not pot_odds_info.get('free') and 'pot_odds_guidance' in template.sections:
                 # `pot_odds_guidance` template uses `{pot_odds:.1f}` — a stray
                 # None here would explode. Defensive coercion keeps the prompt
                 # rendering even if upstream regresses; the `free` branch is
                 # the correct path when math is undefined.
-                sections_to_render.append(
-                    template.sections['pot_odds_guidance'].format(
-                        pot_odds=_safe_pot_odds(pot_odds_info.get('pot_odds')),
-                        equity_needed=pot_odds_info.get('equity_needed', 0),
-                        pot_fmt=pot_odds_info.get('pot_fmt', ''),
-                        call_fmt=pot_odds_info.get('call_fmt', ''),
-                        pot_odds_extra=pot_odds_info.get('pot_odds_extra', ''),
+                sections.append(
+                    (
+                        template.sections['pot_odds_guidance'].format(
+                            pot_odds=_safe_pot_odds(pot_odds_info.get('pot_odds')),
+                            equity_needed=pot_odds_info.get('equity_needed', 0),
+                            pot_fmt=pot_odds_info.get('pot_fmt', ''),
+                            call_fmt=pot_odds_info.get('call_fmt', ''),
+                            pot_odds_extra=pot_odds_info.get('pot_odds_extra', ''),
+                        ),
+                        False,
                     )
                 )
 
         if include_mind_games and 'mind_games' in template.sections:
-            sections_to_render.append(template.sections['mind_games'])
+            sections.append((template.sections['mind_games'], True))
 
         # Response format: simple JSON or full dramatic sequence
         if use_simple_response_format and 'response_format_simple' in template.sections:
-            sections_to_render.append(template.sections['response_format_simple'])
+            sections.append((template.sections['response_format_simple'], True))
         elif include_dramatic_sequence and 'dramatic_sequence' in template.sections:
             # Substitute the shared gesture/example block. Use `.replace`
             # rather than `.format` to avoid disturbing the `{name}`
@@ -802,10 +918,7 @@ class PromptManager:
             section = template.sections['dramatic_sequence'].replace(
                 '{dramatic_sequence_guidance}', DRAMATIC_SEQUENCE_GUIDANCE
             )
-            sections_to_render.append(section)
-
-        # Join all sections
-        rendered = "\n\n".join(sections_to_render)
+            sections.append((section, True))
 
         # Append drama context at END (critical - avoids biasing decision)
         if drama_context:
@@ -814,13 +927,13 @@ class PromptManager:
             drama_text = DRAMA_CONTEXTS.get(level, '')
             tone_modifier = TONE_MODIFIERS.get(tone, '')
             if drama_text:
-                rendered = f"{rendered}\n\n{drama_text}{tone_modifier}"
+                sections.append((f"{drama_text}{tone_modifier}", False))
 
         # Phase 2: Append expression guidance (visibility + tempo)
         if expression_guidance:
-            rendered = f"{rendered}\n\n{expression_guidance}"
+            sections.append((expression_guidance, False))
 
-        return rendered
+        return sections
 
     def render_correction_prompt(
         self,
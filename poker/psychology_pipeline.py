@@ -9,6 +9,8 @@ UI concerns (socket emissions, animation delays) stay in callers via callbacks.
 """
 
 import logging
+import threading
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
@@ -16,6 +18,7 @@ from .controllers import AIPlayerController
 from .equity_snapshot import HandEquityHistory
 from .moment_analyzer import MomentAnalyzer
 from .pressure_detector import PressureEventDetector
+from .repositories.base_repository import BaseRepository, retry_on_lock
 
 logger = logging.getLogger(__name__)
 
@@ -61,12 +64,165 @@ class PsychologyResult:
     resolved_results: Dict[str, dict]
     recovery_infos: Dict[str, dict]
     pending_narrations: List[NarrationRequest] = field(default_factory=list)
+    write_count: int = 0  # rows persisted for this hand (one commit)
+
+
+class PostHandWriteStats:
+    """Process-wide counters for post-hand psychology persistence."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = {
+                'hands': 0,  # batches committed
+                'rows': 0,
+                'max_rows_per_hand': 0,
+                'fallbacks': 0,  # batches retried row by row
+            }
+
+    def record(self, rows: int, *, fallback: bool = False) -> None:
+        with self._lock:
+            self._counts['hands'] += 1
+            self._counts['rows'] += rows
+            self._counts['max_rows_per_hand'] = max(self._counts['max_rows_per_hand'], rows)
+            self._counts['fallbacks'] += int(fallback)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+post_hand_write_stats = PostHandWriteStats()
+
+
+def _shared_transaction(*repos):
+    """One transaction every repo can write through, or a `None` connection.
+
+    Same rule as `cash_mode.bankroll.chip_unit_of_work`: only real
+    BaseRepository instances on ONE SQLite file can share a connection; for
+    anything else (test doubles, split files) each repo commits its own batch.
+    """
+    repos = [r for r in repos if r is not None]
+    if not repos or not all(isinstance(r, BaseRepository) for r in repos):
+        return nullcontext(None)
+    if len({r.db_path for r in repos}) != 1:
+        return nullcontext(None)
+    return repos[0].transaction()
+
+
+@dataclass
+class PostHandWrites:
+    """Unit of work for one hand's psychology writes at a table.
+
+    The pipeline queues resolved pressure events, recovery events and
+    controller state here instead of writing each one as it is produced, then
+    `commit` lands them all in ONE transaction with one executemany per table.
+    A full table used to pay a commit per event plus one per player.
+    """
+
+    game_id: str
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    controller_states: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.events) + len(self.controller_states)
+
+    def add_event(
+        self,
+        player_name: str,
+        event_type: str,
+        hand_number: Optional[int],
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.events.append(
+            {
+                'game_id': self.game_id,
+                'player_name': player_name,
+                'event_type': event_type,
+                'details': details,
+                'hand_number': hand_number,
+            }
+        )
+
+    def add_controller_state(
+        self,
+        player_name: str,
+        psychology: Dict[str, Any],
+        prompt_config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.controller_states.append(
+            {
+                'game_id': self.game_id,
+                'player_name': player_name,
+                'psychology': psychology,
+                'prompt_config': prompt_config,
+            }
+        )
+
+    def commit(self, pressure_event_repo=None, game_repo=None) -> int:
+        """Write everything queued for the repos given; returns rows written.
+
+        If the batch fails, rows are retried one at a time so one bad row
+        doesn't drop the rest. The queue is emptied either way.
+        """
+        events = self.events if pressure_event_repo is not None else []
+        states = self.controller_states if game_repo is not None else []
+        if not events and not states:
+            return 0
+        fallback = False
+        try:
+            written = _commit_batch(pressure_event_repo, game_repo, events, states)
+        except Exception as e:
+            logger.error(
+                f"Batched post-hand write failed for game {self.game_id}; "
+                f"retrying {len(events) + len(states)} rows one at a time: {e}",
+                exc_info=True,
+            )
+            fallback = True
+            written = _commit_rows(pressure_event_repo, game_repo, events, states)
+        self.events = []
+        self.controller_states = []
+        post_hand_write_stats.record(written, fallback=fallback)
+        return written
+
+
+@retry_on_lock()
+def _commit_batch(pressure_event_repo, game_repo, events, states) -> int:
+    with _shared_transaction(
+        game_repo if states else None, pressure_event_repo if events else None
+    ) as conn:
+        written = 0
+        if events:
+            written += pressure_event_repo.save_events(events, conn=conn)
+        if states:
+            written += game_repo.save_controller_states(states, conn=conn)
+        return written
+
+
+def _commit_rows(pressure_event_repo, game_repo, events, states) -> int:
+    written = 0
+    for event in events:
+        try:
+            pressure_event_repo.save_event(**event)
+            written += 1
+        except Exception as e:
+            logger.warning(f"Pressure event write failed (dropped): {e}", exc_info=True)
+    for state in states:
+        try:
+            game_repo.save_controller_state(**state)
+            written += 1
+        except Exception as e:
+            logger.warning(f"Controller state write failed (dropped): {e}", exc_info=True)
+    return written
 
 
 class PsychologyPipeline:
     """Runs the full post-hand psychology pipeline.
 
-    Stages: detect -> resolve -> persist -> callback -> update_composure -> recover -> save.
+    Stages: detect -> resolve -> queue -> callback -> update_composure -> recover -> save -> commit.
 
     Args:
         pressure_detector: Detects showdown, equity, stack, streak, nemesis events.
@@ -111,7 +267,11 @@ class PsychologyPipeline:
         *,
         on_events_resolved: Optional[Callable] = None,
     ) -> PsychologyResult:
-        """Run full pipeline: detect -> resolve -> persist -> callback -> update_composure -> recover -> save.
+        """Run full pipeline: detect -> resolve -> queue -> callback -> update_composure -> recover -> save -> commit.
+
+        Every write the hand produces (pressure events, recovery events,
+        controller state) is queued on a PostHandWrites and committed once at
+        the end; PsychologyResult.write_count reports how many rows landed.
 
         Args:
             ctx: All context needed for processing.
@@ -126,6 +286,7 @@ class PsychologyPipeline:
         """
         controllers = ctx.controllers
         game_state = ctx.game_state
+        writes = PostHandWrites(ctx.game_id)
 
         # Pre-compute winner/loser names (needed by detection and steps 2-5)
         winner_names = ctx.winner_names
@@ -177,7 +338,7 @@ class PsychologyPipeline:
                         exc_info=True,
                     )
 
-            # === 3. PERSIST RESOLVED EVENTS ===
+            # === 3. QUEUE RESOLVED EVENTS === (committed with the rest in step 8)
             if self.pressure_event_repo:
                 try:
                     for player_name, result in resolved_results.items():
@@ -187,8 +348,7 @@ class PsychologyPipeline:
 
                         for event_name in result['events_applied']:
                             event_deltas = per_event_deltas.get(event_name, {})
-                            self.pressure_event_repo.save_event(
-                                game_id=ctx.game_id,
+                            writes.add_event(
                                 player_name=player_name,
                                 event_type=event_name,
                                 hand_number=ctx.hand_number,
@@ -204,7 +364,7 @@ class PsychologyPipeline:
                                 },
                             )
                 except Exception as e:
-                    logger.error(f"Failed to persist pressure events: {e}", exc_info=True)
+                    logger.error(f"Failed to queue pressure events: {e}", exc_info=True)
 
             # === 4. FIRE CALLBACK ===
             if on_events_resolved:
@@ -217,11 +377,21 @@ class PsychologyPipeline:
         pending_narrations = self._update_composure(ctx, winner_names)
 
         # === 6. APPLY RECOVERY === (always runs)
-        recovery_infos = self._apply_recovery(ctx)
+        recovery_infos = self._apply_recovery(ctx, writes)
 
-        # === 7. SAVE STATE === (always runs)
+        # === 7. QUEUE STATE === (always runs)
         if self.persist_controller_state and self.game_repo:
-            self._save_state(ctx)
+            self._save_state(ctx, writes)
+
+        # === 8. COMMIT === one transaction for the whole table's writes
+        write_count = writes.commit(
+            self.pressure_event_repo,
+            self.game_repo if self.persist_controller_state else None,
+        )
+        logger.debug(
+            f"[Psychology] Game {ctx.game_id} hand {ctx.hand_number}: "
+            f"{write_count} post-hand writes"
+        )
 
         return PsychologyResult(
             current_short_stack=current_short,
@@ -229,6 +399,7 @@ class PsychologyPipeline:
             resolved_results=resolved_results,
             recovery_infos=recovery_infos,
             pending_narrations=pending_narrations,
+            write_count=write_count,
         )
 
     # === PRIVATE: DETECTION ===
@@ -469,8 +640,8 @@ class PsychologyPipeline:
 
     # === PRIVATE: RECOVERY ===
 
-    def _apply_recovery(self, ctx: PsychologyContext) -> Dict[str, dict]:
-        """Apply recovery between hands and persist recovery/gravity events."""
+    def _apply_recovery(self, ctx: PsychologyContext, writes: PostHandWrites) -> Dict[str, dict]:
+        """Apply recovery between hands and queue recovery/gravity events."""
         recovery_infos = {}
 
         for player_name, controller in ctx.controllers.items():
@@ -496,8 +667,7 @@ class PsychologyPipeline:
                         abs(recovery_info['recovery_conf']) > 0.001
                         or abs(recovery_info['recovery_comp']) > 0.001
                     ):
-                        self.pressure_event_repo.save_event(
-                            game_id=ctx.game_id,
+                        writes.add_event(
                             player_name=player_name,
                             event_type='_recovery',
                             hand_number=ctx.hand_number,
@@ -509,7 +679,7 @@ class PsychologyPipeline:
                         )
                 except Exception as e:
                     logger.warning(
-                        f"Failed to persist recovery events for {player_name}: {e}",
+                        f"Failed to queue recovery events for {player_name}: {e}",
                         exc_info=True,
                     )
 
@@ -517,8 +687,8 @@ class PsychologyPipeline:
 
     # === PRIVATE: SAVE STATE ===
 
-    def _save_state(self, ctx: PsychologyContext) -> None:
-        """Save psychology and emotional state to database."""
+    def _save_state(self, ctx: PsychologyContext, writes: PostHandWrites) -> None:
+        """Queue psychology and emotional state for the post-hand commit."""
         for player_name, controller in ctx.controllers.items():
             if not hasattr(controller, 'psychology') or not controller.psychology:
                 continue
@@ -534,14 +704,13 @@ class PsychologyPipeline:
                 # psychology_dict already carries the narrated emotional state
                 # (narrative/inner_voice) under its 'emotional' key — the
                 # dedicated emotional_state table was retired in v136.
-                self.game_repo.save_controller_state(
-                    ctx.game_id,
+                writes.add_controller_state(
                     player_name,
                     psychology=psychology_dict,
                     prompt_config=prompt_config_dict,
                 )
             except Exception as e:
                 logger.error(
-                    f"Failed to save psychology state for {player_name}: {e}",
+                    f"Failed to queue psychology state for {player_name}: {e}",
                     exc_info=True,
                 )
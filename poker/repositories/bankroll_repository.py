@@ -28,7 +28,7 @@ import json
 import logging
 from contextlib import nullcontext
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from cash_mode.bankroll import (
     BANKROLL_KNOB_DEFAULTS,
@@ -46,6 +46,7 @@ from cash_mode.staker_profile import (
     compute_default_payoff_eagerness,
     compute_default_willingness_threshold,
 )
+from cash_mode.world_snapshot import MISS, bound_snapshot, in_transaction
 from poker.repositories.base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -201,6 +202,13 @@ class BankrollRepository(BaseRepository):
                     sandbox_id=sandbox_id,
                     conn=c,
                 )
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            snapshot.note_bankroll(
+                state,
+                sandbox_id,
+                committed=conn is None and not in_transaction(self),
+            )
 
     def load_ai_bankroll(
         self,
@@ -209,6 +217,11 @@ class BankrollRepository(BaseRepository):
         sandbox_id: str,
     ) -> Optional[AIBankrollState]:
         """Load the raw stored snapshot in the given sandbox."""
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            cached = snapshot.ai_bankroll(personality_id, sandbox_id)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             row = conn.execute(
                 """
@@ -220,13 +233,16 @@ class BankrollRepository(BaseRepository):
             ).fetchone()
             if not row:
                 return None
-            return AIBankrollState(
+            state = AIBankrollState(
                 personality_id=personality_id,
                 chips=self._derived_or_cached_ai_chips(
                     personality_id, sandbox_id, int(row["chips"])
                 ),
                 last_regen_tick=_parse_timestamp(row["last_regen_tick"]),
             )
+        if snapshot is not None and not in_transaction(self):
+            snapshot.repair_bankroll(state, int(row["chips"]), sandbox_id)
+        return state
 
     def save_emotional_state_json(
         self,
@@ -260,6 +276,11 @@ class BankrollRepository(BaseRepository):
                     """,
                     (personality_id, sandbox_id, state_json),
                 )
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            snapshot.note_emotional_state(
+                personality_id, state_json, sandbox_id, committed=not in_transaction(self)
+            )
 
     def load_emotional_state_json(
         self,
@@ -268,6 +289,11 @@ class BankrollRepository(BaseRepository):
         sandbox_id: str,
     ) -> Optional[str]:
         """Return the persisted emotional-state JSON blob in the sandbox."""
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            cached = snapshot.emotional_state_json(personality_id, sandbox_id)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             row = conn.execute(
                 """
@@ -395,6 +421,11 @@ class BankrollRepository(BaseRepository):
         robust to small per-AI drift, and computing projected for
         every row each refresh would be expensive.
         """
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            cached = snapshot.stored_chip_list(sandbox_id)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             rows = conn.execute(
                 """
@@ -426,6 +457,72 @@ class BankrollRepository(BaseRepository):
                 ).fetchall()
         return [(r["personality_id"], r["sandbox_id"], int(r["chips"])) for r in rows]
 
+    def load_ai_bankroll_rows(self, *, sandbox_id: str) -> List[dict]:
+        """Every AI bankroll row in the sandbox, one dict per AI.
+
+        The bulk read behind the lobby world snapshot: `chips` is the read
+        value (ledger-derived when `CHIP_CUSTODY_DERIVE_READS` is on, via two
+        grouped ledger aggregates instead of one query per AI), `stored_chips`
+        the cached int, plus the timestamp / psychology / status columns,
+        parsed as their single-row loaders parse them.
+        """
+        from cash_mode import economy_flags
+
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT personality_id, chips, last_regen_tick, emotional_state_json,
+                       aspiration_cooldown_until, bankruptcy_count, last_bankruptcy_at
+                FROM ai_bankroll_state
+                WHERE sandbox_id = ?
+                ORDER BY personality_id
+                """,
+                (sandbox_id,),
+            ).fetchall()
+        derived = None
+        if economy_flags.CHIP_CUSTODY_DERIVE_READS and self.chip_ledger_repo is not None:
+            from core.economy.ledger import ai
+
+            derived = self.chip_ledger_repo.balances_of(
+                [ai(r["personality_id"]) for r in rows], sandbox_id=sandbox_id
+            )
+
+        def _iso(value):
+            try:
+                return datetime.fromisoformat(value) if value is not None else None
+            except (TypeError, ValueError):
+                return None
+
+        out = []
+        for r in rows:
+            pid = r["personality_id"]
+            stored = int(r["chips"])
+            chips = stored
+            if derived is not None:
+                chips = derived[ai(pid)]
+                if chips != stored:
+                    logger.warning(
+                        "[CHIP_CUSTODY] ai bankroll cache divergence pid=%s sandbox=%s "
+                        "stored=%d derived=%d (ledger authoritative)",
+                        pid,
+                        sandbox_id,
+                        stored,
+                        chips,
+                    )
+            out.append(
+                {
+                    "personality_id": pid,
+                    "chips": chips,
+                    "stored_chips": stored,
+                    "last_regen_tick": _parse_timestamp(r["last_regen_tick"]),
+                    "emotional_state_json": r["emotional_state_json"],
+                    "aspiration_cooldown_until": _iso(r["aspiration_cooldown_until"]),
+                    "bankruptcy_count": int(r["bankruptcy_count"] or 0),
+                    "last_bankruptcy_at": _iso(r["last_bankruptcy_at"]),
+                }
+            )
+        return out
+
     def iter_player_bankrolls_raw(self):
         """`(player_id, stored_chips)` for every player bankroll row — RAW stored
         int (no derivation). Player bankroll is global (no sandbox column)."""
@@ -447,6 +544,11 @@ class BankrollRepository(BaseRepository):
         `now` and skips the aspiration roll if the AI is still
         cooling off.
         """
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            cached = snapshot.aspiration_cooldown_until(personality_id, sandbox_id)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             row = conn.execute(
                 """
@@ -496,7 +598,13 @@ class BankrollRepository(BaseRepository):
                 """,
                 (value, personality_id, sandbox_id),
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        snapshot = bound_snapshot(self)
+        if snapshot is not None and updated:
+            snapshot.note_aspiration_cooldown(
+                personality_id, until, sandbox_id, committed=not in_transaction(self)
+            )
+        return updated
 
     def record_bankruptcy(
         self,
@@ -537,7 +645,13 @@ class BankrollRepository(BaseRepository):
                 """,
                 (personality_id, sandbox_id),
             ).fetchone()
-        return int(row["bankruptcy_count"]) if row else 0
+        count = int(row["bankruptcy_count"]) if row else 0
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            snapshot.note_bankruptcy(
+                personality_id, count, now, sandbox_id, committed=not in_transaction(self)
+            )
+        return count
 
     def load_bankruptcy_state(
         self,
@@ -553,6 +667,11 @@ class BankrollRepository(BaseRepository):
         or a missing row. Malformed timestamp ⇒ count with None time
         (treated as fully decayed) rather than crashing the refresh.
         """
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            cached = snapshot.bankruptcy_state(personality_id, sandbox_id)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             row = conn.execute(
                 """
@@ -782,6 +901,11 @@ class BankrollRepository(BaseRepository):
         site assume knobs are always available — defaults are the
         right answer for "no specific tuning."
         """
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            cached = snapshot.personality_knobs(personality_id)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             row = conn.execute(
                 "SELECT config_json FROM personalities WHERE personality_id = ?",
@@ -798,8 +922,54 @@ class BankrollRepository(BaseRepository):
                 personality_id,
             )
             return BANKROLL_KNOB_DEFAULTS
+        return self._knobs_from_sub(personality_id, config.get("bankroll_knobs"))
 
-        sub = config.get("bankroll_knobs") or {}
+    def load_personality_knobs_for_pids(
+        self, personality_ids: List[str]
+    ) -> Dict[str, BankrollKnobs]:
+        """Batched `load_personality_knobs`: `{personality_id: BankrollKnobs}`.
+
+        Pulls only the `bankroll_knobs` sub-dict out of each `config_json`
+        (SQLite JSON1), so a large personality config isn't parsed in Python.
+        Same fallbacks as the single read; unknown ids get the defaults.
+        """
+        result = {pid: BANKROLL_KNOB_DEFAULTS for pid in personality_ids}
+        unique = list(result)
+        with self._get_connection() as conn:
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"""
+                    SELECT personality_id,
+                           json_valid(config_json) AS valid,
+                           CASE WHEN json_valid(config_json)
+                                THEN json_type(config_json, '$.bankroll_knobs') END AS kind,
+                           CASE WHEN json_valid(config_json)
+                                THEN json_extract(config_json, '$.bankroll_knobs') END AS knobs
+                    FROM personalities
+                    WHERE personality_id IN ({placeholders})
+                    """,
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    pid = row["personality_id"]
+                    if not row["valid"]:
+                        logger.warning(
+                            "Personality %r has malformed config_json; "
+                            "using bankroll knob defaults",
+                            pid,
+                        )
+                        continue
+                    kind, raw = row["kind"], row["knobs"]
+                    sub = json.loads(raw) if kind in ("object", "array") else raw
+                    result[pid] = self._knobs_from_sub(pid, sub)
+        return result
+
+    @staticmethod
+    def _knobs_from_sub(personality_id: str, sub) -> BankrollKnobs:
+        """Build knobs from a `bankroll_knobs` sub-dict, per-field defaults."""
+        sub = sub or {}
         if not isinstance(sub, dict):
             logger.warning(
                 "Personality %r has non-dict bankroll_knobs; using defaults",
@@ -1256,4 +1426,8 @@ class BankrollRepository(BaseRepository):
                 """,
                 (json.dumps(config), personality_id),
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            snapshot.invalidate_knobs(personality_id)
+        return updated
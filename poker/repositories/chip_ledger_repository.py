@@ -130,6 +130,44 @@ class ChipLedgerRepository(BaseRepository):
                 row = own.execute(sql, params).fetchone()
         return int(row["bal"] or 0)
 
+    def balances_of(
+        self,
+        accounts: List[str],
+        *,
+        sandbox_id: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """`balance_of` for many accounts: two grouped aggregates (sink side,
+        source side) instead of one query per account. Same scoping rules.
+
+        Built for the lobby world snapshot, which loads every AI bankroll in a
+        sandbox at once. Each side is an IN-list probe on the
+        `(sink, sandbox_id)` / `(source, sandbox_id)` indexes, chunked under
+        SQLite's bound-parameter limit. Unknown accounts map to 0.
+        """
+        balances = {account: 0 for account in accounts}
+        unique = list(balances)
+        scope = " AND sandbox_id = ?" if sandbox_id is not None else ""
+        with self._get_connection() as conn:
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                params: List[Any] = list(chunk)
+                if sandbox_id is not None:
+                    params.append(sandbox_id)
+                for column, sign in (("sink", 1), ("source", -1)):
+                    rows = conn.execute(
+                        f"""
+                        SELECT {column} AS account, COALESCE(SUM(amount), 0) AS total
+                        FROM chip_ledger_entries
+                        WHERE {column} IN ({placeholders}){scope}
+                        GROUP BY {column}
+                        """,
+                        params,
+                    ).fetchall()
+                    for row in rows:
+                        balances[row["account"]] += sign * int(row["total"])
+        return balances
+
     def entries_for_stake(
         self,
         stake_id: str,
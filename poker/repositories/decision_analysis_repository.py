@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from poker.repositories.base_repository import BaseRepository
 from poker.repositories.repository_utils import build_where_clause, parse_json_fields
@@ -511,6 +511,42 @@ class DecisionAnalysisRepository(BaseRepository):
                 return None
             return payload
 
+    def iter_strategy_pipeline_snapshots(
+        self,
+        game_ids: Optional[List[str]] = None,
+        since: Optional[str] = None,
+        chunk_size: int = 5000,
+    ) -> Iterator[Tuple[int, str, str]]:
+        """Stream `(id, game_id, raw_json)` for rows with a pipeline snapshot.
+
+        Bulk counterpart of `get_strategy_pipeline_snapshot` for the
+        shadow-eval export: rows come back in id order, fetched
+        `chunk_size` at a time, and the JSON is left unparsed so the
+        caller decides how to decode it. `since` filters on
+        `created_at >= since`.
+        """
+        conditions = ["strategy_pipeline_snapshot_json IS NOT NULL"]
+        params: List[Any] = []
+        if game_ids:
+            conditions.append(f"game_id IN ({','.join('?' * len(game_ids))})")
+            params.extend(game_ids)
+        if since:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT id, game_id, strategy_pipeline_snapshot_json "
+                f"FROM player_decision_analysis WHERE {' AND '.join(conditions)} "
+                "ORDER BY id ASC",
+                params,
+            )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row[0], row[1], row[2]
+
     def get_intervention_trace(
         self,
         analysis_id: int,
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -437,6 +438,36 @@ class GameRepository(BaseRepository):
                 ),
             )
 
+    def save_controller_states(self, states: List[Dict[str, Any]], *, conn=None) -> int:
+        """Save many players' controller state with one executemany.
+
+        Each item carries `save_controller_state`'s arguments by name. With
+        `conn`, the upsert joins the caller's open transaction (the caller
+        commits). Returns the number of rows written.
+        """
+        if not states:
+            return 0
+        rows = [
+            (
+                s['game_id'],
+                s['player_name'],
+                json.dumps(s['psychology']) if s.get('psychology') else None,
+                json.dumps(s['prompt_config']) if s.get('prompt_config') else None,
+            )
+            for s in states
+        ]
+        ctx = nullcontext(conn) if conn is not None else self._get_connection()
+        with ctx as c:
+            c.executemany(
+                """
+                INSERT OR REPLACE INTO controller_state
+                (game_id, player_name, psychology_json, prompt_config_json, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+                rows,
+            )
+        return len(rows)
+
     @staticmethod
     def _build_controller_state_dict(row, player_name: str = '') -> Dict[str, Any]:
         """Build a controller state dict from a database row.
@@ -9,6 +9,9 @@ from .base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Hand summaries kept per player in the session rollup.
+RECENT_HANDS_LIMIT = 5
+
 
 class HandHistoryRepository(BaseRepository):
     """Manages hand history, hand commentary, and session statistics."""
@@ -54,6 +57,7 @@ class HandHistoryRepository(BaseRepository):
             )
 
             hand_id = cursor.lastrowid
+            self._update_session_rollups(conn, hand_dict)
             logger.debug(f"Saved hand #{hand_dict['hand_number']} for game {hand_dict['game_id']}")
             return hand_id
 
@@ -267,9 +271,14 @@ class HandHistoryRepository(BaseRepository):
         """Delete all hand history for a game."""
         with self._get_connection() as conn:
             conn.execute("DELETE FROM hand_history WHERE game_id = ?", (game_id,))
+            conn.execute("DELETE FROM hand_session_rollups WHERE game_id = ?", (game_id,))
 
     def get_session_stats(self, game_id: str, player_name: str) -> Dict[str, Any]:
-        """Compute session statistics for a player from hand history.
+        """Session statistics for a player, read from `hand_session_rollups`.
+
+        The rollup is maintained by `save_hand_history`, so this is a single
+        row read. A game with hand history but no rollup rows (recorded before
+        the table existed) is rolled up from its hands on first access.
 
         Args:
             game_id: The game identifier
@@ -286,111 +295,98 @@ class HandHistoryRepository(BaseRepository):
                 - streak_count: Length of current streak
                 - recent_hands: List of last N hand summaries
         """
-        stats = {
-            'hands_played': 0,
-            'hands_won': 0,
-            'total_winnings': 0,
-            'biggest_pot_won': 0,
-            'biggest_pot_lost': 0,
-            'current_streak': 'neutral',
-            'streak_count': 0,
-            'recent_hands': [],
-        }
-
         with self._get_connection() as conn:
-            # Get all hands for this game, ordered by hand_number
-            cursor = conn.execute(
-                """
-                SELECT hand_number, players_json, winners_json, actions_json, pot_size, showdown
-                FROM hand_history
-                WHERE game_id = ?
-                ORDER BY hand_number ASC
-            """,
-                (game_id,),
-            )
-
-            outcomes = []  # Track outcomes for streak calculation
-
-            for row in cursor.fetchall():
-                players = json.loads(row['players_json'] or '[]')
-                winners = json.loads(row['winners_json'] or '[]')
-                actions = json.loads(row['actions_json'] or '[]')
-                pot_size = row['pot_size'] or 0
-
-                # Check if player participated in this hand
-                player_in_hand = any(p.get('name') == player_name for p in players)
-                if not player_in_hand:
-                    continue
+            row = conn.execute(
+                "SELECT * FROM hand_session_rollups WHERE game_id = ? AND player_name = ?",
+                (game_id, player_name),
+            ).fetchone()
+            if row is not None:
+                stats = _stats_from_rollup_row(row)
+                stats.pop('last_hand_number')
+                return stats
+            tracked = conn.execute(
+                "SELECT 1 FROM hand_session_rollups WHERE game_id = ? LIMIT 1", (game_id,)
+            ).fetchone()
+            if tracked:
+                # Rollups cover every player of a tracked game: no row, no hands.
+                return _empty_session_stats()
+            rollups = self._rebuild_session_rollups(conn, game_id)
+
+        stats = rollups.get(player_name) or _empty_session_stats()
+        stats.pop('last_hand_number', None)
+        return stats
 
-                stats['hands_played'] += 1
+    def _update_session_rollups(self, conn, hand_dict: Dict[str, Any]) -> None:
+        """Fold a just-saved hand into its players' rollup rows.
 
-                # Check if player won
-                player_won = False
-                amount_won = 0
-                for winner in winners:
-                    if winner.get('name') == player_name:
-                        player_won = True
-                        amount_won = winner.get('amount_won', 0)
-                        break
+        Rebuilds the game's rollups from hand history instead when the game is
+        not tracked yet (first hand, or recorded before the table existed) or
+        when the hand is not newer than what a player's rollup already holds
+        (a re-save of the same hand number).
+        """
+        game_id = hand_dict['game_id']
+        hand_number = hand_dict['hand_number']
+        rows = {
+            row['player_name']: row
+            for row in conn.execute(
+                "SELECT * FROM hand_session_rollups WHERE game_id = ?", (game_id,)
+            ).fetchall()
+        }
+        names = [p.get('name') for p in hand_dict.get('players', []) if p.get('name')]
+        if not rows or any(
+            name in rows and rows[name]['last_hand_number'] >= hand_number for name in names
+        ):
+            self._rebuild_session_rollups(conn, game_id)
+            return
+
+        updated = {}
+        for name in names:
+            stats = _stats_from_rollup_row(rows[name]) if name in rows else _empty_session_stats()
+            _fold_hand_into_stats(
+                stats,
+                name,
+                hand_number,
+                hand_dict.get('players', []),
+                hand_dict.get('winners', []),
+                hand_dict.get('actions', []),
+                hand_dict.get('pot_size', 0) or 0,
+            )
+            updated[name] = stats
+        _write_session_rollups(conn, game_id, updated)
 
-                # Calculate amount lost (sum of player's bets)
-                amount_bet = sum(
-                    a.get('amount', 0) for a in actions if a.get('player_name') == player_name
+    def _rebuild_session_rollups(self, conn, game_id: str) -> Dict[str, Dict[str, Any]]:
+        """Recompute every player's rollup for `game_id` from hand history."""
+        rollups: Dict[str, Dict[str, Any]] = {}
+        cursor = conn.execute(
+            """
+            SELECT hand_number, players_json, winners_json, actions_json, pot_size
+            FROM hand_history
+            WHERE game_id = ?
+            ORDER BY hand_number ASC
+        """,
+            (game_id,),
+        )
+        for row in cursor.fetchall():
+            players = json.loads(row['players_json'] or '[]')
+            winners = json.loads(row['winners_json'] or '[]')
+            actions = json.loads(row['actions_json'] or '[]')
+            for player in players:
+                name = player.get('name')
+                if not name:
+                    continue
+                _fold_hand_into_stats(
+                    rollups.setdefault(name, _empty_session_stats()),
+                    name,
+                    row['hand_number'],
+                    players,
+                    winners,
+                    actions,
+                    row['pot_size'] or 0,
                 )
 
-                # Determine outcome
-                if player_won:
-                    stats['hands_won'] += 1
-                    stats['total_winnings'] += amount_won - amount_bet
-                    outcomes.append('won')
-                    if pot_size > stats['biggest_pot_won']:
-                        stats['biggest_pot_won'] = pot_size
-                else:
-                    # Check if folded or lost at showdown
-                    folded = any(
-                        a.get('player_name') == player_name and a.get('action') == 'fold'
-                        for a in actions
-                    )
-                    if folded:
-                        outcomes.append('folded')
-                        stats['total_winnings'] -= amount_bet
-                    else:
-                        # Lost at showdown
-                        outcomes.append('lost')
-                        stats['total_winnings'] -= amount_bet
-                        if pot_size > stats['biggest_pot_lost']:
-                            stats['biggest_pot_lost'] = pot_size
-
-                # Build recent hand summary (keep last 5)
-                if len(stats['recent_hands']) >= 5:
-                    stats['recent_hands'].pop(0)
-
-                outcome_str = outcomes[-1]
-                if outcome_str == 'won':
-                    summary = f"Hand {row['hand_number']}: Won ${amount_won}"
-                elif outcome_str == 'folded':
-                    summary = f"Hand {row['hand_number']}: Folded"
-                else:
-                    summary = f"Hand {row['hand_number']}: Lost ${amount_bet}"
-                stats['recent_hands'].append(summary)
-
-            # Calculate current streak from outcomes
-            if outcomes:
-                current = outcomes[-1]
-                if current in ('won', 'lost'):
-                    streak_type = 'winning' if current == 'won' else 'losing'
-                    streak_count = 1
-                    for outcome in reversed(outcomes[:-1]):
-                        if (streak_type == 'winning' and outcome == 'won') or (
-                            streak_type == 'losing' and outcome == 'lost'
-                        ):
-                            streak_count += 1
-                        else:
-                            break
-                    stats['current_streak'] = streak_type
-                    stats['streak_count'] = streak_count
-
-        return stats
+        conn.execute("DELETE FROM hand_session_rollups WHERE game_id = ?", (game_id,))
+        _write_session_rollups(conn, game_id, rollups)
+        return rollups
 
     def get_session_context_for_prompt(
         self, game_id: str, player_name: str, max_recent: int = 3
@@ -432,3 +428,121 @@ class HandHistoryRepository(BaseRepository):
             parts.append("Recent: " + " | ".join(recent))
 
         return ". ".join(parts) if parts else ""
+
+
+# ── Session rollups ─────────────────────────────────────────────────────
+
+
+def _empty_session_stats() -> Dict[str, Any]:
+    return {
+        'hands_played': 0,
+        'hands_won': 0,
+        'total_winnings': 0,
+        'biggest_pot_won': 0,
+        'biggest_pot_lost': 0,
+        'current_streak': 'neutral',
+        'streak_count': 0,
+        'recent_hands': [],
+    }
+
+
+def _fold_hand_into_stats(
+    stats: Dict[str, Any],
+    player_name: str,
+    hand_number: int,
+    players: List[Dict[str, Any]],
+    winners: List[Dict[str, Any]],
+    actions: List[Dict[str, Any]],
+    pot_size,
+) -> None:
+    """Apply one hand to a player's session stats in place.
+
+    A hand the player was not dealt into is ignored. Wins and showdown losses
+    extend (or start) a winning / losing streak; a fold resets it to neutral.
+    """
+    if not any(p.get('name') == player_name for p in players):
+        return
+    stats['hands_played'] += 1
+    stats['last_hand_number'] = hand_number
+
+    player_won = False
+    amount_won = 0
+    for winner in winners:
+        if winner.get('name') == player_name:
+            player_won = True
+            amount_won = winner.get('amount_won', 0)
+            break
+
+    # Amount lost is the sum of the player's bets
+    amount_bet = sum(a.get('amount', 0) for a in actions if a.get('player_name') == player_name)
+
+    if player_won:
+        outcome = 'won'
+        stats['hands_won'] += 1
+        stats['total_winnings'] += amount_won - amount_bet
+        stats['biggest_pot_won'] = max(stats['biggest_pot_won'], pot_size)
+        summary = f"Hand {hand_number}: Won ${amount_won}"
+    elif any(a.get('player_name') == player_name and a.get('action') == 'fold' for a in actions):
+        outcome = 'folded'
+        stats['total_winnings'] -= amount_bet
+        summary = f"Hand {hand_number}: Folded"
+    else:
+        # Lost at showdown
+        outcome = 'lost'
+        stats['total_winnings'] -= amount_bet
+        stats['biggest_pot_lost'] = max(stats['biggest_pot_lost'], pot_size)
+        summary = f"Hand {hand_number}: Lost ${amount_bet}"
+
+    if outcome == 'folded':
+        stats['current_streak'] = 'neutral'
+        stats['streak_count'] = 0
+    else:
+        streak_type = 'winning' if outcome == 'won' else 'losing'
+        if stats['current_streak'] == streak_type:
+            stats['streak_count'] += 1
+        else:
+            stats['current_streak'] = streak_type
+            stats['streak_count'] = 1
+
+    stats['recent_hands'] = (stats['recent_hands'] + [summary])[-RECENT_HANDS_LIMIT:]
+
+
+def _stats_from_rollup_row(row) -> Dict[str, Any]:
+    return {
+        'hands_played': row['hands_played'],
+        'hands_won': row['hands_won'],
+        'total_winnings': row['total_winnings'],
+        'biggest_pot_won': row['biggest_pot_won'],
+        'biggest_pot_lost': row['biggest_pot_lost'],
+        'current_streak': row['current_streak'],
+        'streak_count': row['streak_count'],
+        'recent_hands': json.loads(row['recent_hands_json']),
+        'last_hand_number': row['last_hand_number'],
+    }
+
+
+def _write_session_rollups(conn, game_id: str, rollups: Dict[str, Dict[str, Any]]) -> None:
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO hand_session_rollups
+        (game_id, player_name, hands_played, hands_won, total_winnings, biggest_pot_won,
+         biggest_pot_lost, current_streak, streak_count, recent_hands_json, last_hand_number)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+        [
+            (
+                game_id,
+                name,
+                stats['hands_played'],
+                stats['hands_won'],
+                stats['total_winnings'],
+                stats['biggest_pot_won'],
+                stats['biggest_pot_lost'],
+                stats['current_streak'],
+                stats['streak_count'],
+                json.dumps(stats['recent_hands']),
+                stats.get('last_hand_number', 0),
+            )
+            for name, stats in rollups.items()
+        ],
+    )
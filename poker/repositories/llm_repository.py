@@ -5,6 +5,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from core.llm.usage_rollups import latency_quantile, latency_window_source, window_source
+
 from .base_repository import BaseRepository
 
 
@@ -104,6 +106,11 @@ class LLMRepository(BaseRepository):
     # Usage summary
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _window_cutoff(conn: sqlite3.Connection, date_modifier: str) -> str:
+        """Resolve a SQLite date modifier to a UTC 'YYYY-MM-DD HH:MM:SS' cutoff."""
+        return conn.execute("SELECT datetime('now', ?)", (date_modifier,)).fetchone()[0]
+
     def get_usage_summary(self, date_modifier: str) -> dict:
         """Get aggregated API usage stats for a time range.
 
@@ -114,17 +121,17 @@ class LLMRepository(BaseRepository):
             Dict with total_calls, total_cost, avg_latency, error_rate.
         """
         with self._get_connection() as conn:
+            source, params = window_source(self._window_cutoff(conn, date_modifier))
             cursor = conn.execute(
-                """
+                f"""
                 SELECT
-                    COUNT(*) as total_calls,
-                    COALESCE(SUM(estimated_cost), 0) as total_cost,
-                    COALESCE(AVG(latency_ms), 0) as avg_latency,
-                    COALESCE(SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) * 100.0 / NULLIF(COUNT(*), 0), 0) as error_rate
-                FROM api_usage
-                WHERE created_at >= datetime('now', ?)
+                    COALESCE(SUM(calls), 0) as total_calls,
+                    COALESCE(SUM(cost), 0) as total_cost,
+                    COALESCE(SUM(latency_sum_ms) / NULLIF(SUM(latency_calls), 0), 0) as avg_latency,
+                    COALESCE(SUM(error_calls) * 100.0 / NULLIF(SUM(calls), 0), 0) as error_rate
+                FROM ({source})
             """,
-                (date_modifier,),
+                params,
             )
             return dict(cursor.fetchone())
 
@@ -137,6 +144,12 @@ class LLMRepository(BaseRepository):
     # to 0 via COALESCE — same convention as the budget gate. `owner_id` may
     # be NULL for system-initiated calls; we surface those as '(system)' so
     # they never silently vanish from the rollup.
+    #
+    # The owner / call-type / model / time-series / uncosted breakdowns read
+    # the hourly/daily rollups through `window_source` (whole days and hours
+    # from the rollup tables, the leading partial hour from raw rows), so
+    # they cost O(buckets) rather than O(calls). Per-game and per-call views
+    # need columns the rollups don't key on and stay on raw rows.
 
     def get_cost_by_owner(self, date_modifier: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Cost + volume aggregated per owner for a time range.
@@ -150,23 +163,24 @@ class LLMRepository(BaseRepository):
             error_calls, input_tokens, output_tokens.
         """
         with self._get_connection() as conn:
+            source, params = window_source(self._window_cutoff(conn, date_modifier))
             cursor = conn.execute(
-                """
+                f"""
                 SELECT
                     COALESCE(NULLIF(owner_id, ''), '(system)') as owner_id,
-                    COALESCE(SUM(estimated_cost), 0) as total_cost,
-                    COUNT(*) as total_calls,
-                    COALESCE(SUM(CASE WHEN call_type = 'image_generation' THEN 1 ELSE 0 END), 0) as image_calls,
-                    COALESCE(SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END), 0) as error_calls,
+                    COALESCE(SUM(cost), 0) as total_cost,
+                    COALESCE(SUM(calls), 0) as total_calls,
+                    COALESCE(SUM(CASE WHEN call_type = 'image_generation' THEN calls ELSE 0 END), 0) as image_calls,
+                    COALESCE(SUM(error_calls), 0) as error_calls,
                     COALESCE(SUM(input_tokens), 0) as input_tokens,
                     COALESCE(SUM(output_tokens), 0) as output_tokens
-                FROM api_usage
-                WHERE created_at >= datetime('now', ?)
+                FROM ({source})
                 GROUP BY COALESCE(NULLIF(owner_id, ''), '(system)')
+                HAVING SUM(calls) > 0
                 ORDER BY total_cost DESC
                 LIMIT ?
                 """,
-                (date_modifier, limit),
+                [*params, limit],
             )
             return [dict(row) for row in cursor.fetchall()]
 
@@ -180,33 +194,69 @@ class LLMRepository(BaseRepository):
             input_tokens, output_tokens, cached_tokens, reasoning_tokens,
             image_count. Sorted by total_cost desc.
         """
-        params: List[Any] = [date_modifier]
-        owner_clause = ""
-        if owner_id is not None:
-            owner_clause = " AND COALESCE(NULLIF(owner_id, ''), '(system)') = ?"
-            params.append(owner_id)
         with self._get_connection() as conn:
+            source, params = window_source(self._window_cutoff(conn, date_modifier))
+            owner_clause = ""
+            if owner_id is not None:
+                owner_clause = " WHERE COALESCE(NULLIF(owner_id, ''), '(system)') = ?"
+                params.append(owner_id)
             cursor = conn.execute(
                 f"""
                 SELECT
                     call_type,
-                    COALESCE(SUM(estimated_cost), 0) as total_cost,
-                    COUNT(*) as total_calls,
-                    COALESCE(AVG(latency_ms), 0) as avg_latency,
+                    COALESCE(SUM(cost), 0) as total_cost,
+                    COALESCE(SUM(calls), 0) as total_calls,
+                    COALESCE(SUM(latency_sum_ms) / NULLIF(SUM(latency_calls), 0), 0) as avg_latency,
                     COALESCE(SUM(input_tokens), 0) as input_tokens,
                     COALESCE(SUM(output_tokens), 0) as output_tokens,
                     COALESCE(SUM(cached_tokens), 0) as cached_tokens,
                     COALESCE(SUM(reasoning_tokens), 0) as reasoning_tokens,
                     COALESCE(SUM(image_count), 0) as image_count
-                FROM api_usage
-                WHERE created_at >= datetime('now', ?){owner_clause}
+                FROM ({source}){owner_clause}
                 GROUP BY call_type
+                HAVING SUM(calls) > 0
                 ORDER BY total_cost DESC
                 """,
                 params,
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_prompt_cache_by_call_type(self, date_modifier: str) -> List[Dict[str, Any]]:
+        """Prompt-cache effectiveness per call_type and provider.
+
+        ``cache_hit_rate`` is the share of prompt (input) tokens served from
+        the provider's prompt cache — the tokens billed at the cached rate.
+        Image calls have no prompt tokens and are left out.
+
+        Returns:
+            List of dicts: call_type, provider, total_calls, input_tokens,
+            cached_tokens, cache_hit_rate (0-1, None without input tokens),
+            avg_latency, cost_per_call. Sorted by input_tokens desc.
+        """
+        with self._get_connection() as conn:
+            source, params = window_source(self._window_cutoff(conn, date_modifier))
+            cursor = conn.execute(
+                f"""
+                SELECT
+                    call_type,
+                    provider,
+                    SUM(calls) as total_calls,
+                    SUM(input_tokens) as input_tokens,
+                    SUM(cached_tokens) as cached_tokens,
+                    CAST(SUM(cached_tokens) AS REAL) / NULLIF(SUM(input_tokens), 0)
+                        as cache_hit_rate,
+                    COALESCE(SUM(latency_sum_ms) / NULLIF(SUM(latency_calls), 0), 0)
+                        as avg_latency,
+                    SUM(cost) / SUM(calls) as cost_per_call
+                FROM ({source})
+                GROUP BY call_type, provider
+                HAVING SUM(calls) > 0 AND SUM(input_tokens) > 0
+                ORDER BY input_tokens DESC
+                """,
+                params,
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
     def get_cost_by_model(
         self, date_modifier: str, owner_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -216,30 +266,80 @@ class LLMRepository(BaseRepository):
             List of dicts: provider, model, total_cost, total_calls,
             input_tokens, output_tokens. Sorted by total_cost desc.
         """
-        params: List[Any] = [date_modifier]
-        owner_clause = ""
-        if owner_id is not None:
-            owner_clause = " AND COALESCE(NULLIF(owner_id, ''), '(system)') = ?"
-            params.append(owner_id)
         with self._get_connection() as conn:
+            source, params = window_source(self._window_cutoff(conn, date_modifier))
+            owner_clause = ""
+            if owner_id is not None:
+                owner_clause = " WHERE COALESCE(NULLIF(owner_id, ''), '(system)') = ?"
+                params.append(owner_id)
             cursor = conn.execute(
                 f"""
                 SELECT
                     provider,
                     model,
-                    COALESCE(SUM(estimated_cost), 0) as total_cost,
-                    COUNT(*) as total_calls,
+                    COALESCE(SUM(cost), 0) as total_cost,
+                    COALESCE(SUM(calls), 0) as total_calls,
                     COALESCE(SUM(input_tokens), 0) as input_tokens,
                     COALESCE(SUM(output_tokens), 0) as output_tokens
-                FROM api_usage
-                WHERE created_at >= datetime('now', ?){owner_clause}
+                FROM ({source}){owner_clause}
                 GROUP BY provider, model
+                HAVING SUM(calls) > 0
                 ORDER BY total_cost DESC
                 """,
                 params,
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_latency_by_model(self, date_modifier: str) -> List[Dict[str, Any]]:
+        """Latency percentiles per provider/model from the rollup histograms.
+
+        Percentiles are histogram bucket upper bounds (within ~25%).
+
+        Returns:
+            List of dicts: provider, model, calls, p50_ms, p95_ms, p99_ms.
+            Sorted by call volume desc.
+        """
+        return self._latency_percentiles(date_modifier, ('provider', 'model'))
+
+    def get_latency_by_call_type(self, date_modifier: str) -> List[Dict[str, Any]]:
+        """Like `get_latency_by_model`, split per call_type as well.
+
+        Returns:
+            List of dicts: provider, model, call_type, calls, p50_ms, p95_ms,
+            p99_ms. Sorted by call volume desc.
+        """
+        return self._latency_percentiles(date_modifier, ('provider', 'model', 'call_type'))
+
+    def _latency_percentiles(
+        self, date_modifier: str, group_by: Tuple[str, ...]
+    ) -> List[Dict[str, Any]]:
+        columns = ", ".join(group_by)
+        with self._get_connection() as conn:
+            source, params = latency_window_source(self._window_cutoff(conn, date_modifier))
+            rows = conn.execute(
+                f"""
+                SELECT {columns}, latency_bucket, SUM(count) as n
+                FROM ({source})
+                GROUP BY {columns}, latency_bucket
+                """,
+                params,
+            ).fetchall()
+        histograms: Dict[Tuple[str, ...], Dict[int, int]] = {}
+        for row in rows:
+            counts = histograms.setdefault(tuple(row[c] for c in group_by), {})
+            counts[row['latency_bucket']] = row['n']
+        result = [
+            {
+                **dict(zip(group_by, key, strict=True)),
+                'calls': sum(counts.values()),
+                'p50_ms': latency_quantile(counts, 0.50),
+                'p95_ms': latency_quantile(counts, 0.95),
+                'p99_ms': latency_quantile(counts, 0.99),
+            }
+            for key, counts in histograms.items()
+        ]
+        return sorted(result, key=lambda r: r['calls'], reverse=True)
+
     def get_cost_by_game(
         self, date_modifier: str, owner_id: Optional[str] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -291,22 +391,17 @@ class LLMRepository(BaseRepository):
             {'total': int, 'by_model': [{provider, model, calls, last_seen}]}.
         """
         with self._get_connection() as conn:
-            total = conn.execute(
-                """SELECT COUNT(*) FROM api_usage
-                   WHERE status != 'error' AND estimated_cost IS NULL
-                     AND created_at >= datetime('now', ?)""",
-                (date_modifier,),
-            ).fetchone()[0]
+            source, params = window_source(self._window_cutoff(conn, date_modifier))
             by_model = conn.execute(
-                """SELECT provider, model, COUNT(*) as calls,
-                          MAX(date(created_at)) as last_seen
-                   FROM api_usage
-                   WHERE status != 'error' AND estimated_cost IS NULL
-                     AND created_at >= datetime('now', ?)
-                   GROUP BY provider, model ORDER BY calls DESC LIMIT 20""",
-                (date_modifier,),
+                f"""SELECT provider, model, SUM(uncosted_calls) as calls,
+                          MAX(CASE WHEN uncosted_calls > 0 THEN date(period) END) as last_seen
+                   FROM ({source})
+                   GROUP BY provider, model HAVING SUM(uncosted_calls) > 0
+                   ORDER BY calls DESC""",
+                params,
             ).fetchall()
-            return {'total': total, 'by_model': [dict(r) for r in by_model]}
+        total = sum(row['calls'] for row in by_model)
+        return {'total': total, 'by_model': [dict(r) for r in by_model[:20]]}
 
     # Upper bound on gap-filled buckets, so an 'all'-range query over a very
     # old dataset can't return a pathological time-series. Daily over ~5 years
@@ -332,24 +427,26 @@ class LLMRepository(BaseRepository):
             Ordered chronologically, with a row per bucket in the window.
         """
         fmt = "%Y-%m-%d %H:00" if bucket == "hour" else "%Y-%m-%d"
-        params: List[Any] = [fmt, date_modifier]
-        owner_clause = ""
-        if owner_id is not None:
-            owner_clause = " AND COALESCE(NULLIF(owner_id, ''), '(system)') = ?"
-            params.append(owner_id)
         with self._get_connection() as conn:
+            source, params = window_source(
+                self._window_cutoff(conn, date_modifier), granularity=bucket
+            )
+            owner_clause = ""
+            if owner_id is not None:
+                owner_clause = " WHERE COALESCE(NULLIF(owner_id, ''), '(system)') = ?"
+                params.append(owner_id)
             cursor = conn.execute(
                 f"""
                 SELECT
-                    strftime(?, created_at) as period,
-                    COALESCE(SUM(estimated_cost), 0) as total_cost,
-                    COUNT(*) as total_calls
-                FROM api_usage
-                WHERE created_at >= datetime('now', ?){owner_clause}
-                GROUP BY period
-                ORDER BY period ASC
+                    strftime(?, period) as period,
+                    COALESCE(SUM(cost), 0) as total_cost,
+                    COALESCE(SUM(calls), 0) as total_calls
+                FROM ({source}){owner_clause}
+                GROUP BY 1
+                HAVING SUM(calls) > 0
+                ORDER BY 1 ASC
                 """,
-                params,
+                [fmt, *params],
             )
             agg = {row['period']: dict(row) for row in cursor.fetchall()}
             if not agg:
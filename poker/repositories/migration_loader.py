@@ -82,16 +82,15 @@ class FileMigrationLoader:
 
     # ---- discovery -------------------------------------------------------
 
-    def discover(self) -> List[Migration]:
-        """Load every migration file, returned in apply order.
+    def discover_ids(self) -> List[str]:
+        """Return every migration id (file stem) in the directory, sorted.
 
-        Raises ``ValueError`` on a malformed filename, a missing/uncallable
-        ``upgrade``, an unknown ``DEPENDS_ON`` target, or a dependency cycle —
-        all author errors that should fail loudly at startup, never silently.
+        Reads filenames only — no module is imported — so it is cheap enough to
+        run on every boot. Raises ``ValueError`` on a malformed filename.
         """
         if not os.path.isdir(self.migrations_dir):
             return []
-        migs: List[Migration] = []
+        ids: List[str] = []
         for fname in sorted(os.listdir(self.migrations_dir)):
             if not fname.endswith(".py") or fname.startswith("_"):
                 continue
@@ -101,7 +100,20 @@ class FileMigrationLoader:
                     f"Migration file {fname!r} does not match the required id "
                     f"format YYYYMMDD_HHMM_slug.py"
                 )
-            migs.append(self._load(stem, os.path.join(self.migrations_dir, fname)))
+            ids.append(stem)
+        return ids
+
+    def discover(self) -> List[Migration]:
+        """Load every migration file, returned in apply order.
+
+        Raises ``ValueError`` on a malformed filename, a missing/uncallable
+        ``upgrade``, an unknown ``DEPENDS_ON`` target, or a dependency cycle —
+        all author errors that should fail loudly at startup, never silently.
+        """
+        migs = [
+            self._load(stem, os.path.join(self.migrations_dir, f"{stem}.py"))
+            for stem in self.discover_ids()
+        ]
         return self._order(migs)
 
     @staticmethod
@@ -168,6 +180,18 @@ class FileMigrationLoader:
         cls._ensure_table(conn)
         return {row[0] for row in conn.execute("SELECT id FROM applied_migrations")}
 
+    def pending_ids(self, conn: sqlite3.Connection) -> List[str]:
+        """Ids of migration files not yet recorded in ``applied_migrations``.
+
+        Filename-only (see ``discover_ids``), so an up-to-date DB is detected
+        without importing any migration module.
+        """
+        ids = self.discover_ids()
+        if not ids:
+            return []
+        applied = self.applied_ids(conn)
+        return [i for i in ids if i not in applied]
+
     def run(self, connection_factory: Callable[[], sqlite3.Connection]) -> List[str]:
         """Apply every discovered migration whose id is not yet recorded.
 
@@ -175,9 +199,11 @@ class FileMigrationLoader:
         ``applied_migrations`` insert, so a crash never leaves a migration
         applied-but-unrecorded (which would re-run it next boot). Returns the
         ids applied this run, in apply order.
+
+        When nothing is pending the migration modules are never imported.
         """
-        migs = self.discover()
-        if not migs:
+        ids = self.discover_ids()
+        if not ids:
             return []
 
         conn = connection_factory()
@@ -185,8 +211,10 @@ class FileMigrationLoader:
             applied = self.applied_ids(conn)
         finally:
             conn.close()
+        if applied.issuperset(ids):
+            return []
 
-        pending = [m for m in migs if m.id not in applied]
+        pending = [m for m in self.discover() if m.id not in applied]
         done: List[str] = []
         for m in pending:
             conn = connection_factory()
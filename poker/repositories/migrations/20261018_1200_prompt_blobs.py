@@ -0,0 +1,83 @@
+"""Content-addressed blob store for prompt-capture system prompts and history.
+
+`prompt_captures` stored every capture's full system prompt and conversation
+history inline, although both repeat heavily (same persona prompt on every
+decision; each history is the previous one plus an exchange). New captures now
+write that text once into `prompt_blobs` (sha256 → zlib) and reference it from
+`system_prompt_hash` / `conversation_history_hashes` (JSON list, one hash per
+message). See `core/llm/prompt_blobs.py`.
+
+`refcount` = number of capture rows referencing the blob, maintained by the
+triggers below so every delete path (retention sweep, per-game delete, FK
+cascade) keeps it exact; orphans (refcount 0) are garbage-collected by the
+capture cleanup methods.
+
+Additive, idempotent. Existing rows keep their inline text and are read
+unchanged.
+"""
+
+import sqlite3
+
+DESCRIPTION = "Add prompt_blobs (deduplicated compressed prompt text) + capture hash refs"
+
+_REFS = (
+    "hash = {row}.system_prompt_hash "
+    "OR hash IN (SELECT value FROM json_each(COALESCE({row}.conversation_history_hashes, '[]')))"
+)
+_HAS_REFS = "{row}.system_prompt_hash IS NOT NULL OR {row}.conversation_history_hashes IS NOT NULL"
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS prompt_blobs (
+            hash TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            data BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            refcount INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_prompt_blobs_orphans "
+        "ON prompt_blobs(refcount) WHERE refcount <= 0"
+    )
+
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(prompt_captures)")}
+    if "system_prompt_hash" not in cols:
+        conn.execute("ALTER TABLE prompt_captures ADD COLUMN system_prompt_hash TEXT")
+    if "conversation_history_hashes" not in cols:
+        conn.execute("ALTER TABLE prompt_captures ADD COLUMN conversation_history_hashes TEXT")
+
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_prompt_blobs_ref_insert
+        AFTER INSERT ON prompt_captures
+        WHEN {_HAS_REFS.format(row='NEW')}
+        BEGIN
+            UPDATE prompt_blobs SET refcount = refcount + 1 WHERE {_REFS.format(row='NEW')};
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_prompt_blobs_ref_delete
+        AFTER DELETE ON prompt_captures
+        WHEN {_HAS_REFS.format(row='OLD')}
+        BEGIN
+            UPDATE prompt_blobs SET refcount = refcount - 1 WHERE {_REFS.format(row='OLD')};
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_prompt_blobs_ref_update
+        AFTER UPDATE OF system_prompt_hash, conversation_history_hashes ON prompt_captures
+        BEGIN
+            UPDATE prompt_blobs SET refcount = refcount - 1 WHERE {_REFS.format(row='OLD')};
+            UPDATE prompt_blobs SET refcount = refcount + 1 WHERE {_REFS.format(row='NEW')};
+        END
+        """
+    )
@@ -0,0 +1,97 @@
+"""Full-text index over prompt captures + an emotion facet index.
+
+The capture browsers filtered tags with `tags LIKE '%"tag"%'` (a full scan per
+page) and had no way to search prompt or response text. `prompt_captures_fts`
+is an external-content FTS5 index over user_message / ai_response /
+system_prompt / tags, kept in sync with `prompt_captures` by the triggers
+below and back-filled with `'rebuild'` on first creation. Blob-stored system
+prompts (see the prompt_blobs migration) are '' in the row and so are not
+indexed — persona prompts are the same text on every capture and carry no
+search signal.
+
+`PromptCaptureRepository` checks for the table and falls back to LIKE when the
+SQLite build lacks FTS5, so this migration is a no-op there rather than an
+error.
+
+Also adds prompt_captures(created_at, id) so keyset pages (`ORDER BY
+created_at DESC, id DESC` after a `(created_at, id) < cursor` seek) are served
+entirely from the index, and player_decision_analysis(display_emotion) for the
+distinct-emotion filter facet.
+
+Additive, idempotent.
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+DESCRIPTION = "Add prompt_captures_fts (FTS5 over prompts/responses/tags) + paging/facet indexes"
+
+_COLUMNS = "user_message, ai_response, system_prompt, tags"
+
+
+def _values(row: str) -> str:
+    return ", ".join(f"{row}.{col.strip()}" for col in _COLUMNS.split(","))
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_prompt_captures_created_id "
+        "ON prompt_captures(created_at, id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_decision_analysis_emotion "
+        "ON player_decision_analysis(display_emotion)"
+    )
+
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'prompt_captures_fts'"
+    ).fetchone()
+    if not exists:
+        try:
+            conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE prompt_captures_fts USING fts5(
+                    {_COLUMNS},
+                    content='prompt_captures', content_rowid='id'
+                )
+                """
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning("FTS5 unavailable, prompt capture search falls back to LIKE: %s", e)
+            return
+        conn.execute("INSERT INTO prompt_captures_fts(prompt_captures_fts) VALUES ('rebuild')")
+
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_prompt_captures_fts_insert
+        AFTER INSERT ON prompt_captures
+        BEGIN
+            INSERT INTO prompt_captures_fts(rowid, {_COLUMNS})
+            VALUES (NEW.id, {_values('NEW')});
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_prompt_captures_fts_delete
+        AFTER DELETE ON prompt_captures
+        BEGIN
+            INSERT INTO prompt_captures_fts(prompt_captures_fts, rowid, {_COLUMNS})
+            VALUES ('delete', OLD.id, {_values('OLD')});
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_prompt_captures_fts_update
+        AFTER UPDATE OF {_COLUMNS} ON prompt_captures
+        BEGIN
+            INSERT INTO prompt_captures_fts(prompt_captures_fts, rowid, {_COLUMNS})
+            VALUES ('delete', OLD.id, {_values('OLD')});
+            INSERT INTO prompt_captures_fts(rowid, {_COLUMNS})
+            VALUES (NEW.id, {_values('NEW')});
+        END
+        """
+    )
@@ -0,0 +1,241 @@
+"""Hourly/daily rollups of api_usage, maintained by triggers.
+
+Cost analytics and the spend gate summed raw `api_usage` rows on every
+request, so their cost grew with call volume. This adds:
+
+- `api_usage_rollups` — calls, error / uncosted counts, cost, token totals and
+  latency sum / max per (bucket, bucket_start, owner_id, provider, model,
+  call_type), for `bucket` 'hour' and 'day'. NULL owners are stored as ''.
+- `api_usage_latency_rollups` — a log-bucketed latency histogram per
+  (bucket, bucket_start, provider, model, call_type).
+- `api_usage_latency_bounds` — the histogram's bucket upper bounds
+  (1.25^i ms), so the triggers can bucket without SQL math functions.
+
+Triggers keep both rollups current on INSERT and on cost / token corrections
+(UPDATE). There is intentionally no DELETE trigger: retention pruning of raw
+rows must not erase the aggregated history. Owner transfers move rollup rows
+explicitly (`core.llm.usage_rollups.reassign_owner`).
+
+Existing rows are back-filled on first creation. Additive, idempotent.
+"""
+
+import sqlite3
+
+DESCRIPTION = "Add api_usage hourly/daily rollups + latency histogram, trigger-maintained"
+
+_BUCKETS = {
+    'hour': '%Y-%m-%d %H:00:00',
+    'day': '%Y-%m-%d 00:00:00',
+}
+
+_MERGE = """
+    calls = calls + excluded.calls,
+    error_calls = error_calls + excluded.error_calls,
+    uncosted_calls = uncosted_calls + excluded.uncosted_calls,
+    cost = cost + excluded.cost,
+    input_tokens = input_tokens + excluded.input_tokens,
+    output_tokens = output_tokens + excluded.output_tokens,
+    cached_tokens = cached_tokens + excluded.cached_tokens,
+    reasoning_tokens = reasoning_tokens + excluded.reasoning_tokens,
+    image_count = image_count + excluded.image_count,
+    latency_calls = latency_calls + excluded.latency_calls,
+    latency_sum_ms = latency_sum_ms + excluded.latency_sum_ms,
+    latency_max_ms = MAX(
+        COALESCE(latency_max_ms, excluded.latency_max_ms),
+        COALESCE(excluded.latency_max_ms, latency_max_ms)
+    )"""
+
+_COLUMNS = (
+    "bucket, bucket_start, owner_id, provider, model, call_type, calls, error_calls, "
+    "uncosted_calls, cost, input_tokens, output_tokens, cached_tokens, reasoning_tokens, "
+    "image_count, latency_calls, latency_sum_ms, latency_max_ms"
+)
+
+_KEY = "bucket, bucket_start, owner_id, provider, model, call_type"
+
+
+def _period(fmt: str, column: str) -> str:
+    # Unparseable timestamps land in the current bucket rather than failing the insert.
+    return f"COALESCE(strftime('{fmt}', {column}), strftime('{fmt}', 'now'))"
+
+
+def _insert_trigger_body() -> str:
+    statements = []
+    for bucket, fmt in _BUCKETS.items():
+        statements.append(
+            f"""
+            INSERT INTO api_usage_rollups ({_COLUMNS})
+            VALUES (
+                '{bucket}', {_period(fmt, 'NEW.created_at')}, COALESCE(NEW.owner_id, ''),
+                NEW.provider, NEW.model, NEW.call_type,
+                1, NEW.status = 'error', NEW.status != 'error' AND NEW.estimated_cost IS NULL,
+                COALESCE(NEW.estimated_cost, 0), COALESCE(NEW.input_tokens, 0),
+                COALESCE(NEW.output_tokens, 0), COALESCE(NEW.cached_tokens, 0),
+                COALESCE(NEW.reasoning_tokens, 0), COALESCE(NEW.image_count, 0),
+                NEW.latency_ms IS NOT NULL, COALESCE(NEW.latency_ms, 0), NEW.latency_ms
+            )
+            ON CONFLICT ({_KEY}) DO UPDATE SET {_MERGE};
+            """
+        )
+        statements.append(
+            f"""
+            INSERT INTO api_usage_latency_rollups (
+                bucket, bucket_start, provider, model, call_type, latency_bucket, count
+            )
+            SELECT '{bucket}', {_period(fmt, 'NEW.created_at')},
+                   NEW.provider, NEW.model, NEW.call_type,
+                   (SELECT COUNT(*) FROM api_usage_latency_bounds
+                    WHERE upper_ms < NEW.latency_ms),
+                   1
+            WHERE NEW.latency_ms IS NOT NULL
+            ON CONFLICT (bucket, bucket_start, provider, model, call_type, latency_bucket)
+            DO UPDATE SET count = count + 1;
+            """
+        )
+    return "".join(statements)
+
+
+def _update_trigger_body() -> str:
+    # Corrections (re-costing, token fixes) apply the difference to the row's
+    # existing buckets; the call itself is already counted.
+    statements = []
+    for bucket, fmt in _BUCKETS.items():
+        statements.append(
+            f"""
+            INSERT INTO api_usage_rollups ({_COLUMNS})
+            VALUES (
+                '{bucket}', {_period(fmt, 'NEW.created_at')}, COALESCE(NEW.owner_id, ''),
+                NEW.provider, NEW.model, NEW.call_type,
+                0,
+                (NEW.status = 'error') - (OLD.status = 'error'),
+                (NEW.status != 'error' AND NEW.estimated_cost IS NULL)
+                    - (OLD.status != 'error' AND OLD.estimated_cost IS NULL),
+                COALESCE(NEW.estimated_cost, 0) - COALESCE(OLD.estimated_cost, 0),
+                COALESCE(NEW.input_tokens, 0) - COALESCE(OLD.input_tokens, 0),
+                COALESCE(NEW.output_tokens, 0) - COALESCE(OLD.output_tokens, 0),
+                COALESCE(NEW.cached_tokens, 0) - COALESCE(OLD.cached_tokens, 0),
+                COALESCE(NEW.reasoning_tokens, 0) - COALESCE(OLD.reasoning_tokens, 0),
+                COALESCE(NEW.image_count, 0) - COALESCE(OLD.image_count, 0),
+                0, 0, NULL
+            )
+            ON CONFLICT ({_KEY}) DO UPDATE SET {_MERGE};
+            """
+        )
+    return "".join(statements)
+
+
+def _backfill(conn: sqlite3.Connection) -> None:
+    for bucket, fmt in _BUCKETS.items():
+        period = _period(fmt, 'created_at')
+        conn.execute(
+            f"""
+            INSERT INTO api_usage_rollups ({_COLUMNS})
+            SELECT '{bucket}', {period} AS period, COALESCE(owner_id, ''),
+                   provider, model, call_type,
+                   COUNT(*), SUM(status = 'error'),
+                   SUM(status != 'error' AND estimated_cost IS NULL),
+                   COALESCE(SUM(estimated_cost), 0), COALESCE(SUM(input_tokens), 0),
+                   COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cached_tokens), 0),
+                   COALESCE(SUM(reasoning_tokens), 0), COALESCE(SUM(image_count), 0),
+                   COUNT(latency_ms), COALESCE(SUM(latency_ms), 0), MAX(latency_ms)
+            FROM api_usage
+            GROUP BY period, COALESCE(owner_id, ''), provider, model, call_type
+            """
+        )
+        conn.execute(
+            f"""
+            INSERT INTO api_usage_latency_rollups (
+                bucket, bucket_start, provider, model, call_type, latency_bucket, count
+            )
+            SELECT '{bucket}', {period} AS period, provider, model, call_type,
+                   (SELECT COUNT(*) FROM api_usage_latency_bounds b
+                    WHERE b.upper_ms < a.latency_ms) AS lb,
+                   COUNT(*)
+            FROM api_usage a
+            WHERE latency_ms IS NOT NULL
+            GROUP BY period, provider, model, call_type, lb
+            """
+        )
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'api_usage_rollups'"
+    ).fetchone()
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS api_usage_rollups (
+            bucket TEXT NOT NULL,
+            bucket_start TEXT NOT NULL,
+            owner_id TEXT NOT NULL DEFAULT '',
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            call_type TEXT NOT NULL,
+            calls INTEGER NOT NULL DEFAULT 0,
+            error_calls INTEGER NOT NULL DEFAULT 0,
+            uncosted_calls INTEGER NOT NULL DEFAULT 0,
+            cost REAL NOT NULL DEFAULT 0,
+            input_tokens INTEGER NOT NULL DEFAULT 0,
+            output_tokens INTEGER NOT NULL DEFAULT 0,
+            cached_tokens INTEGER NOT NULL DEFAULT 0,
+            reasoning_tokens INTEGER NOT NULL DEFAULT 0,
+            image_count INTEGER NOT NULL DEFAULT 0,
+            latency_calls INTEGER NOT NULL DEFAULT 0,
+            latency_sum_ms REAL NOT NULL DEFAULT 0,
+            latency_max_ms REAL,
+            PRIMARY KEY (bucket, bucket_start, owner_id, provider, model, call_type)
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_api_usage_rollups_owner "
+        "ON api_usage_rollups(owner_id, bucket, bucket_start)"
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS api_usage_latency_rollups (
+            bucket TEXT NOT NULL,
+            bucket_start TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            call_type TEXT NOT NULL,
+            latency_bucket INTEGER NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket, bucket_start, provider, model, call_type, latency_bucket)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS api_usage_latency_bounds (
+            idx INTEGER PRIMARY KEY,
+            upper_ms REAL NOT NULL
+        )
+        """
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO api_usage_latency_bounds (idx, upper_ms) VALUES (?, ?)",
+        [(i, 1.25**i) for i in range(64)],
+    )
+
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_api_usage_rollup_insert
+        AFTER INSERT ON api_usage
+        BEGIN {_insert_trigger_body()}
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_api_usage_rollup_update
+        AFTER UPDATE OF estimated_cost, status, input_tokens, output_tokens, cached_tokens,
+                        reasoning_tokens, image_count ON api_usage
+        BEGIN {_update_trigger_body()}
+        END
+        """
+    )
+
+    if not exists:
+        _backfill(conn)
@@ -0,0 +1,106 @@
+"""Move avatar image BLOBs into the content-addressed on-disk store.
+
+`avatar_images` gains `image_hash` / `full_image_hash` (SHA-256 of the bytes;
+also the HTTP ETag) and `avatar_image_variants` records the pre-generated
+size variants. Existing rows are moved out of the DB: each blob is written to
+`<store>/<h[0:2]>/<h[2:4]>/<h>` (the layout of poker/avatar_store.py, frozen
+here), its hash recorded, and the column emptied (`image_data` is NOT NULL, so
+it becomes an empty blob; `full_image_data` becomes NULL).
+
+The store is `$AVATAR_STORE_DIR` or `avatar_store/` next to the DB file. An
+in-memory DB has no store, so its rows keep their bytes inline (hash only).
+Files are written before the row update commits; an interrupted run leaves at
+most unreferenced files, and the rerun picks up where it stopped. Variants are
+not generated here (that needs PIL); they are rendered on first request.
+
+The freed pages go to SQLite's freelist; run VACUUM off-peak to shrink the
+file.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+
+DESCRIPTION = "Move avatar image blobs to the on-disk content-addressed store"
+
+
+def _store_dir(conn: sqlite3.Connection):
+    override = os.environ.get("AVATAR_STORE_DIR")
+    if override:
+        return override
+    for _seq, name, path in conn.execute("PRAGMA database_list"):
+        if name == "main":
+            return os.path.join(os.path.dirname(path), "avatar_store") if path else None
+    return None
+
+
+def _put(root: str, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    directory = os.path.join(root, digest[:2], digest[2:4])
+    target = os.path.join(directory, digest)
+    if not os.path.isfile(target):
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    return digest
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(avatar_images)")}
+    if not cols:
+        return
+    if "image_hash" not in cols:
+        conn.execute("ALTER TABLE avatar_images ADD COLUMN image_hash TEXT")
+    if "full_image_hash" not in cols:
+        conn.execute("ALTER TABLE avatar_images ADD COLUMN full_image_hash TEXT")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS avatar_image_variants (
+            personality_id TEXT NOT NULL,
+            emotion TEXT NOT NULL,
+            variant TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            image_hash TEXT NOT NULL,
+            content_type TEXT DEFAULT 'image/png',
+            file_size INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (personality_id, emotion, variant, size)
+        )
+        """
+    )
+
+    root = _store_dir(conn)
+    ids = [
+        r[0]
+        for r in conn.execute(
+            "SELECT id FROM avatar_images WHERE length(image_data) > 0 "
+            "OR length(full_image_data) > 0"
+        )
+    ]
+    # One row at a time so only a single avatar's bytes are in memory.
+    for row_id in ids:
+        image_data, full_data, image_hash, full_hash = conn.execute(
+            "SELECT image_data, full_image_data, image_hash, full_image_hash "
+            "FROM avatar_images WHERE id = ?",
+            (row_id,),
+        ).fetchone()
+        if image_data:
+            if root:
+                image_hash = _put(root, image_data)
+                image_data = b""
+            else:
+                image_hash = hashlib.sha256(image_data).hexdigest()
+        if full_data:
+            if root:
+                full_hash = _put(root, full_data)
+                full_data = None
+            else:
+                full_hash = hashlib.sha256(full_data).hexdigest()
+        conn.execute(
+            "UPDATE avatar_images SET image_data = ?, full_image_data = ?, "
+            "image_hash = ?, full_image_hash = ? WHERE id = ?",
+            (image_data, full_data, image_hash, full_hash, row_id),
+        )
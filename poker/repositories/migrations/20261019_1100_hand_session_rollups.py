@@ -0,0 +1,38 @@
+"""Per-(game, player) session rollups over hand_history.
+
+`HandHistoryRepository.get_session_stats` (read on every post-hand psychology
+pass and, via `get_session_context_for_prompt`, on prompt building) re-parsed
+the game's whole hand history each call, so its cost grew with session length.
+`hand_session_rollups` holds the running aggregates instead: hands played /
+won, net chips, biggest pots won / lost, the current streak, the last few hand
+summaries, and `last_hand_number` (the newest hand folded in).
+
+Rows are maintained by `save_hand_history`. Games that predate this table are
+rolled up lazily from their hand history on first read or write, so there is
+no backfill here. Additive, idempotent.
+"""
+
+import sqlite3
+
+DESCRIPTION = "Add hand_session_rollups (per game/player session stats)"
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS hand_session_rollups (
+            game_id TEXT NOT NULL,
+            player_name TEXT NOT NULL,
+            hands_played INTEGER NOT NULL DEFAULT 0,
+            hands_won INTEGER NOT NULL DEFAULT 0,
+            total_winnings INTEGER NOT NULL DEFAULT 0,
+            biggest_pot_won INTEGER NOT NULL DEFAULT 0,
+            biggest_pot_lost INTEGER NOT NULL DEFAULT 0,
+            current_streak TEXT NOT NULL DEFAULT 'neutral',
+            streak_count INTEGER NOT NULL DEFAULT 0,
+            recent_hands_json TEXT NOT NULL DEFAULT '[]',
+            last_hand_number INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (game_id, player_name)
+        )
+        """
+    )
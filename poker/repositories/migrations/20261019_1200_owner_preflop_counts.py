@@ -0,0 +1,136 @@
+"""Per-owner preflop action counts for the coach's leak report, trigger-maintained.
+
+The preflop-leak report (`flask_app/services/coach_leaks.py`) joined
+`player_decision_analysis` to `games` and pulled every one of the owner's
+human preflop rows into Python on each recompute, and its cache key was a
+COUNT over the same join. `owner_preflop_action_counts` holds the
+aggregate instead: decisions per (owner_id, canonical hand, position, action)
+for the human seat (player_name IS the game's owner_name), PRE_FLOP rows with
+a canonical hand only. NULL positions / actions are stored as ''. Positions are
+kept as stored; the report groups them with `position_to_group` at read time.
+
+The counts always equal what that join returns, so triggers follow both sides:
+  - decision rows inserted / deleted / corrected add or remove themselves;
+  - a games row inserted, deleted or re-owned (save_game rewrites owner_id /
+    owner_name on every save) adds or removes that game's decisions.
+Rows that reach zero are removed.
+
+Existing rows are back-filled on first creation. Additive, idempotent.
+"""
+
+import sqlite3
+
+DESCRIPTION = "Add owner_preflop_action_counts (coach leak aggregates), trigger-maintained"
+
+_UPSERT = """
+    INSERT INTO owner_preflop_action_counts (owner_id, canon, position, action, n)
+    {select}
+    ON CONFLICT (owner_id, canon, position, action) DO UPDATE SET n = n + excluded.n;
+"""
+
+# One decision row: a single games PK lookup.
+_PDA_ROW = """
+    SELECT g.owner_id, {p}.player_hand_canonical, COALESCE({p}.player_position, ''),
+           COALESCE({p}.action_taken, ''), {sign}
+    FROM games g
+    WHERE g.game_id = {p}.game_id
+      AND g.owner_id IS NOT NULL
+      AND {p}.player_name IS g.owner_name
+      AND {p}.phase = 'PRE_FLOP'
+      AND {p}.player_hand_canonical IS NOT NULL
+"""
+
+# A whole game's human preflop rows (idx on player_decision_analysis.game_id).
+_GAME_ROWS = """
+    SELECT {g}.owner_id, pda.player_hand_canonical, COALESCE(pda.player_position, ''),
+           COALESCE(pda.action_taken, ''), {sign}COUNT(*)
+    FROM player_decision_analysis pda
+    WHERE pda.game_id = {g}.game_id
+      AND {g}.owner_id IS NOT NULL
+      AND pda.player_name IS {g}.owner_name
+      AND pda.phase = 'PRE_FLOP'
+      AND pda.player_hand_canonical IS NOT NULL
+    GROUP BY 1, 2, 3, 4
+"""
+
+_PRUNE = "DELETE FROM owner_preflop_action_counts WHERE owner_id = {owner} AND n <= 0;"
+
+
+def _triggers() -> dict:
+    add_new = _UPSERT.format(select=_PDA_ROW.format(p='NEW', sign='1'))
+    remove_old = _UPSERT.format(select=_PDA_ROW.format(p='OLD', sign='-1'))
+    prune_old_pda = (
+        "DELETE FROM owner_preflop_action_counts WHERE n <= 0 AND owner_id = "
+        "(SELECT owner_id FROM games WHERE game_id = OLD.game_id);"
+    )
+    add_game = _UPSERT.format(select=_GAME_ROWS.format(g='NEW', sign=''))
+    remove_game = _UPSERT.format(select=_GAME_ROWS.format(g='OLD', sign='-'))
+    prune_old_game = _PRUNE.format(owner='OLD.owner_id')
+    return {
+        'trg_owner_preflop_counts_pda_insert': (
+            "AFTER INSERT ON player_decision_analysis",
+            add_new,
+        ),
+        'trg_owner_preflop_counts_pda_delete': (
+            "AFTER DELETE ON player_decision_analysis",
+            remove_old + prune_old_pda,
+        ),
+        'trg_owner_preflop_counts_pda_update': (
+            "AFTER UPDATE OF game_id, player_name, phase, player_hand_canonical, "
+            "player_position, action_taken ON player_decision_analysis",
+            remove_old + add_new + prune_old_pda,
+        ),
+        'trg_owner_preflop_counts_game_insert': (
+            "AFTER INSERT ON games",
+            add_game,
+        ),
+        'trg_owner_preflop_counts_game_delete': (
+            "AFTER DELETE ON games",
+            remove_game + prune_old_game,
+        ),
+        'trg_owner_preflop_counts_game_reown': (
+            "AFTER UPDATE OF owner_id, owner_name ON games "
+            "WHEN OLD.owner_id IS NOT NEW.owner_id OR OLD.owner_name IS NOT NEW.owner_name",
+            remove_game + add_game + prune_old_game,
+        ),
+    }
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'owner_preflop_action_counts'"
+    ).fetchone()
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS owner_preflop_action_counts (
+            owner_id TEXT NOT NULL,
+            canon TEXT NOT NULL,
+            position TEXT NOT NULL DEFAULT '',
+            action TEXT NOT NULL DEFAULT '',
+            n INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (owner_id, canon, position, action)
+        )
+        """
+    )
+    for name, (event, body) in _triggers().items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {body} END")
+
+    if not exists:
+        # CROSS JOIN pins the loop order (decision rows outer, games by PK inner);
+        # left to the planner this can nested-loop games x name-matched rows.
+        conn.execute(
+            """
+            INSERT INTO owner_preflop_action_counts (owner_id, canon, position, action, n)
+            SELECT g.owner_id, pda.player_hand_canonical, COALESCE(pda.player_position, ''),
+                   COALESCE(pda.action_taken, ''), COUNT(*)
+            FROM player_decision_analysis pda
+            CROSS JOIN games g
+            WHERE g.game_id = pda.game_id
+              AND g.owner_id IS NOT NULL
+              AND pda.player_name IS g.owner_name
+              AND pda.phase = 'PRE_FLOP'
+              AND pda.player_hand_canonical IS NOT NULL
+            GROUP BY 1, 2, 3, 4
+            """
+        )
@@ -5,8 +5,9 @@ Manages the personalities and avatar_images tables.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from poker.avatar_store import AvatarStore
 from poker.personality_id import (
     assign_unique_personality_id,
     slugify_personality_name,
@@ -932,6 +933,25 @@ class PersonalityRepository(BaseRepository):
             ).fetchone()
         return row['personality_id'] if row and row['personality_id'] else None
 
+    @property
+    def avatar_store(self) -> Optional[AvatarStore]:
+        """On-disk store the avatar bytes live in (None for an in-memory DB)."""
+        if not hasattr(self, '_avatar_store'):
+            self._avatar_store = AvatarStore.for_db(self.db_path)
+        return self._avatar_store
+
+    def _put_avatar_bytes(self, data: bytes) -> Tuple[str, Optional[bytes]]:
+        """Store ``data`` and return ``(hash, inline_bytes)``.
+
+        ``inline_bytes`` is what goes into the row's BLOB column: None once the
+        bytes are in the on-disk store, the bytes themselves when there is no
+        store (in-memory DB).
+        """
+        store = self.avatar_store
+        if store is None:
+            return AvatarStore.digest(data), data
+        return store.put(data), None
+
     def save_avatar_image(
         self,
         personality_name: str,
@@ -943,12 +963,18 @@ class PersonalityRepository(BaseRepository):
         full_image_data: Optional[bytes] = None,
         full_width: Optional[int] = None,
         full_height: Optional[int] = None,
+        variants: Optional[Dict[Tuple[str, int], bytes]] = None,
     ) -> None:
         """Save an avatar image. `personality_name` is an avatar KEY — a display
         name (cash/regular) or a `personality_id` slug (tournaments) — resolved to
         the canonical `personality_id` (v147). The upsert dedups on
         `(personality_id, emotion)`. A key that matches no persona is skipped (an
-        avatar can't be keyed without a pid)."""
+        avatar can't be keyed without a pid).
+
+        The bytes go to the content-addressed avatar store; the row keeps the
+        hashes. `variants` (``{('icon'|'full', size): png}``, see
+        ``image_processing.process_avatar_variants``) replaces any previously
+        stored size variants."""
         pid = self._resolve_avatar_pid(personality_name)
         if pid is None:
             logger.warning(
@@ -957,112 +983,184 @@ class PersonalityRepository(BaseRepository):
                 personality_name,
             )
             return
+        image_hash, inline = self._put_avatar_bytes(image_data)
+        full_hash = full_inline = None
+        if full_image_data:
+            full_hash, full_inline = self._put_avatar_bytes(full_image_data)
         with self._get_connection() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO avatar_images
                 (personality_id, emotion, image_data, content_type,
                  width, height, file_size,
-                 full_image_data, full_width, full_height, full_file_size, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                 full_image_data, full_width, full_height, full_file_size,
+                 image_hash, full_image_hash, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
             """,
                 (
                     pid,
                     emotion,
-                    image_data,
+                    inline if inline is not None else b'',
                     content_type,
                     width,
                     height,
                     len(image_data),
-                    full_image_data,
+                    full_inline,
                     full_width,
                     full_height,
                     len(full_image_data) if full_image_data else None,
+                    image_hash,
+                    full_hash,
                 ),
             )
-
-    def load_avatar_image(self, personality_name: str, emotion: str) -> Optional[bytes]:
-        """Load avatar image data. `personality_name` is an avatar key (name or
-        pid) resolved to the canonical `personality_id`."""
-        pid = self._resolve_avatar_pid(personality_name)
-        if pid is None:
-            return None
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT image_data FROM avatar_images " "WHERE personality_id = ? AND emotion = ?",
+            conn.execute(
+                "DELETE FROM avatar_image_variants WHERE personality_id = ? AND emotion = ?",
                 (pid, emotion),
             )
+        if variants:
+            self.save_avatar_variants(pid, emotion, variants)
 
-            row = cursor.fetchone()
-            return row[0] if row else None
+    def save_avatar_variants(
+        self, personality_name: str, emotion: str, variants: Dict[Tuple[str, int], bytes]
+    ) -> None:
+        """Store pre-generated size variants (``{('icon'|'full', size): png}``).
 
-    def load_avatar_image_with_metadata(
-        self, personality_name: str, emotion: str
-    ) -> Optional[Dict[str, Any]]:
-        """Load avatar image with metadata from database."""
+        Variant bytes always go to the on-disk store; without one (in-memory
+        DB) variants are not kept and callers serve the original size.
+        """
+        store = self.avatar_store
         pid = self._resolve_avatar_pid(personality_name)
-        if pid is None:
-            return None
+        if pid is None or store is None or not variants:
+            return
+        rows = [
+            (pid, emotion, variant, size, store.put(data), len(data))
+            for (variant, size), data in variants.items()
+        ]
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT image_data, content_type, width, height, file_size "
-                "FROM avatar_images WHERE personality_id = ? AND emotion = ?",
-                (pid, emotion),
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO avatar_image_variants
+                (personality_id, emotion, variant, size, image_hash, content_type, file_size)
+                VALUES (?, ?, ?, ?, ?, 'image/png', ?)
+            """,
+                rows,
             )
 
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            return {
-                'image_data': row['image_data'],
-                'content_type': row['content_type'],
-                'width': row['width'],
-                'height': row['height'],
-                'file_size': row['file_size'],
-            }
+    def get_avatar_file(
+        self,
+        personality_name: str,
+        emotion: str,
+        variant: str = 'icon',
+        size: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Locate an avatar image without reading it through SQLite.
 
-    def load_full_avatar_image(self, personality_name: str, emotion: str) -> Optional[bytes]:
-        """Load full uncropped avatar image from database."""
+        `variant` is 'icon' (circular crop) or 'full'; `size` picks a stored
+        size variant (None = the original). Returns ``{'hash', 'content_type',
+        'path', 'data'}`` where exactly one of `path` (a file in the avatar
+        store, for sendfile) or `data` (inline bytes, in-memory DBs only) is
+        set, or None when there is no such image.
+        """
         pid = self._resolve_avatar_pid(personality_name)
         if pid is None:
             return None
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT full_image_data FROM avatar_images "
-                "WHERE personality_id = ? AND emotion = ?",
-                (pid, emotion),
-            )
+            if size is not None:
+                row = conn.execute(
+                    "SELECT image_hash, content_type, NULL AS data FROM avatar_image_variants "
+                    "WHERE personality_id = ? AND emotion = ? AND variant = ? AND size = ?",
+                    (pid, emotion, variant, size),
+                ).fetchone()
+            elif variant == 'full':
+                # The inline column is only selected when non-empty, so a
+                # store-backed row never drags its (emptied) blob through here.
+                row = conn.execute(
+                    "SELECT full_image_hash AS image_hash, content_type, "
+                    "CASE WHEN length(full_image_data) > 0 THEN full_image_data END AS data "
+                    "FROM avatar_images WHERE personality_id = ? AND emotion = ?",
+                    (pid, emotion),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT image_hash, content_type, "
+                    "CASE WHEN length(image_data) > 0 THEN image_data END AS data "
+                    "FROM avatar_images WHERE personality_id = ? AND emotion = ?",
+                    (pid, emotion),
+                ).fetchone()
+        if not row:
+            return None
+        image_hash, data = row['image_hash'], row['data']
+        result = {
+            'hash': image_hash,
+            'content_type': row['content_type'] or 'image/png',
+            'path': None,
+            'data': None,
+        }
+        if data:
+            result['hash'] = image_hash or AvatarStore.digest(data)
+            result['data'] = bytes(data)
+            return result
+        store = self.avatar_store
+        if not image_hash or store is None or not store.exists(image_hash):
+            return None
+        result['path'] = str(store.path(image_hash))
+        return result
+
+    def _read_avatar_bytes(
+        self, personality_name: str, emotion: str, variant: str
+    ) -> Optional[bytes]:
+        avatar = self.get_avatar_file(personality_name, emotion, variant)
+        if avatar is None:
+            return None
+        if avatar['data'] is not None:
+            return avatar['data']
+        return self.avatar_store.read(avatar['hash'])
 
-            row = cursor.fetchone()
-            return row[0] if row and row[0] else None
+    def load_avatar_image(self, personality_name: str, emotion: str) -> Optional[bytes]:
+        """Load avatar image data. `personality_name` is an avatar key (name or
+        pid) resolved to the canonical `personality_id`."""
+        return self._read_avatar_bytes(personality_name, emotion, 'icon')
 
-    def load_full_avatar_image_with_metadata(
-        self, personality_name: str, emotion: str
+    def _load_avatar_metadata(
+        self, personality_name: str, emotion: str, variant: str
     ) -> Optional[Dict[str, Any]]:
-        """Load full avatar image with metadata from database."""
-        pid = self._resolve_avatar_pid(personality_name)
-        if pid is None:
+        image_data = self._read_avatar_bytes(personality_name, emotion, variant)
+        if not image_data:
             return None
+        pid = self._resolve_avatar_pid(personality_name)
+        prefix = 'full_' if variant == 'full' else ''
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT full_image_data, content_type, full_width, full_height, "
-                "full_file_size FROM avatar_images "
-                "WHERE personality_id = ? AND emotion = ?",
+            row = conn.execute(
+                f"SELECT content_type, {prefix}width AS width, {prefix}height AS height, "
+                f"{prefix}file_size AS file_size "
+                "FROM avatar_images WHERE personality_id = ? AND emotion = ?",
                 (pid, emotion),
-            )
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'image_data': image_data,
+            'content_type': row['content_type'],
+            'width': row['width'],
+            'height': row['height'],
+            'file_size': row['file_size'],
+        }
 
-            row = cursor.fetchone()
-            if not row or not row['full_image_data']:
-                return None
+    def load_avatar_image_with_metadata(
+        self, personality_name: str, emotion: str
+    ) -> Optional[Dict[str, Any]]:
+        """Load avatar image with metadata."""
+        return self._load_avatar_metadata(personality_name, emotion, 'icon')
 
-            return {
-                'image_data': row['full_image_data'],
-                'content_type': row['content_type'],
-                'width': row['full_width'],
-                'height': row['full_height'],
-                'file_size': row['full_file_size'],
-            }
+    def load_full_avatar_image(self, personality_name: str, emotion: str) -> Optional[bytes]:
+        """Load full uncropped avatar image."""
+        return self._read_avatar_bytes(personality_name, emotion, 'full')
+
+    def load_full_avatar_image_with_metadata(
+        self, personality_name: str, emotion: str
+    ) -> Optional[Dict[str, Any]]:
+        """Load full avatar image with metadata."""
+        return self._load_avatar_metadata(personality_name, emotion, 'full')
 
     def has_full_avatar_image(self, personality_name: str, emotion: str) -> bool:
         """Check if a full avatar image exists for the given personality and emotion."""
@@ -1071,8 +1169,8 @@ class PersonalityRepository(BaseRepository):
             return False
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT 1 FROM avatar_images "
-                "WHERE personality_id = ? AND emotion = ? AND full_image_data IS NOT NULL",
+                "SELECT 1 FROM avatar_images WHERE personality_id = ? AND emotion = ? "
+                "AND (full_image_hash IS NOT NULL OR full_image_data IS NOT NULL)",
                 (pid, emotion),
             )
             return cursor.fetchone() is not None
@@ -1117,6 +1215,7 @@ class PersonalityRepository(BaseRepository):
         if pid is None:
             return 0
         with self._get_connection() as conn:
+            conn.execute("DELETE FROM avatar_image_variants WHERE personality_id = ?", (pid,))
             cursor = conn.execute(
                 "DELETE FROM avatar_images WHERE personality_id = ?",
                 (pid,),
@@ -1232,6 +1331,8 @@ class PersonalityRepository(BaseRepository):
                 personality_name,
             )
             return
+        image_hash, inline = self._put_avatar_bytes(image_data)
+        inline = inline if inline is not None else b''
         with self._get_connection() as conn:
             cursor = conn.execute(
                 "SELECT id FROM avatar_images WHERE personality_id = ? AND emotion = ?",
@@ -1243,17 +1344,24 @@ class PersonalityRepository(BaseRepository):
                 conn.execute(
                     """
                     UPDATE avatar_images
-                    SET image_data = ?, content_type = 'image/png',
-                        updated_at = CURRENT_TIMESTAMP
+                    SET image_data = ?, image_hash = ?, file_size = ?,
+                        content_type = 'image/png', updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
                 """,
-                    (image_data, existing['id']),
+                    (inline, image_hash, len(image_data), existing['id']),
                 )
             else:
                 conn.execute(
                     """
-                    INSERT INTO avatar_images (personality_id, emotion, image_data, content_type)
-                    VALUES (?, ?, ?, 'image/png')
+                    INSERT INTO avatar_images
+                    (personality_id, emotion, image_data, image_hash, file_size, content_type)
+                    VALUES (?, ?, ?, ?, ?, 'image/png')
                 """,
-                    (pid, emotion, image_data),
+                    (pid, emotion, inline, image_hash, len(image_data)),
                 )
+            # The icon changed; its size variants are re-rendered on demand.
+            conn.execute(
+                "DELETE FROM avatar_image_variants WHERE personality_id = ? AND emotion = ? "
+                "AND variant = 'icon'",
+                (pid, emotion),
+            )
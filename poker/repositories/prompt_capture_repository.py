@@ -7,16 +7,126 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from core.llm.prompt_blobs import collect_orphan_blobs, externalize_capture, hydrate_capture
 from poker.repositories.base_repository import BaseRepository
 from poker.repositories.repository_utils import build_where_clause, parse_json_fields
 
 logger = logging.getLogger(__name__)
 
+# Distinct-value filter facets (players, emotions) are re-read at most this often.
+FACET_TTL_SECONDS = 60.0
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def encode_capture_cursor(created_at: str, capture_id: int) -> str:
+    """Opaque keyset cursor pointing just past ``(created_at, id)``."""
+    return f"{created_at}|{capture_id}"
+
+
+def decode_capture_cursor(cursor: str) -> Tuple[str, int]:
+    """Inverse of ``encode_capture_cursor``. Raises ValueError when malformed."""
+    created_at, sep, capture_id = cursor.rpartition('|')
+    if not sep or not created_at:
+        raise ValueError(f"Invalid capture cursor: {cursor!r}")
+    return created_at, int(capture_id)
+
+
+def _fts_phrase(text: str) -> Optional[str]:
+    """Quote free text as one FTS5 phrase (None if it has no word tokens)."""
+    tokens = _FTS_TOKEN_RE.findall(text)
+    return '"' + ' '.join(tokens) + '"' if tokens else None
+
+
+def _fts_search_query(text: str) -> Optional[str]:
+    """Every word must match; the last one as a prefix so typing narrows live."""
+    tokens = _FTS_TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return ' '.join(f'"{t}"' for t in tokens) + '*'
+
 
 class PromptCaptureRepository(BaseRepository):
-    """Handles prompt capture storage, retrieval, and statistics."""
+    """Handles prompt capture storage, retrieval, and statistics.
+
+    Listings page by keyset cursor (``cursor=`` / ``next_cursor``) as well as
+    offset; text search and tag filters use the ``prompt_captures_fts`` index
+    when the SQLite build has FTS5, and LIKE scans otherwise.
+    """
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self._fts_ready: Optional[bool] = None
+        self._facets: Dict[str, Tuple[float, List[str]]] = {}
+
+    def _has_fts(self, conn) -> bool:
+        if self._fts_ready is None:
+            self._fts_ready = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'prompt_captures_fts'"
+                ).fetchone()
+                is not None
+            )
+        return self._fts_ready
+
+    def _cached_facet(self, name: str, load: Callable[[], List[str]]) -> List[str]:
+        cached = self._facets.get(name)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < FACET_TTL_SECONDS:
+            return cached[1]
+        values = load()
+        self._facets[name] = (now, values)
+        return values
+
+    def _text_conditions(
+        self,
+        conn,
+        search: Optional[str],
+        tags: Optional[List[str]],
+        conditions: List[str],
+        params: List[Any],
+    ) -> None:
+        """Append full-text search and tag conditions (FTS5-backed when available)."""
+        use_fts = self._has_fts(conn)
+        if search:
+            query = _fts_search_query(search) if use_fts else None
+            if query:
+                conditions.append(
+                    "pc.id IN (SELECT rowid FROM prompt_captures_fts "
+                    "WHERE prompt_captures_fts MATCH ?)"
+                )
+                params.append(query)
+            elif not use_fts:
+                conditions.append("(pc.user_message LIKE ? OR pc.ai_response LIKE ?)")
+                params.extend([f'%{search}%', f'%{search}%'])
+        if tags:
+            phrases = [p for p in (_fts_phrase(tag) for tag in tags) if p]
+            if use_fts and phrases:
+                # The index narrows to candidate rows; the LIKEs below keep the
+                # exact whole-tag semantics (FTS matches tokens, not JSON items).
+                conditions.append(
+                    "pc.id IN (SELECT rowid FROM prompt_captures_fts "
+                    "WHERE prompt_captures_fts MATCH ?)"
+                )
+                params.append(f"tags : ({' OR '.join(phrases)})")
+            # Match any of the provided tags
+            tag_conditions = []
+            for tag in tags:
+                tag_conditions.append("pc.tags LIKE ?")
+                params.append(f'%"{tag}"%')
+            conditions.append(f"({' OR '.join(tag_conditions)})")
+
+    @staticmethod
+    def _cursor_condition(cursor: str, conditions: List[str], params: List[Any]) -> None:
+        created_at, capture_id = decode_capture_cursor(cursor)
+        # Row-value comparison so SQLite seeks idx_prompt_captures_created_id
+        # straight to the cursor instead of scanning the pages before it.
+        conditions.append("(pc.created_at, pc.id) < (?, ?)")
+        params.extend([created_at, capture_id])
 
     def save_prompt_capture(self, capture: Dict[str, Any]) -> int:
         """Save a prompt capture for debugging AI decisions.
@@ -30,10 +140,16 @@ class PromptCaptureRepository(BaseRepository):
                 - action_taken, raise_amount
                 - model, latency_ms, input_tokens, output_tokens
 
+        The system prompt and conversation history are stored in the
+        deduplicated blob store (``core.llm.prompt_blobs``).
+
         Returns:
             The ID of the inserted capture.
         """
         with self._get_connection() as conn:
+            system_prompt, system_prompt_hash, history, history_hashes = externalize_capture(
+                conn, capture.get('system_prompt'), capture.get('conversation_history')
+            )
             cursor = conn.execute(
                 """
                 INSERT INTO prompt_captures (
@@ -47,6 +163,7 @@ class PromptCaptureRepository(BaseRepository):
                     action_taken, raise_amount,
                     -- Prompts (INPUT)
                     system_prompt, conversation_history, user_message, raw_request,
+                    system_prompt_hash, conversation_history_hashes,
                     -- Response (OUTPUT)
                     ai_response, raw_api_response,
                     -- LLM Config
@@ -61,7 +178,7 @@ class PromptCaptureRepository(BaseRepository):
                     tags, notes,
                     -- Prompt Config (for analysis)
                     prompt_config_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
                 (
                     # Identity
@@ -87,12 +204,12 @@ class PromptCaptureRepository(BaseRepository):
                     capture.get('action_taken'),
                     capture.get('raise_amount'),
                     # Prompts (INPUT)
-                    capture.get('system_prompt'),
-                    json.dumps(capture.get('conversation_history'))
-                    if capture.get('conversation_history')
-                    else None,
+                    system_prompt,
+                    history,
                     capture.get('user_message'),
                     capture.get('raw_request'),
+                    system_prompt_hash,
+                    history_hashes,
                     # Response (OUTPUT)
                     capture.get('ai_response'),
                     capture.get('raw_api_response'),
@@ -119,7 +236,10 @@ class PromptCaptureRepository(BaseRepository):
                     else None,
                 ),
             )
-            return cursor.lastrowid
+        players = self._facets.get('players')
+        if players is not None and capture.get('player_name') not in players[1]:
+            self._facets.pop('players', None)
+        return cursor.lastrowid
 
     def get_prompt_capture(self, capture_id: int) -> Optional[Dict[str, Any]]:
         """Get a single prompt capture by ID.
@@ -144,7 +264,7 @@ class PromptCaptureRepository(BaseRepository):
             if not row:
                 return None
 
-            capture = dict(row)
+            capture = hydrate_capture(conn, dict(row))
             # Parse JSON fields
             parse_json_fields(
                 capture,
@@ -184,8 +304,11 @@ class PromptCaptureRepository(BaseRepository):
         min_tilt_level: Optional[float] = None,
         max_tilt_level: Optional[float] = None,
         has_decision_analysis: Optional[bool] = None,
+        search: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
         """List prompt captures with optional filtering.
 
@@ -196,16 +319,21 @@ class PromptCaptureRepository(BaseRepository):
             display_emotion: Filter by display emotion (e.g., 'confident', 'tilted')
             min_tilt_level: Filter by minimum tilt level
             max_tilt_level: Filter by maximum tilt level
+            search: Full-text search over prompt, response and tags
+            cursor: Keyset cursor from a previous page's ``next_cursor``;
+                replaces ``offset`` so deep pages cost the same as the first
+            include_total: Skip the COUNT when False (``total`` is None)
 
         Returns:
-            Dict with 'captures' list and 'total' count.
+            Dict with 'captures' list, 'total' count and 'next_cursor'
+            (None on the last page).
         """
         conditions = []
         params = []
 
         # Determine if we need the decision-analysis join. Used by both
         # psychology filters and `has_decision_analysis`.
-        any(
+        needs_decision_join = any(
             [
                 display_emotion,
                 min_tilt_level is not None,
@@ -246,13 +374,6 @@ class PromptCaptureRepository(BaseRepository):
             conditions.append("pc.parent_id IS NOT NULL")
         elif is_correction is False:
             conditions.append("pc.parent_id IS NULL")
-        if tags:
-            # Match any of the provided tags
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append("pc.tags LIKE ?")
-                params.append(f'%"{tag}"%')
-            conditions.append(f"({' OR '.join(tag_conditions)})")
 
         # Psychology filters (require join)
         if display_emotion:
@@ -273,19 +394,18 @@ class PromptCaptureRepository(BaseRepository):
         elif has_decision_analysis is False:
             conditions.append("pda.id IS NULL")
 
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        # Always JOIN player_decision_analysis so the list projection can
-        # COALESCE game-state columns: commentary captures don't carry
-        # pot/hand/stack/etc., that data lives on the linked analysis row.
-        # Cheap because pda.capture_id is indexed.
-        join_clause = "LEFT JOIN player_decision_analysis pda ON pda.capture_id = pc.id"
-
         # SELECT projection for the captures spine. (The Decision Analyzer
         # used to UNION in capture-less decision_analysis rows here under
         # synthetic negative ids; it now spines on player_decision_analysis
         # directly via DecisionAnalysisRepository.list_decisions, so this
         # method is purely a prompt_captures lister again.)
-        captures_select = f"""
+        #
+        # Always JOIN player_decision_analysis so the list projection can
+        # COALESCE game-state columns: commentary captures don't carry
+        # pot/hand/stack/etc., that data lives on the linked analysis row.
+        # Cheap because pda.capture_id is indexed.
+        join_clause = "LEFT JOIN player_decision_analysis pda ON pda.capture_id = pc.id"
+        captures_select = """
             SELECT pc.id, pc.created_at, pc.game_id, pc.player_name, pc.hand_number,
                    CASE WHEN pc.call_type = 'commentary'
                         THEN COALESCE(pda.phase, pc.phase)
@@ -308,34 +428,56 @@ class PromptCaptureRepository(BaseRepository):
                    pc.model, pc.provider, pc.latency_ms, pc.tags, pc.notes,
                    pc.error_type, pc.error_description, pc.parent_id, pc.correction_attempt
             FROM prompt_captures pc
-            {join_clause}
-            {where_clause}
-            GROUP BY pc.id
         """
 
-        unified = captures_select
-        unified_params = list(params)
-
         with self._get_connection() as conn:
-            count_cursor = conn.execute(
-                f"SELECT COUNT(*) FROM ({unified})",
-                unified_params,
-            )
-            total = count_cursor.fetchone()[0]
-
+            self._text_conditions(conn, search, tags, conditions, params)
+            count_where = build_where_clause(conditions)
+            # The page is picked on prompt_captures alone (walking the
+            # created_at index) and only its rows are joined and projected,
+            # so page cost no longer grows with table size. The analysis
+            # join is only pulled into the page scan when a filter needs it.
+            page_join = join_clause if needs_decision_join else ""
+
+            total = None
+            if include_total:
+                total = conn.execute(
+                    f"SELECT COUNT(DISTINCT pc.id) FROM prompt_captures pc "
+                    f"{page_join} {count_where}",
+                    params,
+                ).fetchone()[0]
+
+            page_params = list(params)
+            if cursor:
+                self._cursor_condition(cursor, conditions, page_params)
+            page_where = build_where_clause(conditions)
             # created_at is whole-second precision, so many decisions in one hand
             # share a timestamp. Tie-break on the row id so same-second rows
             # order deterministically newest-first instead of being shuffled
             # arbitrarily by SQLite.
+            page_query = f"""
+                SELECT {'DISTINCT ' if needs_decision_join else ''}pc.id, pc.created_at
+                FROM prompt_captures pc
+                {page_join}
+                {page_where}
+                ORDER BY pc.created_at DESC, pc.id DESC
+                LIMIT ?{'' if cursor else ' OFFSET ?'}
+            """
+            page_params.append(limit)
+            if not cursor:
+                page_params.append(offset)
+
             query = f"""
-                SELECT * FROM ({unified})
-                ORDER BY created_at DESC, id DESC
-                LIMIT ? OFFSET ?
+                {captures_select}
+                {join_clause}
+                WHERE pc.id IN (SELECT id FROM ({page_query}))
+                GROUP BY pc.id
+                ORDER BY pc.created_at DESC, pc.id DESC
             """
-            cursor = conn.execute(query, unified_params + [limit, offset])
+            rows = conn.execute(query, page_params).fetchall()
 
             captures = []
-            for row in cursor.fetchall():
+            for row in rows:
                 capture = dict(row)
                 parse_json_fields(
                     capture,
@@ -344,33 +486,58 @@ class PromptCaptureRepository(BaseRepository):
                 )
                 captures.append(capture)
 
-            return {'captures': captures, 'total': total}
+            return {
+                'captures': captures,
+                'total': total,
+                'next_cursor': self._next_cursor(captures, limit),
+            }
+
+    @staticmethod
+    def _next_cursor(captures: List[Dict[str, Any]], limit: int) -> Optional[str]:
+        if not captures or len(captures) < limit:
+            return None
+        last = captures[-1]
+        return encode_capture_cursor(last['created_at'], last['id'])
 
     def get_distinct_emotions(self) -> List[str]:
-        """Get distinct display_emotion values from player_decision_analysis."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT DISTINCT display_emotion FROM player_decision_analysis "
-                "WHERE display_emotion IS NOT NULL ORDER BY display_emotion"
-            )
-            return [row[0] for row in cursor.fetchall()]
+        """Get distinct display_emotion values from player_decision_analysis.
+
+        Cached for ``FACET_TTL_SECONDS``.
+        """
+
+        def load() -> List[str]:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT DISTINCT display_emotion FROM player_decision_analysis "
+                    "WHERE display_emotion IS NOT NULL ORDER BY display_emotion"
+                )
+                return [row[0] for row in cursor.fetchall()]
+
+        return self._cached_facet('emotions', load)
 
     def get_distinct_players(self) -> List[str]:
         """Get distinct player_name values across captures and analyses.
 
         Unions both sources so the filter covers LLM-bot captures and the
         analysis-only rows (solver / TieredBot / human decisions that skipped
-        the LLM and have no prompt capture).
+        the LLM and have no prompt capture). Cached for ``FACET_TTL_SECONDS``;
+        a capture saved through this repository for an unseen player drops
+        the cache immediately.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT DISTINCT player_name FROM ("
-                "  SELECT player_name FROM prompt_captures WHERE player_name IS NOT NULL"
-                "  UNION"
-                "  SELECT player_name FROM player_decision_analysis WHERE player_name IS NOT NULL"
-                ") ORDER BY player_name"
-            )
-            return [row[0] for row in cursor.fetchall()]
+
+        def load() -> List[str]:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT DISTINCT player_name FROM ("
+                    "  SELECT player_name FROM prompt_captures WHERE player_name IS NOT NULL"
+                    "  UNION"
+                    "  SELECT player_name FROM player_decision_analysis"
+                    "  WHERE player_name IS NOT NULL"
+                    ") ORDER BY player_name"
+                )
+                return [row[0] for row in cursor.fetchall()]
+
+        return self._cached_facet('players', load)
 
     def get_prompt_capture_stats(
         self, game_id: Optional[str] = None, call_type: Optional[str] = None
@@ -477,6 +644,7 @@ class PromptCaptureRepository(BaseRepository):
 
         with self._get_connection() as conn:
             cursor = conn.execute(f"DELETE FROM prompt_captures {where_clause}", params)
+            collect_orphan_blobs(conn)
             return cursor.rowcount
 
     # ========== Playground Capture Methods ==========
@@ -489,6 +657,9 @@ class PromptCaptureRepository(BaseRepository):
         offset: int = 0,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
         """List captures for the playground (filtered by call_type).
 
@@ -499,57 +670,65 @@ class PromptCaptureRepository(BaseRepository):
             call_type: Filter by call type (e.g., 'commentary', 'personality_generation')
             provider: Filter by LLM provider
             limit: Max results to return
-            offset: Pagination offset
+            offset: Pagination offset (ignored when ``cursor`` is given)
             date_from: Filter by start date (ISO format)
             date_to: Filter by end date (ISO format)
+            search: Full-text search over prompt, response and tags
+            cursor: Keyset cursor from a previous page's ``next_cursor``
+            include_total: Skip the COUNT when False (``total`` is None)
 
         Returns:
-            Dict with 'captures' list and 'total' count
+            Dict with 'captures' list, 'total' count and 'next_cursor'
         """
         conditions = []  # Show all captures (including legacy ones without call_type)
         params = []
 
         if call_type:
-            conditions.append("call_type = ?")
+            conditions.append("pc.call_type = ?")
             params.append(call_type)
         if provider:
-            conditions.append("provider = ?")
+            conditions.append("pc.provider = ?")
             params.append(provider)
         if date_from:
-            conditions.append("created_at >= ?")
+            conditions.append("pc.created_at >= ?")
             params.append(date_from)
         if date_to:
-            conditions.append("created_at <= ?")
+            conditions.append("pc.created_at <= ?")
             params.append(date_to)
 
-        where_clause = build_where_clause(conditions)
-
         with self._get_connection() as conn:
-            # Get total count
-            count_cursor = conn.execute(
-                f"SELECT COUNT(*) FROM prompt_captures {where_clause}", params
-            )
-            total = count_cursor.fetchone()[0]
+            self._text_conditions(conn, search, None, conditions, params)
 
+            total = None
+            if include_total:
+                total = conn.execute(
+                    f"SELECT COUNT(*) FROM prompt_captures pc {build_where_clause(conditions)}",
+                    params,
+                ).fetchone()[0]
+
+            if cursor:
+                self._cursor_condition(cursor, conditions, params)
             # Get captures with pagination
             query = f"""
-                SELECT id, created_at, game_id, player_name, hand_number,
-                       phase, call_type, action_taken,
-                       model, provider, reasoning_effort,
-                       latency_ms, input_tokens, output_tokens,
-                       tags, notes,
-                       is_image_capture, image_size, image_width, image_height,
-                       target_personality, target_emotion
-                FROM prompt_captures
-                {where_clause}
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
+                SELECT pc.id, pc.created_at, pc.game_id, pc.player_name, pc.hand_number,
+                       pc.phase, pc.call_type, pc.action_taken,
+                       pc.model, pc.provider, pc.reasoning_effort,
+                       pc.latency_ms, pc.input_tokens, pc.output_tokens,
+                       pc.tags, pc.notes,
+                       pc.is_image_capture, pc.image_size, pc.image_width, pc.image_height,
+                       pc.target_personality, pc.target_emotion
+                FROM prompt_captures pc
+                {build_where_clause(conditions)}
+                ORDER BY pc.created_at DESC, pc.id DESC
+                LIMIT ?{'' if cursor else ' OFFSET ?'}
             """
-            params.extend([limit, offset])
-            cursor = conn.execute(query, params)
+            params.append(limit)
+            if not cursor:
+                params.append(offset)
+            rows = conn.execute(query, params).fetchall()
 
             captures = []
-            for row in cursor.fetchall():
+            for row in rows:
                 capture = dict(row)
                 # Parse JSON fields
                 for field in ['tags']:
@@ -564,7 +743,11 @@ class PromptCaptureRepository(BaseRepository):
                             )
                 captures.append(capture)
 
-            return {'captures': captures, 'total': total}
+            return {
+                'captures': captures,
+                'total': total,
+                'next_cursor': self._next_cursor(captures, limit),
+            }
 
     def get_playground_capture_stats(self) -> Dict[str, Any]:
         """Get aggregate statistics for all prompt captures."""
@@ -606,6 +789,8 @@ class PromptCaptureRepository(BaseRepository):
             retention_days: Delete captures older than this many days.
                            If 0, no deletion occurs (unlimited retention).
 
+        Also garbage-collects prompt blobs no remaining capture references.
+
         Returns:
             Number of captures deleted.
         """
@@ -623,8 +808,10 @@ class PromptCaptureRepository(BaseRepository):
             )
 
             deleted = cursor.rowcount
+            blobs = collect_orphan_blobs(conn)
             if deleted > 0:
                 logger.info(
-                    f"Cleaned up {deleted} playground captures older than {retention_days} days"
+                    f"Cleaned up {deleted} playground captures older than {retention_days} days "
+                    f"({blobs} orphaned prompt blobs)"
                 )
             return deleted
@@ -33,6 +33,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Optional
 
+from cash_mode.world_snapshot import MISS, bound_snapshot, in_transaction
 from poker.memory.opponent_model import (
     REGARD_NEUTRAL,
     CashPairStats,
@@ -139,6 +140,11 @@ class RelationshipRepository(BaseRepository):
                     state.last_decay_tick.isoformat() if state.last_decay_tick else None,
                 ),
             )
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            snapshot.note_relationship(
+                observer_id, opponent_id, state, committed=not in_transaction(self)
+            )
 
     def load_relationship_state(
         self,
@@ -160,6 +166,18 @@ class RelationshipRepository(BaseRepository):
         """
         if now is None:
             now = datetime.utcnow()
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            # Lobby tick: load the observer's whole outbound row set once,
+            # then serve every pair from memory.
+            cached = snapshot.relationship(observer_id, opponent_id, now)
+            if cached is MISS and not in_transaction(self):
+                snapshot.store_relationships(
+                    observer_id, self.load_raw_relationships_for(observer_id)
+                )
+                cached = snapshot.relationship(observer_id, opponent_id, now)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             row = conn.execute(
                 """
@@ -195,6 +213,25 @@ class RelationshipRepository(BaseRepository):
             ).fetchone()
             return _state_from_row(row, project_to=None) if row else None
 
+    def load_raw_relationships_for(self, observer_id: str) -> Dict[str, RelationshipState]:
+        """Every (observer, *) row WITHOUT projection, `{opponent_id: state}`.
+
+        The bulk load behind the lobby world snapshot, which projects heat
+        per read (`load_relationship_state` semantics) from these stored
+        values.
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT opponent_id, heat, respect, likability,
+                       last_seen, last_decay_tick
+                FROM relationship_states
+                WHERE observer_id = ?
+                """,
+                (observer_id,),
+            ).fetchall()
+            return {row['opponent_id']: _state_from_row(row) for row in rows}
+
     def load_all_relationships(
         self,
         observer_id: str,
@@ -575,6 +612,11 @@ class RelationshipRepository(BaseRepository):
                 """,
                 (sandbox_id, ai_id, table_id, int(net_delta), now),
             )
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            snapshot.note_table_hand(
+                ai_id, table_id, net_delta, sandbox_id, committed=not in_transaction(self)
+            )
 
     def load_ai_table_net(
         self,
@@ -588,6 +630,14 @@ class RelationshipRepository(BaseRepository):
         path uses it to bias an AI toward rooms it wins at and away from rooms
         it loses at. Empty dict when the AI has no recorded hands.
         """
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            cached = snapshot.ai_table_net(ai_id, sandbox_id)
+            if cached is MISS and not in_transaction(self):
+                snapshot.store_table_net(self.load_ai_table_net_for_sandbox(sandbox_id=sandbox_id))
+                cached = snapshot.ai_table_net(ai_id, sandbox_id)
+            if cached is not MISS:
+                return cached
         with self._get_connection() as conn:
             rows = conn.execute(
                 """
@@ -599,6 +649,23 @@ class RelationshipRepository(BaseRepository):
             ).fetchall()
         return {row["table_id"]: int(row["net_chips"]) for row in rows}
 
+    def load_ai_table_net_for_sandbox(self, *, sandbox_id: str) -> Dict[str, Dict[str, int]]:
+        """`load_ai_table_net` for every AI in the sandbox in one query:
+        `{ai_id: {table_id: net_chips}}`."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT ai_id, table_id, net_chips
+                FROM ai_table_hand_counts
+                WHERE sandbox_id = ?
+                """,
+                (sandbox_id,),
+            ).fetchall()
+        out: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            out.setdefault(row["ai_id"], {})[row["table_id"]] = int(row["net_chips"])
+        return out
+
     def load_ai_table_hands(
         self,
         ai_id: str,
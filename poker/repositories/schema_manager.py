@@ -399,6 +399,10 @@ class SchemaManager:
           * existing PRE-baseline DB (e.g. a restored old backup) → the archived
             legacy v1..v157 chain brings it up to the baseline.
         Per-file migrations (applied-set) then run in every case.
+
+        A DB already at the baseline with every migration file recorded (the
+        normal restart / worker-recycle case) returns straight after the
+        version check: no baseline replay, no migration module imports.
         """
         # Test-only fast path: seed a fresh DB from a cached, fully-built template
         # instead of building from scratch. Inert in prod.
@@ -406,6 +410,10 @@ class SchemaManager:
         started_empty = (not seeded) and self._db_is_empty()
         self._enable_wal_mode()
         current = self._get_current_schema_version()
+        if not (started_empty or seeded) and current >= SCHEMA_VERSION:
+            if self._schema_is_current():
+                logger.debug("Schema at v%s with no pending migrations; skipping", current)
+                return
         if started_empty or seeded or current >= SCHEMA_VERSION:
             # Empty/fresh, seeded template, or already at/above baseline: the head
             # schema is canonical. _init_db lays it (CREATE ... IF NOT EXISTS no-ops on
@@ -425,6 +433,23 @@ class SchemaManager:
         if started_empty:
             self._maybe_save_as_template()
 
+    def _schema_is_current(self) -> bool:
+        """True when every per-file migration is already recorded as applied."""
+        from poker.repositories.migration_loader import FileMigrationLoader
+
+        loader = FileMigrationLoader(self._migrations_dir())
+        conn = self._get_connection()
+        try:
+            return not loader.pending_ids(conn)
+        except sqlite3.Error:
+            return False
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _migrations_dir() -> str:
+        return os.path.join(os.path.dirname(__file__), "migrations")
+
     def _fast_test_mode(self) -> bool:
         return os.environ.get(_TEST_SCHEMA_TEMPLATE_ENV) == "1"
 
@@ -508,8 +533,7 @@ class SchemaManager:
         """
         from poker.repositories.migration_loader import FileMigrationLoader
 
-        migrations_dir = os.path.join(os.path.dirname(__file__), "migrations")
-        FileMigrationLoader(migrations_dir).run(self._get_connection)
+        FileMigrationLoader(self._migrations_dir()).run(self._get_connection)
 
     def _init_db(self, stamp: bool = True, seed: bool = True):
         """Build the head schema directly from the generated baseline.
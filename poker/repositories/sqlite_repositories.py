@@ -3,6 +3,7 @@ SQLite implementation of pressure event repository.
 """
 
 import json
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional
 
 from poker.repositories.base_repository import BaseRepository
@@ -36,6 +37,37 @@ class PressureEventRepository(BaseRepository):
                 ),
             )
 
+    def save_events(self, events: List[Dict[str, Any]], *, conn=None) -> int:
+        """Save many pressure events with one executemany.
+
+        Each item carries `save_event`'s arguments by name. With `conn`, the
+        insert joins the caller's open transaction (the caller commits).
+        Returns the number of rows written.
+        """
+        if not events:
+            return 0
+        rows = [
+            (
+                e['game_id'],
+                e['player_name'],
+                e['event_type'],
+                json.dumps(e['details']) if e.get('details') else None,
+                e.get('hand_number'),
+            )
+            for e in events
+        ]
+        ctx = nullcontext(conn) if conn is not None else self._get_connection()
+        with ctx as c:
+            c.executemany(
+                """
+                INSERT INTO pressure_events
+                (game_id, player_name, event_type, details_json, hand_number)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        return len(rows)
+
     def get_events_for_game(self, game_id: str) -> List[Dict[str, Any]]:
         """Get all pressure events for a specific game."""
         events = []
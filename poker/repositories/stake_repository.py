@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from cash_mode.staker_history import StakerHistoryStats
 from cash_mode.stakes import (
@@ -31,6 +31,7 @@ from cash_mode.stakes import (
     STAKE_STATUS_SETTLED,
     Stake,
 )
+from cash_mode.world_snapshot import bound_snapshot, in_transaction
 from poker.repositories.base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -113,6 +114,9 @@ class StakeRepository(BaseRepository):
                     stake.sandbox_id,
                 ),
             )
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            snapshot.note_stakes_changed()
 
     def update_payouts(
         self,
@@ -223,6 +227,16 @@ class StakeRepository(BaseRepository):
         `sandbox_id` keeps the original global lookup — correct for
         human borrowers, who belong to a single (their own) sandbox.
         """
+        snapshot = bound_snapshot(self)
+        if snapshot is not None:
+            # Lobby tick: "no active stake" (the common answer) comes from the
+            # snapshot's borrower set; a positive still loads the row below.
+            if snapshot.stakes_stale and not in_transaction(self):
+                snapshot.reload_active_borrowers(
+                    self.active_borrower_ids("personality", sandbox_id=snapshot.sandbox_id)
+                )
+            if snapshot.has_active_stake_for(borrower_id, borrower_kind, sandbox_id) is False:
+                return None
         clauses = ["borrower_id = ?", "borrower_kind = ?", "status = 'active'"]
         params: list = [borrower_id, borrower_kind]
         if sandbox_id is not None:
@@ -249,6 +263,27 @@ class StakeRepository(BaseRepository):
                 return None
             return _row_to_stake(row)
 
+    def active_borrower_ids(
+        self,
+        borrower_kind: str,
+        *,
+        sandbox_id: Optional[str] = None,
+    ) -> Set[str]:
+        """Borrower ids of that kind holding an active stake — the set form of
+        `load_active_for_borrower`, with the same sandbox scoping (legacy
+        NULL-sandbox rows match every sandbox)."""
+        clauses = ["borrower_kind = ?", "status = 'active'"]
+        params: list = [borrower_kind]
+        if sandbox_id is not None:
+            clauses.append("(sandbox_id = ? OR sandbox_id IS NULL)")
+            params.append(sandbox_id)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT DISTINCT borrower_id FROM stakes WHERE {' AND '.join(clauses)}",
+                tuple(params),
+            ).fetchall()
+        return {row["borrower_id"] for row in rows}
+
     def list_stakes_for_session(self, session_id: str) -> List[Stake]:
         """Return every stake row for a session, oldest first.
 
@@ -455,7 +490,11 @@ class StakeRepository(BaseRepository):
                     f"UPDATE stakes SET status = ? {where}",
                     (status, *tail_params),
                 )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        snapshot = bound_snapshot(self)
+        if snapshot is not None and updated:
+            snapshot.note_stakes_changed()
+        return updated
 
     def has_defaulted_stake(self, staker_id: str, borrower_id: str) -> bool:
         """True iff `borrower_id` ever defaulted on a stake from `staker_id`.
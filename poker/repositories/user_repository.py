@@ -8,6 +8,7 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from core.llm.usage_rollups import reassign_owner
 from poker.repositories.base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -159,13 +160,15 @@ class UserRepository(BaseRepository):
             )
             games_transferred = cursor.rowcount
 
-            # Transfer API usage records
+            # Transfer API usage records (and their cost rollups, which may
+            # also cover rows retention has already pruned)
             conn.execute(
                 """
                 UPDATE api_usage SET owner_id = ? WHERE owner_id = ?
             """,
                 (to_id, from_id),
             )
+            reassign_owner(conn, from_id, to_id)
 
             # Transfer prompt captures
             conn.execute(
@@ -0,0 +1,323 @@
+"""
+Compiled (binary, memory-mapped) strategy tables.
+
+The strategy charts ship as JSON — the authoring format the chart generators
+write and reviewers diff. Parsing ~8 MB of it into per-node ``StrategyProfile``
+dicts costs every process (and every ProcessPool worker in the sim harnesses)
+startup time and a private copy of every profile. This module compiles a chart
+JSON into a flat binary file next to it (``<name>.stbl``) that the loaders in
+``strategy_table`` mmap instead: the OS page cache shares the pages across
+workers and a profile is only decoded when a lookup first touches its node.
+
+File layout (little-endian, sections 8-byte aligned)::
+
+    header    magic, version, source size + crc32, section counts
+    hashes    n_entries x u64   blake2b-64 of node.key, sorted (bisect index)
+    entries   n_entries x (key_off u32, key_len u16, n_actions u16, freq_off u32)
+    actions   n_freqs x u16     index into the action vocabulary
+    freqs     n_freqs x f64     action frequencies
+    keys      utf-8 node keys, concatenated
+    vocab     NUL-separated action names
+
+The header records the source JSON's size and crc32; a compiled file whose
+source has since changed is ignored (the loader falls back to JSON), so a stale
+build can never serve an out-of-date chart. Frequencies are stored as float64
+so a compiled lookup returns exactly the JSON's values: the archetype charts
+carry frequencies float32 cannot represent, and the rounding would break the
+charts' rows-sum-to-one invariant and shift seeded sampling.
+
+Build step (also run in the Docker image build)::
+
+    python -m poker.strategy.data.build_compiled_tables          # compile all
+    python -m poker.strategy.data.build_compiled_tables --check  # exit 1 if stale
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Set
+
+from .strategy_profile import StrategyProfile
+
+logger = logging.getLogger(__name__)
+
+COMPILED_SUFFIX = '.stbl'
+_MAGIC = b'STBL'
+_VERSION = 1
+# magic, version, reserved, source size, source crc32,
+# n_entries, n_freqs, keys blob length, vocab blob length
+_HEADER = struct.Struct('<4sHHQIIIII')
+_ENTRY = struct.Struct('<IHHI')
+
+# Chart kinds: 'preflop' is the nested rfi/vs_open/... schema, 'postflop' the
+# flat node.key -> {action: prob} schema.
+PREFLOP = 'preflop'
+POSTFLOP = 'postflop'
+
+
+def _key_hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _source_fingerprint(raw: bytes) -> "tuple[int, int]":
+    return len(raw), zlib.crc32(raw)
+
+
+def compiled_path_for(json_path: str) -> str:
+    """Default compiled-file path for a chart JSON (same dir, ``.stbl``)."""
+    return os.path.splitext(json_path)[0] + COMPILED_SUFFIX
+
+
+def _parse_source(raw: bytes, kind: str) -> Dict[str, StrategyProfile]:
+    from .strategy_table import _parse_json_to_preflop_data, _parse_postflop_json
+
+    data = json.loads(raw)
+    if kind == PREFLOP:
+        return _parse_json_to_preflop_data(data)
+    if kind == POSTFLOP:
+        return _parse_postflop_json(data)
+    raise ValueError(f"Unknown chart kind: {kind!r} (expected 'preflop' or 'postflop')")
+
+
+def compile_strategy_json(json_path: str, kind: str, out_path: Optional[str] = None) -> str:
+    """Compile a chart JSON into the binary format. Returns the output path.
+
+    Written to a temp file and renamed into place, so a concurrent reader never
+    maps a half-written table.
+    """
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    profiles = _parse_source(raw, kind)
+    src_size, src_crc = _source_fingerprint(raw)
+
+    vocab: List[str] = sorted({a for p in profiles.values() for a in p.action_probabilities})
+    vocab_index = {a: i for i, a in enumerate(vocab)}
+
+    rows = sorted(
+        ((_key_hash(k.encode()), k.encode(), p) for k, p in profiles.items()),
+        key=lambda r: (r[0], r[1]),
+    )
+    keys_blob = bytearray()
+    entries = bytearray()
+    action_ids: List[int] = []
+    freqs: List[float] = []
+    for _, key, profile in rows:
+        n_actions = len(profile.action_probabilities)
+        entries += _ENTRY.pack(len(keys_blob), len(key), n_actions, len(freqs))
+        keys_blob += key
+        for action, prob in profile.action_probabilities.items():
+            action_ids.append(vocab_index[action])
+            freqs.append(prob)
+    vocab_blob = '\0'.join(vocab).encode()
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        0,
+        src_size,
+        src_crc,
+        len(rows),
+        len(freqs),
+        len(keys_blob),
+        len(vocab_blob),
+    )
+    sections = [
+        header,
+        struct.pack(f'<{len(rows)}Q', *(r[0] for r in rows)),
+        bytes(entries),
+        struct.pack(f'<{len(action_ids)}H', *action_ids),
+        struct.pack(f'<{len(freqs)}d', *freqs),
+        bytes(keys_blob),
+        vocab_blob,
+    ]
+
+    out_path = out_path or compiled_path_for(json_path)
+    tmp_path = f"{out_path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        for section in sections:
+            f.write(section)
+            f.write(b'\0' * (_align(len(section)) - len(section)))
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+class CompiledProfileMap(MutableMapping):
+    """``node.key -> StrategyProfile`` mapping backed by a memory-mapped table.
+
+    Drop-in for the plain dicts ``StrategyTable`` holds: lookups bisect the
+    sorted hash index and decode the profile on first touch (then cache it), so
+    a process only pays for the nodes it actually visits. Writes — the
+    experiment transforms that mutate ``table._postflop`` — land in a private
+    overlay; the shared mapping itself is never modified. ``copy()`` shares the
+    mmap and copies the overlay, matching ``dict(...)`` ownership semantics.
+    """
+
+    def __init__(self, path: str, _mm: Optional[mmap.mmap] = None):
+        self.path = path
+        if _mm is None:
+            with open(path, 'rb') as f:
+                _mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mm = _mm
+        (
+            magic,
+            version,
+            _,
+            self.source_size,
+            self.source_crc,
+            n_entries,
+            n_freqs,
+            keys_len,
+            vocab_len,
+        ) = _HEADER.unpack_from(_mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path}: not a v{_VERSION} compiled strategy table")
+
+        view = memoryview(_mm)
+        off = _align(_HEADER.size)
+        self._hashes = view[off : off + 8 * n_entries].cast('Q')
+        off = _align(off + 8 * n_entries)
+        self._entries_off = off
+        off = _align(off + _ENTRY.size * n_entries)
+        self._action_ids = view[off : off + 2 * n_freqs].cast('H')
+        off = _align(off + 2 * n_freqs)
+        self._freqs = view[off : off + 8 * n_freqs].cast('d')
+        off = _align(off + 8 * n_freqs)
+        self._keys_off = off
+        off = _align(off + keys_len)
+        self._vocab = bytes(view[off : off + vocab_len]).decode().split('\0')
+        self._n_entries = n_entries
+
+        self._decoded: Dict[str, StrategyProfile] = {}
+        self._overlay: Dict[str, StrategyProfile] = {}
+        self._deleted: Set[str] = set()
+
+    # ── Compiled-section access ──────────────────────────────────────
+
+    def _entry(self, i: int) -> "tuple[int, int, int, int]":
+        return _ENTRY.unpack_from(self._mm, self._entries_off + _ENTRY.size * i)
+
+    def _key_at(self, i: int) -> bytes:
+        key_off, key_len, _, _ = self._entry(i)
+        start = self._keys_off + key_off
+        return self._mm[start : start + key_len]
+
+    def _decode(self, key: str) -> Optional[StrategyProfile]:
+        profile = self._decoded.get(key)
+        if profile is not None:
+            return profile
+        raw_key = key.encode()
+        h = _key_hash(raw_key)
+        i = bisect.bisect_left(self._hashes, h)
+        while i < self._n_entries and self._hashes[i] == h:
+            key_off, key_len, n_actions, freq_off = self._entry(i)
+            start = self._keys_off + key_off
+            if self._mm[start : start + key_len] == raw_key:
+                vocab, ids, freqs = self._vocab, self._action_ids, self._freqs
+                profile = StrategyProfile(
+                    action_probabilities={
+                        vocab[ids[j]]: freqs[j] for j in range(freq_off, freq_off + n_actions)
+                    }
+                )
+                self._decoded[key] = profile
+                return profile
+            i += 1
+        return None
+
+    def _compiled_keys(self) -> Iterator[str]:
+        for i in range(self._n_entries):
+            yield self._key_at(i).decode()
+
+    # ── Mapping protocol ─────────────────────────────────────────────
+
+    def __getitem__(self, key: str) -> StrategyProfile:
+        if key in self._overlay:
+            return self._overlay[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        profile = self._decode(key)
+        if profile is None:
+            raise KeyError(key)
+        return profile
+
+    def get(self, key, default=None):
+        # Hot path (every lookup): skip the KeyError round-trip of the mixin.
+        profile = self._overlay.get(key)
+        if profile is not None:
+            return profile
+        if key in self._deleted:
+            return default
+        profile = self._decode(key)
+        return default if profile is None else profile
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+    def __setitem__(self, key: str, profile: StrategyProfile) -> None:
+        self._deleted.discard(key)
+        self._overlay[key] = profile
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._overlay.pop(key, None)
+        if self._decode(key) is not None:
+            self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._compiled_keys():
+            if key not in self._deleted and key not in self._overlay:
+                yield key
+        yield from self._overlay
+
+    def __len__(self) -> int:
+        shadowed = sum(1 for k in self._overlay if self._decode(k) is not None)
+        return self._n_entries - len(self._deleted) - shadowed + len(self._overlay)
+
+    def copy(self) -> "CompiledProfileMap":
+        clone = CompiledProfileMap(self.path, _mm=self._mm)
+        clone._decoded = self._decoded  # immutable profiles — safe to share
+        clone._overlay = dict(self._overlay)
+        clone._deleted = set(self._deleted)
+        return clone
+
+    def __repr__(self) -> str:
+        return f"CompiledProfileMap({self.path!r}, {len(self)} nodes)"
+
+
+def load_compiled(
+    json_path: str, compiled_path: Optional[str] = None
+) -> Optional[CompiledProfileMap]:
+    """Map the compiled form of ``json_path`` if one exists and is current.
+
+    Returns None — caller parses the JSON — when there is no compiled file, it
+    was built from a different version of the source, it is unreadable, or the
+    host is big-endian (the index is read through native-order memoryviews).
+    """
+    compiled_path = compiled_path or compiled_path_for(json_path)
+    if sys.byteorder != 'little' or not os.path.exists(compiled_path):
+        return None
+    try:
+        table = CompiledProfileMap(compiled_path)
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning(f"Ignoring unreadable compiled strategy table {compiled_path}: {e}")
+        return None
+    try:
+        with open(json_path, 'rb') as f:
+            fingerprint = _source_fingerprint(f.read())
+    except OSError:
+        fingerprint = None
+    if fingerprint is not None and fingerprint != (table.source_size, table.source_crc):
+        logger.info(f"Compiled strategy table {compiled_path} is stale; using JSON")
+        return None
+    return table
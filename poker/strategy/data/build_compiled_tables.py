@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Compile the strategy-chart JSON into memory-mapped binary tables (``.stbl``).
+
+Every chart the ``strategy_table`` loaders read — the base/HU/depth preflop
+charts, the archetype width-tier charts and the postflop chart — gets a
+``<name>.stbl`` next to its JSON. The loaders map the compiled file when its
+recorded source fingerprint still matches the JSON and parse the JSON
+otherwise, so re-run this after regenerating any chart (the Docker image build
+runs it). The JSON stays the source of truth; the ``.stbl`` files are build
+artifacts and are not committed. Format: see ``poker/strategy/compiled_table.py``.
+
+Usage:
+    docker compose exec backend python -m poker.strategy.data.build_compiled_tables
+    docker compose exec backend python -m poker.strategy.data.build_compiled_tables --check
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Tuple
+
+from poker.strategy.compiled_table import (
+    POSTFLOP,
+    PREFLOP,
+    compile_strategy_json,
+    load_compiled,
+)
+from poker.strategy.deviation_profiles import ARCHETYPE_WIDTH_TABLE
+from poker.strategy.strategy_table import DEPTH_CHART_BUCKETS
+
+HERE = os.path.dirname(__file__)
+
+
+def chart_sources(data_dir: str = HERE) -> List[Tuple[str, str]]:
+    """Every chart JSON the strategy_table loaders read, with its kind."""
+    names = {"preflop_100bb_6max.json", "preflop_100bb_hu.json"}
+    names.update(f"preflop_{depth}bb_6max.json" for depth in DEPTH_CHART_BUCKETS)
+    names.update(f for f in ARCHETYPE_WIDTH_TABLE.values() if f)
+    sources = [(os.path.join(data_dir, n), PREFLOP) for n in sorted(names)]
+    sources.append((os.path.join(data_dir, "postflop_strategies.json"), POSTFLOP))
+    return [(path, kind) for path, kind in sources if os.path.exists(path)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--data-dir", default=HERE, help="chart directory (default: this dir)")
+    parser.add_argument(
+        "--check", action="store_true", help="only report stale/missing tables (exit 1 if any)"
+    )
+    args = parser.parse_args(argv)
+
+    stale = 0
+    for json_path, kind in chart_sources(args.data_dir):
+        name = os.path.basename(json_path)
+        if args.check:
+            if load_compiled(json_path) is None:
+                stale += 1
+                print(f"stale    {name}")
+            continue
+        out = compile_strategy_json(json_path, kind)
+        size_kb = os.path.getsize(out) / 1024
+        print(f"compiled {name} -> {os.path.basename(out)} ({size_kb:.0f} KB)")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
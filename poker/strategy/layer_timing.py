@@ -0,0 +1,132 @@
+"""
+Per-layer timing for the TieredBotController decision pipeline.
+
+Opt-in instrumentation: attach a ``LayerTimer`` to a controller
+(``controller.layer_timer = LayerTimer()``) and every decision records how
+long each pipeline layer took, in pipeline order, into
+``_last_pipeline_snapshot['layer_timings_us']`` — next to the
+InterventionTrace the same layers already emit. With no timer attached the
+controller pays one attribute check per layer.
+
+The timer is lap-style: ``start()`` at the top of a decision, ``lap(layer)``
+right after each layer returns (the elapsed time since the previous mark is
+charged to ``layer``), ``finish()`` at the end (the remainder is charged to
+``finalize``). Laps accumulate across decisions in ``samples`` so a benchmark
+can report latency percentiles per layer; ``track_allocations=True`` also
+records each layer's peak traced allocation (via tracemalloc, which slows
+everything down — use it for the allocation column, not the latency one).
+
+See experiments/bench_tiered_layers.py for the corpus-replay benchmark.
+"""
+
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+FINALIZE = 'finalize'
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in [0, 100]) of an unsorted list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil without float error
+    return ordered[min(int(rank), len(ordered)) - 1]
+
+
+class LayerTimer:
+    """Lap timer for one controller's decision pipeline."""
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.samples: Dict[str, List[float]] = defaultdict(list)  # layer -> us per decision
+        self.alloc_samples: Dict[str, List[int]] = defaultdict(list)  # layer -> peak bytes
+        self.decisions = 0
+        self._current: Dict[str, float] = {}
+        self._current_alloc: Dict[str, int] = {}
+        self._mark: Optional[int] = None
+        self._alloc_base = 0
+
+    def start(self) -> None:
+        """Begin a decision: reset the per-decision laps and the clock."""
+        self._current = {}
+        self._current_alloc = {}
+        if self.track_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._reset_alloc_mark()
+        self._mark = time.perf_counter_ns()
+
+    def _reset_alloc_mark(self) -> None:
+        tracemalloc.reset_peak()
+        self._alloc_base = tracemalloc.get_traced_memory()[0]
+
+    def lap(self, layer: str) -> None:
+        """Charge the time since the previous mark to ``layer``."""
+        if self._mark is None:
+            return
+        now = time.perf_counter_ns()
+        self._current[layer] = self._current.get(layer, 0.0) + (now - self._mark) / 1000.0
+        if self.track_allocations:
+            peak = tracemalloc.get_traced_memory()[1] - self._alloc_base
+            self._current_alloc[layer] = max(self._current_alloc.get(layer, 0), peak)
+            self._reset_alloc_mark()
+        # Re-read the clock so the bookkeeping above isn't billed to the next layer.
+        self._mark = time.perf_counter_ns()
+
+    def finish(self) -> Dict[str, float]:
+        """End the decision; returns ``{layer: microseconds}`` in pipeline order."""
+        if self._mark is None:
+            return {}
+        self.lap(FINALIZE)
+        self._mark = None
+        self.decisions += 1
+        for layer, us in self._current.items():
+            self.samples[layer].append(us)
+        for layer, peak in self._current_alloc.items():
+            self.alloc_samples[layer].append(peak)
+        return {layer: round(us, 1) for layer, us in self._current.items()}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-layer stats across every finished decision.
+
+        ``n`` counts the decisions that reached the layer (preflop-only and
+        postflop-only layers differ); ``share`` is the layer's fraction of the
+        total timed pipeline time.
+        """
+        grand_total = sum(sum(v) for v in self.samples.values()) or 1.0
+        out: Dict[str, Dict[str, float]] = {}
+        for layer, values in self.samples.items():
+            stats = {
+                'n': len(values),
+                'p50_us': percentile(values, 50),
+                'p99_us': percentile(values, 99),
+                'mean_us': sum(values) / len(values),
+                'share': sum(values) / grand_total,
+            }
+            allocs = self.alloc_samples.get(layer)
+            if allocs:
+                stats['p50_alloc_kb'] = percentile(allocs, 50) / 1024
+                stats['p99_alloc_kb'] = percentile(allocs, 99) / 1024
+            out[layer] = stats
+        return out
+
+
+def format_layer_summary(summary: Dict[str, Dict[str, float]]) -> str:
+    """Fixed-width report table, slowest layer (by total share) first."""
+    with_alloc = any('p50_alloc_kb' in s for s in summary.values())
+    header = f"{'layer':<24} {'n':>7} {'p50 us':>9} {'p99 us':>9} {'mean us':>9} {'share':>7}"
+    if with_alloc:
+        header += f" {'p50 KB':>8} {'p99 KB':>8}"
+    lines = [header, '-' * len(header)]
+    for layer, s in sorted(summary.items(), key=lambda kv: -kv[1]['share']):
+        line = (
+            f"{layer:<24} {s['n']:>7} {s['p50_us']:>9.1f} {s['p99_us']:>9.1f} "
+            f"{s['mean_us']:>9.1f} {s['share']:>6.1%}"
+        )
+        if with_alloc:
+            line += f" {s.get('p50_alloc_kb', 0.0):>8.1f} {s.get('p99_alloc_kb', 0.0):>8.1f}"
+        lines.append(line)
+    return '\n'.join(lines)
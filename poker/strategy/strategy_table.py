@@ -1,7 +1,8 @@
 """
 Strategy table: lookup and legal-action masking for solver-derived baselines.
 
-Loads preflop and postflop strategy data from JSON, keyed by node.key strings.
+Loads preflop and postflop strategy data from JSON (or its compiled,
+memory-mapped form — see compiled_table), keyed by node.key strings.
 Provides exact lookup, fallback defaults, and action masking/renormalization
 to bridge abstract strategy actions to the game engine's legal action set.
 """
@@ -10,8 +11,9 @@ import json
 import logging
 import os
 from dataclasses import replace
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple
 
+from .compiled_table import CompiledProfileMap, load_compiled
 from .nodes import PostflopNode, PreflopNode
 from .strategy_profile import StrategyProfile
 
@@ -131,6 +133,18 @@ _TEXTURE_NEIGHBOR = {
 }
 
 
+def _own_profiles(data: Mapping[str, StrategyProfile]) -> Dict[str, StrategyProfile]:
+    """Private copy of a profile mapping for a table to own (and mutate).
+
+    A compiled table copies cheaply — the clone shares the mmap and only the
+    write overlay is duplicated — so it stays compiled instead of being
+    materialized into a dict.
+    """
+    if isinstance(data, CompiledProfileMap):
+        return data.copy()
+    return dict(data)
+
+
 class StrategyTable:
     """In-memory lookup table for preflop and postflop solver baselines."""
 
@@ -148,9 +162,40 @@ class StrategyTable:
         the champion-vs-challenger core-fix A/B to isolate the fold-the-nuts
         fallback's value vs the bot itself.
         """
-        self._preflop: Dict[str, StrategyProfile] = dict(preflop_data)
-        self._postflop: Dict[str, StrategyProfile] = dict(postflop_data or {})
+        self._preflop: Dict[str, StrategyProfile] = _own_profiles(preflop_data)
+        self._postflop: Dict[str, StrategyProfile] = _own_profiles(postflop_data or {})
         self.spr_fallback: bool = spr_fallback
+        # Resolved-lookup index, filled on first use: (node.key, legal actions)
+        # -> the final masked profile the fallback ladder lands on, so a repeat
+        # decision is one dict hit. See clear_lookup_cache().
+        self._preflop_resolved: Dict[tuple, Tuple[StrategyProfile, str]] = {}
+        self._postflop_resolved: Dict[tuple, StrategyProfile] = {}
+        # (id(profile), legal actions) -> (profile, masked-or-None). The source
+        # profile is held in the value so its id can't be recycled under us.
+        self._masked: Dict[tuple, Tuple[StrategyProfile, Optional[StrategyProfile]]] = {}
+
+    def clear_lookup_cache(self) -> None:
+        """Drop the resolved-lookup index.
+
+        The *_with_fallback lookups memoize their result per (node, legal
+        actions) and return the shared cached profile — callers treat profiles
+        as read-only. Call this after mutating ``_preflop`` / ``_postflop`` on a
+        table that has already served lookups (the experiment transforms mutate
+        freshly loaded tables, before any lookup, and don't need to).
+        """
+        self._preflop_resolved.clear()
+        self._postflop_resolved.clear()
+        self._masked.clear()
+
+    def _mask(self, profile: StrategyProfile, legal: tuple) -> Optional[StrategyProfile]:
+        """Memoized :func:`_mask_and_renormalize` per (profile, legal-action set)."""
+        cache_key = (id(profile), legal)
+        hit = self._masked.get(cache_key)
+        if hit is not None and hit[0] is profile:
+            return hit[1]
+        masked = _mask_and_renormalize(profile, list(legal))
+        self._masked[cache_key] = (profile, masked)
+        return masked
 
     def lookup_preflop(self, node: PreflopNode) -> Optional[StrategyProfile]:
         """Look up base strategy for a preflop node. Returns None if not found."""
@@ -200,12 +245,7 @@ class StrategyTable:
         without vs_squeeze data — e.g. the depth/archetype charts — stays
         behaviour-preserving.
         """
-        profile, _ = self._resolve_preflop_node(node)
-        if profile is not None:
-            masked = _mask_and_renormalize(profile, legal_actions)
-            if masked is not None:
-                return masked
-        return _conservative_default(legal_actions)
+        return self._lookup_preflop_resolved(node, legal_actions)[0]
 
     def lookup_with_fallback_traced(
         self,
@@ -222,13 +262,30 @@ class StrategyTable:
             mask -> conservative default (a true fall-through).
           - ``'miss'``           no node -> conservative default (fall-through).
         """
+        return self._lookup_preflop_resolved(node, legal_actions)
+
+    def _lookup_preflop_resolved(
+        self,
+        node: PreflopNode,
+        legal_actions: List[str],
+    ) -> Tuple[StrategyProfile, str]:
+        """Resolved ``(profile, source)`` for a preflop node, memoized."""
+        legal = tuple(legal_actions)
+        cache_key = (node.key, legal)
+        resolved = self._preflop_resolved.get(cache_key)
+        if resolved is not None:
+            return resolved
         profile, source = self._resolve_preflop_node(node)
-        if profile is not None:
-            masked = _mask_and_renormalize(profile, legal_actions)
+        if profile is None:
+            resolved = (_conservative_default(legal_actions), "miss")
+        else:
+            masked = self._mask(profile, legal)
             if masked is not None:
-                return masked, source
-            return _conservative_default(legal_actions), "masked_out"
-        return _conservative_default(legal_actions), "miss"
+                resolved = (masked, source)
+            else:
+                resolved = (_conservative_default(legal_actions), "masked_out")
+        self._preflop_resolved[cache_key] = resolved
+        return resolved
 
     # ── Postflop lookup ─────────────────────────────────────────────
 
@@ -259,7 +316,20 @@ class StrategyTable:
         slices were cut after the hardened SNG gate measured them neutral — see
         docs/plans/SNG_RUNNER_HARDENING.md — so every shallow/3BP spot now rides
         this fallback.)
+
+        The resolved result is memoized per (node, legal actions, spr_fallback),
+        so the ladder is walked once per distinct spot.
         """
+        legal = tuple(legal_actions)
+        cache_key = (node.key, legal, self.spr_fallback)
+        resolved = self._postflop_resolved.get(cache_key)
+        if resolved is None:
+            resolved = self._resolve_postflop(node, legal)
+            self._postflop_resolved[cache_key] = resolved
+        return resolved
+
+    def _resolve_postflop(self, node: PostflopNode, legal: tuple) -> StrategyProfile:
+        """Walk the postflop degrade ladder (uncached; see the public lookup)."""
         # Degradation candidates, most-specific first. SPR degrades before
         # pot_type: shallow sizing/commit matters more than the SRP↔3BP nuance.
         candidates = [node]
@@ -274,7 +344,7 @@ class StrategyTable:
         for cand in candidates:
             profile = self._postflop.get(cand.key)
             if profile is not None:
-                masked = _mask_and_renormalize(profile, legal_actions)
+                masked = self._mask(profile, legal)
                 if masked is not None:
                     if cand is not node:
                         logger.debug(f"Postflop fallback: {node.key} → {cand.key}")
@@ -289,7 +359,7 @@ class StrategyTable:
             neighbor_node = replace(base, board_texture=neighbor_texture)
             profile = self._postflop.get(neighbor_node.key)
             if profile is not None:
-                masked = _mask_and_renormalize(profile, legal_actions)
+                masked = self._mask(profile, legal)
                 if masked is not None:
                     logger.debug(
                         f"Postflop fallback: {node.board_texture} → "
@@ -299,7 +369,7 @@ class StrategyTable:
 
         # Conservative default
         logger.debug(f"Postflop conservative default for {node.key}")
-        return _postflop_conservative_default(node.facing_action, legal_actions)
+        return _postflop_conservative_default(node.facing_action, list(legal))
 
     @property
     def size(self) -> int:
@@ -384,12 +454,30 @@ def _parse_postflop_json(data: dict) -> Dict[str, StrategyProfile]:
     return result
 
 
+def _load_preflop_profiles(json_path: str) -> Mapping[str, StrategyProfile]:
+    """Preflop profiles for a chart: the compiled table if current, else JSON."""
+    compiled = load_compiled(json_path)
+    if compiled is not None:
+        return compiled
+    with open(json_path) as f:
+        return _parse_json_to_preflop_data(json.load(f))
+
+
+def _load_postflop_profiles(json_path: str) -> Mapping[str, StrategyProfile]:
+    """Postflop profiles for a chart: the compiled table if current, else JSON."""
+    compiled = load_compiled(json_path)
+    if compiled is not None:
+        return compiled
+    with open(json_path) as f:
+        return _parse_postflop_json(json.load(f))
+
+
 def load_strategy_table(
     json_path: str = None,
     postflop_path: str = None,
     spr_fallback: bool = True,
 ) -> StrategyTable:
-    """Load strategy table from JSON files.
+    """Load strategy table from JSON files (compiled form used when current).
 
     Default paths:
     - Preflop: poker/strategy/data/preflop_100bb_6max.json
@@ -409,18 +497,14 @@ def load_strategy_table(
 
     if json_path is None:
         json_path = os.path.join(data_dir, 'preflop_100bb_6max.json')
-    with open(json_path) as f:
-        preflop_raw = json.load(f)
-    preflop_data = _parse_json_to_preflop_data(preflop_raw)
+    preflop_data = _load_preflop_profiles(json_path)
 
     # Load postflop data (optional — file may not exist yet)
-    postflop_data: Dict[str, StrategyProfile] = {}
+    postflop_data: Mapping[str, StrategyProfile] = {}
     if postflop_path is None:
         postflop_path = os.path.join(data_dir, 'postflop_strategies.json')
     if os.path.exists(postflop_path):
-        with open(postflop_path) as f:
-            postflop_raw = json.load(f)
-        postflop_data = _parse_postflop_json(postflop_raw)
+        postflop_data = _load_postflop_profiles(postflop_path)
 
     return StrategyTable(preflop_data, postflop_data, spr_fallback=spr_fallback)
 
@@ -445,10 +529,7 @@ def load_hu_strategy_table(json_path: str = None) -> Optional[StrategyTable]:
     if not os.path.exists(json_path):
         return None
 
-    with open(json_path) as f:
-        preflop_raw = json.load(f)
-    preflop_data = _parse_json_to_preflop_data(preflop_raw)
-    return StrategyTable(preflop_data, postflop_data={})
+    return StrategyTable(_load_preflop_profiles(json_path), postflop_data={})
 
 
 # Depth buckets the bot adjusts its preflop game across. 100 is the base
@@ -478,9 +559,7 @@ def load_depth_strategy_tables() -> Dict[int, "StrategyTable"]:
         path = os.path.join(data_dir, f'preflop_{depth}bb_6max.json')
         if not os.path.exists(path):
             continue
-        with open(path) as f:
-            preflop_raw = json.load(f)
-        tables[depth] = StrategyTable(_parse_json_to_preflop_data(preflop_raw), postflop_data={})
+        tables[depth] = StrategyTable(_load_preflop_profiles(path), postflop_data={})
     return tables
 
 
@@ -510,9 +589,7 @@ def load_archetype_preflop_tables() -> Dict[str, "StrategyTable"]:
         path = os.path.join(data_dir, filename)
         if not os.path.exists(path):
             continue
-        with open(path) as f:
-            preflop_raw = json.load(f)
-        tables[key] = StrategyTable(_parse_json_to_preflop_data(preflop_raw), postflop_data={})
+        tables[key] = StrategyTable(_load_preflop_profiles(path), postflop_data={})
     return tables
 
 
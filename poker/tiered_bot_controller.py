@@ -52,6 +52,7 @@ from .strategy.intervention_trace import (
     layer_order_for,
     make_no_op_trace,
 )
+from .strategy.layer_timing import LayerTimer
 from .strategy.math_floor import apply_pot_odds_floor
 from .strategy.multiway import apply_multiway_adjustment
 from .strategy.personality_modifier import apply_river_bluff_guardrail, modify_strategy
@@ -639,6 +640,11 @@ class TieredBotController(AIPlayerController):
         # set this per matchup; Mode 1 (shadow-eval) uses it for
         # counterfactual per-decision evaluation.
         self.disable_rules: frozenset = frozenset()
+        # Opt-in per-layer timing (poker/strategy/layer_timing.py). None = off:
+        # each pipeline layer then costs one attribute check. When set, every
+        # decision writes {layer: microseconds} into
+        # _last_pipeline_snapshot['layer_timings_us'] alongside the trace.
+        self.layer_timer: Optional[LayerTimer] = None
 
         # Multi-street context layer (docs/plans/STRUCTURAL_PASSIVITY_PLAN.md +
         # POSTFLOP_NEXT_LEVER.md). The postflop pipeline reads hero's-own-line +
@@ -1210,11 +1216,23 @@ class TieredBotController(AIPlayerController):
             valid_actions = game_state.current_player_options
         except Exception:
             valid_actions = ['fold', 'check', 'call', 'raise']
-        return self._get_ai_decision(
+        timer = getattr(self, 'layer_timer', None)
+        if timer is not None:
+            timer.start()
+        decision = self._get_ai_decision(
             message='',
             valid_actions=valid_actions,
             call_amount=getattr(game_state, 'call_amount', 0) or 0,
         )
+        if timer is not None:
+            self._last_pipeline_snapshot['layer_timings_us'] = timer.finish()
+        return decision
+
+    def _lap(self, layer: str) -> None:
+        """Charge elapsed pipeline time to `layer` when a LayerTimer is attached."""
+        timer = getattr(self, 'layer_timer', None)
+        if timer is not None:
+            timer.lap(layer)
 
     def _get_ai_decision(self, message: str, **context) -> Dict:
         """Override: Use strategy tables + personality distortion instead of LLM.
@@ -1285,6 +1303,8 @@ class TieredBotController(AIPlayerController):
                 f"chart={chart_label} eff_bb={effective_stack_bb:.1f}"
             )
 
+        self._lap('node_build')
+
         # Layer 1: Lookup base strategy. Short-stack HU spots bypass the
         # deep-stack table and use the dedicated push/fold chart instead;
         # the deep-stack ranges are mis-calibrated below ~15 BB because
@@ -1338,6 +1358,8 @@ class TieredBotController(AIPlayerController):
             base_strategy.action_probabilities
         )
 
+        self._lap('base_strategy')
+
         # Facing-an-all-in equity veto (see _facing_all_in_preflop_veto).
         # Facing a cold all-in the chart's coarse vs_3bet/vs_4bet stub can
         # sample a trash JAM/CALL — the root cause of the prod "47o jams into
@@ -1390,6 +1412,8 @@ class TieredBotController(AIPlayerController):
             self._attach_expression(decision, game_state, player_idx, phase='pre_flop')
             return decision
 
+        self._lap('facing_all_in_veto')
+
         # Layer 2: Personality distortion (skipped for BaselineSolverBot)
         emotional_state = get_emotional_shift(self.psychology)
         anchors = self.psychology.anchors if self.psychology else None
@@ -1434,6 +1458,7 @@ class TieredBotController(AIPlayerController):
                 reason_code='distortion_skipped',
             )
         self._last_intervention_trace.append(personality_trace)
+        self._lap('personality')
 
         # Phase 6.b (preflop): scenario-scoped spot tendencies (e.g. tag's
         # `defend_3bet`, which de-polarizes the 4-bet-or-fold vs_3bet response
@@ -1450,6 +1475,8 @@ class TieredBotController(AIPlayerController):
             hand_strength=self._classify_preflop_hand_strength(canonical_hand, anchors),
         )
 
+        self._lap('spot_tendencies')
+
         # Phase 2 (PERCEPTIBILITY_CONDITIONING.md): tilt_conditioning runs
         # between spot-tendencies and exploitation. Inert (no-op, byte-identical)
         # unless the flag is on AND the profile opts in (cap > 0.0).
@@ -1460,6 +1487,8 @@ class TieredBotController(AIPlayerController):
             emotional_state=emotional_state,
         )
 
+        self._lap('tilt_conditioning')
+
         if self.debug_logging:
             logger.info(
                 f"[TIERED_BOT] {self.player_name}: "
@@ -1481,6 +1510,7 @@ class TieredBotController(AIPlayerController):
             hand_strength=None,
         )
         self._last_intervention_trace.extend(exploitation_traces)
+        self._lap('exploitation')
 
         # Phase 6.5: strong-hand value override.
         # Replaces strategy entirely when hero has a top-tier hand vs a
@@ -1496,6 +1526,7 @@ class TieredBotController(AIPlayerController):
             hand_strength=self._classify_preflop_hand_strength(canonical_hand, anchors),
         )
         self._last_intervention_trace.append(value_override_trace)
+        self._lap('strong_hand_override')
 
         # Playstyle-gated rule diagnostics. Preflop sees no playstyle
         # counters fire (value_vs_station is postflop-only); the call
@@ -1516,6 +1547,7 @@ class TieredBotController(AIPlayerController):
             disable_rules=getattr(self, "disable_rules", frozenset()),
         )
         self._last_intervention_trace.append(short_stack_trace)
+        self._lap('short_stack')
 
         # Math floor: override when pot odds / pot-committed / short stack
         # make personality-driven folds clearly -EV.
@@ -1528,6 +1560,7 @@ class TieredBotController(AIPlayerController):
             self._last_intervention_trace,
         )
         self._last_intervention_trace.append(math_floor_trace)
+        self._lap('math_floor')
 
         abstract_action = modified_strategy.sample_action(self.rng)
         self._last_pipeline_snapshot['sampled_abstract_action'] = abstract_action
@@ -1575,6 +1608,8 @@ class TieredBotController(AIPlayerController):
                 f"final_action={game_action} raise_to={raise_to}"
             )
 
+        self._lap('sample_and_size')
+
         decision = {
             'action': game_action,
             'raise_to': raise_to,
@@ -1642,6 +1677,7 @@ class TieredBotController(AIPlayerController):
         # pair the resolved action with its full postflop context without
         # re-deriving the node. Cheap; the snapshot already exists for replay.
         self._last_pipeline_snapshot['node_key'] = node.key
+        self._lap('node_build')
 
         # 3. Lookup base strategy. Only the (SRP, high) chart is authored;
         # shallow-SPR / 3-bet-pot spots ride the degrade ladder (low → high,
@@ -1658,6 +1694,8 @@ class TieredBotController(AIPlayerController):
                 f"postflop base_strategy={base_strategy.action_probabilities}"
             )
 
+        self._lap('base_strategy')
+
         # 4. Multiway adjustment (if > 2 active players)
         active_count = sum(1 for p in game_state.players if not p.is_folded)
         if active_count > 2:
@@ -1681,6 +1719,8 @@ class TieredBotController(AIPlayerController):
             base_strategy.action_probabilities
         )
 
+        self._lap('multiway')
+
         # 5. Personality distortion (skipped for BaselineSolverBot)
         emotional_state = get_emotional_shift(self.psychology)
         anchors = self.psychology.anchors if self.psychology else None
@@ -1706,6 +1746,7 @@ class TieredBotController(AIPlayerController):
                 reason_code='distortion_skipped',
             )
         self._last_intervention_trace.append(personality_trace)
+        self._lap('personality')
 
         if self.debug_logging:
             logger.info(
@@ -1727,6 +1768,8 @@ class TieredBotController(AIPlayerController):
                     f"result={modified_strategy.action_probabilities}"
                 )
 
+        self._lap('river_guardrail')
+
         # Hand strength is consumed by exploitation (value_vs_station
         # gate) AND by value_override + bluff_catch below, so compute
         # it once up front. The classifier is pure on `node`, so the
@@ -1765,6 +1808,8 @@ class TieredBotController(AIPlayerController):
         # selected) — see that method. Done as a side effect of the
         # tally call so we don't duplicate _select_exploitation_stats_from_spots.
 
+        self._lap('hand_context')
+
         # 6.b Spot/line-specific personality tendencies (item 3,
         # PERSONALITY_PRICING_AND_VARIETY.md). Runs in the personality block
         # (layer_order 0), right after the global-scalar distortion and before
@@ -1778,6 +1823,8 @@ class TieredBotController(AIPlayerController):
             hand_strength=hand_strength,
         )
 
+        self._lap('spot_tendencies')
+
         # 6.c Phase 2 (PERCEPTIBILITY_CONDITIONING.md): tilt_conditioning runs
         # between spot-tendencies and exploitation. Inert (no-op, byte-identical)
         # unless the flag is on AND the profile opts in (cap > 0.0).
@@ -1788,6 +1835,8 @@ class TieredBotController(AIPlayerController):
             emotional_state=emotional_state,
         )
 
+        self._lap('tilt_conditioning')
+
         # 6a. Phase 6: opponent exploitation (between personality and math floor)
         modified_strategy, exploitation_traces = self._apply_exploitation(
             modified_strategy,
@@ -1799,6 +1848,7 @@ class TieredBotController(AIPlayerController):
             hand_strength=hand_strength,
         )
         self._last_intervention_trace.extend(exploitation_traces)
+        self._lap('exploitation')
 
         # 6a.45 Phase A induce_override: smooth-call vs detected
         # multi-street barrelers with nuts IP on dry boards. Sits
@@ -1819,6 +1869,7 @@ class TieredBotController(AIPlayerController):
             active_opponent_count=active_count - 1,
         )
         self._last_intervention_trace.append(induce_override_trace)
+        self._lap('induce_override')
 
         # 6a.5 Phase 6.5: strong-hand value override.
         # Replaces strategy when hero has a strong made hand vs a detected
@@ -1835,6 +1886,7 @@ class TieredBotController(AIPlayerController):
             prior_layer_fired=induce_override_trace.fired,
         )
         self._last_intervention_trace.append(value_override_trace)
+        self._lap('strong_hand_override')
 
         # Playstyle-gated rule diagnostics. Must run after value_override
         # so the fired-vs-superseded distinction for value_vs_station is
@@ -1866,6 +1918,7 @@ class TieredBotController(AIPlayerController):
             self._last_intervention_trace,
         )
         self._last_intervention_trace.append(bluff_catch_trace)
+        self._lap('bluff_catch_override')
 
         # 6a.5b.1b Phase B sizing defense (SIZING_AWARE_OPPONENT_MODELING.md §B).
         # Behind sizing_defense_enabled (default off → byte-identical). Folds more
@@ -1886,6 +1939,7 @@ class TieredBotController(AIPlayerController):
             self._last_intervention_trace,
         )
         self._last_intervention_trace.append(sizing_defense_trace)
+        self._lap('sizing_defense')
 
         # 6a.5b.2 Multi-street context (STRUCTURAL_PASSIVITY_PLAN.md).
         # Behind enable_multistreet_context (default off). Reads hero's-own-
@@ -1907,6 +1961,7 @@ class TieredBotController(AIPlayerController):
             bluff_catch_trace=bluff_catch_trace,
         )
         self._last_intervention_trace.append(multistreet_trace)
+        self._lap('multistreet_context')
 
         # 6a.5b.3 Overbet sizing (docs/plans/POSTFLOP_NEXT_LEVER.md).
         # The chart bet menu caps at bet_100 — the bot is structurally incapable
@@ -1928,6 +1983,7 @@ class TieredBotController(AIPlayerController):
             multistreet_trace=multistreet_trace,
         )
         self._last_intervention_trace.append(overbet_trace)
+        self._lap('overbet_context')
 
         # NOTE: the value-bet floor override (§12) was retired (§14) once its
         # win was traced to multiway over-suppressing value hands and baked
@@ -1955,6 +2011,7 @@ class TieredBotController(AIPlayerController):
             overbet_trace=overbet_trace,
         )
         self._last_intervention_trace.append(defense_floor_trace)
+        self._lap('defense_floor')
 
         # 6a.6b Gated stab-defense (OVERBET_BALANCING §5j): vs a detected frequent
         # stabber, widen the bot's defense facing a postflop bet (shift fold→call)
@@ -1991,6 +2048,7 @@ class TieredBotController(AIPlayerController):
                 stab_defense_trace, self._last_intervention_trace
             )
         self._last_intervention_trace.append(stab_defense_trace)
+        self._lap('stab_defense')
 
         # 6a.6 Phase 6 Step B: short-stack heuristic. Suppress medium-raise
         # probability mass below 20 BB effective stack — non-jam raises
@@ -2004,6 +2062,7 @@ class TieredBotController(AIPlayerController):
             disable_rules=getattr(self, "disable_rules", frozenset()),
         )
         self._last_intervention_trace.append(short_stack_trace)
+        self._lap('short_stack')
 
         # 6a.7 Postflop commit: at low SPR, funnel value-hand (nuts/
         # strong_made) passive + small-bet mass into a jam — get the money in
@@ -2019,6 +2078,7 @@ class TieredBotController(AIPlayerController):
             disable_rules=getattr(self, "disable_rules", frozenset()),
         )
         self._last_intervention_trace.append(postflop_commit_trace)
+        self._lap('postflop_commit')
 
         # 6b. Math floor — override when arithmetic mandates a call/jam.
         # Runs AFTER personality + river guardrail so it has final say.
@@ -2031,6 +2091,7 @@ class TieredBotController(AIPlayerController):
             self._last_intervention_trace,
         )
         self._last_intervention_trace.append(math_floor_trace)
+        self._lap('math_floor')
 
         # 7. Sample action
         abstract_action = modified_strategy.sample_action(self.rng)
@@ -2066,6 +2127,8 @@ class TieredBotController(AIPlayerController):
                 f"postflop final={game_action} raise_to={raise_to}"
             )
 
+        self._lap('sample_and_size')
+
         decision = {
             'action': game_action,
             'raise_to': raise_to,
@@ -67,6 +67,26 @@ export interface UncostedCalls {
   by_model: UncostedModel[];
 }
 
+export interface ModelLatency {
+  provider: string;
+  model: string;
+  calls: number;
+  p50_ms: number | null;
+  p95_ms: number | null;
+  p99_ms: number | null;
+}
+
+export interface CallTypePromptCache {
+  call_type: string;
+  provider: string;
+  total_calls: number;
+  input_tokens: number;
+  cached_tokens: number;
+  cache_hit_rate: number | null;
+  avg_latency: number;
+  cost_per_call: number;
+}
+
 export interface CostOverview {
   range: CostRange;
   summary: UsageSummary;
@@ -76,6 +96,8 @@ export interface CostOverview {
   by_game: GameCost[];
   uncosted: UncostedCalls;
   timeseries: TimeseriesPoint[];
+  latency_by_model: ModelLatency[];
+  prompt_cache_by_call_type: CallTypePromptCache[];
 }
 
 export interface OwnerDetail {
@@ -33,6 +33,9 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
   const [selectedCapture, setSelectedCapture] = useState<PlaygroundCaptureDetail | null>(null);
   const [stats, setStats] = useState<PlaygroundStats | null>(null);
   const [total, setTotal] = useState(0);
+  // Keyset paging: cursors of the pages before the current one, and the next page's.
+  const [prevCursors, setPrevCursors] = useState<(string | undefined)[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [statsLoading, setStatsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -74,6 +77,12 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
   // Available providers/models (using 'system' scope for admin tools)
   const { providers, getModelsForProvider, getModelTier } = useLLMProviders({ scope: 'system' });
 
+  // Any filter change starts over at page 1.
+  const resetPaging = (next: PlaygroundFilters) => {
+    setPrevCursors([]);
+    setFilters({ ...next, cursor: undefined, offset: 0 });
+  };
+
   // Fetch captures
   const fetchCaptures = useCallback(async () => {
     setLoading(true);
@@ -83,8 +92,10 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
       const params = new URLSearchParams();
       if (filters.call_type) params.append('call_type', filters.call_type);
       if (filters.provider) params.append('provider', filters.provider);
+      if (filters.q) params.append('q', filters.q);
       if (filters.limit) params.append('limit', String(filters.limit));
-      if (filters.offset) params.append('offset', String(filters.offset));
+      // Deep pages seek by cursor; offset only positions the "x - y of n" label.
+      if (filters.cursor) params.append('cursor', filters.cursor);
       // Skip the expensive bundled stats so the list paints fast; stats are
       // fetched separately via fetchStats().
       params.append('include_stats', 'false');
@@ -95,6 +106,7 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
       if (data.success) {
         setCaptures(data.captures);
         setTotal(data.total);
+        setNextCursor(data.next_cursor ?? null);
       } else {
         setError(data.error || 'Failed to fetch captures');
       }
@@ -346,7 +358,7 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
             <select
               value={filters.call_type || ''}
               onChange={(e) =>
-                setFilters({ ...filters, call_type: e.target.value || undefined, offset: 0 })
+                resetPaging({ ...filters, call_type: e.target.value || undefined })
               }
             >
               <option value="">All call types</option>
@@ -360,7 +372,7 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
             <select
               value={filters.provider || ''}
               onChange={(e) =>
-                setFilters({ ...filters, provider: e.target.value || undefined, offset: 0 })
+                resetPaging({ ...filters, provider: e.target.value || undefined })
               }
             >
               <option value="">All providers</option>
@@ -371,6 +383,16 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
                   </option>
                 ))}
             </select>
+            <input
+              type="search"
+              placeholder="Search prompts / responses"
+              defaultValue={filters.q || ''}
+              onKeyDown={(e) => {
+                if (e.key === 'Enter') {
+                  resetPaging({ ...filters, q: e.currentTarget.value.trim() || undefined });
+                }
+              }}
+            />
             <button onClick={fetchCaptures} disabled={loading}>
               {loading ? 'Loading...' : 'Refresh'}
             </button>
@@ -409,13 +431,15 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
           {total > (filters.limit || 50) && (
             <div className="pagination">
               <button
-                disabled={(filters.offset || 0) === 0}
-                onClick={() =>
+                disabled={prevCursors.length === 0}
+                onClick={() => {
                   setFilters({
                     ...filters,
+                    cursor: prevCursors[prevCursors.length - 1],
                     offset: Math.max(0, (filters.offset || 0) - (filters.limit || 50)),
-                  })
-                }
+                  });
+                  setPrevCursors(prevCursors.slice(0, -1));
+                }}
               >
                 Previous
               </button>
@@ -424,10 +448,15 @@ export function PromptPlayground({ onBack, embedded = false }: Props) {
                 {Math.min((filters.offset || 0) + (filters.limit || 50), total)} of {total}
               </span>
               <button
-                disabled={(filters.offset || 0) + (filters.limit || 50) >= total}
-                onClick={() =>
-                  setFilters({ ...filters, offset: (filters.offset || 0) + (filters.limit || 50) })
-                }
+                disabled={!nextCursor}
+                onClick={() => {
+                  setPrevCursors([...prevCursors, filters.cursor]);
+                  setFilters({
+                    ...filters,
+                    cursor: nextCursor ?? undefined,
+                    offset: (filters.offset || 0) + (filters.limit || 50),
+                  });
+                }}
               >
                 Next
               </button>
@@ -60,14 +60,18 @@ export interface PlaygroundFilters {
   provider?: string;
   date_from?: string;
   date_to?: string;
+  q?: string;
   limit?: number;
   offset?: number;
+  /** Keyset cursor for the page starting at `offset` (undefined on page 1). */
+  cursor?: string;
 }
 
 export interface PlaygroundListResponse {
   success: boolean;
   captures: PlaygroundCapture[];
   total: number;
+  next_cursor: string | null;
   stats: PlaygroundStats;
 }
 
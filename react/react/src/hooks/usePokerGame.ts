@@ -14,6 +14,7 @@ import type { CashBustEvent, LobbyEvent } from '../components/cash/types';
 import type { RunoutSchedule } from '../types/runout';
 import { config } from '../config';
 import { logger } from '../utils/logger';
+import { applyStatePatch, type StatePatchFrame } from '../utils/statePatch';
 import { HAPTICS } from '../utils/haptics';
 import { onAppResume } from '../utils/nativeApp';
 import { useGameStore, selectGameState } from '../stores/gameStore';
@@ -150,6 +151,12 @@ export function usePokerGame({
   // beat that first carries each AI line (separate from messageIdsRef, which is
   // the apply-time display dedup).
   const enqueuedAiMsgIdsRef = useRef<Set<string>>(new Set());
+  // Last full socket frame *received* (not applied — the sequencer may still be
+  // holding it), the base the next `game_state_patch` applies to. Null until a
+  // full `update_game_state` frame arrives; a patch against any other base
+  // triggers one `request_full_state` resync (see flask_app/state_delta.py).
+  const lastFrameRef = useRef<GameState | null>(null);
+  const resyncRequestedRef = useRef(false);
   // Post-hand commentary timing. End-of-hand commentary is emitted ASAP by the
   // backend (async `new_message` pushes, seconds after the winner), which would
   // otherwise pop on screen WHILE the run-out / showdown is still animating. So
@@ -376,6 +383,9 @@ export function usePokerGame({
         clearAiThinkingTimeout();
         // Drop any in-flight sequencer timeline on disconnect
         resetSequencer();
+        // Frames may be missed while offline: resync from a full frame.
+        lastFrameRef.current = null;
+        resyncRequestedRef.current = false;
       });
 
       socket.on('player_joined', (_data: { message: string }) => {
@@ -388,13 +398,9 @@ export function usePokerGame({
         if (onSceneComplete) onSceneComplete();
       });
 
-      socket.on('update_game_state', (data: { game_state: GameState }) => {
-        if (!data?.game_state) {
-          logger.error('[SEQUENCER] Received invalid state update — missing game_state', { data });
-          return;
-        }
+      const enqueueFrame = (frame: GameState) => {
         clearAiThinkingTimeout();
-        const state = { ...data.game_state, messages: data.game_state.messages || [] };
+        const state = { ...frame, messages: frame.messages || [] };
         // Does this push carry new AI table talk? (messages are cumulative, so
         // track ids seen at enqueue time — independent of the apply-time dedup —
         // to flag the beat that first carries each AI line.) The sequencer floors
@@ -407,6 +413,39 @@ export function usePokerGame({
           }
         }
         enqueueState(state, commentary);
+      };
+
+      socket.on('update_game_state', (data: { game_state: GameState }) => {
+        if (!data?.game_state) {
+          logger.error('[SEQUENCER] Received invalid state update — missing game_state', { data });
+          return;
+        }
+        lastFrameRef.current = data.game_state;
+        resyncRequestedRef.current = false;
+        enqueueFrame(data.game_state);
+      });
+
+      // Delta frame: the changed paths since `base_version`. Only applies on
+      // top of exactly that frame; otherwise ask for one full resync frame.
+      socket.on('game_state_patch', (data: StatePatchFrame) => {
+        const base = lastFrameRef.current;
+        if (!base || base.state_version !== data?.base_version) {
+          if (!resyncRequestedRef.current && gameIdRef.current) {
+            resyncRequestedRef.current = true;
+            logger.debug('[SEQUENCER] Patch base mismatch — requesting full state', {
+              have: base?.state_version,
+              base: data?.base_version,
+            });
+            socket.emit('request_full_state', { game_id: gameIdRef.current });
+          }
+          return;
+        }
+        const frame = {
+          ...applyStatePatch(base, data.ops),
+          state_version: data.state_version,
+        };
+        lastFrameRef.current = frame;
+        enqueueFrame(frame);
       });
 
       // Listen for new message (singular - desktop format)
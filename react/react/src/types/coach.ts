@@ -19,6 +19,7 @@ export interface CoachStats {
   hand_rank: number | null;
   outs: number | null;
   outs_cards: string[] | null;
+  outs_by_class?: Record<string, number> | null; // Outs per resulting hand class
   recommendation: ActionRecommendation | null;
   raise_to: number | null; // Specific raise amount suggested by coach
   position: string | null;
@@ -0,0 +1,51 @@
+import { describe, it, expect } from 'vitest';
+import { applyStatePatch } from '../statePatch';
+
+const base = {
+  pot: { total: 150 },
+  players: [
+    { name: 'Alice', stack: 1000, bet: 0 },
+    { name: 'Bob', stack: 900, bet: 100 },
+  ],
+  messages: [{ id: '1' }, { id: '2' }],
+  flag: true,
+};
+
+describe('applyStatePatch', () => {
+  it('replaces nested values without mutating the base', () => {
+    const next = applyStatePatch(base, [
+      { op: 'replace', path: '/players/0/stack', value: 900 },
+      { op: 'replace', path: '/players/0/bet', value: 100 },
+      { op: 'replace', path: '/pot/total', value: 250 },
+    ]);
+    expect(next.players[0]).toEqual({ name: 'Alice', stack: 900, bet: 100 });
+    expect(next.pot.total).toBe(250);
+    expect(base.players[0].stack).toBe(1000);
+    expect(base.pot.total).toBe(150);
+  });
+
+  it('keeps untouched subtrees by reference', () => {
+    const next = applyStatePatch(base, [{ op: 'replace', path: '/players/0/bet', value: 50 }]);
+    expect(next.players[1]).toBe(base.players[1]);
+    expect(next.messages).toBe(base.messages);
+    expect(next.players).not.toBe(base.players);
+  });
+
+  it('slides an appended log window', () => {
+    const next = applyStatePatch(base, [
+      { op: 'remove', path: '/messages/0' },
+      { op: 'add', path: '/messages/-', value: { id: '3' } },
+    ]);
+    expect(next.messages).toEqual([{ id: '2' }, { id: '3' }]);
+    expect(base.messages).toHaveLength(2);
+  });
+
+  it('adds and removes object keys, decoding escaped tokens', () => {
+    const next = applyStatePatch(base as Record<string, unknown>, [
+      { op: 'remove', path: '/flag' },
+      { op: 'add', path: '/a~1b~0c', value: 1 },
+    ]);
+    expect(next).not.toHaveProperty('flag');
+    expect(next['a/b~c']).toBe(1);
+  });
+});
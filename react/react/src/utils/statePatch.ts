@@ -0,0 +1,81 @@
+/**
+ * Apply the backend's `game_state_patch` deltas (flask_app/state_delta.py).
+ *
+ * A patch is an RFC 6902 subset — `add` / `remove` / `replace` — that turns
+ * the full frame stamped `base_version` into the frame stamped
+ * `state_version`. It only applies on top of exactly that base: the caller
+ * checks the version and asks the server for a full frame
+ * (`request_full_state`) on any mismatch.
+ *
+ * Application is copy-on-write: only the containers along a changed path are
+ * cloned, so untouched subtrees (seats that didn't act, old chat lines) keep
+ * their identity and the store's structural sharing stays cheap.
+ */
+
+export interface StatePatchOp {
+  op: 'add' | 'remove' | 'replace';
+  path: string;
+  value?: unknown;
+}
+
+export interface StatePatchFrame {
+  game_id: string;
+  base_version: number;
+  state_version: number;
+  ops: StatePatchOp[];
+}
+
+type Container = Record<string, unknown> | unknown[];
+
+function decodeToken(token: string): string {
+  return token.replace(/~1/g, '/').replace(/~0/g, '~');
+}
+
+function shallowClone(node: Container): Container {
+  return Array.isArray(node) ? [...node] : { ...node };
+}
+
+function applyOp(root: unknown, op: StatePatchOp, cloned: Set<unknown>): unknown {
+  const tokens = op.path.split('/').slice(1).map(decodeToken);
+  if (tokens.length === 0) return op.value;
+
+  // Clone each container on the path once per patch (tracked in `cloned`) so a
+  // patch with many ops under one seat copies that seat a single time.
+  const ensureOwned = (node: Container): Container => {
+    if (cloned.has(node)) return node;
+    const copy = shallowClone(node);
+    cloned.add(copy);
+    return copy;
+  };
+
+  const newRoot = ensureOwned(root as Container);
+  let parent = newRoot;
+  for (const token of tokens.slice(0, -1)) {
+    const key = Array.isArray(parent) ? Number(token) : token;
+    const child = ensureOwned((parent as Record<string | number, unknown>)[key] as Container);
+    (parent as Record<string | number, unknown>)[key] = child;
+    parent = child;
+  }
+
+  const last = tokens[tokens.length - 1];
+  if (Array.isArray(parent)) {
+    if (op.op === 'add' && last === '-') parent.push(op.value);
+    else if (op.op === 'remove') parent.splice(Number(last), 1);
+    else parent[Number(last)] = op.value;
+  } else if (op.op === 'remove') {
+    delete parent[last];
+  } else {
+    parent[last] = op.value;
+  }
+  return newRoot;
+}
+
+/** Return `base` with `ops` applied; `base` itself is never mutated. */
+export function applyStatePatch<T>(base: T, ops: StatePatchOp[]): T {
+  const cloned = new Set<unknown>();
+  let doc: unknown = base;
+  for (const op of ops) {
+    doc = applyOp(doc, op, cloned);
+  }
+  return doc as T;
+}
@@ -9,10 +9,19 @@ consistent snapshot even while the app is writing, then verifies it with
 `PRAGMA integrity_check`, prunes to a daily retention window, and (optionally)
 ships the snapshot off-box.
 
+Avatar images live outside the DB in the content-addressed avatar store
+(`avatar_store/` next to the DB, see poker/avatar_store.py). Its files are
+write-once and named by hash, so the store is mirrored incrementally into
+`<dest>/avatar_store` (new files only, never pruned). The mirror is shipped
+with its own command, `--remote-avatar-cmd`: `rclone copy` of a directory
+copies its *contents*, so reusing the snapshot's destination would spill the
+hash-shard directories into the backup root.
+
 Usage:
     python3 scripts/backup_db.py /opt/poker/data/poker_games.db
     python3 scripts/backup_db.py <db> --dest <dir> --keep 7 \
-        --remote-cmd 'rclone copy {path} storagebox:poker-backups/'
+        --remote-cmd 'rclone copy {path} storagebox:poker-backups/' \
+        --remote-avatar-cmd 'rclone copy {path} storagebox:poker-backups/avatar_store/'
 
 Exit codes: 0 ok; 1 source missing / backup failed; 2 integrity check failed;
 3 off-box copy failed (local backup still succeeded). Non-zero is alertable —
@@ -21,6 +30,7 @@ wire it to the PRH-28 webhook from cron.
 Schedule (operator, on the prod box) — daily at 03:30, keep 7, ship off-box:
     30 3 * * * cd /opt/poker && python3 scripts/backup_db.py data/poker_games.db \
         --keep 7 --remote-cmd 'rclone copy {path} storagebox:poker-backups/' \
+        --remote-avatar-cmd 'rclone copy {path} storagebox:poker-backups/avatar_store/' \
         >> /var/log/poker-backup.log 2>&1
 """
 
@@ -28,6 +38,7 @@ import argparse
 import datetime
 import os
 import shlex
+import shutil
 import sqlite3
 import subprocess
 import sys
@@ -89,6 +100,25 @@ def prune(dest_dir: Path, src_name: str, keep: int) -> int:
     return deleted
 
 
+def mirror_avatar_store(store: Path, mirror: Path) -> int:
+    """Copy avatar-store files missing from `mirror`. Returns #copied.
+
+    Files are immutable and named by content hash, so "exists" means
+    "identical" and an incremental copy is a complete backup.
+    """
+    copied = 0
+    for path in store.rglob("*"):
+        if not path.is_file() or path.name.startswith(".tmp-"):
+            continue
+        target = mirror / path.relative_to(store)
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, target)
+        copied += 1
+    return copied
+
+
 def ship_off_box(path: Path, remote_cmd_template: str) -> bool:
     """Run the off-box copy command with {path} substituted. True on success."""
     cmd = remote_cmd_template.format(path=str(path))
@@ -115,6 +145,13 @@ def main(argv=None) -> int:
         help="off-box copy command template; {path} is substituted "
         "(or set BACKUP_REMOTE_CMD). Omit to keep backups on-box only.",
     )
+    parser.add_argument(
+        "--remote-avatar-cmd",
+        default=os.environ.get("BACKUP_REMOTE_AVATAR_CMD"),
+        help="off-box copy command template for the avatar-store mirror directory; "
+        "{path} is substituted (or set BACKUP_REMOTE_AVATAR_CMD). Give it its own "
+        "destination, e.g. 'rclone copy {path} storagebox:poker-backups/avatar_store/'.",
+    )
     args = parser.parse_args(argv)
 
     src = Path(args.src)
@@ -139,9 +176,23 @@ def main(argv=None) -> int:
     deleted = prune(dest_dir, src.name, args.keep)
     _log(f"retention: kept newest {args.keep}, deleted {deleted}")
 
+    store = Path(os.environ.get("AVATAR_STORE_DIR") or src.parent / "avatar_store")
+    mirror = dest_dir / "avatar_store"
+    if store.is_dir():
+        _log(f"avatar store: copied {mirror_avatar_store(store, mirror)} new file(s) to {mirror}")
+
     if args.remote_cmd:
         if not ship_off_box(snapshot, args.remote_cmd):
             return 3
+        if mirror.is_dir():
+            if args.remote_avatar_cmd:
+                if not ship_off_box(mirror, args.remote_avatar_cmd):
+                    return 3
+            else:
+                _log(
+                    "WARN no --remote-avatar-cmd / BACKUP_REMOTE_AVATAR_CMD set — the avatar "
+                    "store is backed up ON-BOX ONLY"
+                )
         _log("off-box copy: ok")
     else:
         _log(
@@ -11,10 +11,16 @@
 # (a new file, never touching the live DB) and scp's it down to ./data/.
 # It does NOT migrate, deploy, or restart anything.
 #
+# Avatar images are NOT in the DB: rows hold content hashes that point into the
+# avatar store (${PROD_DATA_ON_HOST}/avatar_store, see poker/avatar_store.py).
+# The store is rsync'd down to ./data/avatar_store — the local store the app
+# reads next to ./data/ DBs. Files are write-once and named by hash, so the
+# sync only fetches new ones and never overwrites.
+#
 # Usage:
 #   scripts/prod_db_backup.sh
 #
-# Requires: ssh access to the prod box. You will be prompted to confirm before
+# Requires: ssh access to the prod box and rsync. You will be prompted to confirm before
 # anything touches prod.
 
 set -euo pipefail
@@ -37,12 +43,13 @@ echo "   container:  $PROD_CONTAINER"
 echo "   source DB:  $PROD_DB_IN_CONTAINER"
 echo "   snapshot →  ${PROD_DATA_ON_HOST}/${BACKUP_NAME}  (on prod)"
 echo "   download →  ${LOCAL_PATH}  (local)"
+echo "   avatars  →  ${LOCAL_DIR}/avatar_store/  (rsync of ${PROD_DATA_ON_HOST}/avatar_store)"
 echo "=============================================================="
 read -r -p "This will SSH into prod and read the live DB. Continue? [y/N] " ok
 [ "$ok" = "y" ] || [ "$ok" = "Y" ] || { echo "Aborted."; exit 1; }
 
 echo
-echo "[1/4] Taking WAL-safe snapshot inside the container via SQLite backup API…"
+echo "[1/5] Taking WAL-safe snapshot inside the container via SQLite backup API…"
 ssh "$PROD_HOST" "docker exec -i $PROD_CONTAINER python - <<'PY'
 import sqlite3, sys
 src_path = '${PROD_DB_IN_CONTAINER}'
@@ -63,16 +70,27 @@ if ck != 'ok':
 PY"
 
 echo
-echo "[2/4] Verifying snapshot exists on prod host…"
+echo "[2/5] Verifying snapshot exists on prod host…"
 ssh "$PROD_HOST" "ls -lh ${PROD_DATA_ON_HOST}/${BACKUP_NAME}"
 
 echo
-echo "[3/4] Downloading snapshot to ${LOCAL_PATH}…"
+echo "[3/5] Downloading snapshot to ${LOCAL_PATH}…"
 mkdir -p "$LOCAL_DIR"
 scp "${PROD_HOST}:${PROD_DATA_ON_HOST}/${BACKUP_NAME}" "$LOCAL_PATH"
 
 echo
-echo "[4/4] Local integrity re-check after transfer…"
+echo "[4/5] Syncing the avatar store to ${LOCAL_DIR}/avatar_store/…"
+# Without it the snapshot's avatar rows point at files that don't exist locally.
+if ssh "$PROD_HOST" "test -d ${PROD_DATA_ON_HOST}/avatar_store"; then
+    mkdir -p "${LOCAL_DIR}/avatar_store"
+    rsync -a --ignore-existing --exclude '.tmp-*' \
+        "${PROD_HOST}:${PROD_DATA_ON_HOST}/avatar_store/" "${LOCAL_DIR}/avatar_store/"
+else
+    echo "   (no avatar store on prod yet — avatars are still inline in the DB)"
+fi
+
+echo
+echo "[5/5] Local integrity re-check after transfer…"
 # Run inside the local backend container so we use the same sqlite build.
 docker compose exec -T backend python - "$BACKUP_NAME" <<'PY'
 import sqlite3, sys
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+startup_report.py — where does backend startup time go?
+
+Boots the Flask app once in a child interpreter under ``python -X importtime``
+and reports:
+
+  * per-module import time — the slowest modules by cumulative time, and the
+    total self time per top-level package;
+  * per-step init time — ``flask_app.extensions.startup_timings`` for each
+    ``init_extensions`` step (persistence, YAML syncs, auth, ...);
+  * the wall time of ``create_app()`` and of the whole boot.
+
+Run it against a throwaway DB copy so it never migrates the real one:
+
+    python scripts/startup_report.py --db /tmp/poker_copy.db --top 25
+
+Exit code is 0 unless the child fails to boot.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_CHILD = """
+import json, time
+t0 = time.perf_counter()
+from flask_app import config
+config.DB_PATH = {db!r}
+from flask_app import create_app
+t1 = time.perf_counter()
+create_app()
+t2 = time.perf_counter()
+from flask_app.extensions import get_startup_report
+report = get_startup_report()
+report['import_ms'] = round((t1 - t0) * 1000, 1)
+report['create_app_ms'] = round((t2 - t1) * 1000, 1)
+print('STARTUP_REPORT ' + json.dumps(report))
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:") :].split("|")
+        rows.append((name.strip(), int(self_us), int(cum_us)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db", required=True, help="scratch DB path (created if missing)")
+    parser.add_argument("--top", type=int, default=20, help="rows per import table")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    env.pop("POKER_TEST_SCHEMA_TEMPLATE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD.format(db=args.db)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    report_line = next(
+        (ln for ln in proc.stdout.splitlines() if ln.startswith("STARTUP_REPORT ")), None
+    )
+    if proc.returncode != 0 or report_line is None:
+        sys.stderr.write(proc.stderr[-4000:])
+        print("App failed to boot", file=sys.stderr)
+        return 1
+    report = json.loads(report_line[len("STARTUP_REPORT ") :])
+    rows = parse_importtime(proc.stderr)
+
+    print(f"Import flask_app:    {report['import_ms']:8.1f} ms")
+    print(f"create_app():        {report['create_app_ms']:8.1f} ms")
+    print(f"  of which init_extensions steps: {report['total_ms']:.1f} ms")
+    for name, ms in report["steps_ms"].items():
+        print(f"    {name:<24}{ms:8.1f} ms")
+
+    print(f"\nSlowest modules (cumulative, top {args.top}):")
+    for name, _, cum in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"  {cum / 1000:8.1f} ms  {name}")
+
+    by_package: Counter = Counter()
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    print(f"\nSelf import time by top-level package (top {args.top}):")
+    for package, self_us in by_package.most_common(args.top):
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Avatar serving from the content-addressed store: ETag / 304, size variants."""
+
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from flask_app.routes.image_routes import image_bp
+from poker.avatar_store import AvatarStore
+
+pytestmark = pytest.mark.flask
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AvatarStore(str(tmp_path / "avatar_store"))
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(image_bp)
+    return app.test_client()
+
+
+def _stored(store, data):
+    digest = store.put(data)
+    return {
+        'hash': digest,
+        'content_type': 'image/png',
+        'path': str(store.path(digest)),
+        'data': None,
+    }
+
+
+def test_serves_store_file_with_etag_and_304(client, store):
+    avatar = _stored(store, b"\x89PNG\r\n\x1a\nicon")
+    with patch('flask_app.routes.image_routes.get_avatar_file', return_value=avatar):
+        first = client.get('/api/avatar/Bob/happy')
+        assert first.status_code == 200
+        assert first.data == b"\x89PNG\r\n\x1a\nicon"
+        assert first.headers['ETag'] == f'"{avatar["hash"]}"'
+        assert first.headers['Cache-Control'] == 'public, max-age=86400'
+
+        again = client.get(
+            '/api/avatar/Bob/happy', headers={'If-None-Match': first.headers['ETag']}
+        )
+        assert again.status_code == 304
+        assert again.data == b""
+
+
+@pytest.mark.parametrize(
+    'data,mimetype',
+    [
+        (b"\xff\xd8\xffjpeg", 'image/jpeg'),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", 'image/webp'),
+        (b"\x89PNG\r\n\x1a\npng", 'image/png'),
+    ],
+)
+def test_store_file_mimetype_is_sniffed(client, store, data, mimetype):
+    # Rows record 'image/png' whatever was uploaded; the bytes decide.
+    avatar = _stored(store, data)
+    with patch('flask_app.routes.image_routes.get_avatar_file', return_value=avatar):
+        response = client.get('/api/avatar/Bob/happy/full')
+    assert response.status_code == 200
+    assert response.mimetype == mimetype
+
+
+def test_inline_bytes_also_get_etag(client):
+    avatar = {
+        'hash': 'abc123',
+        'content_type': 'image/png',
+        'path': None,
+        'data': b"\x89PNG\r\n\x1a\n",
+    }
+    with patch('flask_app.routes.image_routes.get_avatar_file', return_value=avatar):
+        response = client.get('/api/avatar/Bob/happy/full', headers={'If-None-Match': '"abc123"'})
+    assert response.status_code == 304
+
+
+def test_size_is_passed_through(client, store):
+    avatar = _stored(store, b"\x89PNG\r\n\x1a\nsmall")
+    with patch('flask_app.routes.image_routes.get_avatar_file', return_value=avatar) as lookup:
+        response = client.get('/api/avatar/Bob/happy?size=64')
+    assert response.status_code == 200
+    lookup.assert_called_with('Bob', 'happy', 'icon', 64)
+
+
+def test_missing_variant_is_rendered_once_from_the_original(tmp_path):
+    import io
+
+    from PIL import Image
+
+    from poker.character_images import CharacterImageService
+    from poker.image_processing import process_avatar_image
+    from poker.repositories.personality_repository import PersonalityRepository
+    from poker.repositories.schema_manager import SchemaManager
+
+    db_path = str(tmp_path / 'avatars.db')
+    SchemaManager(db_path).ensure_schema()
+    repo = PersonalityRepository(db_path)
+    repo.save_personality('Bob', {})
+    buf = io.BytesIO()
+    Image.new('RGB', (512, 512), (200, 10, 10)).save(buf, 'PNG')
+    icon, full, _, _ = process_avatar_image(buf.getvalue())
+    repo.save_avatar_image('Bob', 'happy', icon, full_image_data=full)  # no variants
+
+    service = CharacterImageService(personality_repo=repo)
+    avatar = service.get_avatar_file('Bob', 'happy', 'icon', 64)
+    assert Image.open(avatar['path']).size == (64, 64)
+    assert repo.get_avatar_file('Bob', 'happy', 'full', 256) is not None  # stored for next time
+
+    # Sizes outside the variant set serve the original.
+    assert (
+        service.get_avatar_file('Bob', 'happy', 'icon', 999)['hash']
+        == (repo.get_avatar_file('Bob', 'happy')['hash'])
+    )
+    repo.close()
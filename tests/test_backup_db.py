@@ -0,0 +1,112 @@
+"""Tests for scripts/backup_db.py off-box shipping of the snapshot and avatar store."""
+
+from __future__ import annotations
+
+import importlib.util
+import sqlite3
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_PATH = REPO_ROOT / "scripts" / "backup_db.py"
+
+
+def _load_backup_module():
+    """Load the script via importlib; `scripts/` isn't on the Python path."""
+    spec = importlib.util.spec_from_file_location("backup_db", SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def backup_db():
+    return _load_backup_module()
+
+
+@pytest.fixture
+def live_db(tmp_path, monkeypatch):
+    monkeypatch.delenv("BACKUP_REMOTE_CMD", raising=False)
+    monkeypatch.delenv("BACKUP_REMOTE_AVATAR_CMD", raising=False)
+    monkeypatch.delenv("AVATAR_STORE_DIR", raising=False)
+    db = tmp_path / "poker_games.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE t (x)")
+    conn.commit()
+    conn.close()
+    shard = tmp_path / "avatar_store" / "ab"
+    shard.mkdir(parents=True)
+    (shard / "abcdef.png").write_bytes(b"png")
+    return db
+
+
+@pytest.fixture
+def ran(monkeypatch):
+    commands = []
+
+    def fake_run(argv, **kwargs):
+        commands.append(argv)
+        return subprocess.CompletedProcess(argv, 0, "", "")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return commands
+
+
+def test_avatar_mirror_ships_to_its_own_destination(backup_db, live_db, ran, tmp_path):
+    dest = tmp_path / "backups"
+    rc = backup_db.main(
+        [
+            str(live_db),
+            "--dest",
+            str(dest),
+            "--remote-cmd",
+            "rclone copy {path} storagebox:poker-backups/",
+            "--remote-avatar-cmd",
+            "rclone copy {path} storagebox:poker-backups/avatar_store/",
+        ]
+    )
+    assert rc == 0
+    (snapshot,) = dest.glob("poker_games.db.backup_*")
+    assert ran == [
+        ["rclone", "copy", str(snapshot), "storagebox:poker-backups/"],
+        ["rclone", "copy", str(dest / "avatar_store"), "storagebox:poker-backups/avatar_store/"],
+    ]
+    assert (dest / "avatar_store" / "ab" / "abcdef.png").read_bytes() == b"png"
+
+
+def test_avatar_mirror_not_shipped_with_snapshot_command(backup_db, live_db, ran, tmp_path):
+    rc = backup_db.main(
+        [
+            str(live_db),
+            "--dest",
+            str(tmp_path / "backups"),
+            "--remote-cmd",
+            "rclone copy {path} storagebox:poker-backups/",
+        ]
+    )
+    assert rc == 0
+    assert len(ran) == 1
+    assert ran[0][2].startswith(str(tmp_path / "backups" / "poker_games.db.backup_"))
+
+
+def test_avatar_ship_failure_exits_3(backup_db, live_db, monkeypatch, tmp_path):
+    def fake_run(argv, **kwargs):
+        rc = 1 if argv[-1].endswith("avatar_store/") else 0
+        return subprocess.CompletedProcess(argv, rc, "", "boom")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    rc = backup_db.main(
+        [
+            str(live_db),
+            "--dest",
+            str(tmp_path / "backups"),
+            "--remote-cmd",
+            "rclone copy {path} remote:b/",
+            "--remote-avatar-cmd",
+            "rclone copy {path} remote:b/avatar_store/",
+        ]
+    )
+    assert rc == 3
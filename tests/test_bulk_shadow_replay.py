@@ -0,0 +1,163 @@
+"""Tests for experiments/bulk_shadow_replay.py.
+
+The bulk path (export to a columnar file, dedup, replay in workers) must
+report the same per-rule numbers as running `shadow_eval` game by game on
+the same rows.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+
+import pytest
+
+from experiments.analyze_intervention_traces import shadow_eval
+from experiments.bulk_shadow_replay import (
+    SnapshotColumns,
+    bulk_shadow_eval,
+    export_snapshots,
+    main,
+    parse_arm,
+)
+from poker.repositories.decision_analysis_repository import DecisionAnalysisRepository
+from poker.repositories.schema_manager import SchemaManager
+from poker.strategy import phase_7_5_config as cfg
+
+ANCHORS = {
+    'baseline_aggression': 0.9,
+    'baseline_looseness': 0.7,
+    'ego': 0.6,
+    'poise': 0.5,
+    'expressiveness': 0.5,
+    'risk_identity': 0.6,
+    'adaptation_bias': 0.5,
+    'baseline_energy': 0.5,
+    'recovery_rate': 0.15,
+}
+ARMS = ['personality.default', 'math_floor.default', 'personality.default+math_floor.default']
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    cfg.reset_for_testing()
+    yield
+    cfg.reset_for_testing()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'bulk_replay.db')
+    SchemaManager(path).ensure_schema()
+    return path
+
+
+def _snapshot(rng: random.Random) -> dict:
+    fold = rng.choice([0.2, 0.5, 0.7])
+    snapshot = {
+        'phase': 'POSTFLOP',
+        'base_strategy_probs': {'fold': fold, 'call': round(1.0 - fold, 2)},
+        'legal_actions': ['fold', 'call'],
+        'cost_to_call': 100,
+        'pot_total': rng.choice([300, 5000]),
+        'player_stack': 400,
+        'player_bet': rng.choice([0, 800]),
+        'big_blind': 100,
+    }
+    if rng.random() < 0.5:
+        snapshot['anchors'] = ANCHORS
+        snapshot['emotional_state'] = {'state': 'composed', 'severity': 'none', 'intensity': 0.0}
+        snapshot['deviation_profile_name'] = rng.choice(['lag', 'nit'])
+    return snapshot
+
+
+def _populate(db_path: str, games: int = 3, decisions: int = 40) -> None:
+    rng = random.Random(11)
+    conn = sqlite3.connect(db_path)
+    try:
+        for g in range(games):
+            conn.execute(
+                "INSERT INTO games "
+                "(game_id, phase, num_players, pot_size, game_state_json, owner_id) "
+                "VALUES (?, 'FLOP', 2, 0.0, '{}', 'test')",
+                (f'g{g}',),
+            )
+            for h in range(decisions):
+                snap = json.dumps(_snapshot(rng)) if h % 13 else '{not json'
+                conn.execute(
+                    "INSERT INTO player_decision_analysis "
+                    "(game_id, player_name, hand_number, phase, action_taken, "
+                    "strategy_pipeline_snapshot_json) VALUES (?, 'Hero', ?, 'FLOP', 'call', ?)",
+                    (f'g{g}', h, snap),
+                )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _export(db_path, tmp_path, **filters):
+    path = str(tmp_path / 'snapshots.npz')
+    summary = export_snapshots(DecisionAnalysisRepository(db_path), path, **filters)
+    return path, summary
+
+
+def test_export_round_trips_snapshots(db_path, tmp_path):
+    _populate(db_path)
+    path, summary = _export(db_path, tmp_path)
+    assert summary['rows'] == 3 * 40 - 3 * 4
+    assert summary['skipped_malformed'] == 3 * 4
+
+    repo = DecisionAnalysisRepository(db_path)
+    columns = SnapshotColumns.load(path)
+    for row in range(len(columns)):
+        stored = repo.get_strategy_pipeline_snapshot(int(columns.analysis_ids[row]))
+        assert columns.snapshot(row) == stored
+        assert list(columns.snapshot(row)['base_strategy_probs']) == ['fold', 'call']
+
+    path, summary = _export(db_path, tmp_path, game_ids=['g1'])
+    assert summary['games'] == 1
+    assert summary['rows'] == 40 - 4
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_bulk_matches_per_game_shadow_eval(db_path, tmp_path, workers):
+    _populate(db_path)
+    path, _ = _export(db_path, tmp_path)
+    arms = [parse_arm(spec) for spec in ARMS]
+    report = bulk_shadow_eval(path, arms, workers=workers, chunk_size=3)
+
+    assert report['total_decisions'] == report['evaluated_decisions'] == 108
+    assert report['unique_snapshots'] < report['total_decisions']
+
+    repo = DecisionAnalysisRepository(db_path)
+    by_arm = {r['disable_rule']: r for r in report['arms']}
+    for spec in ARMS[:2]:
+        layer, rule_id = spec.split('.')
+        per_game = [shadow_eval(repo, f'g{g}', (layer, rule_id)) for g in range(3)]
+        evaluated = sum(r['evaluated_decisions'] for r in per_game)
+        mean = sum(r['mean_l1_distance'] * r['evaluated_decisions'] for r in per_game) / evaluated
+        assert evaluated == 108
+        assert by_arm[spec]['mean_l1_distance'] == pytest.approx(mean, abs=1e-3)
+        assert by_arm[spec]['max_l1_distance'] == max(r['max_l1_distance'] for r in per_game)
+        assert by_arm[spec]['action_flips'] == sum(r['action_flips'] for r in per_game)
+        assert by_arm[spec]['affected_decisions'] > 0
+
+    both = by_arm['math_floor.default+personality.default']
+    assert both['affected_decisions'] >= by_arm['math_floor.default']['affected_decisions']
+
+
+def test_replay_game_filter_and_cli(db_path, tmp_path, capsys):
+    _populate(db_path)
+    path = str(tmp_path / 'cli.npz')
+    assert main(['export', '--db', db_path, '--out', path]) == 0
+    capsys.readouterr()
+
+    argv = ['replay', '--snapshots', path, '--game-id', 'g2', '--workers', '1']
+    assert main(argv + ['--rule', 'math_floor.default', '--output', 'json']) == 0
+    report = json.loads(capsys.readouterr().out)
+    expected = shadow_eval(DecisionAnalysisRepository(db_path), 'g2', ('math_floor', 'default'))
+    assert report['evaluated_decisions'] == expected['evaluated_decisions']
+    assert report['arms'][0]['action_flips'] == expected['action_flips']
+
+    assert main(argv + ['--rule', 'math_floor']) == 2
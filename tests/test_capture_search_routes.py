@@ -0,0 +1,82 @@
+"""Query validation for the capture search and playground listing routes."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask_app import create_app
+from poker.repositories import create_repos
+
+
+class TestCaptureSearchRoutes(unittest.TestCase):
+    def setUp(self):
+        self.test_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.test_db.close()
+        self.repos = create_repos(self.test_db.name)
+
+        def mock_init_persistence():
+            import flask_app.extensions as ext
+
+            ext.game_repo = self.repos['game_repo']
+            ext.user_repo = self.repos['user_repo']
+            ext.settings_repo = self.repos['settings_repo']
+            ext.personality_repo = self.repos['personality_repo']
+            ext.experiment_repo = self.repos['experiment_repo']
+            ext.prompt_capture_repo = self.repos['prompt_capture_repo']
+            ext.decision_analysis_repo = self.repos['decision_analysis_repo']
+            ext.prompt_preset_repo = self.repos['prompt_preset_repo']
+            ext.capture_label_repo = self.repos['capture_label_repo']
+            ext.replay_experiment_repo = self.repos['replay_experiment_repo']
+            ext.llm_repo = self.repos['llm_repo']
+            ext.guest_tracking_repo = self.repos['guest_tracking_repo']
+            ext.hand_history_repo = self.repos['hand_history_repo']
+            ext.tournament_repo = self.repos['tournament_repo']
+            ext.coach_repo = self.repos['coach_repo']
+            ext.persistence_db_path = self.repos['db_path']
+
+        with patch('flask_app.extensions.init_persistence', mock_init_persistence):
+            self.app = create_app()
+        self.app.testing = True
+        self.client = self.app.test_client()
+
+        authz = MagicMock()
+        authz.auth_manager.get_current_user.return_value = {'id': 'admin-1', 'name': 'Admin'}
+        authz.has_permission.return_value = True
+        auth_patch = patch('poker.authorization.authorization_service', authz)
+        auth_patch.start()
+        self.addCleanup(auth_patch.stop)
+
+    def tearDown(self):
+        for repo in self.repos.values():
+            if hasattr(repo, 'close'):
+                repo.close()
+        os.unlink(self.test_db.name)
+
+    def test_malformed_cursor_is_a_400(self):
+        for path in (
+            '/api/captures/search?cursor=garbage',
+            '/api/captures/search?cursor=2026-01-01|x',
+            '/admin/api/playground/captures?cursor=garbage',
+        ):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 400, path)
+            self.assertEqual(response.get_json()['error'], 'Invalid cursor')
+
+    def test_well_formed_cursor_pages(self):
+        response = self.client.get('/api/captures/search?cursor=2026-01-01 00:00:00|5')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['captures'], [])
+
+    def test_labels_reject_search_and_cursor(self):
+        for query in ('q=shove', 'cursor=2026-01-01 00:00:00|5'):
+            response = self.client.get(f'/api/captures/search?labels=bluff&{query}')
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn('not supported with labels', response.get_json()['error'])
+
+        response = self.client.get('/api/captures/search?labels=bluff')
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -386,6 +386,62 @@ def test_greedy_skips_seeker_with_no_candidate():
     assert tables["t"].open_count == 1
 
 
+def _random_casino(rng, n_seekers, n_tables):
+    tables = {}
+    for k in range(n_tables):
+        stake = rng.choice(STAKES_ORDER[:6])
+        tables[f"t{k:03d}"] = _table(
+            f"t{k:03d}",
+            stake=stake,
+            opens=rng.randint(0, 4),
+            grinders=rng.randint(0, 5),
+            fish=rng.choice([0, 0, rng.randint(1, 5_000)]),
+            whale=rng.choice([0, 0, 0, rng.randint(1, 20_000)]),
+            marquee=rng.choice([0.0, rng.random()]),
+        )
+        if rng.random() < 0.3:
+            tables[f"t{k:03d}"].venue_appeal = 0.5
+    ids = sorted(tables)
+    seekers = []
+    for i in range(n_seekers):
+        allowed = set(rng.sample(ids, rng.randint(0, len(ids))))
+        seeker = _seeker(
+            f"p{i:03d}",
+            allowed | {"missing"},
+            bankroll=rng.choice([50, 800, 5_000, 40_000, 300_000]) + rng.randint(0, 999),
+            comfort=rng.choice(STAKES_ORDER[:6] + ["unknown"]),
+            mult=rng.choice([1.0, 1.5, 2.5]),
+            appetite=rng.choice([0.0, rng.random()]),
+        )
+        seeker.net_by_table.update(
+            {tid: rng.randint(-9_000, 9_000) for tid in allowed if rng.random() < 0.3}
+        )
+        seekers.append(seeker)
+    return seekers, tables
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_greedy_matrix_scorer_matches_scalar_loop(seed):
+    """The NumPy scorer must give the scalar loop's exact assignments (and
+    leave the tables in the same state) — incl. exact-tie breaking."""
+    import copy
+    import random
+
+    rng = random.Random(seed)
+    seekers, tables = _random_casino(rng, rng.randint(1, 60), rng.randint(1, 25))
+    if seed % 4 == 0:  # identical tables → exact score ties
+        tables = {tid: _table(tid, opens=2, fish=900) for tid in tables}
+    scalar_tables = copy.deepcopy(tables)
+
+    scalar = assign_seats_greedy(seekers, scalar_tables, vectorized=False)
+    matrix = assign_seats_greedy(seekers, tables, vectorized=True)
+
+    assert matrix == scalar
+    assert {t: (v.open_count, v.grinder_count) for t, v in tables.items()} == {
+        t: (v.open_count, v.grinder_count) for t, v in scalar_tables.items()
+    }
+
+
 # --- B4: occupant prestige / status appetite (the marquee pull) -------------
 
 
@@ -0,0 +1,190 @@
+"""Per-tick lobby world snapshot: bulk loaders agree with the single-row
+reads, bound repos serve from the snapshot and write through to it, writes
+inside a transaction are repaired on the next read, and `verify` catches an
+out-of-band DB change."""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from cash_mode.bankroll import AIBankrollState
+from cash_mode.lobby import ensure_lobby_seeded, refresh_unseated_tables
+from cash_mode.world_snapshot import MISS, bind_world_snapshot, load_world_snapshot
+from core.economy.ledger import ai
+from poker.repositories.bankroll_repository import BankrollRepository
+from poker.repositories.cash_table_repository import CashTableRepository
+from poker.repositories.chip_ledger_repository import ChipLedgerRepository
+from poker.repositories.personality_repository import PersonalityRepository
+from poker.repositories.schema_manager import SchemaManager
+from poker.repositories.stake_repository import StakeRepository
+
+SANDBOX = "snap-sandbox"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "world_snapshot.db")
+    SchemaManager(path).ensure_schema()
+    return path
+
+
+@pytest.fixture
+def repos(db_path):
+    ledger = ChipLedgerRepository(db_path)
+    bankroll = BankrollRepository(db_path)
+    bankroll.chip_ledger_repo = ledger
+    return {
+        "bankroll_repo": bankroll,
+        "chip_ledger_repo": ledger,
+        "cash_table_repo": CashTableRepository(db_path),
+        "personality_repo": PersonalityRepository(db_path),
+        "stake_repo": StakeRepository(db_path),
+    }
+
+
+def _seed(db_path, repos, pid, name, chips, cap=200_000):
+    config_json = json.dumps(
+        {
+            "bankroll_knobs": {
+                "starting_bankroll": cap,
+                "bankroll_rate": 500,
+                "buy_in_multiplier": 1.0,
+                "stake_comfort_zone": "$10",
+            },
+        }
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO personalities "
+            "(name, personality_id, config_json, visibility, circulating) "
+            "VALUES (?, ?, ?, 'public', 1)",
+            (name, pid, config_json),
+        )
+    repos["bankroll_repo"].save_ai_bankroll(
+        AIBankrollState(personality_id=pid, chips=chips, last_regen_tick=datetime.utcnow()),
+        sandbox_id=SANDBOX,
+        chip_ledger_repo=repos["chip_ledger_repo"],
+    )
+
+
+def _snapshot(repos):
+    return load_world_snapshot(
+        sandbox_id=SANDBOX,
+        bankroll_repo=repos["bankroll_repo"],
+        personality_repo=repos["personality_repo"],
+        stake_repo=repos["stake_repo"],
+    )
+
+
+def _verify(world, repos):
+    return world.verify(
+        bankroll_repo=repos["bankroll_repo"],
+        personality_repo=repos["personality_repo"],
+        stake_repo=repos["stake_repo"],
+    )
+
+
+def test_bulk_loaders_match_single_row_reads(db_path, repos):
+    for i, chips in enumerate([1_000, 25_000, 0]):
+        _seed(db_path, repos, f"p_{i}", f"Pers{i}", chips)
+    bankroll, ledger = repos["bankroll_repo"], repos["chip_ledger_repo"]
+    pids = ["p_0", "p_1", "p_2"]
+
+    rows = bankroll.load_ai_bankroll_rows(sandbox_id=SANDBOX)
+    assert [r["personality_id"] for r in rows] == pids
+    for row in rows:
+        single = bankroll.load_ai_bankroll(row["personality_id"], sandbox_id=SANDBOX)
+        assert row["chips"] == single.chips
+        assert row["last_regen_tick"] == single.last_regen_tick
+
+    accounts = [ai(pid) for pid in pids] + ["ai:nobody"]
+    assert ledger.balances_of(accounts, sandbox_id=SANDBOX) == {
+        a: ledger.balance_of(a, sandbox_id=SANDBOX) for a in accounts
+    }
+    assert bankroll.load_personality_knobs_for_pids(pids) == {
+        pid: bankroll.load_personality_knobs(pid) for pid in pids
+    }
+    assert repos["personality_repo"].display_names_by_ids(pids) == {
+        "p_0": "Pers0",
+        "p_1": "Pers1",
+        "p_2": "Pers2",
+    }
+
+
+def test_bound_repo_serves_snapshot_and_writes_through(db_path, repos):
+    _seed(db_path, repos, "p_0", "Pers0", 5_000)
+    bankroll = repos["bankroll_repo"]
+    world = _snapshot(repos)
+
+    with bind_world_snapshot(world):
+        # Served from the snapshot: the repo doesn't touch the DB.
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE ai_bankroll_state SET emotional_state_json = '{}'")
+        assert bankroll.load_emotional_state_json("p_0", sandbox_id=SANDBOX) is None
+
+        bankroll.save_emotional_state_json("p_0", '{"energy": 0.4}', sandbox_id=SANDBOX)
+        assert bankroll.load_emotional_state_json("p_0", sandbox_id=SANDBOX) == '{"energy": 0.4}'
+        assert world.name_for("p_0") == "Pers0"
+
+    assert _verify(world, repos) == []
+
+
+def test_writes_inside_transaction_are_repaired_on_read(db_path, repos):
+    _seed(db_path, repos, "p_0", "Pers0", 5_000)
+    bankroll = repos["bankroll_repo"]
+    world = _snapshot(repos)
+    later = AIBankrollState(personality_id="p_0", chips=5_000, last_regen_tick=datetime.utcnow())
+
+    with bind_world_snapshot(world):
+        with bankroll.transaction():
+            bankroll.save_ai_bankroll(later, sandbox_id=SANDBOX)
+        assert world.ai_bankroll("p_0", SANDBOX) is MISS
+        assert world.chips_stale[world.index["p_0"]]
+
+        state = bankroll.load_ai_bankroll("p_0", sandbox_id=SANDBOX)
+        assert state.last_regen_tick == later.last_regen_tick
+        assert not world.chips_stale[world.index["p_0"]]
+
+    assert _verify(world, repos) == []
+
+
+def test_verify_reports_out_of_band_writes(db_path, repos):
+    _seed(db_path, repos, "p_0", "Pers0", 5_000)
+    world = _snapshot(repos)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE ai_bankroll_state SET bankruptcy_count = 3")
+
+    problems = _verify(world, repos)
+    assert len(problems) == 1
+    assert problems[0].startswith("bankruptcy_count p_0")
+
+
+def test_refresh_with_snapshot_stays_coherent(db_path, repos, caplog):
+    for i in range(12):
+        _seed(db_path, repos, f"p_{i}", f"Pers{i}", 200_000, cap=500_000)
+    ensure_lobby_seeded(
+        cash_table_repo=repos["cash_table_repo"],
+        personality_repo=repos["personality_repo"],
+        bankroll_repo=repos["bankroll_repo"],
+        sandbox_id=SANDBOX,
+    )
+
+    rng = random.Random(7)
+    with caplog.at_level(logging.ERROR, logger="cash_mode.lobby"):
+        for _ in range(10):
+            refresh_unseated_tables(
+                cash_table_repo=repos["cash_table_repo"],
+                personality_repo=repos["personality_repo"],
+                bankroll_repo=repos["bankroll_repo"],
+                chip_ledger_repo=repos["chip_ledger_repo"],
+                stake_repo=repos["stake_repo"],
+                rng=rng,
+                sandbox_id=SANDBOX,
+            )
+    assert "world snapshot diverged" not in caplog.text
@@ -313,3 +313,33 @@ class TestAssistant:
         call_kwargs = mock_client.chat.completions.create.call_args[1]
         assert call_kwargs["response_format"] == {"type": "json_object"}
         assert response == '{"action": "raise", "amount": 100}'
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_stable_context_rides_in_system_prefix(self, mock_openai_class, usage_tracker):
+        """stable_context is sent after the system prompt but never stored in memory."""
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = '{"action": "fold"}'
+        mock_response.choices[0].finish_reason = "stop"
+        mock_response.usage = Mock()
+        mock_response.usage.prompt_tokens = 10
+        mock_response.usage.completion_tokens = 5
+        mock_response.usage.completion_tokens_details = None
+        mock_response.usage.prompt_tokens_details = None
+        mock_client.chat.completions.create.return_value = mock_response
+
+        assistant = Assistant(system_prompt="You are Batman.", tracker=usage_tracker)
+        assistant.chat("State 1", stable_context="RULES")
+        assistant.chat("State 2", stable_context="RULES")
+
+        first, second = (c[1] for c in mock_client.chat.completions.create.call_args_list)
+        assert first["messages"][0] == {"role": "system", "content": "You are Batman.\n\nRULES"}
+        assert first["messages"][0] == second["messages"][0]
+        assert second["messages"][-1] == {"role": "user", "content": "State 2"}
+        # Identical system prefix -> identical cache key
+        assert first["extra_body"]["prompt_cache_key"] == second["extra_body"]["prompt_cache_key"]
+        assert assistant.system_message == "You are Batman."
+        assert all("RULES" not in m["content"] for m in assistant.memory.get_history())
@@ -136,3 +136,50 @@ class TestCallType:
         assert isinstance(CallType.PLAYER_DECISION, str)
         assert CallType.PLAYER_DECISION.value == "player_decision"
         assert "player_decision" in f"{CallType.PLAYER_DECISION.value}"
+
+
+class TestAnthropicPromptCache:
+    """Anthropic cache breakpoint + usage normalisation."""
+
+    @patch('core.llm.providers.anthropic.anthropic.Anthropic')
+    def test_system_prompt_marked_cacheable(self, mock_anthropic_class):
+        from core.llm.providers.anthropic import AnthropicProvider
+
+        provider = AnthropicProvider(api_key="x")
+        provider.complete(
+            messages=[
+                {"role": "system", "content": "Persona and rules"},
+                {"role": "user", "content": "State"},
+            ]
+        )
+        kwargs = mock_anthropic_class.return_value.messages.create.call_args[1]
+        assert kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "Persona and rules",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert kwargs["messages"] == [{"role": "user", "content": "State"}]
+
+    @patch('core.llm.providers.anthropic.anthropic.Anthropic')
+    def test_usage_counts_cache_reads_as_input(self, mock_anthropic_class):
+        from core.llm.providers.anthropic import AnthropicProvider
+
+        raw = Mock()
+        raw.content = []
+        raw.usage = Mock(
+            spec=[
+                'input_tokens',
+                'output_tokens',
+                'cache_read_input_tokens',
+                'cache_creation_input_tokens',
+            ],
+            input_tokens=40,
+            output_tokens=7,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=0,
+        )
+        usage = AnthropicProvider(api_key="x").extract_usage(raw)
+        assert usage["input_tokens"] == 1540
+        assert usage["cached_tokens"] == 1500
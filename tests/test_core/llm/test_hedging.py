@@ -0,0 +1,198 @@
+"""Hedged / failover completions (core.llm.hedging)."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.llm import CallType, LLMClient, LLMResponse
+from core.llm.hedging import HedgePolicy, hedge_stats, run_hedged
+
+pytestmark = pytest.mark.llm
+
+
+def _response(provider, status="ok"):
+    return LLMResponse(
+        content="hi" if status == "ok" else "",
+        model=f"{provider}-model",
+        provider=provider,
+        input_tokens=1,
+        output_tokens=1,
+        latency_ms=1,
+        status=status,
+    )
+
+
+def _call(provider, delay=0.0, status="ok", calls=None):
+    def fn():
+        if calls is not None:
+            calls.append(provider)
+        time.sleep(delay)
+        return _response(provider, status)
+
+    return fn
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    hedge_stats.reset()
+    yield
+    hedge_stats.reset()
+
+
+class TestRunHedged:
+    def test_fast_primary_never_hedges(self):
+        calls = []
+        result = run_hedged(_call("primary", calls=calls), _call("secondary", calls=calls), 1.0)
+        assert result.provider == "primary"
+        assert calls == ["primary"]
+        assert hedge_stats.snapshot()['primary_fast'] == 1
+
+    def test_slow_primary_loses_to_secondary(self):
+        result = run_hedged(_call("primary", delay=1.0), _call("secondary"), 0.05)
+        assert result.provider == "secondary"
+        stats = hedge_stats.snapshot()
+        assert stats['hedged'] == 1 and stats['secondary_won'] == 1
+
+    def test_slow_primary_can_still_win(self):
+        result = run_hedged(_call("primary", delay=0.1), _call("secondary", delay=1.0), 0.05)
+        assert result.provider == "primary"
+        assert hedge_stats.snapshot()['primary_won'] == 1
+
+    def test_failed_secondary_waits_for_primary(self):
+        result = run_hedged(_call("primary", delay=0.2), _call("secondary", status="error"), 0.05)
+        assert result.provider == "primary"
+
+    def test_fast_failure_fails_over(self):
+        result = run_hedged(_call("primary", status="error"), _call("secondary"), 1.0)
+        assert result.provider == "secondary"
+        stats = hedge_stats.snapshot()
+        assert stats['failover'] == 1 and stats['failover_ok'] == 1
+
+    def test_both_fail_returns_primary_error(self):
+        result = run_hedged(
+            _call("primary", status="error"), _call("secondary", status="error"), 1.0
+        )
+        assert result.provider == "primary"
+        assert result.status == "error"
+        assert hedge_stats.snapshot()['all_failed'] == 1
+
+    def test_raising_callable_counts_as_failure(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        assert run_hedged(boom, _call("secondary"), 1.0).provider == "secondary"
+
+
+class TestHedgePolicy:
+    def test_explicit_call_type_delay_wins(self):
+        policy = HedgePolicy(provider="groq", call_type_delays={"player_decision": 2.5})
+        assert policy.delay_for("openai", "gpt", "player_decision") == 2.5
+
+    def test_default_without_observations(self):
+        policy = HedgePolicy(provider="groq", delay_seconds=4.0)
+        assert policy.delay_for("openai", "never-seen", "player_decision") == 4.0
+
+
+class TestClientHedging:
+    def _fake_once(self, delays, calls):
+        def fake(client, **kwargs):
+            calls.append((client.model, threading.current_thread().name))
+            time.sleep(delays[client.model])
+            return _response(client.model)
+
+        return fake
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_slow_primary_is_hedged_to_secondary(self, mock_openai_class, usage_tracker):
+        calls = []
+        policy = HedgePolicy(provider="openai", model="backup", delay_seconds=0.05)
+        client = LLMClient(model="main", tracker=usage_tracker, hedge=policy)
+        fake = self._fake_once({"main": 1.0, "backup": 0.0}, calls)
+        with patch.object(LLMClient, '_complete_once', autospec=True, side_effect=fake):
+            response = client.complete(
+                messages=[{"role": "user", "content": "hi"}],
+                call_type=CallType.PLAYER_DECISION,
+            )
+        assert response.provider == "backup"
+        assert {model for model, _ in calls} == {"main", "backup"}
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_tool_calls_are_not_hedged(self, mock_openai_class, usage_tracker):
+        calls = []
+        policy = HedgePolicy(provider="openai", model="backup", delay_seconds=0.01)
+        client = LLMClient(model="main", tracker=usage_tracker, hedge=policy)
+        fake = self._fake_once({"main": 0.05, "backup": 0.0}, calls)
+        with patch.object(LLMClient, '_complete_once', autospec=True, side_effect=fake):
+            client.complete(
+                messages=[{"role": "user", "content": "hi"}],
+                tool_executor=lambda name, args: "{}",
+            )
+        assert calls == [("main", threading.current_thread().name)]
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_unknown_secondary_disables_hedging(self, mock_openai_class, usage_tracker):
+        calls = []
+        client = LLMClient(model="main", tracker=usage_tracker, hedge=HedgePolicy(provider="nope"))
+        fake = self._fake_once({"main": 0.0}, calls)
+        with patch.object(LLMClient, '_complete_once', autospec=True, side_effect=fake):
+            response = client.complete(messages=[{"role": "user", "content": "hi"}])
+        assert response.provider == "main"
+        assert client._hedge is None
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_both_requests_are_tracked(self, mock_openai_class, usage_tracker):
+        policy = HedgePolicy(provider="openai", model="backup", delay_seconds=0.0)
+        client = LLMClient(model="main", tracker=usage_tracker, hedge=policy)
+        recorded = []
+        with patch.object(usage_tracker, 'record', side_effect=lambda **kw: recorded.append(kw)):
+            mock_openai_class.return_value.chat.completions.create.side_effect = (
+                lambda **kw: time.sleep(0.05) or _openai_reply(kw["model"])
+            )
+            client.complete(messages=[{"role": "user", "content": "hi"}])
+            deadline = time.time() + 5
+            while len(recorded) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+        assert sorted(kw['response'].model for kw in recorded) == ["backup", "main"]
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_only_the_winner_is_captured(self, mock_openai_class, usage_tracker):
+        policy = HedgePolicy(provider="openai", model="backup", delay_seconds=0.0)
+        client = LLMClient(model="main", tracker=usage_tracker, hedge=policy)
+        recorded = []
+        enricher = Mock(side_effect=lambda data: data)
+        with (
+            patch.object(usage_tracker, 'record', side_effect=lambda **kw: recorded.append(kw)),
+            patch('core.llm.client.capture_prompt') as capture,
+        ):
+            mock_openai_class.return_value.chat.completions.create.side_effect = (
+                lambda **kw: time.sleep(0.05) or _openai_reply(kw["model"])
+            )
+            response = client.complete(
+                messages=[{"role": "user", "content": "hi"}],
+                call_type=CallType.PLAYER_DECISION,
+                capture_enricher=enricher,
+            )
+            deadline = time.time() + 5
+            while len(recorded) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+        assert len(recorded) == 2
+        capture.assert_called_once()
+        assert capture.call_args.kwargs['response'] is response
+        assert capture.call_args.kwargs['enricher'] is enricher
+
+
+def _openai_reply(model):
+    reply = Mock()
+    reply.choices = [Mock()]
+    reply.choices[0].message.content = "ok"
+    reply.choices[0].message.tool_calls = None
+    reply.choices[0].finish_reason = "stop"
+    reply.usage.prompt_tokens = 1
+    reply.usage.completion_tokens = 1
+    reply.usage.prompt_tokens_details.cached_tokens = 0
+    reply.usage.completion_tokens_details.reasoning_tokens = 0
+    reply.id = f"req-{model}"
+    reply.model = model
+    return reply
@@ -0,0 +1,149 @@
+"""Live latency histograms (core.llm.latency_sketch) + adaptive timeouts."""
+
+import random
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.llm import CallType, LLMClient, latency_sketch
+from core.llm.latency_sketch import LatencySketch, LatencySketchRegistry
+from core.llm.usage_rollups import latency_bucket, latency_quantile
+
+pytestmark = pytest.mark.llm
+
+
+class _Clock:
+    def __init__(self, now=1_800_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestLatencySketch:
+    def test_matches_the_rollup_histogram(self):
+        # Same buckets and quantile estimate as api_usage_latency_rollups.
+        rng = random.Random(7)
+        values = [rng.lognormvariate(7, 1) for _ in range(5000)]
+        sketch = LatencySketch()
+        counts = {}
+        for v in values:
+            sketch.add(v)
+            counts[latency_bucket(v)] = counts.get(latency_bucket(v), 0) + 1
+        assert sketch.bins == counts
+        for q in (0.5, 0.9, 0.99):
+            assert sketch.quantile(q) == latency_quantile(counts, q)
+            # A bucket upper bound: at or above the true value, within one bucket.
+            exact = _exact_quantile(values, q)
+            assert exact <= sketch.quantile(q) <= exact * 1.25 * 1.25
+        assert sketch.max_ms == max(values)
+
+    def test_quantile_capped_at_max(self):
+        sketch = LatencySketch()
+        sketch.add(100.0)
+        assert sketch.quantile(0.99) == 100.0
+
+    def test_empty(self):
+        assert LatencySketch().quantile(0.5) is None
+        assert LatencySketch().summary() == {'count': 0}
+
+    def test_merge_equals_single_sketch(self):
+        a, b, both = LatencySketch(), LatencySketch(), LatencySketch()
+        for i, v in enumerate(range(1, 2000, 7)):
+            (a if i % 2 else b).add(float(v))
+            both.add(float(v))
+        merged = LatencySketch().merge(a).merge(b)
+        assert merged.bins == both.bins
+        assert merged.summary() == both.summary()
+
+
+class TestRegistry:
+    def test_recent_window_expires(self):
+        clock = _Clock()
+        registry = LatencySketchRegistry(clock=clock)
+        registry.record('openai', 'gpt', 'player_decision', 500.0)
+        registry.record('openai', 'gpt', 'player_decision', 900.0, ok=False)
+        [row] = registry.snapshot()
+        assert row['recent']['count'] == 2 and row['recent']['errors'] == 1
+
+        clock.now += latency_sketch.WINDOW_SECONDS * latency_sketch.RECENT_WINDOWS + 1
+        [row] = registry.snapshot()
+        assert row['recent']['count'] == 0
+        assert row['lifetime']['count'] == 2 and row['lifetime']['errors'] == 1
+
+    def test_suggested_timeout_needs_samples(self):
+        registry = LatencySketchRegistry(clock=_Clock())
+        for _ in range(latency_sketch.TIMEOUT_MIN_SAMPLES - 1):
+            registry.record('groq', 'llama', 'commentary', 8000.0)
+        assert registry.suggested_timeout('groq', 'llama') is None
+        registry.record('groq', 'llama', 'commentary', 8000.0)
+        suggested = registry.suggested_timeout('groq', 'llama')
+        assert suggested == pytest.approx(12.0)  # bucket bound capped at the max
+        # Fast calls are clamped to the floor.
+        fast = LatencySketchRegistry(clock=_Clock())
+        for _ in range(50):
+            fast.record('groq', 'llama', 'commentary', 100.0)
+        assert fast.suggested_timeout('groq', 'llama') == latency_sketch.TIMEOUT_FLOOR_SECONDS
+
+
+def _mock_openai(mock_openai_class):
+    mock_client = Mock()
+    mock_openai_class.return_value = mock_client
+    resp = Mock()
+    resp.choices = [Mock()]
+    resp.choices[0].message.content = "ok"
+    resp.choices[0].finish_reason = "stop"
+    resp.usage = Mock()
+    resp.usage.prompt_tokens = 10
+    resp.usage.completion_tokens = 5
+    resp.usage.completion_tokens_details = None
+    resp.usage.prompt_tokens_details = None
+    mock_client.chat.completions.create.return_value = resp
+    return mock_client
+
+
+class TestAdaptiveTimeout:
+    def _timeout_sent(self, mock_openai_class, usage_tracker, suggested, **client_kwargs):
+        mock_client = _mock_openai(mock_openai_class)
+        client = LLMClient(tracker=usage_tracker, **client_kwargs)
+        with patch.object(
+            latency_sketch.latency_sketches, 'suggested_timeout', return_value=suggested
+        ):
+            client.complete(
+                messages=[{"role": "user", "content": "hi"}], call_type=CallType.PLAYER_DECISION
+            )
+        return mock_client.chat.completions.create.call_args[1].get("timeout")
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_capped_by_default_timeout(self, mock_openai_class, usage_tracker):
+        kwargs = {'default_timeout': 12.5, 'adaptive_timeout': True}
+        assert self._timeout_sent(mock_openai_class, usage_tracker, 6.0, **kwargs) == 6.0
+        assert self._timeout_sent(mock_openai_class, usage_tracker, 30.0, **kwargs) == 12.5
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_falls_back_without_data(self, mock_openai_class, usage_tracker):
+        kwargs = {'default_timeout': 12.5, 'adaptive_timeout': True}
+        assert self._timeout_sent(mock_openai_class, usage_tracker, None, **kwargs) == 12.5
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_off_by_default(self, mock_openai_class, usage_tracker):
+        assert self._timeout_sent(mock_openai_class, usage_tracker, 6.0) is None
+
+    @patch('core.llm.providers.openai.OpenAI')
+    def test_calls_feed_the_registry(self, mock_openai_class, usage_tracker):
+        _mock_openai(mock_openai_class)
+        before = latency_sketch.latency_sketches.recent(
+            'openai', LLMClient(tracker=usage_tracker).model
+        ).count
+        LLMClient(tracker=usage_tracker).complete(
+            messages=[{"role": "user", "content": "hi"}], call_type=CallType.PLAYER_DECISION
+        )
+        after = latency_sketch.latency_sketches.recent(
+            'openai', LLMClient(tracker=usage_tracker).model
+        ).count
+        assert after == before + 1
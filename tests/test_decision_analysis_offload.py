@@ -74,3 +74,52 @@ def test_run_job_without_capture_label_repo(repos):
     job = json.loads(json.dumps(_sample_job()))
     decision_id = run_decision_analysis_job(job, repos["decision_analysis_repo"], None)
     assert decision_id is not None
+
+
+def test_worker_batch_dedups_equity_and_writes_every_row(repos):
+    """Identical (hand, board, opponents) jobs in one batch share one equity
+    Monte Carlo; every job still gets its own row."""
+    from unittest.mock import patch
+
+    from poker.decision_analysis_worker import process_batch
+    from poker.decision_analyzer import DecisionAnalyzer
+
+    jobs = [json.loads(json.dumps(_sample_job())) for _ in range(3)]
+    other = json.loads(json.dumps(_sample_job()))
+    other["analyze_kwargs"]["community_cards"] = ["2c", "7d", "9s"]
+    jobs.append(other)
+
+    real = DecisionAnalyzer.calculate_equity_vs_random
+    with patch.object(
+        DecisionAnalyzer, "calculate_equity_vs_random", autospec=True, side_effect=real
+    ) as vs_random:
+        written, deduped = process_batch(
+            jobs, repos["decision_analysis_repo"], repos["capture_label_repo"]
+        )
+
+    assert (written, deduped) == (4, 2)
+    assert vs_random.call_count == 2
+    listed = repos["decision_analysis_repo"].list_decision_analyses(game_id="test")
+    assert listed["total"] == 4
+
+
+def test_worker_partition_never_splits_a_group():
+    from poker.decision_analysis_worker import group_jobs, partition_groups
+
+    jobs = [_sample_job() for _ in range(3)] + [
+        {**_sample_job(), "analyze_kwargs": {**_sample_job()["analyze_kwargs"], "phase": "TURN"}}
+    ]
+    # phase isn't an equity input, so all four share one group.
+    groups = group_jobs(jobs)
+    assert [len(g) for g in groups] == [4]
+    assert [len(c) for c in partition_groups(groups, 3)] == [4]
+
+
+def test_worker_metrics_report_queue_lag():
+    from poker.decision_analysis_worker import WorkerMetrics
+
+    metrics = WorkerMetrics()
+    metrics.record_lag([{"enqueued_at": 100.0}, {"enqueued_at": 104.0}, {}], now=110.0)
+    assert metrics.last_lag_s == 10.0
+    metrics.record_lag([{"enqueued_at": 109.0}], now=110.0)
+    assert (metrics.last_lag_s, metrics.max_lag_s) == (1.0, 10.0)
@@ -0,0 +1,106 @@
+"""Decision-analysis queue backends: the durable SQLite queue (leases,
+visibility timeouts, bounded size) and the Redis backend's local spill."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from poker import decision_analysis_queue as daq
+from poker.decision_analysis_queue import RECEIPT_KEY, SQLiteJobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = SQLiteJobQueue(str(tmp_path / "queue.db"), max_size=5, visibility_timeout=0.2)
+    yield q
+    q.close()
+
+
+def test_enqueue_dequeue_ack(queue):
+    for i in range(3):
+        queue.enqueue({"n": i})
+    jobs = queue.dequeue_batch(10, timeout=0)
+    assert [j["n"] for j in jobs] == [0, 1, 2]
+    # Leased, not deleted: still counted, but not handed out again.
+    assert queue.depth() == 3
+    assert queue.dequeue_batch(10, timeout=0) == []
+
+    queue.ack(jobs)
+    assert queue.depth() == 0
+
+
+def test_unacked_jobs_are_redelivered_after_visibility_timeout(queue):
+    queue.enqueue({"n": 1})
+    first = queue.dequeue_batch(1, timeout=0)
+    time.sleep(0.25)
+    again = queue.dequeue_batch(1, timeout=0)
+    assert [j["n"] for j in again] == [1]
+    assert again[0][RECEIPT_KEY] == first[0][RECEIPT_KEY]
+
+
+def test_poison_job_dropped_after_max_attempts(tmp_path):
+    q = SQLiteJobQueue(str(tmp_path / "q.db"), visibility_timeout=0, max_attempts=2)
+    q.enqueue({"n": 1})
+    assert len(q.dequeue_batch(1, timeout=0)) == 1
+    assert len(q.dequeue_batch(1, timeout=0)) == 1
+    assert q.dequeue_batch(1, timeout=0) == []
+    assert q.depth() == 0
+    q.close()
+
+
+def test_bounded_size_sheds_oldest_first(queue):
+    for i in range(8):
+        queue.enqueue({"n": i})
+    assert queue.depth() == 5
+    assert [j["n"] for j in queue.dequeue_batch(10, timeout=0)] == [3, 4, 5, 6, 7]
+
+
+def test_jobs_survive_reopening_the_file(tmp_path):
+    path = str(tmp_path / "q.db")
+    writer = SQLiteJobQueue(path)
+    writer.enqueue({"n": 7})
+    writer.close()
+
+    reader = SQLiteJobQueue(path)
+    assert [j["n"] for j in reader.dequeue_batch(1, timeout=0)] == [7]
+    reader.close()
+
+
+@pytest.fixture
+def local_queue(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECISION_ANALYSIS_QUEUE_PATH", str(tmp_path / "spill.db"))
+    monkeypatch.setattr(daq, "_local_queue", None)
+    yield
+    if daq._local_queue is not None:
+        daq._local_queue.close()
+    daq._local_queue = None
+
+
+def test_redis_outage_spills_to_local_queue(local_queue, monkeypatch):
+    monkeypatch.delenv("DECISION_ANALYSIS_QUEUE_BACKEND", raising=False)
+    producer = MagicMock()
+    producer.lpush.side_effect = ConnectionError("redis down")
+    consumer = MagicMock()
+    monkeypatch.setattr(daq, "_get_producer", lambda: producer)
+    monkeypatch.setattr(daq, "_get_consumer", lambda: consumer)
+
+    daq.enqueue_decision_analysis_job({"n": 1})  # must not raise
+
+    jobs = daq.dequeue_batch(10, timeout=0)
+    assert [j["n"] for j in jobs] == [1]
+    assert "enqueued_at" in jobs[0]
+    consumer.brpop.assert_not_called()  # spill drained before Redis is polled
+
+    daq.ack_jobs(jobs)
+    assert daq._get_local_queue().depth() == 0
+
+
+def test_sqlite_backend_never_touches_redis(local_queue, monkeypatch):
+    monkeypatch.setenv("DECISION_ANALYSIS_QUEUE_BACKEND", "sqlite")
+    monkeypatch.setattr(daq, "_get_producer", MagicMock(side_effect=AssertionError))
+    monkeypatch.setattr(daq, "_get_consumer", MagicMock(side_effect=AssertionError))
+
+    daq.enqueue_decision_analysis_job({"n": 2})
+    assert daq.queue_depth() == 1
+    assert [j["n"] for j in daq.dequeue_batch(10, timeout=0)] == [2]
@@ -0,0 +1,72 @@
+"""Tests for duplicate-deal (seat-mirrored) mode in the sim harness.
+
+The load-bearing property is that a rotated seating really replays the same
+deal: the seat index keeps its cards, blinds and button, and only the player
+sitting there changes. If that breaks, the "paired" observations stop
+cancelling card luck and the duplicate CI is silently wrong.
+"""
+
+import pytest
+
+from experiments._duplicate import duplicate_seatings, paired_observation
+from experiments.simulate_bb100 import make_game_state, run_matchup
+from poker.poker_state_machine import PokerPhase, PokerStateMachine
+from poker.strategy.strategy_table import load_strategy_table
+
+
+class TestDuplicateSeatings:
+    def test_off_is_original_order_only(self):
+        assert duplicate_seatings(['A', 'B', 'C'], duplicate=False) == [['A', 'B', 'C']]
+
+    def test_heads_up_is_the_seat_swap(self):
+        assert duplicate_seatings(['A', 'B'], duplicate=True) == [['A', 'B'], ['B', 'A']]
+
+    def test_six_max_covers_every_seat_once(self):
+        names = ['H', 'o1', 'o2', 'o3', 'o4', 'o5']
+        seatings = duplicate_seatings(names, duplicate=True)
+        assert len(seatings) == 6
+        assert seatings[0] == names
+        # The hero occupies each seat index exactly once across the group.
+        assert sorted(s.index('H') for s in seatings) == list(range(6))
+        # Rotation keeps neighbours: everyone's left-hand opponent is unchanged.
+        for s in seatings:
+            i = s.index('H')
+            assert s[(i + 1) % 6] == 'o1'
+
+    def test_paired_observation_is_group_mean(self):
+        assert paired_observation([300.0, -100.0]) == 100.0
+        with pytest.raises(ValueError):
+            paired_observation([])
+
+
+def _dealt(seating, seed=5, dealer_idx=1):
+    gs = make_game_state(seating, dealer_idx=dealer_idx, seed=seed)
+    sm = PokerStateMachine(gs)
+    sm.current_hand_seed = seed
+    sm.run_until([PokerPhase.HAND_OVER, PokerPhase.GAME_OVER])
+    return sm.game_state
+
+
+class TestMirroredDeal:
+    def test_seat_keeps_cards_and_blind_when_players_swap(self):
+        first, mirror = (_dealt(s) for s in duplicate_seatings(['P1', 'P2'], duplicate=True))
+        for seat in range(2):
+            a, b = first.players[seat], mirror.players[seat]
+            assert a.name != b.name
+            assert [str(c) for c in a.hand] == [str(c) for c in b.hand]
+            assert a.bet == b.bet
+        assert first.current_dealer_idx == mirror.current_dealer_idx
+
+
+@pytest.mark.simulation
+class TestDuplicateMatchup:
+    def test_returns_one_paired_observation_per_deal(self):
+        table = load_strategy_table()
+        paired = run_matchup('TAG', 'Nit', 4, table, base_seed=11, duplicate=True)
+        assert len(paired) == 4
+
+    def test_off_matches_the_original_harness(self):
+        table = load_strategy_table()
+        a = run_matchup('TAG', 'Nit', 4, table, base_seed=11)
+        b = run_matchup('TAG', 'Nit', 4, table, base_seed=11, duplicate=False)
+        assert a == b
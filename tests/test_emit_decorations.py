@@ -0,0 +1,143 @@
+"""Tests for the per-hand game-state emit decoration cache + latency histogram."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from flask_app.services import emit_decorations
+from flask_app.services.latency_histogram import LatencyHistogram
+
+
+def _state(*names):
+    return SimpleNamespace(
+        players=[SimpleNamespace(name=n, is_human=(i == 0)) for i, n in enumerate(names)]
+    )
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        assert LatencyHistogram().snapshot() == {'count': 0}
+
+    def test_quantiles_within_one_bucket(self):
+        hist = LatencyHistogram()
+        for ms in range(1, 101):
+            hist.record(float(ms))
+        snap = hist.snapshot()
+        assert snap['count'] == 100
+        assert snap['mean_ms'] == pytest.approx(50.5)
+        assert snap['max_ms'] == 100.0
+        assert 50 <= snap['p50_ms'] <= 50 * 1.25
+        assert 99 <= snap['p99_ms'] <= 100 * 1.25
+
+    def test_overflow_reports_max(self):
+        hist = LatencyHistogram()
+        hist.record(60_000.0)
+        assert hist.snapshot()['p99_ms'] == 60_000.0
+
+    def test_reset(self):
+        hist = LatencyHistogram()
+        hist.record(1.0)
+        hist.reset()
+        assert hist.snapshot()['count'] == 0
+
+
+class TestDecorationCache:
+    def _game(self, hand=1):
+        return {'memory_manager': SimpleNamespace(hand_count=hand), 'ai_controllers': {}}
+
+    def test_reused_within_a_hand(self):
+        game, state = self._game(), _state('Human', 'Bot')
+        build = MagicMock(return_value={'x': 1})
+        assert emit_decorations.get_static_decorations(game, state, build) == ({'x': 1}, False)
+        assert emit_decorations.get_static_decorations(game, state, build) == ({'x': 1}, True)
+        build.assert_called_once()
+
+    def test_new_hand_rebuilds(self):
+        game, state = self._game(), _state('Human', 'Bot')
+        build = MagicMock(return_value={})
+        emit_decorations.get_static_decorations(game, state, build)
+        game['memory_manager'].hand_count = 2
+        _, hit = emit_decorations.get_static_decorations(game, state, build)
+        assert not hit and build.call_count == 2
+
+    def test_seat_or_controller_change_rebuilds(self):
+        game = self._game()
+        build = MagicMock(return_value={})
+        emit_decorations.get_static_decorations(game, _state('Human', 'Bot'), build)
+        _, hit = emit_decorations.get_static_decorations(game, _state('Human', 'Newcomer'), build)
+        assert not hit
+        game['ai_controllers']['Newcomer'] = object()
+        _, hit = emit_decorations.get_static_decorations(game, _state('Human', 'Newcomer'), build)
+        assert not hit
+
+    def test_personality_edit_rebuilds(self):
+        game, state = self._game(), _state('Human', 'Bot')
+        build = MagicMock(return_value={})
+        emit_decorations.get_static_decorations(game, state, build)
+        emit_decorations.bump_personality_epoch()
+        _, hit = emit_decorations.get_static_decorations(game, state, build)
+        assert not hit
+
+
+class TestEmitterUsesCache:
+    def test_owner_avatar_resolved_once_per_hand(self):
+        from flask_app import extensions
+        from flask_app.handlers import game_handler
+        from poker.poker_game import initialize_game_state
+        from poker.poker_state_machine import PokerStateMachine
+
+        game_data = {
+            'state_machine': PokerStateMachine(initialize_game_state(['Alice', 'Bob'])),
+            'ai_controllers': {},
+            'messages': [],
+            'owner_id': 'owner-1',
+            'memory_manager': SimpleNamespace(hand_count=3),
+        }
+        avatar_service = MagicMock()
+        avatar_service.get_avatar_url.return_value = '/api/avatar/me.png'
+        warm_before = emit_decorations.emit_latency['warm'].snapshot()['count']
+        with (
+            patch.object(game_handler.game_state_service, 'get_game', return_value=game_data),
+            patch.object(game_handler, 'socketio') as sio,
+            patch.object(extensions, 'user_avatar_service', avatar_service),
+            patch.object(game_handler.feature_flags, 'is_enabled', return_value=False),
+        ):
+            for _ in range(3):
+                game_handler.update_and_emit_game_state('g-deco')
+        avatar_service.get_avatar_url.assert_called_once_with('owner-1')
+        humans = [
+            p for p in sio.emit.call_args.args[1]['game_state']['players'] if p.get('is_human')
+        ]
+        assert humans[0]['avatar_url'] == '/api/avatar/me.png'
+        assert emit_decorations.emit_latency['warm'].snapshot()['count'] == warm_before + 2
+
+    def test_llm_debug_stats_read_on_every_emit(self):
+        from flask_app.handlers import game_handler
+        from poker.poker_game import initialize_game_state
+        from poker.poker_state_machine import PokerStateMachine
+
+        game_data = {
+            'state_machine': PokerStateMachine(initialize_game_state(['Alice', 'Bob'])),
+            'ai_controllers': {},
+            'messages': [],
+            'memory_manager': SimpleNamespace(hand_count=4),
+        }
+        ai_name = next(
+            p.name for p in game_data['state_machine'].game_state.players if not p.is_human
+        )
+        stats = MagicMock(side_effect=[{ai_name: {'calls': n}} for n in (1, 2)])
+        with (
+            patch.object(game_handler.game_state_service, 'get_game', return_value=game_data),
+            patch.object(game_handler, 'socketio') as sio,
+            patch.object(game_handler.config, 'enable_ai_debug', True),
+            patch.object(game_handler, 'get_all_players_llm_stats', stats),
+            patch.object(game_handler.feature_flags, 'is_enabled', return_value=False),
+        ):
+            for _ in range(2):
+                game_handler.update_and_emit_game_state('g-llm-debug')
+        # The second emit is warm (decorations reused) yet sees the new call.
+        assert stats.call_count == 2
+        players = sio.emit.call_args.args[1]['game_state']['players']
+        ai = next(p for p in players if p['name'] == ai_name)
+        assert ai['llm_debug'] == {'calls': 2}
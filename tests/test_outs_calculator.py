@@ -0,0 +1,119 @@
+"""Tests for poker/outs_calculator.py exact outs enumeration."""
+
+import eval7
+import pytest
+
+from flask_app.services.coach_engine import _compute_outs
+from poker.hand_ranges import OpponentInfo, get_opponent_range
+from poker.outs_calculator import HAND_CLASSES, compute_outs, range_combos
+
+
+def _brute_force(hole, board, opponent_range=None):
+    """Deal every card, then every live range combo, straight from eval7."""
+    hero = [eval7.Card(c) for c in hole]
+    board_cards = [eval7.Card(c) for c in board]
+    known = set(hero + board_cards)
+    current = eval7.handtype(eval7.evaluate(hero + board_cards))
+    classes = {}
+    board_classes = {}
+    strengths = {}
+    combos = range_combos(frozenset(opponent_range) if opponent_range else None)
+    for card in eval7.Deck().cards:
+        if card in known:
+            continue
+        new_board = board_cards + [card]
+        score = eval7.evaluate(hero + new_board)
+        classes[str(card)] = eval7.handtype(score)
+        board_classes[str(card)] = eval7.handtype(eval7.evaluate(new_board))
+        results = [
+            (score > s) + 0.5 * (score == s)
+            for s in (
+                eval7.evaluate(list(combo) + new_board)
+                for combo in combos
+                if not set(combo) & (known | {card})
+            )
+        ]
+        strengths[str(card)] = sum(results) / len(results)
+    return current, classes, board_classes, strengths
+
+
+@pytest.mark.parametrize(
+    'hole,board,opponent_range',
+    [
+        (['Ah', 'Kh'], ['Qh', '7h', '2c'], None),
+        (['9s', '8s'], ['7d', '6c', '2h', 'Kd'], None),
+        (['Ah', 'Kh'], ['Qh', '7h', '2c'], {'QQ', '77', 'AQs', 'KQo'}),
+    ],
+)
+def test_matches_brute_force(hole, board, opponent_range):
+    result = compute_outs(hole, board, opponent_range)
+    current, classes, board_classes, strengths = _brute_force(hole, board, opponent_range)
+    assert result.current_class == current
+    assert len(result.outcomes) == 52 - 2 - len(board)
+    for outcome in result.outcomes:
+        assert outcome.hand_class == classes[outcome.card]
+        if outcome.improves:
+            assert outcome.strength == pytest.approx(strengths[outcome.card])
+        else:
+            assert outcome.strength is None
+    rank = HAND_CLASSES.index
+    expected_outs = {
+        card
+        for card, hand_class in classes.items()
+        if rank(hand_class) > max(rank(current), rank(board_classes[card]))
+        and strengths[card] >= 0.5
+    }
+    assert {o.card for o in result.outs} == expected_outs
+
+
+def test_flush_draw_vs_set_discounts_board_pairing_cards():
+    # Nut flush draw vs a set: the flush card that pairs the board (2h) gives
+    # the set a full house, and the pair cards never get there.
+    result = compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c'], {'QQ'})
+    assert sorted(o.card for o in result.outs) == ['3h', '4h', '5h', '6h', '8h', '9h', 'Jh', 'Th']
+    assert result.outs_by_class() == {'Flush': 8}
+    assert {'2h', 'Ac', 'Kd'} <= {o.card for o in result.tainted_outs}
+
+    # Vs any two cards: all 9 flush cards plus the 6 that pair a hole card; a
+    # card that only pairs the board is not an out.
+    open_range = compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c']).to_dict()
+    assert open_range['by_class'] == {'Flush': 9, 'Pair': 6}
+    assert open_range['count'] == 15
+
+
+def test_board_pairing_card_is_not_an_out():
+    # 98 on 76 2 K: the 5s and Ts make a straight; a 2/6/7/K only pairs the board.
+    result = compute_outs(['9s', '8s'], ['7d', '6c', '2h', 'Kd'])
+    straights = {o.card for o in result.outs if o.hand_class == 'Straight'}
+    assert straights == {'5c', '5d', '5h', '5s', 'Tc', 'Td', 'Th', 'Ts'}
+    board_pairs = [o for o in result.outcomes if o.card[0] in '267K']
+    assert len(board_pairs) == 12
+    assert not any(o.improves for o in board_pairs)
+
+
+def test_cached_per_hole_board_and_range():
+    first = compute_outs(['Kh', 'Ah'], ['2c', 'Qh', '7h'])
+    assert compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c']) is first
+    assert compute_outs(['A♥', 'K♥'], ['Q♥', '7♥', '2♣']) is first
+    assert compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c'], {'QQ'}) is not first
+
+
+def test_no_card_to_come():
+    assert compute_outs(['Ah', 'Kh'], []) is None
+    assert compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c', '3d', '4s']) is None
+
+
+def test_coach_outs_use_combined_opponent_range():
+    opponents = [
+        OpponentInfo(name='Nit', position='under_the_gun', preflop_action='4bet+'),
+        OpponentInfo(name='Fish', position='button'),
+    ]
+    combined = set().union(*(get_opponent_range(o) for o in opponents))
+    info = _compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c'], opponents)
+    expected = compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c'], combined)
+    assert info == expected.to_dict()
+    assert info['by_class']['Flush'] >= 8
+    assert all(len(card) == 2 for card in info['cards'])
+
+    # Without opponent info the range is any two cards.
+    assert _compute_outs(['Ah', 'Kh'], ['Qh', '7h', '2c'])['count'] == 15
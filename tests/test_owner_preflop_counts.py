@@ -0,0 +1,126 @@
+"""The trigger-kept `owner_preflop_action_counts` aggregate must always equal the
+row-level scan it replaces (`load_owner_preflop_decisions`): across inserts,
+deleted / corrected decision rows, and games that are deleted or re-owned."""
+
+import random
+import sqlite3
+from collections import Counter
+
+import pytest
+
+from flask_app.services.coach_leaks import (
+    compute_preflop_leaks,
+    count_owner_preflop_decisions,
+    load_owner_preflop_counts,
+    load_owner_preflop_decisions,
+)
+from poker.repositories.schema_manager import SchemaManager
+
+HANDS = ['AA', 'AKs', '72o', 'T9s', 'KJo']
+POSITIONS = ['under_the_gun', 'button', 'big_blind_player', 'CO', None]
+ACTIONS = ['fold', 'call', 'raise', 'all_in', None]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'counts.db')
+    SchemaManager(path).ensure_schema()
+    return path
+
+
+def _add_game(conn, game_id, owner_id, owner_name):
+    conn.execute(
+        "INSERT INTO games (game_id, phase, num_players, pot_size, game_state_json, "
+        "owner_id, owner_name) VALUES (?, 'PRE_FLOP', 2, 0, '{}', ?, ?)",
+        (game_id, owner_id, owner_name),
+    )
+
+
+def _add_decisions(conn, game_id, players, rng, n):
+    conn.executemany(
+        "INSERT INTO player_decision_analysis (game_id, player_name, hand_number, phase, "
+        "player_position, player_hand_canonical, action_taken) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                game_id,
+                rng.choice(players),
+                i,
+                rng.choice(['PRE_FLOP', 'PRE_FLOP', 'FLOP']),
+                rng.choice(POSITIONS),
+                rng.choice(HANDS + [None]),
+                rng.choice(ACTIONS),
+            )
+            for i in range(n)
+        ],
+    )
+
+
+def _assert_matches_scan(db_path, owner_id):
+    scan = load_owner_preflop_decisions(db_path, owner_id)
+    counts = load_owner_preflop_counts(db_path, owner_id)
+    expanded = Counter()
+    for row in counts:
+        expanded[(row['canon'], row['position'], row['action'] or None)] += row['n']
+    assert expanded == Counter((d['canon'], d['position'], d['action']) for d in scan)
+    assert count_owner_preflop_decisions(db_path, owner_id) == len(scan)
+    from_counts, from_scan = compute_preflop_leaks(counts), compute_preflop_leaks(scan)
+    assert from_counts.total_decisions == from_scan.total_decisions
+    assert from_counts.by_position_summary == from_scan.by_position_summary
+    # Equal-severity leaks tie; their relative order follows input order.
+    assert sorted(from_counts.leaks, key=repr) == sorted(from_scan.leaks, key=repr)
+    return len(scan)
+
+
+def test_counts_track_decisions_and_games(db_path):
+    rng = random.Random(3)
+    conn = sqlite3.connect(db_path)
+    _add_game(conn, 'g1', 'u1', 'Hero')
+    _add_game(conn, 'g2', 'u1', 'Hero')
+    _add_game(conn, 'g3', 'u2', 'Villain')
+    for game in ('g1', 'g2', 'g3'):
+        _add_decisions(conn, game, ['Hero', 'Villain', 'Bot'], rng, 120)
+    # Decisions analyzed before their game row was first saved.
+    _add_decisions(conn, 'g4', ['Hero', 'Bot'], rng, 40)
+    conn.commit()
+    assert _assert_matches_scan(db_path, 'u1') > 0
+    _assert_matches_scan(db_path, 'u2')
+
+    _add_game(conn, 'g4', 'u1', 'Hero')
+    conn.execute("DELETE FROM player_decision_analysis WHERE id % 7 = 0")
+    conn.execute("UPDATE player_decision_analysis SET action_taken = 'call' WHERE id % 5 = 0")
+    conn.commit()
+    _assert_matches_scan(db_path, 'u1')
+
+    # Re-owned (save_game rewrites owner columns) and deleted games.
+    conn.execute("UPDATE games SET owner_id = 'u2', owner_name = 'Bot' WHERE game_id = 'g2'")
+    conn.execute("UPDATE games SET owner_id = 'u2', owner_name = 'Bot' WHERE game_id = 'g2'")
+    conn.execute("DELETE FROM games WHERE game_id = 'g1'")
+    conn.commit()
+    _assert_matches_scan(db_path, 'u1')
+    _assert_matches_scan(db_path, 'u2')
+
+    conn.execute("DELETE FROM games")
+    conn.commit()
+    conn.close()
+    assert _assert_matches_scan(db_path, 'u1') == 0
+    assert load_owner_preflop_counts(db_path, 'u1') == []
+
+
+def test_backfill_on_first_creation(db_path):
+    from importlib import import_module
+
+    migration = import_module('poker.repositories.migrations.20261019_1200_owner_preflop_counts')
+    rng = random.Random(8)
+    conn = sqlite3.connect(db_path)
+    _add_game(conn, 'g1', 'u1', 'Hero')
+    _add_decisions(conn, 'g1', ['Hero', 'Bot'], rng, 80)
+    conn.execute("DROP TABLE owner_preflop_action_counts")
+    for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+        "AND name LIKE 'trg_owner_preflop_counts_%'"
+    ).fetchall():
+        conn.execute(f"DROP TRIGGER {name}")
+    migration.upgrade(conn)
+    conn.commit()
+    conn.close()
+    assert _assert_matches_scan(db_path, 'u1') > 0
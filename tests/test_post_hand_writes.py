@@ -0,0 +1,69 @@
+"""PostHandWrites: one hand's psychology writes land in one transaction, and a
+failed batch falls back to row-by-row writes without duplicating rows."""
+
+import pytest
+
+from poker.psychology_pipeline import PostHandWrites, post_hand_write_stats
+from poker.repositories.game_repository import GameRepository
+from poker.repositories.schema_manager import SchemaManager
+from poker.repositories.sqlite_repositories import PressureEventRepository
+
+
+@pytest.fixture
+def repos(tmp_path):
+    path = str(tmp_path / "post_hand.db")
+    SchemaManager(path).ensure_schema()
+    events, games = PressureEventRepository(path), GameRepository(path)
+    post_hand_write_stats.reset()
+    yield events, games
+    events.close()
+    games.close()
+
+
+def _queue(writes, players):
+    for i, name in enumerate(players):
+        writes.add_event(name, 'big_loss', 7, {'comp_delta': -0.05})
+        writes.add_event(name, '_recovery', 7, {'comp_delta': 0.01})
+        writes.add_controller_state(name, psychology={'axes': {'composure': 0.5 + i / 10}})
+
+
+def test_commit_writes_every_row_once(repos):
+    event_repo, game_repo = repos
+    writes = PostHandWrites('g1')
+    _queue(writes, ['Alice', 'Bob', 'Carol'])
+    assert len(writes) == 9
+
+    assert writes.commit(event_repo, game_repo) == 9
+    assert len(writes) == 0
+    events = event_repo.get_events_for_game('g1')
+    assert sorted(e['event_type'] for e in events) == ['_recovery'] * 3 + ['big_loss'] * 3
+    assert set(game_repo.load_all_controller_states('g1')) == {'Alice', 'Bob', 'Carol'}
+    assert post_hand_write_stats.snapshot() == {
+        'hands': 1,
+        'rows': 9,
+        'max_rows_per_hand': 9,
+        'fallbacks': 0,
+    }
+
+
+def test_failed_batch_rolls_back_then_writes_rows_individually(repos):
+    event_repo, game_repo = repos
+    writes = PostHandWrites('g1')
+    _queue(writes, ['Alice'])
+    # Not JSON-serializable: the controller-state executemany fails after the
+    # events were inserted in the same transaction.
+    writes.add_controller_state('Bob', psychology={'bad': {1, 2}})
+
+    assert writes.commit(event_repo, game_repo) == 3
+    assert len(event_repo.get_events_for_game('g1')) == 2  # rolled back, not doubled
+    assert set(game_repo.load_all_controller_states('g1')) == {'Alice'}
+    assert post_hand_write_stats.snapshot()['fallbacks'] == 1
+
+
+def test_rows_without_a_repo_are_not_written(repos):
+    event_repo, _ = repos
+    writes = PostHandWrites('g1')
+    _queue(writes, ['Alice'])
+
+    assert writes.commit(event_repo) == 2
+    assert post_hand_write_stats.snapshot()['rows'] == 2
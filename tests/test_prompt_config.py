@@ -31,7 +31,7 @@ class TestPromptConfig(unittest.TestCase):
         config = PromptConfig()
         d = config.to_dict()
 
-        self.assertEqual(len(d), 29)  # 25 bool + 1 Optional[bool] + 1 int + 2 str
+        self.assertEqual(len(d), 30)  # 26 bool + 1 Optional[bool] + 1 int + 2 str
         self.assertIn('pot_odds', d)
         self.assertIn('mind_games', d)
         self.assertIn('dramatic_sequence', d)
@@ -178,6 +178,7 @@ class TestPromptConfig(unittest.TestCase):
             preflop_range_gate=True,
             hu_equity_offset=True,
             relationship_context=True,
+            cacheable_prompt_prefix=True,
         )
         self.assertIn('all enabled', repr(config))
 
@@ -286,6 +287,35 @@ class TestPromptConfigIntegration(unittest.TestCase):
         # Should still have the base instruction
         self.assertIn("CRITICAL", result)
 
+    def test_render_decision_segments_split(self):
+        """Fixed instructions are stable; game state and drama are volatile."""
+        from poker.prompt_manager import PromptManager
+
+        pm = PromptManager()
+        options = dict(
+            include_mind_games=True,
+            include_dramatic_sequence=True,
+            short_stack_info={'stack_bb': 2},
+            drama_context={'level': 'climactic', 'tone': 'neutral'},
+        )
+        first = pm.render_decision_segments("Hand 1 state", **options)
+        second = pm.render_decision_segments("Hand 2 state", **options)
+
+        self.assertEqual(first.stable, second.stable)
+        self.assertIn("MIND GAMES", first.stable)
+        self.assertIn("BETTING DISCIPLINE", first.stable)
+        self.assertNotIn("Hand 1 state", first.stable)
+        self.assertIn("Hand 1 state", first.volatile)
+        self.assertIn("SHORT STACK", first.volatile)
+        self.assertIn("RESPONSE STYLE", first.volatile)
+
+        # Same sections as the single-string render, nothing lost or duplicated
+        full = pm.render_decision_prompt("Hand 1 state", **options)
+        self.assertEqual(
+            sorted(full.split("\n\n")),
+            sorted((first.stable + "\n\n" + first.volatile).split("\n\n")),
+        )
+
 
 class TestGameModes(unittest.TestCase):
     """Tests for game mode factory methods."""
@@ -352,6 +382,10 @@ class TestGameModes(unittest.TestCase):
 class TestZoneToggles(unittest.TestCase):
     """Tests for Phase 9 zone toggles across game modes."""
 
+    def test_cacheable_prompt_prefix_off_by_default(self):
+        """Moving decision instructions into the cached prefix is opt-in (A/B first)."""
+        self.assertFalse(PromptConfig().cacheable_prompt_prefix)
+
     def test_default_zone_toggles_enabled(self):
         """Default config has both zone toggles True."""
         config = PromptConfig()
@@ -0,0 +1,123 @@
+"""Parity of the vectorized population simulator
+(experiments/psychology_population_simulator.py) with the scalar path.
+
+The same drawn events are fed to real PlayerPsychology instances
+(`apply_pressure_event` + `recover`) for every grid point, under each recovery
+mode (as shipped, TILT_PERSISTENCE, EMOTIONAL_REBALANCE), and the axes must
+match hand for hand. Gates are patched as in test_tilt_episode.py.
+"""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import poker.player_psychology as pp
+from experiments.psychology_population_simulator import (
+    STREAK_EVENT,
+    ZONE_PARAMS,
+    PopulationSimulator,
+    build_population,
+    expand_grid,
+)
+from poker.player_psychology import PlayerPsychology
+from poker.zone_config import clear_zone_params, set_zone_params
+
+
+def _persona(poise: float, ego: float, recovery_rate: float) -> dict:
+    return {
+        'anchors': {
+            'baseline_aggression': 0.6,
+            'baseline_looseness': 0.4,
+            'ego': ego,
+            'poise': poise,
+            'expressiveness': 0.6,
+            'risk_identity': 0.6,
+            'adaptation_bias': 0.5,
+            'baseline_energy': 0.5,
+            'recovery_rate': recovery_rate,
+            'self_belief': 0.5,
+        }
+    }
+
+
+PERSONAS = {
+    'hothead': _persona(0.15, 0.8, 0.12),
+    'volatile': _persona(0.5, 0.6, 0.15),
+    'stoic': _persona(0.85, 0.3, 0.2),
+}
+
+
+class _FixedRng:
+    def __init__(self, value: float):
+        self.value = value
+
+    def random(self) -> float:
+        return self.value
+
+
+@pytest.fixture(autouse=True)
+def _restore_zone_params():
+    yield
+    clear_zone_params()
+
+
+@pytest.mark.parametrize(
+    'tilt_persist,rebalance',
+    [(False, False), (True, False), (False, True)],
+    ids=['shipped', 'tilt_persistence', 'rebalance'],
+)
+def test_vectorized_matches_scalar(tilt_persist, rebalance):
+    hands = 150
+    gates = (
+        mock.patch('poker.player_psychology._tilt_persistence_enabled', return_value=tilt_persist),
+        mock.patch('poker.player_psychology._emotional_rebalance_enabled', return_value=rebalance),
+        mock.patch('poker.psychology_model._emotional_rebalance_enabled', return_value=rebalance),
+    )
+    with gates[0], gates[1], gates[2]:
+        grid = expand_grid(
+            {
+                'RECOVERY_BELOW_BASELINE_FLOOR': [0.6, 0.45],
+                'TILT_DRAG_FLOOR': [0.3, 0.1],
+            }
+        )
+        sim = PopulationSimulator(build_population(PERSONAS, size=6), grid, play_rate=0.8, seed=3)
+        draws, trace = [], []
+        for _ in range(hands):
+            draw = sim.draw_hand()
+            sim.step(*draw)
+            draws.append(draw)
+            trace.append(np.stack([sim.conf, sim.comp, sim.energy]))
+
+        assert min(t[1].min() for t in trace) < pp.TILT_LINE  # tilt paths exercised
+
+        names = sim.population.names
+        for g, point in enumerate(grid):
+            set_zone_params({k: point[k] for k in ZONE_PARAMS})
+            with mock.patch.object(pp, 'TILT_DRAG_FLOOR', point['TILT_DRAG_FLOOR']):
+                for n, name in enumerate(names):
+                    psy = PlayerPsychology.from_personality_config(name, PERSONAS[name])
+                    for h, (events, streak, episode_u) in enumerate(draws):
+                        psy.apply_pressure_event(sim.events[events[n]])
+                        if streak[n]:
+                            psy.apply_pressure_event(STREAK_EVENT)
+                        psy._episode_rng = _FixedRng(float(episode_u[n]))
+                        psy.recover()
+                        expected = (psy.axes.confidence, psy.axes.composure, psy.axes.energy)
+                        np.testing.assert_allclose(trace[h][:, g, n], expected, atol=1e-12)
+
+
+def test_sweep_outputs_are_distributions():
+    grid = expand_grid({'RECOVERY_ABOVE_BASELINE': [0.6, 0.8, 1.0]})
+    sim = PopulationSimulator(build_population(PERSONAS, size=300), grid, play_rate=0.5)
+    result = sim.run(400)
+
+    np.testing.assert_allclose(result.band_occupancy.sum(axis=1), 1.0)
+    assert result.swing_hist.shape == (3, sim.max_swing + 1)
+    assert (result.swing_hist.sum(axis=1) > 0).all()
+    assert result.swing_percentiles().shape == (3, 3)
+
+
+def test_expand_grid_rejects_unknown_parameters():
+    with pytest.raises(ValueError, match='NOT_A_PARAM'):
+        expand_grid({'NOT_A_PARAM': [1.0]})
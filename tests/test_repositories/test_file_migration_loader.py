@@ -150,3 +150,18 @@ def test_missing_directory_is_noop(tmp_path):
     loader = FileMigrationLoader(str(tmp_path / "does_not_exist"))
     assert loader.discover() == []
     assert loader.run(_factory(str(tmp_path / "t.db"))) == []
+
+
+def test_up_to_date_db_does_not_import_migrations(tmp_path):
+    mig = tmp_path / "migrations"
+    mig.mkdir()
+    _write(mig, "20260101_0900_add_a", ADD_A)
+    db = str(tmp_path / "t.db")
+    loader = FileMigrationLoader(str(mig))
+    assert loader.run(_factory(db)) == ["20260101_0900_add_a"]
+
+    # Nothing pending: the module must not even be loaded (it would raise here).
+    _write(mig, "20260101_0900_add_a", "raise RuntimeError('imported')\n")
+    with sqlite3.connect(db) as conn:
+        assert loader.pending_ids(conn) == []
+    assert loader.run(_factory(db)) == []
@@ -391,6 +391,24 @@ def test_controller_state_psychology_round_trip(repo):
     assert loaded['psychology'] == SAMPLE_PSYCHOLOGY_V2
 
 
+def test_save_controller_states_batch(repo):
+    written = repo.save_controller_states(
+        [
+            {'game_id': 'game1', 'player_name': 'Alice', 'psychology': SAMPLE_PSYCHOLOGY_V2},
+            {
+                'game_id': 'game1',
+                'player_name': 'Bob',
+                'psychology': SAMPLE_PSYCHOLOGY_V2,
+                'prompt_config': {'temperature': 0.7},
+            },
+        ]
+    )
+    assert written == 2
+    states = repo.load_all_controller_states('game1')
+    assert states['Alice']['psychology'] == SAMPLE_PSYCHOLOGY_V2
+    assert states['Bob']['prompt_config'] == {'temperature': 0.7}
+
+
 # --- Opponent Models ---
 
 
@@ -1,5 +1,7 @@
 """Tests for HandHistoryRepository."""
 
+import random
+
 import pytest
 
 from poker.repositories.hand_history_repository import HandHistoryRepository
@@ -88,6 +90,7 @@ class TestDeleteHandHistory:
         repo.save_hand_history(_make_hand('g1', 2))
         repo.delete_hand_history_for_game('g1')
         assert repo.load_hand_history('g1') == []
+        assert repo.get_session_stats('g1', 'Alice')['hands_played'] == 0
 
 
 class TestHandCommentary:
@@ -180,6 +183,39 @@ class TestSessionStats:
         assert stats['current_streak'] == 'winning'
         assert stats['streak_count'] == 3
 
+    def test_rollup_matches_rebuild_from_history(self, repo):
+        rng = random.Random(5)
+        names = ['Alice', 'Bob', 'Cara']
+        for n in range(1, 41):
+            players = [{'name': name} for name in names if rng.random() < 0.8] or [{'name': 'Bob'}]
+            actions = [
+                {'player_name': p['name'], 'action': rng.choice(['call', 'fold']), 'amount': 20}
+                for p in players
+            ]
+            winner = rng.choice(players)['name']
+            pot = rng.randint(50, 500)
+            repo.save_hand_history(
+                _make_hand(
+                    'g1',
+                    n,
+                    players=players,
+                    winners=[{'name': winner, 'amount_won': pot}],
+                    actions=actions,
+                    pot_size=pot,
+                )
+            )
+        # Re-saving a hand replaces it rather than counting it twice.
+        repo.save_hand_history(_make_hand('g1', 40, players=[{'name': 'Alice'}]))
+
+        incremental = {name: repo.get_session_stats('g1', name) for name in names}
+        with repo._get_connection() as conn:
+            conn.execute("DELETE FROM hand_session_rollups")
+        rebuilt = {name: repo.get_session_stats('g1', name) for name in names}
+        assert incremental == rebuilt
+        assert sum(s['hands_played'] for s in rebuilt.values()) > 40
+        assert len(rebuilt['Alice']['recent_hands']) == 5
+        assert rebuilt['Alice']['recent_hands'][-1].startswith('Hand 40: Lost')
+
 
 class TestSessionContextForPrompt:
     def test_empty_returns_empty_string(self, repo):
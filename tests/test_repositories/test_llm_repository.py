@@ -114,3 +114,143 @@ class TestUpdateModelDetails:
 
     def test_update_nonexistent_returns_false(self, repo):
         assert repo.update_model_details(99999, display_name='X') is False
+
+
+class TestUsageRollups:
+    """Cost analytics read trigger-maintained rollups; results must match raw rows."""
+
+    def _insert(self, repo, hours_ago, owner_id, cost, latency_ms=100, status='ok', iso=True):
+        from datetime import datetime, timedelta, timezone
+
+        ts = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+        created_at = ts.isoformat() if iso else ts.strftime('%Y-%m-%d %H:%M:%S')
+        with repo._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO api_usage (created_at, owner_id, call_type, provider, model, "
+                "status, estimated_cost, latency_ms, input_tokens, output_tokens) "
+                "VALUES (?, ?, 'player_decision', 'openai', 'gpt-5-nano', ?, ?, ?, 10, 5)",
+                (created_at, owner_id, status, cost, latency_ms),
+            )
+
+    def _seed(self, repo):
+        self._insert(repo, 0.1, 'alice', 0.50)
+        self._insert(repo, 3, 'alice', 0.25, latency_ms=2000, iso=False)
+        self._insert(repo, 23.9, 'bob', 1.00, status='error')
+        self._insert(repo, 30, 'bob', 4.00)  # outside a 24h window
+        self._insert(repo, 5, None, None)  # system call, missing pricing
+
+    def _raw_total(self, repo, date_modifier):
+        with repo._get_connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(estimated_cost), 0) FROM api_usage "
+                "WHERE datetime(created_at) >= datetime('now', ?)",
+                (date_modifier,),
+            ).fetchone()
+        return row[0], row[1]
+
+    def test_breakdowns_match_raw_rows(self, repo):
+        self._seed(repo)
+        calls, cost = self._raw_total(repo, '-24 hours')
+        summary = repo.get_usage_summary('-24 hours')
+        assert (summary['total_calls'], summary['total_cost']) == (calls, pytest.approx(cost))
+        assert summary['error_rate'] == pytest.approx(25.0)
+
+        by_owner = {r['owner_id']: r for r in repo.get_cost_by_owner('-24 hours')}
+        assert by_owner['alice']['total_calls'] == 2
+        assert by_owner['alice']['total_cost'] == pytest.approx(0.75)
+        assert by_owner['bob']['error_calls'] == 1
+        assert by_owner['(system)']['total_cost'] == 0
+
+        [model] = repo.get_cost_by_model('-24 hours', owner_id='alice')
+        assert model['total_calls'] == 2 and model['input_tokens'] == 20
+        [call_type] = repo.get_cost_by_call_type('-7 days')
+        assert call_type['total_calls'] == 5
+        assert call_type['total_cost'] == pytest.approx(5.75)
+
+        uncosted = repo.get_uncosted_calls('-24 hours')
+        assert uncosted['total'] == 1
+
+    def test_timeseries_totals_match(self, repo):
+        self._seed(repo)
+        hourly = repo.get_cost_timeseries('-24 hours', bucket='hour')
+        assert sum(p['total_calls'] for p in hourly) == 4
+        daily = repo.get_cost_timeseries('-7 days', owner_id='bob')
+        assert sum(p['total_cost'] for p in daily) == pytest.approx(5.0)
+
+    def test_latency_percentiles(self, repo):
+        self._seed(repo)
+        [row] = repo.get_latency_by_model('-7 days')
+        assert row['calls'] == 5
+        assert 100 <= row['p50_ms'] <= 125
+        assert 2000 <= row['p99_ms'] <= 2500
+        [by_call_type] = repo.get_latency_by_call_type('-7 days')
+        assert by_call_type == {**row, 'call_type': 'player_decision'}
+
+    def test_prompt_cache_hit_rate(self, repo):
+        self._seed(repo)
+        with repo._get_connection() as conn:
+            conn.execute("UPDATE api_usage SET cached_tokens = 5 WHERE owner_id = 'alice'")
+        [row] = repo.get_prompt_cache_by_call_type('-7 days')
+        assert (row['call_type'], row['provider']) == ('player_decision', 'openai')
+        assert row['input_tokens'] == 50 and row['cached_tokens'] == 10
+        assert row['cache_hit_rate'] == pytest.approx(0.2)
+
+    def test_recosting_updates_rollups(self, repo):
+        self._seed(repo)
+        with repo._get_connection() as conn:
+            conn.execute("UPDATE api_usage SET estimated_cost = 0.1 WHERE owner_id IS NULL")
+        by_owner = {r['owner_id']: r for r in repo.get_cost_by_owner('-24 hours')}
+        assert by_owner['(system)']['total_cost'] == pytest.approx(0.1)
+        assert repo.get_uncosted_calls('-24 hours')['total'] == 0
+
+    def test_pruned_rows_stay_in_rollups(self, repo):
+        self._seed(repo)
+        with repo._get_connection() as conn:
+            conn.execute("DELETE FROM api_usage")
+        [call_type] = repo.get_cost_by_call_type('-7 days')
+        # Only the leading partial hour is read from raw rows.
+        assert call_type['total_calls'] >= 4
+
+    def test_rebuild_matches_incremental(self, repo):
+        from core.llm.usage_rollups import rebuild_rollups
+
+        self._seed(repo)
+        query = "SELECT * FROM api_usage_rollups ORDER BY bucket, bucket_start, owner_id"
+        with repo._get_connection() as conn:
+            incremental = [tuple(r) for r in conn.execute(query)]
+            rebuild_rollups(conn)
+            rebuilt = [tuple(r) for r in conn.execute(query)]
+        assert rebuilt == incremental
+
+    def test_guest_transfer_moves_rollups(self, repo, db_path):
+        from poker.repositories.user_repository import UserRepository
+
+        self._insert(repo, 1, 'guest_1', 0.5)
+        self._insert(repo, 1, 'user_1', 0.25)
+        users = UserRepository(db_path)
+        users.transfer_guest_to_user('guest_1', 'user_1', 'User')
+        users.close()
+        by_owner = {r['owner_id']: r for r in repo.get_cost_by_owner('-24 hours')}
+        assert 'guest_1' not in by_owner
+        assert by_owner['user_1']['total_cost'] == pytest.approx(0.75)
+
+    def test_raw_edge_handles_both_timestamp_formats_across_midnight(self, repo):
+        from core.llm.usage_rollups import window_source
+
+        rows = [
+            ('2026-01-01T17:00:00+00:00', 1.0),  # before the cutoff
+            ('2026-01-01T23:30:00.5+00:00', 2.0),  # raw edge
+            ('2026-01-01 23:45:00', 4.0),  # raw edge, SQLite default format
+            ('2026-01-02 05:00:00', 8.0),  # daily rollup
+            ('2026-01-02T06:00:00+00:00', 16.0),  # daily rollup
+        ]
+        with repo._get_connection() as conn:
+            for created_at, cost in rows:
+                conn.execute(
+                    "INSERT INTO api_usage (created_at, call_type, provider, model, status, "
+                    "estimated_cost) VALUES (?, 'player_decision', 'openai', 'm', 'ok', ?)",
+                    (created_at, cost),
+                )
+            source, params = window_source('2026-01-01 23:10:00')
+            total = conn.execute(f"SELECT SUM(cost) FROM ({source})", params).fetchone()[0]
+        assert total == pytest.approx(30.0)
@@ -331,6 +331,80 @@ def test_delete_avatar_images(repo):
     assert repo.load_avatar_image("DeleteBot", "happy") is None
 
 
+def test_avatar_bytes_live_in_content_addressed_store(repo, db_path, tmp_path):
+    """Avatar bytes go to the on-disk store next to the DB; the row keeps the
+    sha256 (the serving ETag) and an empty blob."""
+    import hashlib
+    import sqlite3
+
+    repo.save_personality("StoreBot", {})
+    icon, full = b"\x89PNG_icon", b"\x89PNG_full"
+    repo.save_avatar_image("StoreBot", "happy", icon, full_image_data=full)
+
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        "SELECT image_data, full_image_data, image_hash, full_image_hash FROM avatar_images"
+    ).fetchone()
+    conn.close()
+    assert row == (b"", None, hashlib.sha256(icon).hexdigest(), hashlib.sha256(full).hexdigest())
+
+    avatar = repo.get_avatar_file("StoreBot", "happy", "full")
+    assert avatar["data"] is None
+    assert avatar["path"].startswith(str(tmp_path / "avatar_store"))
+    assert open(avatar["path"], "rb").read() == full
+    assert repo.load_avatar_image("StoreBot", "happy") == icon
+
+
+def test_avatar_size_variants(repo):
+    repo.save_personality("VariantBot", {})
+    repo.save_avatar_image(
+        "VariantBot", "happy", b"icon", variants={("icon", 64): b"icon64", ("full", 256): b"f256"}
+    )
+    assert open(repo.get_avatar_file("VariantBot", "happy", "icon", 64)["path"], "rb").read() == (
+        b"icon64"
+    )
+    assert repo.get_avatar_file("VariantBot", "happy", "icon", 128) is None
+
+    # Re-saving the avatar drops the stale variants.
+    repo.save_avatar_image("VariantBot", "happy", b"icon2")
+    assert repo.get_avatar_file("VariantBot", "happy", "icon", 64) is None
+
+
+def test_blob_store_migration_moves_existing_blobs(repo, db_path, tmp_path):
+    """The 20261019 migration moves blobs written before the store existed."""
+    import hashlib
+    import importlib.util
+    import sqlite3
+    from pathlib import Path
+
+    import poker.repositories.migrations as migrations_pkg
+
+    pid = repo.save_personality("LegacyBot", {})
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO avatar_images (personality_id, emotion, image_data, full_image_data) "
+        "VALUES (?, 'happy', ?, ?)",
+        (pid, b"legacy-icon", b"legacy-full"),
+    )
+    conn.commit()
+
+    path = Path(migrations_pkg.__file__).parent / "20261019_1000_avatar_blob_store.py"
+    spec = importlib.util.spec_from_file_location("_avatar_blob_store", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with conn:
+        module.upgrade(conn)
+        module.upgrade(conn)  # idempotent
+    row = conn.execute(
+        "SELECT length(image_data), full_image_data, image_hash FROM avatar_images"
+    ).fetchone()
+    conn.close()
+
+    assert row == (0, None, hashlib.sha256(b"legacy-icon").hexdigest())
+    assert repo.load_avatar_image("LegacyBot", "happy") == b"legacy-icon"
+    assert repo.load_full_avatar_image("LegacyBot", "happy") == b"legacy-full"
+
+
 def test_list_personalities_with_avatars(repo):
     repo.save_personality("AvatarBot1", {})
     repo.save_personality("AvatarBot2", {})
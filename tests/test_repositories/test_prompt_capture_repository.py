@@ -1,5 +1,7 @@
 """Tests for PromptCaptureRepository."""
 
+from unittest.mock import patch
+
 import pytest
 
 from poker.repositories.prompt_capture_repository import PromptCaptureRepository
@@ -135,3 +137,182 @@ class TestPromptCaptures:
         repo.save_prompt_capture(_make_capture(game_id='g1', provider='openai'))
         stats = repo.get_playground_capture_stats()
         assert stats['total'] == 1
+
+
+class TestPromptBlobStore:
+    SYSTEM = 'You are Batman, a brooding poker player. ' * 20
+    HISTORY = [
+        {'role': 'user', 'content': 'Flop comes K72. ' * 30},
+        {'role': 'assistant', 'content': '{"action": "raise"}'},
+    ]
+
+    def _blobs(self, repo):
+        with repo._get_connection() as conn:
+            return {
+                row['hash']: row['refcount']
+                for row in conn.execute("SELECT hash, refcount FROM prompt_blobs")
+            }
+
+    def test_round_trip_reassembles_text(self, repo):
+        cid = repo.save_prompt_capture(
+            _make_capture(system_prompt=self.SYSTEM, conversation_history=self.HISTORY)
+        )
+        loaded = repo.get_prompt_capture(cid)
+        assert loaded['system_prompt'] == self.SYSTEM
+        assert loaded['conversation_history'] == self.HISTORY
+        assert 'system_prompt_hash' not in loaded
+        with repo._get_connection() as conn:
+            row = conn.execute(
+                "SELECT system_prompt, conversation_history FROM prompt_captures WHERE id = ?",
+                (cid,),
+            ).fetchone()
+        assert row['system_prompt'] == '' and row['conversation_history'] is None
+
+    def test_repeated_sections_stored_once(self, repo):
+        repo.save_prompt_capture(
+            _make_capture(system_prompt=self.SYSTEM, conversation_history=self.HISTORY)
+        )
+        longer = self.HISTORY + [{'role': 'user', 'content': 'Turn: 3c'}]
+        repo.save_prompt_capture(
+            _make_capture(system_prompt=self.SYSTEM, conversation_history=longer)
+        )
+        blobs = self._blobs(repo)
+        # system prompt + 3 distinct messages; the shared ones are referenced twice.
+        assert len(blobs) == 4
+        assert sorted(blobs.values()) == [1, 2, 2, 2]
+
+    def test_short_system_prompt_stays_inline(self, repo):
+        cid = repo.save_prompt_capture(_make_capture(system_prompt='Be brief.'))
+        assert self._blobs(repo) == {}
+        assert repo.get_prompt_capture(cid)['system_prompt'] == 'Be brief.'
+
+    def test_delete_collects_orphans_only(self, repo):
+        repo.save_prompt_capture(_make_capture(game_id='g1', system_prompt=self.SYSTEM))
+        repo.save_prompt_capture(
+            _make_capture(
+                game_id='g2', system_prompt=self.SYSTEM, conversation_history=self.HISTORY
+            )
+        )
+        repo.delete_prompt_captures(game_id='g2')
+        assert list(self._blobs(repo).values()) == [1]  # system prompt still used by g1
+        repo.delete_prompt_captures(game_id='g1')
+        assert self._blobs(repo) == {}
+
+    def test_cleanup_old_captures_collects_orphans(self, repo):
+        cid = repo.save_prompt_capture(_make_capture(system_prompt=self.SYSTEM))
+        with repo._get_connection() as conn:
+            conn.execute(
+                "UPDATE prompt_captures SET call_type = 'commentary', "
+                "created_at = datetime('now', '-30 days') WHERE id = ?",
+                (cid,),
+            )
+        assert repo.cleanup_old_captures(7) == 1
+        assert self._blobs(repo) == {}
+
+    def test_capture_prompt_writes_blobs(self, repo, db_path):
+        from core.llm import tracking
+        from core.llm.response import LLMResponse
+        from core.llm.tracking import CallType
+
+        response = LLMResponse(
+            content='{"action": "fold"}',
+            model='gpt-test',
+            input_tokens=10,
+            output_tokens=5,
+            latency_ms=12,
+            provider='openai',
+        )
+        messages = [
+            {'role': 'system', 'content': self.SYSTEM},
+            self.HISTORY[1],
+            {'role': 'user', 'content': 'River?'},
+        ]
+        with (
+            patch.object(tracking, 'get_capture_db_path', return_value=db_path),
+            patch.object(tracking, 'should_capture_prompt', return_value=True),
+        ):
+            cid = tracking.capture_prompt(messages, response, CallType.PLAYER_DECISION)
+        loaded = repo.get_prompt_capture(cid)
+        assert loaded['system_prompt'] == self.SYSTEM
+        assert loaded['conversation_history'] == [self.HISTORY[1]]
+        assert loaded['user_message'] == 'River?'
+
+
+class TestCaptureSearchAndPaging:
+    def _seed(self, repo, n=7):
+        ids = [
+            repo.save_prompt_capture(
+                _make_capture(
+                    player_name=f'P{i % 3}',
+                    user_message=f'Board shows flush draw number{i}',
+                    ai_response='{"action": "fold"}' if i % 2 else '{"action": "call"}',
+                    tags=['mistake'] if i % 3 == 0 else ['fine-tag'],
+                )
+            )
+            for i in range(n)
+        ]
+        return ids
+
+    def test_keyset_pages_cover_everything_once(self, repo):
+        ids = self._seed(repo)
+        seen, cursor = [], None
+        while True:
+            page = repo.list_prompt_captures(limit=3, cursor=cursor, include_total=False)
+            assert page['total'] is None
+            seen += [c['id'] for c in page['captures']]
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        assert seen == sorted(ids, reverse=True)
+        assert seen == [c['id'] for c in repo.list_prompt_captures(limit=50)['captures']]
+
+    def test_keyset_matches_offset_paging(self, repo):
+        self._seed(repo)
+        first = repo.list_prompt_captures(limit=4)
+        second = repo.list_prompt_captures(limit=4, cursor=first['next_cursor'])
+        by_offset = repo.list_prompt_captures(limit=4, offset=4)
+        assert [c['id'] for c in second['captures']] == [c['id'] for c in by_offset['captures']]
+        assert second['total'] == 7 and second['next_cursor'] is None
+
+    def test_full_text_search(self, repo):
+        ids = self._seed(repo)
+        result = repo.list_prompt_captures(search='number3')
+        assert [c['id'] for c in result['captures']] == [ids[3]]
+        # Prefix match on the last word, AND across words.
+        assert repo.list_prompt_captures(search='flush numb')['total'] == 7
+        assert repo.list_prompt_captures(search='fold')['total'] == 3
+
+    def test_tags_keep_exact_semantics(self, repo):
+        repo.save_prompt_capture(_make_capture(tags=['fine-tag']))
+        repo.save_prompt_capture(_make_capture(tags=['fine']))
+        assert repo.list_prompt_captures(tags=['fine'])['total'] == 1
+        assert repo.list_prompt_captures(tags=['fine-tag'])['total'] == 1
+
+    def test_index_follows_updates_and_deletes(self, repo):
+        cid = repo.save_prompt_capture(_make_capture(game_id='g1'))
+        repo.update_prompt_capture_tags(cid, ['revisit'])
+        assert repo.list_prompt_captures(tags=['revisit'])['total'] == 1
+        repo.delete_prompt_captures(game_id='g1')
+        assert repo.list_prompt_captures(search='poker')['total'] == 0
+
+    def test_playground_search_and_cursor(self, repo):
+        self._seed(repo, n=5)
+        first = repo.list_playground_captures(limit=2, search='draw')
+        rest = repo.list_playground_captures(limit=10, cursor=first['next_cursor'])
+        assert first['total'] == 5
+        assert len(rest['captures']) == 3 and rest['next_cursor'] is None
+
+    def test_bad_cursor_rejected(self, repo):
+        with pytest.raises(ValueError):
+            repo.list_prompt_captures(cursor='garbage')
+
+    def test_player_facet_cached_but_refreshed_for_new_players(self, repo, db_path):
+        import sqlite3
+
+        repo.save_prompt_capture(_make_capture(player_name='Alice'))
+        assert repo.get_distinct_players() == ['Alice']
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE prompt_captures SET player_name = 'Zed'")
+        assert repo.get_distinct_players() == ['Alice']  # served from cache
+        repo.save_prompt_capture(_make_capture(player_name='Bob'))
+        assert repo.get_distinct_players() == ['Bob', 'Zed']
@@ -0,0 +1,175 @@
+"""Tests for the early-stopping sequential A/B mode (experiments/_sequential.py).
+
+The stopping rule is pure arithmetic and is tested directly. The all-in EV
+adjustment is checked on hand-built all-in states (known equities, chip
+conservation), and once end-to-end through a short champion/challenger run.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from experiments._sequential import (
+    STOP_FUTILE,
+    STOP_MAX_HANDS,
+    STOP_NEGATIVE,
+    STOP_POSITIVE,
+    SequentialTest,
+    allin_ev_deltas,
+)
+from experiments.champion_challenger import CHANGES, run_cc_matchup
+from poker.poker_game import Card
+
+
+def _feed(test, values):
+    for v in values:
+        result = test.add(v)
+        if result is not None:
+            return result
+    return test.finish()
+
+
+class TestSequentialTest:
+    def test_stops_early_on_decisive_winner(self):
+        rng = random.Random(1)
+        test = SequentialTest(big_blind=100, max_hands=20000, block_size=100)
+        result = _feed(test, (rng.gauss(200, 1000) for _ in range(20000)))
+        assert result.reason == STOP_POSITIVE
+        assert result.n < 20000
+        assert result.n % 100 == 0  # only stops on a look
+
+    def test_stops_early_on_decisive_loser(self):
+        rng = random.Random(2)
+        test = SequentialTest(big_blind=100, max_hands=20000, block_size=100)
+        result = _feed(test, (rng.gauss(-200, 1000) for _ in range(20000)))
+        assert result.reason == STOP_NEGATIVE
+        assert result.ci_hi < 0
+
+    def test_futility_stop_when_effect_is_tiny(self):
+        rng = random.Random(3)
+        test = SequentialTest(big_blind=100, max_hands=200000, block_size=1000, futility_bb100=5.0)
+        result = _feed(test, (rng.gauss(0, 300) for _ in range(200000)))
+        assert result.reason == STOP_FUTILE
+        assert result.n < 200000
+        assert -5.0 < result.ci_lo and result.ci_hi < 5.0
+
+    def test_null_runs_to_cap_without_futility(self):
+        # Constant zero deltas: the CI never clears 0, no futility margin set.
+        test = SequentialTest(big_blind=100, max_hands=500, block_size=100)
+        result = _feed(test, [0.0] * 500)
+        assert result.reason == STOP_MAX_HANDS
+        assert result.n == 500
+
+    def test_min_hands_suppresses_early_looks(self):
+        test = SequentialTest(big_blind=100, max_hands=1000, block_size=10, min_hands=200)
+        result = _feed(test, [100.0, 300.0] * 500)
+        assert result.reason == STOP_POSITIVE
+        assert result.n == 200
+
+    def test_look_adjusted_z_is_wider_than_fixed_n(self):
+        one_look = SequentialTest(big_blind=100, max_hands=100, block_size=100)
+        many_looks = SequentialTest(big_blind=100, max_hands=10000, block_size=100)
+        assert one_look.z == pytest.approx(1.96, abs=0.01)
+        assert many_looks.z > one_look.z
+
+    def test_false_positive_rate_under_null_is_controlled(self):
+        # Peeking 20 times at a null stream must not blow past alpha.
+        rejections = 0
+        for trial in range(200):
+            rng = random.Random(1000 + trial)
+            test = SequentialTest(big_blind=100, max_hands=2000, block_size=100)
+            result = _feed(test, (rng.gauss(0, 1000) for _ in range(2000)))
+            rejections += result.reason in (STOP_POSITIVE, STOP_NEGATIVE)
+        assert rejections / 200 <= 0.05
+
+    def test_rejects_bad_config(self):
+        with pytest.raises(ValueError):
+            SequentialTest(big_blind=100, max_hands=100, block_size=0)
+        with pytest.raises(ValueError):
+            SequentialTest(big_blind=100, max_hands=100, alpha=1.5)
+
+
+def _player(name, stack, hand, folded=False):
+    return SimpleNamespace(name=name, stack=stack, hand=tuple(hand), is_folded=folded)
+
+
+class TestAllinEvDeltas:
+    def test_no_allin_returns_realized(self):
+        out = allin_ev_deltas(None, {'A': 1000, 'B': 1000}, {'A': 1500, 'B': 500})
+        assert out == {'A': 500.0, 'B': -500.0}
+
+    def test_river_allin_is_not_adjusted(self):
+        board = [Card('2', 'Clubs'), Card('7', 'Diamonds'), Card('9', 'Hearts')]
+        board += [Card('J', 'Spades'), Card('3', 'Hearts')]
+        state = SimpleNamespace(
+            players=(
+                _player('A', 0, [Card('A', 'Spades'), Card('A', 'Hearts')]),
+                _player('B', 0, [Card('K', 'Spades'), Card('K', 'Hearts')]),
+            ),
+            community_cards=tuple(board),
+        )
+        out = allin_ev_deltas(state, {'A': 1000, 'B': 1000}, {'A': 2000, 'B': 0})
+        assert out == {'A': 1000.0, 'B': -1000.0}
+
+    def test_locked_hand_gets_full_pot(self):
+        # Turn all-in with quad aces vs nothing: the river cannot change it.
+        board = [
+            Card('A', 'Clubs'),
+            Card('A', 'Diamonds'),
+            Card('7', 'Hearts'),
+            Card('2', 'Spades'),
+        ]
+        state = SimpleNamespace(
+            players=(
+                _player('A', 0, [Card('A', 'Spades'), Card('A', 'Hearts')]),
+                _player('B', 0, [Card('3', 'Spades'), Card('4', 'Hearts')]),
+            ),
+            community_cards=tuple(board),
+        )
+        # Realized says B somehow won (simulating the noise we integrate out).
+        out = allin_ev_deltas(state, {'A': 1000, 'B': 1000}, {'A': 0, 'B': 2000})
+        assert out['A'] == pytest.approx(1000.0)
+        assert out['B'] == pytest.approx(-1000.0)
+
+    def test_dead_money_and_conservation(self):
+        # C folded after posting 100; A and B all-in for 1000 each on the flop.
+        board = [Card('K', 'Clubs'), Card('8', 'Diamonds'), Card('3', 'Hearts')]
+        state = SimpleNamespace(
+            players=(
+                _player('A', 0, [Card('A', 'Spades'), Card('K', 'Hearts')]),
+                _player('B', 0, [Card('Q', 'Spades'), Card('Q', 'Hearts')]),
+                _player('C', 900, [Card('5', 'Spades'), Card('6', 'Hearts')], folded=True),
+            ),
+            community_cards=tuple(board),
+        )
+        start = {'A': 1000, 'B': 1000, 'C': 1000}
+        final = {'A': 0, 'B': 2100, 'C': 900}
+        out = allin_ev_deltas(state, start, final)
+        assert out['C'] == -100.0
+        assert sum(out.values()) == pytest.approx(0.0)
+        # AK top pair is a big favorite over QQ on K83.
+        assert out['A'] > 500
+
+
+class TestSequentialMatchup:
+    def test_allin_ev_matchup_conserves_and_stops_on_cap(self):
+        spec = CHANGES['null']
+        sequential = SequentialTest(big_blind=100, max_hands=30, block_size=10)
+        result = run_cc_matchup(
+            change_name='null',
+            archetype='Baseline',
+            n_seats=2,
+            n_challenger=1,
+            n_hands=30,
+            champion_table=spec.champion_table(),
+            challenger_table=spec.challenger_table(),
+            base_seed=7,
+            allin_ev=True,
+            sequential=sequential,
+        )
+        n_hands = len(result.seat_deltas[result.challenger_names[0]])
+        assert n_hands == sequential.n <= 30
+        for hand_idx in range(n_hands):
+            total = sum(result.seat_deltas[name][hand_idx] for name in result.seat_deltas)
+            assert total == pytest.approx(0.0)
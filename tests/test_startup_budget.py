@@ -0,0 +1,90 @@
+"""Startup-time budget for the backend.
+
+Deploy restarts and gunicorn worker recycling pay the full boot on every
+worker, so startup has a budget. These tests fail when:
+
+  * booting the app on an already-migrated DB takes more than
+    STARTUP_BUDGET_SECONDS of CPU time (default 3s; ~1.4s now, ~4.7s before
+    provider SDKs were imported lazily). CPU rather than wall time, so a
+    loaded CI box running tests in parallel doesn't trip the budget;
+  * a boot imports a vendor LLM SDK (each costs 0.5-3s; they load on first
+    use now);
+  * the schema check on an up-to-date DB replays the baseline or loads
+    migration modules.
+
+``scripts/startup_report.py`` shows where the time goes when this fails.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from poker.repositories.migration_loader import FileMigrationLoader
+from poker.repositories.schema_manager import SchemaManager
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STARTUP_BUDGET_SECONDS = float(os.environ.get('STARTUP_BUDGET_SECONDS', '3'))
+VENDOR_SDKS = ('openai', 'anthropic', 'google.genai', 'mistralai', 'groq')
+
+_BOOT = """
+import json, sys, time
+t0 = time.process_time()
+from flask_app import config
+config.DB_PATH = {db!r}
+from flask_app import create_app
+create_app()
+elapsed = time.process_time() - t0
+from flask_app.extensions import get_startup_report
+print(json.dumps({{
+    'elapsed': elapsed,
+    'report': get_startup_report(),
+    'sdks': [m for m in {sdks!r} if m in sys.modules],
+}}))
+"""
+
+
+def _boot(db_path):
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    proc = subprocess.run(
+        [sys.executable, '-c', _BOOT.format(db=db_path, sdks=VENDOR_SDKS)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.slow
+def test_warm_boot_within_budget(tmp_path):
+    db_path = str(tmp_path / 'startup.db')
+    _boot(db_path)  # first boot builds the schema
+    result = _boot(db_path)
+
+    assert result['sdks'] == []
+    assert 'persistence' in result['report']['steps_ms']
+    assert result['elapsed'] < STARTUP_BUDGET_SECONDS, (
+        f"startup took {result['elapsed']:.1f}s CPU (budget {STARTUP_BUDGET_SECONDS}s); "
+        f"init steps: {result['report']['steps_ms']}"
+    )
+
+
+def test_current_schema_skips_baseline_and_migrations(tmp_path):
+    db_path = str(tmp_path / 'current.db')
+    SchemaManager(db_path).ensure_schema()
+
+    with (
+        patch.object(SchemaManager, '_init_db') as init_db,
+        patch.object(FileMigrationLoader, '_load') as load,
+    ):
+        SchemaManager(db_path).ensure_schema()
+
+    init_db.assert_not_called()
+    load.assert_not_called()
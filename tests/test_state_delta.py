@@ -0,0 +1,181 @@
+"""Tests for versioned JSON-patch game-state frames (flask_app.state_delta)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from flask_app.state_delta import MAX_PATCH_OPS, FrameLog, apply_patch, diff_state
+
+
+def _frame(version, **overrides):
+    frame = {
+        'players': [
+            {'name': 'Alice', 'stack': 1000, 'bet': 0, 'psychology': {'tilt_level': 0.1}},
+            {'name': 'Bob', 'stack': 1000, 'bet': 0},
+        ],
+        'pot': {'total': 30},
+        'messages': [{'id': '1', 'message': 'hi'}],
+        'phase': 'PRE_FLOP',
+        'state_version': version,
+    }
+    frame.update(overrides)
+    return frame
+
+
+class TestDiffState:
+    def test_round_trip(self):
+        old = _frame(1)
+        new = _frame(
+            2,
+            pot={'total': 130},
+            phase='FLOP',
+            players=[
+                {'name': 'Alice', 'stack': 900, 'bet': 100},
+                {'name': 'Bob', 'stack': 1000, 'bet': 0, 'nickname': 'B'},
+            ],
+        )
+        assert apply_patch(old, diff_state(old, new)) == new
+
+    def test_only_changed_paths(self):
+        old = _frame(1)
+        new = _frame(2, pot={'total': 60})
+        new['players'][1]['bet'] = 30
+        ops = diff_state(old, new)
+        assert {op['path'] for op in ops} == {'/pot/total', '/players/1/bet', '/state_version'}
+
+    def test_sliding_message_window(self):
+        old = _frame(1, messages=[{'id': str(i)} for i in range(5)])
+        new = _frame(1, messages=[{'id': str(i)} for i in range(2, 8)])
+        ops = diff_state(old['messages'], new['messages'], '/messages')
+        assert [op['op'] for op in ops] == ['remove', 'remove', 'add', 'add', 'add']
+        assert apply_patch(old, diff_state(old, new)) == new
+
+    def test_bool_and_int_are_distinct(self):
+        assert diff_state({'a': 1}, {'a': True}) == [{'op': 'replace', 'path': '/a', 'value': True}]
+
+    def test_keys_are_escaped(self):
+        ops = diff_state({}, {'a/b~c': 1})
+        assert ops == [{'op': 'add', 'path': '/a~1b~0c', 'value': 1}]
+        assert apply_patch({}, ops) == {'a/b~c': 1}
+
+
+class TestFrameLog:
+    def test_first_frame_is_full(self):
+        log = FrameLog()
+        assert log.record('g', _frame(1)) is None
+        assert log.latest('g')['state_version'] == 1
+
+    def test_patch_keyed_by_previous_version(self):
+        log = FrameLog()
+        log.record('g', _frame(1))
+        base_version, ops = log.record('g', _frame(5, phase='FLOP'))
+        assert base_version == 1
+        assert ops == [{'op': 'replace', 'path': '/phase', 'value': 'FLOP'}]
+
+    def test_large_delta_falls_back_to_full_frame(self):
+        log = FrameLog()
+        log.record('g', _frame(1, extra={str(i): i for i in range(MAX_PATCH_OPS + 1)}))
+        assert (
+            log.record('g', _frame(2, extra={str(i): -i - 1 for i in range(MAX_PATCH_OPS + 1)}))
+            is None
+        )
+        # The oversized frame still becomes the base for the next patch.
+        assert log.record('g', _frame(3, extra={str(i): -i - 1 for i in range(MAX_PATCH_OPS + 1)}))
+
+    def test_forget(self):
+        log = FrameLog()
+        log.record('g', _frame(1))
+        log.forget('g')
+        assert log.latest('g') is None
+        assert log.record('g', _frame(2)) is None
+
+
+class TestEmitPath:
+    @pytest.fixture
+    def game_data(self):
+        from poker.poker_game import initialize_game_state
+        from poker.poker_state_machine import PokerStateMachine
+
+        state_machine = PokerStateMachine(initialize_game_state(['Alice', 'Bob']))
+        return {'state_machine': state_machine, 'ai_controllers': {}, 'messages': []}
+
+    def _emit_twice(self, game_data, enabled):
+        from flask_app.handlers import game_handler
+        from flask_app.state_delta import frame_log
+
+        frame_log.forget('g-delta')
+        with (
+            patch.object(game_handler.game_state_service, 'get_game', return_value=game_data),
+            patch.object(game_handler, 'socketio') as sio,
+            patch.object(game_handler.feature_flags, 'is_enabled', return_value=enabled),
+        ):
+            game_handler.update_and_emit_game_state('g-delta')
+            game_data['messages'].append({'id': 'm1', 'content': 'nh', 'timestamp': 't'})
+            game_handler.update_and_emit_game_state('g-delta')
+        frame_log.forget('g-delta')
+        return [c.args for c in sio.emit.call_args_list]
+
+    def test_second_emit_is_a_patch(self, game_data):
+        (full_event, full), (patch_event, delta) = self._emit_twice(game_data, enabled=True)
+        assert full_event == 'update_game_state'
+        assert patch_event == 'game_state_patch'
+        assert delta['base_version'] == full['game_state']['state_version']
+        assert delta['state_version'] > delta['base_version']
+        # The version travels on the envelope, not in the ops.
+        assert all(op['path'] != '/state_version' for op in delta['ops'])
+        rebuilt = apply_patch(full['game_state'], delta['ops'])
+        assert [m['id'] for m in rebuilt['messages']] == ['m1']
+
+    def test_flag_off_sends_full_frames(self, game_data):
+        events = [args[0] for args in self._emit_twice(game_data, enabled=False)]
+        assert events == ['update_game_state', 'update_game_state']
+
+    def test_emit_full_game_state_targets_one_socket(self):
+        from flask_app.handlers import game_handler
+        from flask_app.state_delta import frame_log
+
+        frame_log.record('g-resync', _frame(7))
+        try:
+            with patch.object(game_handler, 'socketio') as sio:
+                game_handler.emit_full_game_state('g-resync', to='sid-1')
+            sio.emit.assert_called_once_with(
+                'update_game_state', {'game_state': _frame(7)}, to='sid-1'
+            )
+        finally:
+            frame_log.forget('g-resync')
+
+
+@pytest.mark.flask
+class TestRequestFullStateSocket:
+    def _handlers(self):
+        from flask_app.routes.game_routes import register_socket_events
+
+        handlers = {}
+        sio = MagicMock()
+        sio.on = lambda event: lambda fn: handlers.setdefault(event, fn)
+        register_socket_events(sio)
+        return handlers
+
+    @patch('flask_app.routes.game_routes.emit')
+    @patch('flask_app.routes.game_routes.get_authorization_service', return_value=None)
+    @patch('flask_app.routes.game_routes.emit_full_game_state')
+    @patch('flask_app.routes.game_routes.game_state_service')
+    @patch('flask_app.extensions.auth_manager')
+    def test_non_owner_rejected(self, mock_auth, mock_gss, mock_full, _authz, mock_emit):
+        mock_auth.get_current_user.return_value = {'id': 'intruder'}
+        mock_gss.get_game.return_value = {'owner_id': 'owner-1'}
+        self._handlers()['request_full_state']({'game_id': 'g'})
+        mock_full.assert_not_called()
+        mock_emit.assert_called_once_with(
+            'auth_error', {'error': 'Not authorized for this game', 'code': 'NOT_OWNER'}
+        )
+
+    @patch('flask_app.routes.game_routes.request', new=MagicMock(sid='sid-9'))
+    @patch('flask_app.routes.game_routes.emit_full_game_state')
+    @patch('flask_app.routes.game_routes.game_state_service')
+    @patch('flask_app.extensions.auth_manager')
+    def test_owner_gets_full_frame_on_own_socket(self, mock_auth, mock_gss, mock_full):
+        mock_auth.get_current_user.return_value = {'id': 'owner-1'}
+        mock_gss.get_game.return_value = {'owner_id': 'owner-1'}
+        self._handlers()['request_full_state']({'game_id': 'g'})
+        mock_full.assert_called_once_with('g', to='sid-9')
@@ -0,0 +1,150 @@
+"""Tests for poker.strategy.compiled_table (binary mmap strategy tables)."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from poker.strategy.compiled_table import (
+    POSTFLOP,
+    PREFLOP,
+    CompiledProfileMap,
+    compile_strategy_json,
+    compiled_path_for,
+    load_compiled,
+)
+from poker.strategy.nodes import PreflopNode
+from poker.strategy.strategy_profile import StrategyProfile
+from poker.strategy.strategy_table import (
+    StrategyTable,
+    _parse_json_to_preflop_data,
+    load_strategy_table,
+)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'poker', 'strategy', 'data')
+
+SAMPLE_PREFLOP = {
+    "rfi": {
+        "UTG": {"AKs": {"raise_2.5bb": 1.0}, "72o": {"fold": 1.0}},
+        "BTN": {"AKs": {"raise_2.5bb": 0.8, "raise_3bb": 0.2}},
+    },
+    "vs_open": {"BB_vs_UTG": {"AKs": {"call": 0.4, "raise_3x": 0.6}}},
+}
+SAMPLE_POSTFLOP = {
+    "flop|IP|SRP|dry_high|air|no_draw|unopened|high": {"check": 0.7, "bet_33": 0.3},
+}
+
+
+@pytest.fixture
+def preflop_json(tmp_path):
+    path = tmp_path / 'preflop.json'
+    path.write_text(json.dumps(SAMPLE_PREFLOP))
+    return str(path)
+
+
+def _assert_same_profiles(compiled, expected):
+    assert set(compiled) == set(expected)
+    assert len(compiled) == len(expected)
+    for key, profile in expected.items():
+        # Exact values and action order — lookups must match the JSON bit-for-bit.
+        assert list(compiled[key].action_probabilities.items()) == list(
+            profile.action_probabilities.items()
+        )
+
+
+class TestRoundTrip:
+    def test_preflop_round_trip(self, preflop_json):
+        compile_strategy_json(preflop_json, PREFLOP)
+        compiled = load_compiled(preflop_json)
+        assert isinstance(compiled, CompiledProfileMap)
+        _assert_same_profiles(compiled, _parse_json_to_preflop_data(SAMPLE_PREFLOP))
+
+    def test_postflop_round_trip(self, tmp_path):
+        path = tmp_path / 'postflop.json'
+        path.write_text(json.dumps(SAMPLE_POSTFLOP))
+        compile_strategy_json(str(path), POSTFLOP)
+        compiled = load_compiled(str(path))
+        key = next(iter(SAMPLE_POSTFLOP))
+        assert compiled[key].action_probabilities['check'] == pytest.approx(0.7)
+
+    def test_production_chart_round_trip(self, tmp_path):
+        src = os.path.join(DATA_DIR, 'preflop_100bb_6max.json')
+        json_path = tmp_path / 'preflop_100bb_6max.json'
+        shutil.copy(src, json_path)
+        compile_strategy_json(str(json_path), PREFLOP)
+        with open(src) as f:
+            expected = _parse_json_to_preflop_data(json.load(f))
+        _assert_same_profiles(load_compiled(str(json_path)), expected)
+
+    def test_missing_key(self, preflop_json):
+        compile_strategy_json(preflop_json, PREFLOP)
+        compiled = load_compiled(preflop_json)
+        assert compiled.get('rfi|CO||AKs') is None
+        assert 'rfi|CO||AKs' not in compiled
+        with pytest.raises(KeyError):
+            compiled['rfi|CO||AKs']
+
+    def test_unknown_kind_rejected(self, preflop_json):
+        with pytest.raises(ValueError):
+            compile_strategy_json(preflop_json, 'river')
+
+
+class TestFreshness:
+    def test_no_compiled_file_returns_none(self, preflop_json):
+        assert load_compiled(preflop_json) is None
+
+    def test_stale_compiled_file_is_ignored(self, preflop_json):
+        compile_strategy_json(preflop_json, PREFLOP)
+        edited = json.loads(json.dumps(SAMPLE_PREFLOP))
+        edited['rfi']['UTG']['72o'] = {"fold": 0.5, "raise_2.5bb": 0.5}
+        with open(preflop_json, 'w') as f:
+            json.dump(edited, f)
+        assert load_compiled(preflop_json) is None
+
+    def test_corrupt_compiled_file_is_ignored(self, preflop_json):
+        with open(compiled_path_for(preflop_json), 'wb') as f:
+            f.write(b'not a table' * 10)
+        assert load_compiled(preflop_json) is None
+
+
+class TestMutationOverlay:
+    def test_writes_stay_private_to_the_owning_table(self, preflop_json):
+        compile_strategy_json(preflop_json, PREFLOP)
+        compiled = load_compiled(preflop_json)
+        a = StrategyTable(compiled)
+        b = StrategyTable(compiled)
+        key = 'rfi|UTG||72o'
+        a._preflop[key] = StrategyProfile(action_probabilities={'raise_2.5bb': 1.0})
+        assert a._preflop[key].action_probabilities == {'raise_2.5bb': 1.0}
+        assert b._preflop[key].action_probabilities == {'fold': 1.0}
+        assert compiled[key].action_probabilities == {'fold': 1.0}
+        assert len(a._preflop) == len(compiled)
+
+    def test_add_and_delete(self, preflop_json):
+        compile_strategy_json(preflop_json, PREFLOP)
+        m = load_compiled(preflop_json).copy()
+        n = len(m)
+        m['rfi|CO||AKs'] = StrategyProfile(action_probabilities={'raise_2.5bb': 1.0})
+        assert len(m) == n + 1 and 'rfi|CO||AKs' in m
+        del m['rfi|UTG||72o']
+        assert len(m) == n and 'rfi|UTG||72o' not in m
+        assert set(m) == (set(_parse_json_to_preflop_data(SAMPLE_PREFLOP)) - {'rfi|UTG||72o'}) | {
+            'rfi|CO||AKs'
+        }
+
+
+class TestLoaderIntegration:
+    def test_load_strategy_table_uses_compiled_chart(self, preflop_json):
+        compile_strategy_json(preflop_json, PREFLOP)
+        table = load_strategy_table(json_path=preflop_json, postflop_path='/nonexistent.json')
+        assert isinstance(table._preflop, CompiledProfileMap)
+        node = PreflopNode(hand='AKs', position='BTN', scenario='rfi', opener_position='')
+        profile = table.lookup_with_fallback(node, ['fold', 'call', 'raise'])
+        assert profile.action_probabilities['raise_2.5bb'] == pytest.approx(0.8)
+        assert table.size == 4
+
+    def test_load_strategy_table_falls_back_to_json(self, preflop_json):
+        table = load_strategy_table(json_path=preflop_json, postflop_path='/nonexistent.json')
+        assert isinstance(table._preflop, dict)
+        assert table.size == 4
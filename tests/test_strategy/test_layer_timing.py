@@ -0,0 +1,109 @@
+"""Tests for poker.strategy.layer_timing and the tiered-bot layer laps."""
+
+from experiments.bench_tiered_layers import record_corpus, replay_corpus
+from poker.strategy.layer_timing import (
+    FINALIZE,
+    LayerTimer,
+    format_layer_summary,
+    percentile,
+)
+
+FIELD = ['TAG', 'LAG', 'Rock', 'Calling Station', 'Maniac', 'Baseline']
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [5.0, 1.0, 3.0, 2.0, 4.0]
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 99) == 5.0
+        assert percentile(values, 0) == 1.0
+
+    def test_empty(self):
+        assert percentile([], 50) == 0.0
+
+
+class TestLayerTimer:
+    def test_laps_accumulate_in_pipeline_order(self):
+        timer = LayerTimer()
+        timer.start()
+        timer.lap('node_build')
+        timer.lap('base_strategy')
+        timer.lap('node_build')  # a layer revisited in one decision sums
+        laps = timer.finish()
+        assert list(laps) == ['node_build', 'base_strategy', FINALIZE]
+        assert all(us >= 0 for us in laps.values())
+        assert timer.decisions == 1
+        assert len(timer.samples['node_build']) == 1
+
+    def test_lap_without_start_is_ignored(self):
+        timer = LayerTimer()
+        timer.lap('node_build')
+        assert timer.finish() == {}
+        assert timer.decisions == 0
+
+    def test_summary_shares_sum_to_one(self):
+        timer = LayerTimer()
+        for _ in range(3):
+            timer.start()
+            timer.lap('a')
+            timer.lap('b')
+            timer.finish()
+        summary = timer.summary()
+        assert summary['a']['n'] == 3
+        assert abs(sum(s['share'] for s in summary.values()) - 1.0) < 1e-9
+        table = format_layer_summary(summary)
+        assert table.splitlines()[0].startswith('layer')
+        assert 'KB' not in table
+
+    def test_allocation_tracking(self):
+        timer = LayerTimer(track_allocations=True)
+        timer.start()
+        blob = [object() for _ in range(2000)]
+        timer.lap('alloc')
+        timer.finish()
+        del blob
+        summary = timer.summary()
+        assert summary['alloc']['p50_alloc_kb'] > 10
+        assert 'p50 KB' in format_layer_summary(summary)
+
+
+class TestControllerLaps:
+    def test_replay_records_pipeline_layers(self):
+        spots = record_corpus(FIELD, n_hands=3, base_seed=7)
+        assert spots
+        timer = replay_corpus(spots, repeat=1)
+        assert timer.decisions == len(spots)
+        layers = set(timer.samples)
+        assert {'node_build', 'base_strategy', 'personality', FINALIZE} <= layers
+        if any(s.phase != 'PRE_FLOP' for s in spots):
+            assert 'postflop_commit' in layers
+
+    def test_timer_does_not_change_decisions(self):
+        from experiments.bench_tiered_layers import _SpotMachine
+        from experiments.simulate_bb100 import ARCHETYPES, make_controller
+        from poker.poker_state_machine import PokerPhase
+        from poker.strategy.strategy_table import load_strategy_table
+
+        spots = record_corpus(FIELD, n_hands=2, base_seed=11)
+        table = load_strategy_table()
+        results = []
+        for timed in (False, True):
+            machine = _SpotMachine()
+            controllers = {}
+            actions = []
+            for spot in spots:
+                if spot.seat not in controllers:
+                    controllers[spot.seat] = make_controller(
+                        spot.seat, ARCHETYPES[spot.archetype], table, machine, rng_seed=3
+                    )
+                    if timed:
+                        controllers[spot.seat].layer_timer = LayerTimer()
+                controller = controllers[spot.seat]
+                machine.game_state = spot.game_state
+                machine.current_phase = PokerPhase[spot.phase]
+                decision = controller.decide_action()
+                actions.append((decision['action'], decision.get('raise_to')))
+                snapshot = controller._last_pipeline_snapshot or {}
+                assert ('layer_timings_us' in snapshot) == timed
+            results.append(actions)
+        assert results[0] == results[1]
@@ -480,3 +480,80 @@ class TestLookupWithFallbackTraced:
         untraced = table.lookup_with_fallback(node, legal)
         traced, _ = table.lookup_with_fallback_traced(node, legal)
         assert untraced.action_probabilities == traced.action_probabilities
+
+
+class TestResolvedLookupCache:
+    """The *_with_fallback lookups memoize the resolved ladder per (node, legal
+    actions); the cached answer must equal the uncached one."""
+
+    LEGAL_SETS = (
+        ['fold', 'call', 'raise'],
+        ['fold', 'all_in'],
+        ['check', 'raise'],
+        ['check'],
+    )
+
+    def test_repeat_lookup_is_the_cached_profile(self, table):
+        node = PreflopNode(hand='AKs', position='UTG', scenario='rfi', opener_position='')
+        first = table.lookup_with_fallback(node, ['raise', 'fold', 'call'])
+        assert table.lookup_with_fallback(node, ['raise', 'fold', 'call']) is first
+        assert table.lookup_with_fallback_traced(node, ['raise', 'fold', 'call'])[0] is first
+
+    def test_legal_actions_are_part_of_the_key(self, table):
+        node = PreflopNode(hand='AKs', position='UTG', scenario='rfi', opener_position='')
+        assert table.lookup_with_fallback_traced(node, ['raise', 'fold'])[1] == 'hit'
+        prof, src = table.lookup_with_fallback_traced(node, ['check'])
+        assert src == 'masked_out'
+        assert prof.action_probabilities == {'check': 1.0}
+
+    def test_spr_fallback_toggle_is_part_of_the_key(self):
+        high = _pf_node('high')
+        table = StrategyTable(
+            preflop_data={}, postflop_data={high.key: StrategyProfile({'bet_67': 1.0})}
+        )
+        legal = ['check', 'raise']
+        assert (
+            'bet_67'
+            in table.lookup_postflop_with_fallback(_pf_node('low'), legal).action_probabilities
+        )
+        table.spr_fallback = False
+        out = table.lookup_postflop_with_fallback(_pf_node('low'), legal)
+        assert out.action_probabilities == {'check': 1.0}
+
+    def test_clear_lookup_cache_picks_up_mutation(self, table):
+        node = PreflopNode(hand='AKs', position='UTG', scenario='rfi', opener_position='')
+        legal = ['raise', 'fold', 'call']
+        table.lookup_with_fallback(node, legal)
+        table._preflop[node.key] = StrategyProfile({'call': 1.0})
+        table.clear_lookup_cache()
+        assert table.lookup_with_fallback(node, legal).action_probabilities == {'call': 1.0}
+
+    def test_production_preflop_parity(self):
+        table = load_strategy_table()
+        keys = sorted(table._preflop)[::37]
+        for key in keys:
+            scenario, position, opener, hand = key.split('|')
+            node = PreflopNode(
+                hand=hand, position=position, scenario=scenario, opener_position=opener
+            )
+            for legal in self.LEGAL_SETS:
+                expected = _mask_and_renormalize(table._preflop[key], legal)
+                if expected is None:
+                    expected = _conservative_default(legal)
+                for _ in range(2):  # miss, then cache hit
+                    got = table.lookup_with_fallback(node, legal)
+                    assert got.action_probabilities == expected.action_probabilities
+
+    def test_production_postflop_parity_with_uncached_ladder(self):
+        cached = load_strategy_table()
+        for key in sorted(cached._postflop)[::23]:
+            street, pos, _pot, texture, made, draw, facing, _spr = key.split('|')
+            for pot_type, spr in (('SRP', 'high'), ('3BP', 'low'), ('SRP', 'medium')):
+                node = PostflopNode(street, pos, pot_type, texture, made, draw, facing, spr)
+                for legal in self.LEGAL_SETS:
+                    expected = StrategyTable({}, cached._postflop)._resolve_postflop(
+                        node, tuple(legal)
+                    )
+                    for _ in range(2):
+                        got = cached.lookup_postflop_with_fallback(node, legal)
+                        assert got.action_probabilities == expected.action_probabilities